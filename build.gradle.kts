@@ -143,7 +143,8 @@ dependencies {
     implementation(libs.org.springframework.boot.spring.boot.starter.actuator)
 
     // Database
-    runtimeOnly(libs.org.postgresql.postgresql)
+    // Compile scope for PGConnection (LISTEN/NOTIFY in PeerNotificationListener)
+    implementation(libs.org.postgresql.postgresql)
     // Flyway for database migrations in dev/docker environments (Flyway 10 modular DB support)
     implementation("org.flywaydb:flyway-core:10.17.0")
     implementation("org.flywaydb:flyway-database-postgresql:10.17.0")
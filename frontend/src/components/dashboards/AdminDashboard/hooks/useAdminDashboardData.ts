@@ -7,6 +7,7 @@ import {
   useApprovalAction,
   useTimesheetStats,
 } from '../../../../hooks/timesheets';
+import { useDashboardEvents } from '../../../../hooks/useDashboardEvents';
 import { useSession } from '../../../../auth/SessionProvider';
 import { useUserProfile } from '../../../../auth/UserProfileProvider';
 import { useAccessControl } from '../../../../auth/access-control';
@@ -174,13 +175,17 @@ export function useAdminDashboardData(): UseAdminDashboardDataResult {
     optimisticRemove,
   } = useAdminPendingApprovals();
 
+  useDashboardEvents(['timesheet-changed'], () => {
+    refreshTimesheets().catch(() => {});
+  });
+
   const {
     data: dashboardData,
     loading: dashboardLoading,
     error: dashboardError,
     lastUpdatedAt,
     refetch: refetchDashboard,
-  } = useTimesheetDashboardSummary({ scope: 'admin', refetchOnWindowFocus: true, refetchInterval: 30000 });
+  } = useTimesheetDashboardSummary({ scope: 'admin', refetchOnWindowFocus: true, refetchInterval: 30000, live: true });
   useEffect(() => {
     const adminWindow = window as AdminDashboardWindow;
     const previous = adminWindow.__admin_dashboard_last_updated_at ?? null;
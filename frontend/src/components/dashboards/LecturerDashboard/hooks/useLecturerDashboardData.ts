@@ -5,6 +5,7 @@ import {
   useApprovalAction,
   useTimesheetDashboardSummary,
 } from '../../../../hooks/timesheets';
+import { useDashboardEvents } from '../../../../hooks/useDashboardEvents';
 import { useUserProfile } from '../../../../auth/UserProfileProvider';
 import { useSession } from '../../../../auth/SessionProvider';
 import { useAccessControl } from '../../../../auth/access-control';
@@ -139,13 +140,17 @@ export function useLecturerDashboardData(): UseLecturerDashboardDataResult {
 
   const noPendingTimesheets = !pendingLoading && pendingTimesheets.length === 0;
 
+  useDashboardEvents(['timesheet-changed'], () => {
+    refetchPending().catch(() => {});
+  });
+
   const {
     data: dashboardData,
     loading: dashboardLoading,
     error: dashboardError,
     lastUpdatedAt,
     refetch: refetchDashboard,
-  } = useTimesheetDashboardSummary({ scope: 'lecturer', refetchOnWindowFocus: true, refetchInterval: 30000 });
+  } = useTimesheetDashboardSummary({ scope: 'lecturer', refetchOnWindowFocus: true, refetchInterval: 30000, live: true });
   // Expose last updated stamp globally for shell (dev-friendly)
   useEffect(() => {
     (window as any).__dashboard_last_updated_at = lastUpdatedAt ?? (window as any).__dashboard_last_updated_at ?? null;
@@ -376,16 +381,14 @@ export function useLecturerDashboardData(): UseLecturerDashboardDataResult {
     }
 
     try {
+      const requests = selectedTimesheetsState.map((timesheetId) => ({
+        timesheetId,
+        action: 'REJECT' as const,
+        comment: 'Rejected via batch action',
+      }));
+
       actionLockRef.current = true;
-      await Promise.all(
-        selectedTimesheetsState.map((timesheetId) =>
-          approveTimesheet({
-            timesheetId,
-            action: 'REJECT',
-            comment: 'Rejected via batch action',
-          }),
-        ),
-      );
+      await batchApprove(requests);
 
       await Promise.all([refetchPending(), refetchDashboard()]);
       setSelectedTimesheets([]);
@@ -396,7 +399,7 @@ export function useLecturerDashboardData(): UseLecturerDashboardDataResult {
     }
   }, [
     approvalLoading,
-    approveTimesheet,
+    batchApprove,
     canPerformApprovals,
     refetchDashboard,
     refetchPending,
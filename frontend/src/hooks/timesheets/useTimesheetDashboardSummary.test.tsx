@@ -1,6 +1,18 @@
 import { renderHook, act, waitFor } from '@testing-library/react';
 import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
 import { useTimesheetDashboardSummary } from './useTimesheetDashboardSummary';
+import { TimesheetService } from '../../services/timesheets';
+
+const dashboardEvents = vi.hoisted(() => ({ push: null as (() => void) | null }));
+
+// Stand in for a connected stream whenever live updates are enabled
+vi.mock('../useDashboardEvents', () => ({
+  useDashboardEvents: vi.fn((_types: readonly string[], onEvent: () => void, options?: { enabled?: boolean }) => {
+    const enabled = options?.enabled ?? true;
+    dashboardEvents.push = enabled ? onEvent : null;
+    return enabled;
+  }),
+}));
 
 // Mock TimesheetService at module level used by the hook
 vi.mock('../../services/timesheets', async () => {
@@ -52,4 +64,26 @@ describe('useTimesheetDashboardSummary', () => {
     });
     await waitFor(() => expect(result.current.lastUpdatedAt && result.current.lastUpdatedAt >= (firstStamp ?? 0)).toBe(true));
   });
+
+  it('refetches on pushed invalidations instead of polling while live', async () => {
+    vi.useFakeTimers({ shouldAdvanceTime: true });
+    try {
+      const { result } = renderHook(() => useTimesheetDashboardSummary({ scope: 'admin', refetchInterval: 1000, live: true }));
+      await waitFor(() => expect(result.current.loading).toBe(false));
+      expect(TimesheetService.getAdminDashboardSummary).toHaveBeenCalledTimes(1);
+
+      await act(async () => {
+        vi.advanceTimersByTime(5000);
+        window.dispatchEvent(new Event('focus'));
+      });
+      expect(TimesheetService.getAdminDashboardSummary).toHaveBeenCalledTimes(1);
+
+      await act(async () => {
+        dashboardEvents.push?.();
+      });
+      await waitFor(() => expect(TimesheetService.getAdminDashboardSummary).toHaveBeenCalledTimes(2));
+    } finally {
+      vi.useRealTimers();
+    }
+  });
 });
@@ -1,5 +1,6 @@
 import { useCallback, useEffect, useState } from "react";
 import { TimesheetService } from "../../services/timesheets";
+import { useDashboardEvents } from "../useDashboardEvents";
 import type { DashboardSummary } from "../../types/api";
 
 export interface UseTimesheetDashboardSummaryOptions {
@@ -7,6 +8,7 @@ export interface UseTimesheetDashboardSummaryOptions {
   lazy?: boolean;
   refetchOnWindowFocus?: boolean;
   refetchInterval?: number; // ms, active only when document visible
+  live?: boolean; // refetch on server push; polling resumes while the stream is down
 }
 
 interface DashboardSummaryState {
@@ -24,6 +26,7 @@ export const useTimesheetDashboardSummary = (
     lazy = false,
     refetchOnWindowFocus = true,
     refetchInterval = 30000,
+    live = false,
   } = options;
   const [state, setState] = useState<DashboardSummaryState>({
     data: null,
@@ -68,9 +71,17 @@ export const useTimesheetDashboardSummary = (
     }
   }, [fetchSummary, lazy]);
 
+  const streaming = useDashboardEvents(
+    ["summary-invalidated"],
+    () => {
+      fetchSummary().catch(() => {});
+    },
+    { enabled: live },
+  );
+
   // Focus-based refetch
   useEffect(() => {
-    if (!refetchOnWindowFocus) return;
+    if (!refetchOnWindowFocus || streaming) return;
     const handler = () => {
       if (typeof document !== 'undefined' && document.visibilityState === 'visible') {
         fetchSummary().catch(() => {});
@@ -86,11 +97,11 @@ export const useTimesheetDashboardSummary = (
       window.removeEventListener('focus', handler);
       document.removeEventListener('visibilitychange', handler);
     };
-  }, [fetchSummary, refetchOnWindowFocus]);
+  }, [fetchSummary, refetchOnWindowFocus, streaming]);
 
   // Interval refetch only when visible
   useEffect(() => {
-    if (!refetchInterval || refetchInterval <= 0) return;
+    if (!refetchInterval || refetchInterval <= 0 || streaming) return;
     let timer: number | undefined;
     const tick = () => {
       if (typeof document !== 'undefined' && document.visibilityState === 'visible') {
@@ -105,7 +116,7 @@ export const useTimesheetDashboardSummary = (
     return () => {
       if (timer) window.clearTimeout(timer);
     };
-  }, [fetchSummary, refetchInterval]);
+  }, [fetchSummary, refetchInterval, streaming]);
 
   return {
     data: state.data,
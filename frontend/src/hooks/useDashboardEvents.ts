@@ -0,0 +1,59 @@
+/**
+ * Subscribe to dashboard change notifications.
+ *
+ * Calls `onEvent` (debounced) when the server pushes one of `types`, and reports whether the
+ * stream is connected so callers can drop back to polling when it is not.
+ */
+
+import { useEffect, useRef, useState } from 'react';
+import { dashboardEventStream, type DashboardEventType } from '../services/eventStream';
+
+export interface UseDashboardEventsOptions {
+  enabled?: boolean;
+  debounceMs?: number;
+}
+
+export const useDashboardEvents = (
+  types: readonly DashboardEventType[],
+  onEvent: () => void,
+  options: UseDashboardEventsOptions = {},
+): boolean => {
+  const { enabled = true, debounceMs = 1000 } = options;
+  const [connected, setConnected] = useState(() => enabled && dashboardEventStream.isConnected());
+  const callbackRef = useRef(onEvent);
+  callbackRef.current = onEvent;
+  const typeKey = types.join(',');
+
+  useEffect(() => {
+    if (!enabled) {
+      setConnected(false);
+      return;
+    }
+    const wanted = new Set(typeKey.split(','));
+    let timer: ReturnType<typeof setTimeout> | null = null;
+    const stopStatus = dashboardEventStream.onStatusChange(setConnected);
+    const stopEvents = dashboardEventStream.subscribe((event) => {
+      if (!wanted.has(event.type)) {
+        return;
+      }
+      // A single write emits several events; collapse them into one refetch
+      if (timer) {
+        clearTimeout(timer);
+      }
+      timer = setTimeout(() => {
+        timer = null;
+        callbackRef.current();
+      }, debounceMs);
+    });
+    setConnected(dashboardEventStream.isConnected());
+    return () => {
+      if (timer) {
+        clearTimeout(timer);
+      }
+      stopEvents();
+      stopStatus();
+    };
+  }, [debounceMs, enabled, typeKey]);
+
+  return connected;
+};
@@ -32,7 +32,8 @@ vi.mock('axios', () => {
     throw current;
   };
 
-  let mode: 'ok' | '401' | '500' = 'ok';
+  let mode: 'ok' | '401' | '500' | 'etag' = 'ok';
+  const seenIfNoneMatch: (string | undefined)[] = [];
   const instance: any = {
     defaults: { baseURL: 'http://example.com', timeout: 10000, headers: {} },
     interceptors: {
@@ -45,6 +46,14 @@ vi.mock('axios', () => {
         const error: any = { isAxiosError: true, response: { status: 500, data: { message: 'Server error' } }, config: cfg };
         return runResponseRejected(error);
       }
+      if (mode === 'etag') {
+        const ifNoneMatch = cfg.headers?.['If-None-Match'];
+        seenIfNoneMatch.push(ifNoneMatch);
+        if (ifNoneMatch === '"v1"' && cfg.validateStatus?.(304)) {
+          return runResponseFulfilled({ status: 304, statusText: 'Not Modified', data: '', headers: { etag: '"v1"' }, config: cfg });
+        }
+        return runResponseFulfilled({ status: 200, statusText: 'OK', data: { version: 1 }, headers: { etag: '"v1"' }, config: cfg });
+      }
       const response = { status: 200, statusText: 'OK', data: { ok: true }, config: cfg };
       return runResponseFulfilled(response);
     },
@@ -60,7 +69,8 @@ vi.mock('axios', () => {
     create: () => instance,
     AxiosHeaders,
     isAxiosError: (e: any) => !!e?.isAxiosError,
-    __setAxiosMode: (m: 'ok' | '401' | '500') => { mode = m; },
+    __setAxiosMode: (m: 'ok' | '401' | '500' | 'etag') => { mode = m; },
+    __seenIfNoneMatch: seenIfNoneMatch,
   } as any;
   return api;
 });
@@ -127,4 +137,29 @@ describe('SecureApiClient', () => {
     expect(qs).not.toContain('d=');
     expect(qs).not.toContain('e=');
   });
+
+  it('revalidates GETs with If-None-Match and serves 304 from the stored representation', async () => {
+    const axiosModule: any = await import('axios');
+    axiosModule.__setAxiosMode('etag');
+    axiosModule.__seenIfNoneMatch.length = 0;
+    try {
+      const client = new SecureApiClient('http://example.com');
+      client.setAuthToken('etag-user');
+
+      const first = await client.get<{ version: number }>('/api/dashboard/summary');
+      const second = await client.get<{ version: number }>('/api/dashboard/summary');
+
+      expect(first.status).toBe(200);
+      expect(second.status).toBe(304);
+      expect(second.data).toEqual({ version: 1 });
+      expect(axiosModule.__seenIfNoneMatch).toEqual([undefined, '"v1"']);
+
+      // A different identity must not reuse the stored validator
+      client.setAuthToken('other-user');
+      await client.get('/api/dashboard/summary');
+      expect(axiosModule.__seenIfNoneMatch[2]).toBeUndefined();
+    } finally {
+      axiosModule.__setAxiosMode('ok');
+    }
+  });
 });
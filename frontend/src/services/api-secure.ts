@@ -103,10 +103,19 @@ type InternalRequestConfigWithMeta = InternalAxiosRequestConfig & {
   metadata?: RequestMetadata;
 };
 
+// Last representation seen for a GET, replayed when the server answers 304
+type CachedRepresentation = {
+  etag: string;
+  data: unknown;
+};
+
+const MAX_CACHED_REPRESENTATIONS = 100;
+
 export class SecureApiClient {
   private client: AxiosInstance;
   private token: string | null = null;
   private environment: 'browser' | 'server';
+  private representations = new Map<string, CachedRepresentation>();
 
   constructor(baseURL?: string, options: SecureApiClientOptions = {}) {
     const config = getConfig();
@@ -142,6 +151,10 @@ export class SecureApiClient {
   // ---------------------------------------------------------------------------
 
   setAuthToken(token: string | null): void {
+    if (token !== this.token) {
+      // Cached representations belong to the previous identity
+      this.representations.clear();
+    }
     this.token = token;
     const defaults = this.client.defaults.headers.common as
       | AxiosHeaders
@@ -415,8 +428,30 @@ export class SecureApiClient {
   // HTTP Methods
   // ---------------------------------------------------------------------------
 
+  /**
+   * GET with conditional revalidation: a stored ETag is sent as If-None-Match and a 304
+   * is answered from the stored representation, reported with status 304.
+   */
   async get<TResponse>(url: string, config?: AxiosRequestConfig): Promise<ApiSuccessResponse<TResponse>> {
-    const response = await this.client.get<TResponse>(url, config);
+    const key = this.representationKey(url, config);
+    const cached = this.representations.get(key);
+    const requestConfig: AxiosRequestConfig | undefined = cached
+      ? {
+          ...config,
+          headers: { ...(config?.headers as Record<string, string> | undefined), 'If-None-Match': cached.etag },
+          validateStatus: (status) => (status >= 200 && status < 300) || status === 304,
+        }
+      : config;
+
+    const response = await this.client.get<TResponse>(url, requestConfig);
+    if (response.status === 304 && cached) {
+      // Re-insert to keep recently revalidated entries at the end of the eviction order
+      this.representations.delete(key);
+      this.representations.set(key, cached);
+      return this.wrapResponse({ ...response, data: cached.data as TResponse });
+    }
+
+    this.rememberRepresentation(key, response);
     return this.wrapResponse(response);
   }
 
@@ -452,6 +487,30 @@ export class SecureApiClient {
     return this.wrapResponse(response);
   }
 
+  // ---------------------------------------------------------------------------
+  // Conditional GET Support
+  // ---------------------------------------------------------------------------
+
+  private representationKey(url: string, config?: AxiosRequestConfig): string {
+    return config?.params ? `${url}|${JSON.stringify(config.params)}` : url;
+  }
+
+  private rememberRepresentation<T>(key: string, response: AxiosResponse<T>): void {
+    const etag = response.headers?.['etag'];
+    if (response.status !== 200 || typeof etag !== 'string' || etag.length === 0) {
+      this.representations.delete(key);
+      return;
+    }
+    this.representations.delete(key);
+    this.representations.set(key, { etag, data: response.data });
+    if (this.representations.size > MAX_CACHED_REPRESENTATIONS) {
+      const oldest = this.representations.keys().next().value;
+      if (oldest !== undefined) {
+        this.representations.delete(oldest);
+      }
+    }
+  }
+
   // ---------------------------------------------------------------------------
   // Response Wrapper
   // ---------------------------------------------------------------------------
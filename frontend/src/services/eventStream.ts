@@ -0,0 +1,173 @@
+/**
+ * Dashboard Event Stream
+ *
+ * Client for the server-sent event feed at /api/events/stream. EventSource cannot send the
+ * Authorization header, so the stream is read with fetch. A single connection is shared by all
+ * listeners and closed when the last one unsubscribes.
+ */
+
+import { secureApiClient } from './api-secure';
+import { secureLogger } from '../utils/secure-logger';
+
+export type DashboardEventType = 'timesheet-changed' | 'summary-invalidated';
+
+export interface DashboardEvent {
+  type: DashboardEventType;
+  data: Record<string, unknown>;
+}
+
+type EventListener = (event: DashboardEvent) => void;
+type StatusListener = (connected: boolean) => void;
+
+const STREAM_PATH = '/api/events/stream';
+const INITIAL_RETRY_MS = 5000;
+const MAX_RETRY_MS = 60000;
+
+class DashboardEventStream {
+  private listeners = new Set<EventListener>();
+  private statusListeners = new Set<StatusListener>();
+  private controller: AbortController | null = null;
+  private retryTimer: ReturnType<typeof setTimeout> | null = null;
+  private retryDelay = INITIAL_RETRY_MS;
+  private connected = false;
+
+  subscribe(listener: EventListener): () => void {
+    this.listeners.add(listener);
+    this.open();
+    return () => {
+      this.listeners.delete(listener);
+      if (this.listeners.size === 0) {
+        this.close();
+      }
+    };
+  }
+
+  onStatusChange(listener: StatusListener): () => void {
+    this.statusListeners.add(listener);
+    return () => {
+      this.statusListeners.delete(listener);
+    };
+  }
+
+  isConnected(): boolean {
+    return this.connected;
+  }
+
+  private open(): void {
+    if (this.controller || this.retryTimer || this.listeners.size === 0) {
+      return;
+    }
+    const token = secureApiClient.getAuthToken();
+    // Without a session or a streaming fetch, callers keep polling
+    if (!token || typeof fetch !== 'function' || typeof TextDecoder === 'undefined') {
+      return;
+    }
+
+    const controller = new AbortController();
+    this.controller = controller;
+    this.read(controller, token)
+      .catch((error: unknown) => {
+        if (!controller.signal.aborted) {
+          secureLogger.debug('Dashboard event stream failed', error);
+        }
+      })
+      .finally(() => {
+        if (this.controller === controller) {
+          this.controller = null;
+          this.setConnected(false);
+          this.scheduleReconnect();
+        }
+      });
+  }
+
+  private close(): void {
+    if (this.retryTimer) {
+      clearTimeout(this.retryTimer);
+      this.retryTimer = null;
+    }
+    const controller = this.controller;
+    this.controller = null;
+    controller?.abort();
+    this.retryDelay = INITIAL_RETRY_MS;
+    this.setConnected(false);
+  }
+
+  private scheduleReconnect(): void {
+    if (this.listeners.size === 0) {
+      return;
+    }
+    const delay = this.retryDelay;
+    this.retryDelay = Math.min(this.retryDelay * 2, MAX_RETRY_MS);
+    this.retryTimer = setTimeout(() => {
+      this.retryTimer = null;
+      this.open();
+    }, delay);
+  }
+
+  private async read(controller: AbortController, token: string): Promise<void> {
+    const baseURL = secureApiClient.getConfig().baseURL ?? '';
+    const response = await fetch(`${baseURL.replace(/\/$/, '')}${STREAM_PATH}`, {
+      headers: { Accept: 'text/event-stream', Authorization: `Bearer ${token}` },
+      signal: controller.signal,
+    });
+    if (!response.ok || !response.body) {
+      throw new Error(`Event stream rejected with status ${response.status}`);
+    }
+
+    this.retryDelay = INITIAL_RETRY_MS;
+    this.setConnected(true);
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    for (;;) {
+      const { value, done } = await reader.read();
+      if (done) {
+        return;
+      }
+      buffer += decoder.decode(value, { stream: true }).replace(/\r\n?/g, '\n');
+      let boundary = buffer.indexOf('\n\n');
+      while (boundary >= 0) {
+        this.dispatch(buffer.slice(0, boundary));
+        buffer = buffer.slice(boundary + 2);
+        boundary = buffer.indexOf('\n\n');
+      }
+    }
+  }
+
+  private dispatch(frame: string): void {
+    let type = '';
+    const dataLines: string[] = [];
+    for (const line of frame.split('\n')) {
+      if (line.startsWith('event:')) {
+        type = line.slice(6).trim();
+      } else if (line.startsWith('data:')) {
+        dataLines.push(line.slice(5).trimStart());
+      }
+    }
+    if (type !== 'timesheet-changed' && type !== 'summary-invalidated') {
+      return;
+    }
+
+    let data: Record<string, unknown> = {};
+    try {
+      data = dataLines.length > 0 ? JSON.parse(dataLines.join('\n')) : {};
+    } catch {
+      // Payload is advisory; the type alone is enough to refetch
+    }
+    const event: DashboardEvent = { type, data };
+    this.listeners.forEach((listener) => listener(event));
+  }
+
+  private setConnected(connected: boolean): void {
+    if (this.connected === connected) {
+      return;
+    }
+    this.connected = connected;
+    this.statusListeners.forEach((listener) => listener(connected));
+  }
+}
+
+export const dashboardEventStream = new DashboardEventStream();
+
+export default dashboardEventStream;
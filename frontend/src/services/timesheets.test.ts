@@ -360,38 +360,57 @@ describe('TimesheetService Approval Operations', () => {
   });
 
   describe('batchApproveTimesheets', () => {
-    it('should batch approve multiple timesheets', async () => {
+    it('should send one batch request per action', async () => {
       const approvalRequests: ApprovalRequest[] = [
         { timesheetId: 1, action: 'FINAL_APPROVAL' },
         { timesheetId: 2, action: 'FINAL_APPROVAL' },
         { timesheetId: 3, action: 'FINAL_APPROVAL' }
       ];
 
-      const approvalResponse = {
+      const results = [1, 2, 3].map((timesheetId) => ({
+        timesheetId,
         success: true,
-        message: 'Timesheet approved successfully'
-      };
-
-      mockApiClient.post.mockResolvedValue(createMockApiResponse(approvalResponse));
-
-      const results = await TimesheetService.batchApproveTimesheets(approvalRequests);
-
-      expect(mockApiClient.post).toHaveBeenCalledTimes(3);
-      const approvalPayloads = mockApiClient.post.mock.calls.map(([, payload]) => payload as ApprovalRequest);
-      approvalPayloads.forEach((payload: ApprovalRequest) => expect(payload.action).toBe('HR_CONFIRM'));
-      expect(results).toHaveLength(3);
-      expect(results[0]).toEqual(approvalResponse);
+        previousStatus: 'LECTURER_CONFIRMED',
+        newStatus: 'FINAL_CONFIRMED',
+        message: 'Timesheet moved from LECTURER_CONFIRMED to FINAL_CONFIRMED'
+      }));
+
+      mockApiClient.post.mockResolvedValue(createMockApiResponse({
+        action: 'HR_CONFIRM',
+        totalCount: 3,
+        succeededCount: 3,
+        failedCount: 0,
+        results
+      }));
+
+      const responses = await TimesheetService.batchApproveTimesheets(approvalRequests);
+
+      expect(mockApiClient.post).toHaveBeenCalledTimes(1);
+      expect(mockApiClient.post).toHaveBeenCalledWith('/api/approvals/batch', {
+        action: 'HR_CONFIRM',
+        comment: null,
+        timesheetIds: [1, 2, 3]
+      });
+      expect(responses).toHaveLength(3);
+      expect(responses[0]).toEqual(results[0]);
     });
 
-    it('should handle partial failures in batch approval', async () => {
+    it('should reject when any item in the batch fails', async () => {
       const approvalRequests: ApprovalRequest[] = [
         { timesheetId: 1, action: 'FINAL_APPROVAL' },
         { timesheetId: 2, action: 'FINAL_APPROVAL' }
       ];
 
-      mockApiClient.post
-        .mockResolvedValueOnce(createMockApiResponse({ success: true, message: 'Approved' }))
-        .mockRejectedValueOnce(new Error('Approval failed'));
+      mockApiClient.post.mockResolvedValueOnce(createMockApiResponse({
+        action: 'HR_CONFIRM',
+        totalCount: 2,
+        succeededCount: 1,
+        failedCount: 1,
+        results: [
+          { timesheetId: 1, success: true, previousStatus: 'LECTURER_CONFIRMED', newStatus: 'FINAL_CONFIRMED', message: 'Approved' },
+          { timesheetId: 2, success: false, previousStatus: 'DRAFT', newStatus: 'DRAFT', message: 'Approval failed' }
+        ]
+      }));
 
       await expect(TimesheetService.batchApproveTimesheets(approvalRequests)).rejects.toThrow('Approval failed');
     });
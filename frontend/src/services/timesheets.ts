@@ -16,6 +16,8 @@ import type {
   TimesheetQuoteResponse,
   ApprovalRequest,
   ApprovalResponse,
+  ApprovalBatchItemResult,
+  ApprovalBatchResponse,
   DashboardSummary,
 } from '../types/api';
 
@@ -310,10 +312,45 @@ export class TimesheetService {
 
   /**
    * Batch approve multiple timesheets
+   *
+   * Requests sharing an action and comment go to the server in one batch call, which applies
+   * them in a single transaction. Rejects when any item fails; the error carries every
+   * per-item result as `batchResults` since the successful items are already applied.
    */
   static async batchApproveTimesheets(requests: ApprovalRequest[]): Promise<ApprovalResponse[]> {
-    const promises = requests.map(request => this.approveTimesheet(request));
-    return Promise.all(promises);
+    const { API_ENDPOINTS } = await import('../types/api');
+    const groups = new Map<string, { action: ApiApprovalAction; comment: string | null; timesheetIds: number[] }>();
+    for (const request of requests) {
+      const action = normalizeApprovalAction(request.action);
+      const comment = request.comment ?? null;
+      const key = JSON.stringify([action, comment]);
+      const group = groups.get(key) ?? { action, comment, timesheetIds: [] };
+      group.timesheetIds.push(request.timesheetId);
+      groups.set(key, group);
+    }
+
+    const batches = await Promise.all(
+      Array.from(groups.values()).map(async (payload) => {
+        const response = await secureApiClient.post<ApprovalBatchResponse>(API_ENDPOINTS.APPROVALS.BATCH, payload);
+        return response.data.results ?? [];
+      }),
+    );
+
+    const byId = new Map<number, ApprovalBatchItemResult>();
+    batches.flat().forEach((result) => byId.set(result.timesheetId, result));
+    const results = requests
+      .map((request) => byId.get(request.timesheetId))
+      .filter((result): result is ApprovalBatchItemResult => result !== undefined);
+
+    const failures = results.filter((result) => !result.success);
+    if (failures.length > 0) {
+      const detail = failures.map((failure) => `#${failure.timesheetId}: ${failure.message}`).join('; ');
+      throw Object.assign(
+        new Error(`${failures.length} of ${results.length} approvals failed (${detail})`),
+        { batchResults: results },
+      );
+    }
+    return results;
   }
 
   // ---------------------------------------------------------------------------
@@ -256,6 +256,18 @@ export interface ApprovalResponse {
   newStatus: TimesheetStatus;
 }
 
+export interface ApprovalBatchItemResult extends ApprovalResponse {
+  previousStatus: TimesheetStatus | null;
+}
+
+export interface ApprovalBatchResponse {
+  action: ApprovalAction;
+  totalCount: number;
+  succeededCount: number;
+  failedCount: number;
+  results: ApprovalBatchItemResult[];
+}
+
 // =============================================================================
 // API Response & Error Types
 // =============================================================================
@@ -445,6 +457,7 @@ export const API_ENDPOINTS = {
   APPROVALS: {
     PENDING: '/api/approvals/pending',
     HISTORY: (timesheetId: number) => `/api/approvals/history/${timesheetId}`,
+    BATCH: '/api/approvals/batch',
   },
   HEALTH: '/api/health'
 } as const;
@@ -1,30 +1,53 @@
 package com.usyd.catams.application;
 
+import com.usyd.catams.common.application.RequestEntityCache;
 import com.usyd.catams.common.domain.event.TimesheetEvent;
 import com.usyd.catams.common.infrastructure.event.DomainEventPublisher;
 import com.usyd.catams.domain.service.ApprovalDomainService;
 import com.usyd.catams.dto.response.ApprovalActionResponse;
+import com.usyd.catams.dto.response.ApprovalBatchResponse;
 import com.usyd.catams.entity.Approval;
 import com.usyd.catams.entity.Course;
 import com.usyd.catams.entity.Timesheet;
+import com.usyd.catams.entity.TutorAssignment;
 import com.usyd.catams.entity.User;
 import com.usyd.catams.enums.ApprovalAction;
 import com.usyd.catams.enums.ApprovalStatus;
+import com.usyd.catams.enums.UserRole;
+import com.usyd.catams.exception.AuthorizationException;
+import com.usyd.catams.exception.BusinessConflictException;
+import com.usyd.catams.exception.BusinessRuleException;
+import com.usyd.catams.exception.ErrorCodes;
 import com.usyd.catams.exception.ResourceNotFoundException;
 import com.usyd.catams.repository.CourseRepository;
 import com.usyd.catams.repository.TimesheetRepository;
+import com.usyd.catams.repository.TimesheetSpecifications;
 import com.usyd.catams.repository.TutorAssignmentRepository;
 import com.usyd.catams.repository.UserRepository;
 import com.usyd.catams.service.ApprovalService;
+import com.usyd.catams.service.TimesheetWeeklyRollupService;
 import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.data.domain.Page;
+import org.springframework.data.domain.PageImpl;
+import org.springframework.data.domain.PageRequest;
+import org.springframework.data.domain.Pageable;
+import org.springframework.data.domain.Sort;
 import org.springframework.security.access.prepost.PreAuthorize;
 import org.springframework.stereotype.Service;
 import org.springframework.transaction.annotation.Transactional;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
 
+import java.util.ArrayList;
+import java.util.Comparator;
+import java.util.HashMap;
+import java.util.HashSet;
 import java.util.List;
+import java.util.Map;
+import java.util.Optional;
+import java.util.Set;
 import java.util.UUID;
+import java.util.function.Function;
 import java.util.stream.Collectors;
 
 /**
@@ -44,12 +67,17 @@ public class ApprovalApplicationService implements ApprovalService {
 
     private static final Logger logger = LoggerFactory.getLogger(ApprovalApplicationService.class);
 
+    // Approval queue: oldest first, id breaks ties (matches idx_timesheet_status_created)
+    private static final Sort PENDING_QUEUE_ORDER = Sort.by(Sort.Order.asc("createdAt"), Sort.Order.asc("id"));
+
     private final TimesheetRepository timesheetRepository;
     private final UserRepository userRepository;
     private final CourseRepository courseRepository;
     private final TutorAssignmentRepository tutorAssignmentRepository;
     private final ApprovalDomainService approvalDomainService;
     private final DomainEventPublisher eventPublisher;
+    private final TimesheetWeeklyRollupService weeklyRollupService;
+    private final RequestEntityCache requestEntityCache;
 
     @Autowired
     public ApprovalApplicationService(TimesheetRepository timesheetRepository,
@@ -57,13 +85,29 @@ public class ApprovalApplicationService implements ApprovalService {
                                     CourseRepository courseRepository,
                                     TutorAssignmentRepository tutorAssignmentRepository,
                                     ApprovalDomainService approvalDomainService,
-                                    DomainEventPublisher eventPublisher) {
+                                    DomainEventPublisher eventPublisher,
+                                    TimesheetWeeklyRollupService weeklyRollupService,
+                                    RequestEntityCache requestEntityCache) {
         this.timesheetRepository = timesheetRepository;
         this.userRepository = userRepository;
         this.courseRepository = courseRepository;
         this.tutorAssignmentRepository = tutorAssignmentRepository;
         this.approvalDomainService = approvalDomainService;
         this.eventPublisher = eventPublisher;
+        this.weeklyRollupService = weeklyRollupService;
+        // Null only in unit tests; lookups then go straight to the repositories
+        this.requestEntityCache = requestEntityCache;
+    }
+
+    // Backward-compatible constructor used by certain tests
+    public ApprovalApplicationService(TimesheetRepository timesheetRepository,
+                                    UserRepository userRepository,
+                                    CourseRepository courseRepository,
+                                    TutorAssignmentRepository tutorAssignmentRepository,
+                                    ApprovalDomainService approvalDomainService,
+                                    DomainEventPublisher eventPublisher) {
+        this(timesheetRepository, userRepository, courseRepository, tutorAssignmentRepository,
+            approvalDomainService, eventPublisher, null, null);
     }
 
     @Override
@@ -108,10 +152,15 @@ public class ApprovalApplicationService implements ApprovalService {
             ApprovalStatus nextStatus = approvalDomainService.resolveNextStatus(timesheet.getStatus(), action);
 
             // 4. Perform the action through the aggregate with pre-resolved transition
+            TimesheetWeeklyRollupService.Contribution rollupBefore =
+                weeklyRollupService != null ? weeklyRollupService.snapshot(timesheet) : null;
             Approval approval = timesheet.applyApprovalAction(requesterId, action, nextStatus, comment);
 
             // 5. Save the timesheet aggregate (which cascades to save approvals)
             timesheetRepository.save(timesheet);
+            if (weeklyRollupService != null) {
+                weeklyRollupService.recordChanged(rollupBefore, timesheet);
+            }
             
             // 6. Publish domain event for approval processed
             publishApprovalEvent(timesheet, approval, action, requesterId, comment);
@@ -130,6 +179,108 @@ public class ApprovalApplicationService implements ApprovalService {
         }
     }
 
+    @Override
+    @PreAuthorize("hasRole('TUTOR') or hasRole('LECTURER') or hasRole('ADMIN')")
+    public ApprovalBatchResponse performBatchApprovalAction(List<Long> timesheetIds, ApprovalAction action,
+                                                            String comment, Long requesterId) {
+        if (timesheetIds == null || timesheetIds.isEmpty()) {
+            throw new BusinessRuleException("Batch approval requires at least one timesheet", ErrorCodes.VALIDATION_FAILED);
+        }
+        if ((action == ApprovalAction.REJECT || action == ApprovalAction.REQUEST_MODIFICATION)
+            && (comment == null || comment.trim().isEmpty())) {
+            throw new BusinessRuleException("Comment is required for " + action, ErrorCodes.VALIDATION_FAILED);
+        }
+        logger.info("Batch approval requested: action={}, count={}, requesterId={}", action, timesheetIds.size(), requesterId);
+
+        // Shared lookups: one query each for the requester, the timesheets (with history), their courses
+        // and, for lecturers, the tutor assignments of those courses
+        User requester = findUserByIdOrThrow(requesterId);
+        List<Long> distinctIds = timesheetIds.stream().distinct().collect(Collectors.toList());
+        Map<Long, Timesheet> timesheets = timesheetRepository.findAllWithApprovalsByIdIn(distinctIds).stream()
+            .collect(Collectors.toMap(Timesheet::getId, Function.identity()));
+        List<Long> courseIds = timesheets.values().stream()
+            .map(Timesheet::getCourseId)
+            .distinct()
+            .collect(Collectors.toList());
+        Map<Long, Course> courses = courseRepository.findAllById(courseIds).stream()
+            .collect(Collectors.toMap(Course::getId, Function.identity()));
+        Map<Long, Set<Long>> tutorsByCourse = requester.getRole() == UserRole.LECTURER && !courseIds.isEmpty()
+            ? tutorAssignmentRepository.findByCourseIdIn(courseIds).stream()
+                .collect(Collectors.groupingBy(TutorAssignment::getCourseId,
+                    Collectors.mapping(TutorAssignment::getTutorId, Collectors.toSet())))
+            : Map.of();
+
+        Set<Long> processed = new HashSet<>();
+        TimesheetWeeklyRollupService.Batch rollup = weeklyRollupService != null ? weeklyRollupService.batch() : null;
+        List<ApprovalBatchResponse.ItemResult> results = new ArrayList<>(timesheetIds.size());
+        for (Long timesheetId : timesheetIds) {
+            Timesheet timesheet = timesheets.get(timesheetId);
+            if (timesheet == null) {
+                results.add(ApprovalBatchResponse.ItemResult.failed(timesheetId, null,
+                    "Timesheet not found with id: " + timesheetId));
+                continue;
+            }
+            if (!processed.add(timesheetId)) {
+                results.add(ApprovalBatchResponse.ItemResult.failed(timesheetId, timesheet.getStatus(),
+                    "Timesheet " + timesheetId + " appears more than once in the batch"));
+                continue;
+            }
+            try {
+                Approval approval = applyBatchItem(timesheet, action, comment, requester,
+                    courses.get(timesheet.getCourseId()), tutorsByCourse, rollup);
+                results.add(ApprovalBatchResponse.ItemResult.succeeded(
+                    timesheetId, approval.getPreviousStatus(), approval.getNewStatus()));
+            } catch (BusinessRuleException | BusinessConflictException | AuthorizationException
+                     | ResourceNotFoundException | IllegalArgumentException | IllegalStateException ex) {
+                logger.warn("Batch approval item rejected: action={}, timesheetId={}, type={}, message={}",
+                    action, timesheetId, ex.getClass().getSimpleName(), ex.getMessage());
+                results.add(ApprovalBatchResponse.ItemResult.failed(timesheetId, timesheet.getStatus(), ex.getMessage()));
+            }
+        }
+
+        // One flush writes every item's approval and status update as JDBC batches; the rollup's
+        // net change per (course, tutor, week, status) follows as a single upsert
+        timesheetRepository.flush();
+        if (rollup != null) {
+            weeklyRollupService.apply(rollup);
+        }
+
+        ApprovalBatchResponse response = new ApprovalBatchResponse(action, results);
+        logger.info("Batch approval finished: action={}, succeeded={}, failed={}, requesterId={}",
+            action, response.getSucceededCount(), response.getFailedCount(), requesterId);
+        return response;
+    }
+
+    /**
+     * Validate and apply one batch item against the pre-loaded lookups. All checks run before the
+     * aggregate is touched, so a rejected item leaves nothing to undo. The new approval rows and
+     * status updates are written together at flush as JDBC batches, and the item's rollup change
+     * is collected into {@code rollup} for the caller to apply once.
+     */
+    private Approval applyBatchItem(Timesheet timesheet, ApprovalAction action, String comment, User requester,
+                                    Course course, Map<Long, Set<Long>> tutorsByCourse,
+                                    TimesheetWeeklyRollupService.Batch rollup) {
+        if (course == null) {
+            throw new ResourceNotFoundException("Course", String.valueOf(timesheet.getCourseId()));
+        }
+        if (requester.getRole() == UserRole.LECTURER
+            && !tutorsByCourse.getOrDefault(timesheet.getCourseId(), Set.of()).contains(timesheet.getTutorId())) {
+            throw new AuthorizationException(
+                "Tutor " + timesheet.getTutorId() + " is not assigned to course " + timesheet.getCourseId());
+        }
+        approvalDomainService.validateApprovalActionBusinessRules(timesheet, action, requester, course);
+        ApprovalStatus nextStatus = approvalDomainService.resolveNextStatus(timesheet.getStatus(), action);
+
+        TimesheetWeeklyRollupService.Contribution rollupBefore =
+            rollup != null ? weeklyRollupService.snapshot(timesheet) : null;
+        Approval approval = timesheet.applyApprovalAction(requester.getId(), action, nextStatus, comment);
+        if (rollup != null) {
+            rollup.changed(rollupBefore, timesheet);
+        }
+        publishApprovalEvent(timesheet, approval, action, requester.getId(), comment);
+        return approval;
+    }
+
     @Override
     @Transactional(readOnly = true)
     public List<Approval> getApprovalHistory(Long timesheetId, Long requesterId) {
@@ -153,27 +304,39 @@ public class ApprovalApplicationService implements ApprovalService {
     @Override
     @Transactional(readOnly = true)
     public List<Timesheet> getPendingApprovalsForUser(Long approverId) {
+        return getPendingApprovalsForUser(approverId, Pageable.unpaged()).getContent();
+    }
+
+    @Override
+    @Transactional(readOnly = true)
+    public Page<Timesheet> getPendingApprovalsForUser(Long approverId, Pageable pageable) {
         
         User approver = findUserByIdOrThrow(approverId);
 
         // Get relevant statuses from domain service
         List<ApprovalStatus> relevantStatuses = approvalDomainService.getRelevantStatusesForRole(approver.getRole());
+        if (relevantStatuses.isEmpty()) {
+            return Page.empty(pageable);
+        }
 
-        // Get timesheets that are in relevant pending states and that this user can act on
-        return timesheetRepository.findByStatusIn(relevantStatuses).stream()
-            .filter(timesheet -> approvalDomainService.canUserActOnTimesheet(
-                timesheet, approver, findCourseByIdOrThrow(timesheet.getCourseId())))
-            .collect(Collectors.toList());
+        // Eligibility is pushed into SQL; page the IDs oldest first, then load that page with approvals
+        Pageable ordered = pageable.isPaged()
+            ? PageRequest.of(pageable.getPageNumber(), pageable.getPageSize(), PENDING_QUEUE_ORDER)
+            : Pageable.unpaged(PENDING_QUEUE_ORDER);
+        Page<Long> ids = timesheetRepository.findIds(
+            TimesheetSpecifications.pendingApprovalFor(approver.getRole(), approver.getId(), relevantStatuses),
+            ordered);
+        return new PageImpl<>(loadWithApprovalsInOrder(ids.getContent()), pageable, ids.getTotalElements());
     }
 
     @Override
     @Transactional(readOnly = true)
     public boolean canUserPerformAction(Timesheet timesheet, ApprovalAction action, Long requesterId) {
-        User requester = userRepository.findById(requesterId).orElse(null);
+        User requester = findUser(requesterId).orElse(null);
         if (requester == null) {
             return false;
         }
-        Course course = courseRepository.findById(timesheet.getCourseId()).orElse(null);
+        Course course = findCourse(timesheet.getCourseId()).orElse(null);
         if (course == null) {
             return false;
         }
@@ -314,18 +477,43 @@ public class ApprovalApplicationService implements ApprovalService {
         eventPublisher.publish(event);
     }
 
+    private List<Timesheet> loadWithApprovalsInOrder(List<Long> ids) {
+        if (ids.isEmpty()) {
+            return List.of();
+        }
+        Map<Long, Integer> position = new HashMap<>();
+        for (int i = 0; i < ids.size(); i++) {
+            position.put(ids.get(i), i);
+        }
+        List<Timesheet> timesheets = new ArrayList<>(timesheetRepository.findAllWithApprovalsByIdIn(ids));
+        timesheets.sort(Comparator.comparing(t -> position.get(t.getId())));
+        return timesheets;
+    }
+
     private Timesheet findTimesheetByIdOrThrow(Long timesheetId) {
         return timesheetRepository.findById(timesheetId)
             .orElseThrow(() -> new ResourceNotFoundException("Timesheet", String.valueOf(timesheetId)));
     }
 
     private User findUserByIdOrThrow(Long userId) {
-        return userRepository.findById(userId)
+        return findUser(userId)
             .orElseThrow(() -> new ResourceNotFoundException("User", String.valueOf(userId)));
     }
 
     private Course findCourseByIdOrThrow(Long courseId) {
-        return courseRepository.findById(courseId)
+        return findCourse(courseId)
             .orElseThrow(() -> new ResourceNotFoundException("Course", String.valueOf(courseId)));
     }
+
+    private Optional<User> findUser(Long userId) {
+        return requestEntityCache == null
+            ? userRepository.findById(userId)
+            : requestEntityCache.findUser(userId, userRepository::findById);
+    }
+
+    private Optional<Course> findCourse(Long courseId) {
+        return requestEntityCache == null
+            ? courseRepository.findById(courseId)
+            : requestEntityCache.findCourse(courseId, courseRepository::findById);
+    }
 }
@@ -1,7 +1,13 @@
 package com.usyd.catams.application;
 
+import com.usyd.catams.common.application.RequestEntityCache;
+import com.usyd.catams.common.domain.event.TimesheetEvent;
+import com.usyd.catams.common.infrastructure.event.DomainEventPublisher;
 import com.usyd.catams.domain.service.TimesheetDomainService;
 import com.usyd.catams.domain.service.TimesheetValidationService;
+import com.usyd.catams.dto.TimesheetCursor;
+import com.usyd.catams.dto.TutorialRepeatKey;
+import com.usyd.catams.dto.TutorialSessionDates;
 import com.usyd.catams.dto.response.PagedTimesheetResponse;
 import com.usyd.catams.dto.response.TimesheetResponse;
 import com.usyd.catams.entity.Course;
@@ -16,21 +22,37 @@ import com.usyd.catams.exception.ResourceNotFoundException;
 import com.usyd.catams.policy.TimesheetPermissionPolicy;
 import com.usyd.catams.repository.CourseRepository;
 import com.usyd.catams.repository.TimesheetRepository;
+import com.usyd.catams.repository.TimesheetSpecifications;
 import com.usyd.catams.repository.UserRepository;
 import com.usyd.catams.service.TimesheetApplicationFacade;
 import org.hibernate.Hibernate;
 import org.springframework.beans.factory.annotation.Autowired;
 import org.springframework.data.domain.Page;
+import org.springframework.data.domain.PageImpl;
+import org.springframework.data.domain.PageRequest;
 import org.springframework.data.domain.Pageable;
+import org.springframework.data.domain.Sort;
+import org.springframework.data.jpa.domain.Specification;
 import org.springframework.security.access.prepost.PreAuthorize;
 import org.springframework.stereotype.Service;
 import org.springframework.transaction.annotation.Transactional;
 
 import java.math.BigDecimal;
 import java.time.LocalDate;
+import java.util.ArrayList;
+import java.util.Collection;
+import java.util.Comparator;
+import java.util.HashMap;
+import java.util.HashSet;
 import java.util.List;
+import java.util.Map;
+import java.util.NavigableSet;
 import java.util.Objects;
 import java.util.Optional;
+import java.util.Set;
+import java.util.TreeSet;
+import java.util.UUID;
+import java.util.stream.Collectors;
 
 /**
  * Primary application service for timesheet business operations with comprehensive authorization and validation.
@@ -100,6 +122,10 @@ public class TimesheetApplicationService implements TimesheetApplicationFacade,
     private final TimesheetMapper timesheetMapper;
     private final com.usyd.catams.service.Schedule1PolicyProvider policyProvider;
     private final TimesheetPermissionPolicy permissionPolicy;
+    private final com.usyd.catams.service.TimesheetWeeklyRollupService weeklyRollupService;
+    private final RequestEntityCache requestEntityCache;
+    private final DomainEventPublisher eventPublisher;
+    private final com.usyd.catams.service.CourseScopeCache courseScopeCache;
 
     @Autowired
     public TimesheetApplicationService(TimesheetRepository timesheetRepository,
@@ -110,7 +136,11 @@ public class TimesheetApplicationService implements TimesheetApplicationFacade,
                                           TimesheetMapper timesheetMapper,
                                           TimesheetPermissionPolicy permissionPolicy,
                                           com.usyd.catams.repository.TutorAssignmentRepository tutorAssignmentRepository,
-                                          com.usyd.catams.service.Schedule1PolicyProvider policyProvider) {
+                                          com.usyd.catams.service.Schedule1PolicyProvider policyProvider,
+                                          com.usyd.catams.service.TimesheetWeeklyRollupService weeklyRollupService,
+                                          RequestEntityCache requestEntityCache,
+                                          DomainEventPublisher eventPublisher,
+                                          com.usyd.catams.service.CourseScopeCache courseScopeCache) {
         this.timesheetRepository = timesheetRepository;
         this.userRepository = userRepository;
         this.courseRepository = courseRepository;
@@ -121,6 +151,14 @@ public class TimesheetApplicationService implements TimesheetApplicationFacade,
         this.permissionPolicy = permissionPolicy;
         this.tutorAssignmentRepository = tutorAssignmentRepository;
         this.policyProvider = policyProvider;
+        // Null only in unit tests that construct the service without the rollup
+        this.weeklyRollupService = weeklyRollupService;
+        // Null only in unit tests; lookups then go straight to the repositories
+        this.requestEntityCache = requestEntityCache;
+        // Null only in unit tests that do not observe domain events
+        this.eventPublisher = eventPublisher;
+        // Null only in unit tests; assignment checks then go straight to the repository
+        this.courseScopeCache = courseScopeCache;
     }
 
     private final com.usyd.catams.repository.TutorAssignmentRepository tutorAssignmentRepository;
@@ -156,7 +194,7 @@ public class TimesheetApplicationService implements TimesheetApplicationFacade,
         // Enforce repeat tutorial eligibility window and same-content approximation
         if (taskType == TimesheetTaskType.TUTORIAL
                 && calculation.isRepeat()
-                && !isTutorialRepeatEligible(courseId, calculation.getSessionDate())) {
+                && !isTutorialRepeatEligible(courseId, calculation.getSessionDate(), description)) {
             int windowDays = getRepeatEligibilityWindowDays();
             throw new com.usyd.catams.exception.BusinessRuleException(
                 "Repeat Tutorial requires same content delivered within the last " + windowDays + " days to a different group.",
@@ -166,7 +204,9 @@ public class TimesheetApplicationService implements TimesheetApplicationFacade,
 
         // Enforce tutor-course assignment for visibility/authorization (ADMIN bypass)
         if (creator.getRole() != com.usyd.catams.enums.UserRole.ADMIN) {
-            boolean assigned = tutorAssignmentRepository.existsByTutorIdAndCourseId(tutorId, courseId);
+            boolean assigned = courseScopeCache != null
+                ? courseScopeCache.isTutorAssigned(tutorId, courseId)
+                : tutorAssignmentRepository.existsByTutorIdAndCourseId(tutorId, courseId);
             if (!assigned) {
                 throw new com.usyd.catams.exception.AuthorizationException(
                     "Tutor " + tutorId + " is not assigned to course " + courseId + ". Please assign via admin.");
@@ -182,6 +222,13 @@ public class TimesheetApplicationService implements TimesheetApplicationFacade,
         Timesheet timesheet = new Timesheet(tutorId, courseId, weekStartDate, payableHours, hourlyRate, sanitizedDescription, creatorId);
         applySchedule1Calculation(timesheet, calculation, taskType);
         Timesheet savedTimesheet = timesheetRepository.save(timesheet);
+        if (weeklyRollupService != null) {
+            weeklyRollupService.recordCreated(savedTimesheet);
+        }
+        publishEvent(new TimesheetEvent.TimesheetCreatedEvent(
+            savedTimesheet.getId().toString(), tutorId, courseId, savedTimesheet.getWeekStartDate(),
+            savedTimesheet.getHours(), savedTimesheet.getHourlyRate(), savedTimesheet.getDescription(),
+            creatorId.toString(), UUID.randomUUID().toString()));
         
         validateCreateTimesheetPostconditions(savedTimesheet, tutorId, courseId, creatorId, weekStartDate);
         
@@ -190,29 +237,75 @@ public class TimesheetApplicationService implements TimesheetApplicationFacade,
 
     @Override
     @Transactional(readOnly = true)
-    public boolean isTutorialRepeatEligible(Long courseId, LocalDate sessionDate) {
+    public boolean isTutorialRepeatEligible(Long courseId, LocalDate sessionDate, String description) {
         Objects.requireNonNull(courseId, "courseId");
         Objects.requireNonNull(sessionDate, "sessionDate");
 
         int windowDays = getRepeatEligibilityWindowDays();
         LocalDate from = sessionDate.minusDays(windowDays);
         LocalDate to = sessionDate.minusDays(1);
-        long priorCount = timesheetRepository.countTutorialsForRepeatRule(
-            courseId,
-            from,
-            to,
-            null
-        );
+        long priorCount = timesheetRepository.countTutorialsForRepeatRule(courseId, from, to, description);
         return priorCount > 0;
     }
 
+    @Override
+    @Transactional(readOnly = true)
+    public Map<TutorialRepeatKey, Set<LocalDate>> findTutorialRepeatEligibleDates(
+            Map<TutorialRepeatKey, ? extends Collection<LocalDate>> sessionDatesByContent) {
+        Objects.requireNonNull(sessionDatesByContent, "sessionDatesByContent");
+        List<LocalDate> allDates = sessionDatesByContent.values().stream()
+            .flatMap(Collection::stream)
+            .toList();
+        if (allDates.isEmpty()) {
+            return Map.of();
+        }
+
+        int windowDays = getRepeatEligibilityWindowDays();
+        LocalDate earliest = allDates.stream().min(Comparator.naturalOrder()).orElseThrow();
+        LocalDate latest = allDates.stream().max(Comparator.naturalOrder()).orElseThrow();
+        Set<Long> courseIds = sessionDatesByContent.keySet().stream()
+            .map(TutorialRepeatKey::getCourseId)
+            .collect(Collectors.toSet());
+        Map<TutorialRepeatKey, NavigableSet<LocalDate>> priorDatesByContent = new HashMap<>();
+        for (TutorialSessionDates prior : timesheetRepository.findTutorialSessionDatesForRepeatRule(
+                courseIds, earliest.minusDays(windowDays), latest.minusDays(1))) {
+            // A prior tutorial counts for its own content and for content-agnostic checks of its course
+            for (TutorialRepeatKey key : List.of(new TutorialRepeatKey(prior.getCourseId(), null),
+                    new TutorialRepeatKey(prior.getCourseId(), prior.getDescriptionHash()))) {
+                NavigableSet<LocalDate> priorDates = priorDatesByContent.computeIfAbsent(key, k -> new TreeSet<>());
+                // A prior tutorial counts if either of its dates falls in the window
+                if (prior.getWeekStartDate() != null) {
+                    priorDates.add(prior.getWeekStartDate());
+                }
+                if (prior.getSessionDate() != null) {
+                    priorDates.add(prior.getSessionDate());
+                }
+            }
+        }
+
+        Map<TutorialRepeatKey, Set<LocalDate>> eligible = new HashMap<>();
+        sessionDatesByContent.forEach((key, sessionDates) -> {
+            NavigableSet<LocalDate> priorDates = priorDatesByContent.get(key);
+            if (priorDates == null) {
+                return;
+            }
+            for (LocalDate sessionDate : sessionDates) {
+                LocalDate firstInWindow = priorDates.ceiling(sessionDate.minusDays(windowDays));
+                if (firstInWindow != null && firstInWindow.isBefore(sessionDate)) {
+                    eligible.computeIfAbsent(key, k -> new HashSet<>()).add(sessionDate);
+                }
+            }
+        });
+        return eligible;
+    }
+
     private int getRepeatEligibilityWindowDays() {
         return policyProvider.getRepeatEligibilityWindowDays();
     }
 
-    private void applySchedule1Calculation(Timesheet timesheet,
-                                           Schedule1CalculationResult calculation,
-                                           TimesheetTaskType taskType) {
+    static void applySchedule1Calculation(Timesheet timesheet,
+                                          Schedule1CalculationResult calculation,
+                                          TimesheetTaskType taskType) {
         TimesheetTaskType resolvedTaskType = taskType != null ? taskType : TimesheetTaskType.OTHER;
         timesheet.setTaskType(resolvedTaskType);
         timesheet.setRepeat(calculation.isRepeat());
@@ -270,20 +363,17 @@ public class TimesheetApplicationService implements TimesheetApplicationFacade,
             throw new com.usyd.catams.exception.AuthorizationException("User " + requester.getId() + " (" + requester.getRole() + ") is not authorized to view timesheets with the specified filters");
         }
 
-        // Apply role-specific filtering
+        // Apply role-specific filtering; specifications emit only the filters that are set
         switch (requester.getRole()) {
             case ADMIN:
-                return timesheetRepository.findWithFilters(tutorId, courseId, status, pageable);
+                return findPage(TimesheetSpecifications.withFilters(tutorId, courseId, status), pageable);
                 
             case LECTURER:
-                if (courseId != null) {
-                    return timesheetRepository.findWithLecturerScopeByCourse(requester.getId(), courseId, status, pageable);
-                }
-                return timesheetRepository.findWithLecturerScope(requester.getId(), status, pageable);
+                return findPage(TimesheetSpecifications.withLecturerScope(requester.getId(), courseId, status), pageable);
                 
             case TUTOR:
                 // TUTOR can only see their own timesheets, so force tutorId to be their own
-                return timesheetRepository.findWithFilters(requester.getId(), courseId, status, pageable);
+                return findPage(TimesheetSpecifications.withFilters(requester.getId(), courseId, status), pageable);
                 
             default:
                 throw new com.usyd.catams.exception.AuthorizationException("Unknown user role: " + requester.getRole());
@@ -408,13 +498,27 @@ public class TimesheetApplicationService implements TimesheetApplicationFacade,
         LocalDate sessionDate = calculation.getSessionDate();
         timesheetValidationService.validateMonday(sessionDate, "sessionDate");
 
+        com.usyd.catams.service.TimesheetWeeklyRollupService.Contribution rollupBefore =
+            weeklyRollupService != null ? weeklyRollupService.snapshot(timesheet) : null;
+        BigDecimal previousHours = timesheet.getHours();
+        String previousDescription = timesheet.getDescription();
+
         timesheet.setDescription(description);
         applySchedule1Calculation(timesheet, calculation, taskType);
         
         ApprovalStatus newStatus = timesheetDomainService.getStatusAfterTutorUpdate(timesheet.getStatus());
         timesheet.setStatus(newStatus);
         
-        return timesheetRepository.save(timesheet);
+        Timesheet savedTimesheet = timesheetRepository.save(timesheet);
+        if (weeklyRollupService != null) {
+            weeklyRollupService.recordChanged(rollupBefore, savedTimesheet);
+        }
+        publishEvent(new TimesheetEvent.TimesheetUpdatedEvent(
+            savedTimesheet.getId().toString(), savedTimesheet.getTutorId(), savedTimesheet.getCourseId(),
+            savedTimesheet.getWeekStartDate(), previousHours, savedTimesheet.getHours(),
+            previousDescription, savedTimesheet.getDescription(),
+            requesterId.toString(), UUID.randomUUID().toString()));
+        return savedTimesheet;
     }
 
     @Override
@@ -436,6 +540,13 @@ public class TimesheetApplicationService implements TimesheetApplicationFacade,
         }
 
         timesheetRepository.delete(timesheet);
+        if (weeklyRollupService != null) {
+            weeklyRollupService.recordDeleted(timesheet);
+        }
+        publishEvent(new TimesheetEvent.TimesheetDeletedEvent(
+            timesheetId.toString(), timesheet.getTutorId(), timesheet.getCourseId(), timesheet.getWeekStartDate(),
+            timesheet.getStatus(), timesheet.getHours(), timesheet.getHourlyRate(), null,
+            requesterId.toString(), UUID.randomUUID().toString()));
     }
 
     @Override
@@ -464,12 +575,14 @@ public class TimesheetApplicationService implements TimesheetApplicationFacade,
 
         switch (requester.getRole()) {
             case TUTOR:
-                return timesheetRepository.findByStatusAndTutorIdOrderByCreatedAtAsc(
-                    ApprovalStatus.PENDING_TUTOR_CONFIRMATION, requester.getId(), pageable);
+                return findPage(
+                    TimesheetSpecifications.withFilters(requester.getId(), null, ApprovalStatus.PENDING_TUTOR_CONFIRMATION),
+                    orderedBy(pageable, Sort.by(Sort.Direction.ASC, "createdAt")));
                 
             case ADMIN:
-                return timesheetRepository.findByStatusOrderByCreatedAtAsc(
-                    ApprovalStatus.PENDING_TUTOR_CONFIRMATION, pageable);
+                return findPage(
+                    TimesheetSpecifications.hasStatus(ApprovalStatus.PENDING_TUTOR_CONFIRMATION),
+                    orderedBy(pageable, Sort.by(Sort.Direction.ASC, "createdAt")));
                 
             default:
                 throw new com.usyd.catams.exception.AuthorizationException("Unknown user role: " + requester.getRole());
@@ -483,7 +596,8 @@ public class TimesheetApplicationService implements TimesheetApplicationFacade,
         
         validateTutorRole(tutor);
         
-        return timesheetRepository.findByTutorIdOrderByCreatedAtDesc(tutorId, pageable);
+        return findPage(TimesheetSpecifications.hasTutor(tutorId),
+            orderedBy(pageable, Sort.by(Sort.Direction.DESC, "createdAt")));
     }
 
     @Override
@@ -570,9 +684,11 @@ public class TimesheetApplicationService implements TimesheetApplicationFacade,
 
         switch (requester.getRole()) {
             case LECTURER:
-                return timesheetRepository.findApprovedByTutorByCoursesWithAssignment(requester.getId(), pageable);
+                return findPage(
+                    TimesheetSpecifications.withLecturerScope(requester.getId(), null, ApprovalStatus.TUTOR_CONFIRMED),
+                    pageable);
             case ADMIN:
-                return timesheetRepository.findByStatus(ApprovalStatus.LECTURER_CONFIRMED, pageable);
+                return findPage(TimesheetSpecifications.hasStatus(ApprovalStatus.LECTURER_CONFIRMED), pageable);
             default:
                 throw new com.usyd.catams.exception.AuthorizationException("Unknown user role: " + requester.getRole());
         }
@@ -584,6 +700,128 @@ public class TimesheetApplicationService implements TimesheetApplicationFacade,
         return timesheetMapper.toPagedResponse(page);
     }
 
+    // ==================== Keyset (cursor) pagination ====================
+
+    @Override
+    @Transactional(readOnly = true)
+    public PagedTimesheetResponse getTimesheetsAfterCursorAsDto(Long tutorId, Long courseId, ApprovalStatus status,
+                                                                Long requesterId, String after, int size) {
+        User requester = findUserByIdOrThrow(requesterId, "User");
+
+        if (!permissionPolicy.canViewTimesheetsByFilters(requester, tutorId, courseId, status)) {
+            throw new com.usyd.catams.exception.AuthorizationException("User " + requester.getId() + " (" + requester.getRole() + ") is not authorized to view timesheets with the specified filters");
+        }
+
+        TimesheetCursor cursor = TimesheetCursor.decode(after, true);
+        Pageable limit = PageRequest.of(0, size + 1);
+        List<Long> ids;
+        switch (requester.getRole()) {
+            case ADMIN:
+                ids = timesheetRepository.findIdsWithFiltersBefore(tutorId, courseId, status,
+                    cursor.getCreatedAt(), cursor.getId(), limit);
+                break;
+            case LECTURER:
+                ids = timesheetRepository.findIdsWithLecturerScopeBefore(requester.getId(), courseId, status,
+                    cursor.getCreatedAt(), cursor.getId(), limit);
+                break;
+            case TUTOR:
+                // TUTOR can only see their own timesheets, so force tutorId to be their own
+                ids = timesheetRepository.findIdsWithFiltersBefore(requester.getId(), courseId, status,
+                    cursor.getCreatedAt(), cursor.getId(), limit);
+                break;
+            default:
+                throw new com.usyd.catams.exception.AuthorizationException("Unknown user role: " + requester.getRole());
+        }
+        return toCursorPage(ids, size, after);
+    }
+
+    @Override
+    @Transactional(readOnly = true)
+    public PagedTimesheetResponse getTimesheetsByTutorAfterCursorAsDto(Long tutorId, String after, int size) {
+        User tutor = findUserByIdOrThrow(tutorId, "User");
+
+        validateTutorRole(tutor);
+
+        TimesheetCursor cursor = TimesheetCursor.decode(after, true);
+        List<Long> ids = timesheetRepository.findIdsWithFiltersBefore(tutorId, null, null,
+            cursor.getCreatedAt(), cursor.getId(), PageRequest.of(0, size + 1));
+        return toCursorPage(ids, size, after);
+    }
+
+    @Override
+    @Transactional(readOnly = true)
+    public PagedTimesheetResponse getLecturerFinalApprovalQueueAfterCursorAsDto(Long requesterId, String after, int size) {
+        User requester = findUserByIdOrThrow(requesterId, "User");
+
+        if (!permissionPolicy.canViewLecturerFinalApprovalQueue(requester)) {
+            throw new com.usyd.catams.exception.AuthorizationException("User " + requester.getId() + " (" + requester.getRole() + ") cannot access lecturer final approval queue");
+        }
+
+        TimesheetCursor cursor = TimesheetCursor.decode(after, false);
+        Pageable limit = PageRequest.of(0, size + 1);
+        List<Long> ids;
+        switch (requester.getRole()) {
+            case LECTURER:
+                ids = timesheetRepository.findIdsApprovedByTutorByCoursesWithAssignmentAfter(requester.getId(),
+                    cursor.getCreatedAt(), cursor.getId(), limit);
+                break;
+            case ADMIN:
+                ids = timesheetRepository.findIdsWithFiltersAfter(null, null, ApprovalStatus.LECTURER_CONFIRMED,
+                    cursor.getCreatedAt(), cursor.getId(), limit);
+                break;
+            default:
+                throw new com.usyd.catams.exception.AuthorizationException("Unknown user role: " + requester.getRole());
+        }
+        return toCursorPage(ids, size, after);
+    }
+
+    /**
+     * Turn a keyset ID window (fetched with one extra row to detect a following page) into a
+     * response, loading the page's timesheets and approvals in a single query.
+     */
+    private PagedTimesheetResponse toCursorPage(List<Long> ids, int size, String after) {
+        boolean hasNext = ids.size() > size;
+        List<Timesheet> timesheets = loadWithApprovalsInOrder(hasNext ? ids.subList(0, size) : ids);
+
+        String nextCursor = hasNext && !timesheets.isEmpty()
+            ? TimesheetCursor.after(timesheets.get(timesheets.size() - 1)).encode()
+            : null;
+        boolean first = after == null || after.isBlank();
+        return PagedTimesheetResponse.cursorPage(timesheetMapper.toResponseList(timesheets), size, first, nextCursor);
+    }
+
+    // ==================== Two-phase (ID-first) paging ====================
+    // Paging an approvals fetch directly makes Hibernate paginate in memory over every matching
+    // row. Page the IDs in SQL, then fetch just that page with its approvals.
+
+    private Page<Timesheet> findPage(Specification<Timesheet> spec, Pageable pageable) {
+        Page<Long> ids = timesheetRepository.findIds(spec, pageable);
+        return new PageImpl<>(loadWithApprovalsInOrder(ids.getContent()), pageable, ids.getTotalElements());
+    }
+
+    private List<Timesheet> loadWithApprovalsInOrder(List<Long> ids) {
+        List<Timesheet> timesheets = new ArrayList<>();
+        if (ids.isEmpty()) {
+            return timesheets;
+        }
+        Map<Long, Integer> position = new HashMap<>();
+        for (int i = 0; i < ids.size(); i++) {
+            position.put(ids.get(i), i);
+        }
+        timesheets.addAll(timesheetRepository.findAllWithApprovalsByIdIn(ids));
+        timesheets.sort(Comparator.comparing(t -> position.get(t.getId())));
+        return timesheets;
+    }
+
+    /**
+     * Fixed queue ordering first, then any sort requested by the caller.
+     */
+    private static Pageable orderedBy(Pageable pageable, Sort order) {
+        return pageable.isPaged()
+            ? PageRequest.of(pageable.getPageNumber(), pageable.getPageSize(), order.and(pageable.getSort()))
+            : pageable;
+    }
+
     private void validateCreateTimesheetPreconditions(Long tutorId, Long courseId, LocalDate weekStartDate,
                                                     BigDecimal hours, BigDecimal hourlyRate, String description, 
                                                     Long creatorId) {
@@ -610,14 +848,24 @@ public class TimesheetApplicationService implements TimesheetApplicationFacade,
         timesheetValidationService.validateDescription(description);
     }
 
+    private void publishEvent(TimesheetEvent event) {
+        if (eventPublisher != null) {
+            eventPublisher.publish(event);
+        }
+    }
+
     private User findUserByIdOrThrow(Long userId, String errorMessage) {
-        return userRepository.findById(userId)
-            .orElseThrow(() -> new ResourceNotFoundException(errorMessage, String.valueOf(userId)));
+        Optional<User> user = requestEntityCache == null
+            ? userRepository.findById(userId)
+            : requestEntityCache.findUser(userId, userRepository::findById);
+        return user.orElseThrow(() -> new ResourceNotFoundException(errorMessage, String.valueOf(userId)));
     }
 
     private Course findCourseByIdOrThrow(Long courseId, String errorMessage) {
-        return courseRepository.findById(courseId)
-            .orElseThrow(() -> new ResourceNotFoundException(errorMessage, String.valueOf(courseId)));
+        Optional<Course> course = requestEntityCache == null
+            ? courseRepository.findById(courseId)
+            : requestEntityCache.findCourse(courseId, courseRepository::findById);
+        return course.orElseThrow(() -> new ResourceNotFoundException(errorMessage, String.valueOf(courseId)));
     }
 
 
@@ -0,0 +1,407 @@
+package com.usyd.catams.application;
+
+import com.usyd.catams.common.domain.event.CourseEvent;
+import com.usyd.catams.common.infrastructure.event.DomainEventPublisher;
+import com.usyd.catams.domain.service.TimesheetDomainService;
+import com.usyd.catams.domain.service.TimesheetValidationService;
+import com.usyd.catams.dto.TimesheetWeekKey;
+import com.usyd.catams.dto.TutorialRepeatKey;
+import com.usyd.catams.dto.request.TimesheetCreateRequest;
+import com.usyd.catams.dto.response.TimesheetBulkImportResponse;
+import com.usyd.catams.dto.response.TimesheetBulkImportResponse.RowResult;
+import com.usyd.catams.entity.Course;
+import com.usyd.catams.entity.Timesheet;
+import com.usyd.catams.entity.User;
+import com.usyd.catams.enums.TimesheetTaskType;
+import com.usyd.catams.enums.UserRole;
+import com.usyd.catams.exception.AuthorizationException;
+import com.usyd.catams.exception.BusinessConflictException;
+import com.usyd.catams.exception.BusinessException;
+import com.usyd.catams.exception.BusinessRuleException;
+import com.usyd.catams.exception.ErrorCodes;
+import com.usyd.catams.exception.ResourceNotFoundException;
+import com.usyd.catams.policy.TimesheetPermissionPolicy;
+import com.usyd.catams.repository.CourseRepository;
+import com.usyd.catams.repository.TimesheetRepository;
+import com.usyd.catams.repository.TutorAssignmentRepository;
+import com.usyd.catams.repository.UserRepository;
+import com.usyd.catams.service.Schedule1CalculationResult;
+import com.usyd.catams.service.Schedule1PolicyProvider;
+import com.usyd.catams.service.TimesheetBulkImportFacade;
+import com.usyd.catams.service.TimesheetCalculationService;
+import com.usyd.catams.service.TimesheetQueryService;
+import com.usyd.catams.service.TimesheetWeeklyRollupService;
+import jakarta.persistence.EntityManager;
+import jakarta.persistence.PersistenceContext;
+import jakarta.validation.ConstraintViolation;
+import jakarta.validation.Validator;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+
+import java.math.BigDecimal;
+import java.time.LocalDate;
+import java.util.ArrayList;
+import java.util.Comparator;
+import java.util.HashMap;
+import java.util.HashSet;
+import java.util.List;
+import java.util.Map;
+import java.util.NavigableSet;
+import java.util.Set;
+import java.util.TreeMap;
+import java.util.TreeSet;
+import java.util.UUID;
+import java.util.function.Function;
+import java.util.stream.Collectors;
+
+/**
+ * Bulk timesheet import.
+ *
+ * <p>Applies the checks of {@link TimesheetApplicationService#createTimesheet} to every row, but
+ * loads the referenced users, courses, tutor assignments and existing (tutor, course, week) keys
+ * with one set-based query each instead of per row. Accepted rows are persisted in chunks and
+ * flushed as JDBC batches, which relies on the sequence-allocated timesheet id.</p>
+ *
+ * <p>Instead of one event per created timesheet, the import publishes one
+ * {@link CourseEvent.CourseTimesheetsImportedEvent} per affected course, which open dashboards
+ * receive as a single live update.</p>
+ */
+@Service
+@Transactional
+public class TimesheetBulkImportService implements TimesheetBulkImportFacade {
+
+    static final int MAX_ROWS = 5000;
+
+    // Multiple of hibernate.jdbc.batch_size; bounds the persistence context during large imports
+    private static final int FLUSH_CHUNK_SIZE = 500;
+
+    private final TimesheetRepository timesheetRepository;
+    private final UserRepository userRepository;
+    private final CourseRepository courseRepository;
+    private final TutorAssignmentRepository tutorAssignmentRepository;
+    private final TimesheetPermissionPolicy permissionPolicy;
+    private final TimesheetDomainService timesheetDomainService;
+    private final TimesheetValidationService timesheetValidationService;
+    private final TimesheetCalculationService timesheetCalculationService;
+    private final TimesheetQueryService timesheetQueryService;
+    private final Schedule1PolicyProvider policyProvider;
+    private final TimesheetWeeklyRollupService weeklyRollupService;
+    private final DomainEventPublisher eventPublisher;
+    private final Validator validator;
+
+    @PersistenceContext
+    private EntityManager entityManager;
+
+    public TimesheetBulkImportService(TimesheetRepository timesheetRepository,
+                                      UserRepository userRepository,
+                                      CourseRepository courseRepository,
+                                      TutorAssignmentRepository tutorAssignmentRepository,
+                                      TimesheetPermissionPolicy permissionPolicy,
+                                      TimesheetDomainService timesheetDomainService,
+                                      TimesheetValidationService timesheetValidationService,
+                                      TimesheetCalculationService timesheetCalculationService,
+                                      TimesheetQueryService timesheetQueryService,
+                                      Schedule1PolicyProvider policyProvider,
+                                      TimesheetWeeklyRollupService weeklyRollupService,
+                                      DomainEventPublisher eventPublisher,
+                                      Validator validator) {
+        this.timesheetRepository = timesheetRepository;
+        this.userRepository = userRepository;
+        this.courseRepository = courseRepository;
+        this.tutorAssignmentRepository = tutorAssignmentRepository;
+        this.permissionPolicy = permissionPolicy;
+        this.timesheetDomainService = timesheetDomainService;
+        this.timesheetValidationService = timesheetValidationService;
+        this.timesheetCalculationService = timesheetCalculationService;
+        this.timesheetQueryService = timesheetQueryService;
+        this.policyProvider = policyProvider;
+        this.weeklyRollupService = weeklyRollupService;
+        this.eventPublisher = eventPublisher;
+        this.validator = validator;
+    }
+
+    @Override
+    public TimesheetBulkImportResponse importRows(List<TimesheetCreateRequest> rows, Long creatorId) {
+        List<Candidate> candidates = new ArrayList<>();
+        if (rows != null) {
+            for (int i = 0; i < rows.size(); i++) {
+                candidates.add(new Candidate(i + 1, rows.get(i), new ArrayList<>()));
+            }
+        }
+        return importCandidates(candidates, creatorId);
+    }
+
+    @Override
+    public TimesheetBulkImportResponse importCsv(String csv, Long creatorId) {
+        List<Candidate> candidates = TimesheetCsvReader.read(csv).stream()
+            .map(row -> new Candidate(row.number(), row.request(), new ArrayList<>(row.errors())))
+            .toList();
+        return importCandidates(candidates, creatorId);
+    }
+
+    private TimesheetBulkImportResponse importCandidates(List<Candidate> candidates, Long creatorId) {
+        if (candidates.isEmpty()) {
+            throw new BusinessRuleException("Bulk import requires at least one row", ErrorCodes.VALIDATION_FAILED);
+        }
+        if (candidates.size() > MAX_ROWS) {
+            throw new BusinessRuleException(
+                "Bulk import is limited to " + MAX_ROWS + " rows; received " + candidates.size(),
+                ErrorCodes.VALIDATION_FAILED);
+        }
+        User creator = userRepository.findById(creatorId)
+            .orElseThrow(() -> new ResourceNotFoundException("User", String.valueOf(creatorId)));
+
+        for (Candidate candidate : candidates) {
+            validateFields(candidate);
+        }
+        List<Candidate> valid = candidates.stream().filter(Candidate::isValid).toList();
+
+        ImportContext context = loadContext(valid, creator);
+        List<Candidate> accepted = new ArrayList<>();
+        for (Candidate candidate : valid) {
+            try {
+                prepare(candidate, context);
+                accepted.add(candidate);
+            } catch (BusinessException | BusinessRuleException | BusinessConflictException | AuthorizationException
+                     | ResourceNotFoundException | IllegalArgumentException
+                     | Schedule1PolicyProvider.RatePolicyNotFoundException ex) {
+                candidate.errors.add(ex.getMessage());
+            }
+        }
+
+        insertInBatches(accepted);
+        publishImported(accepted, context);
+
+        List<RowResult> results = candidates.stream()
+            .map(candidate -> candidate.isValid()
+                ? RowResult.created(candidate.row, candidate.timesheet.getId())
+                : RowResult.rejected(candidate.row, candidate.errors))
+            .toList();
+        return new TimesheetBulkImportResponse(results);
+    }
+
+    private void validateFields(Candidate candidate) {
+        if (candidate.request == null) {
+            candidate.errors.add("Row is empty");
+            return;
+        }
+        candidate.request.setSessionDate(candidate.request.resolveSessionDate());
+        validator.validate(candidate.request).stream()
+            .sorted(Comparator.comparing(violation -> violation.getPropertyPath().toString()))
+            .map(ConstraintViolation::getMessage)
+            .forEach(candidate.errors::add);
+    }
+
+    /**
+     * Everything the per-row checks need, loaded once for the whole import.
+     */
+    private ImportContext loadContext(List<Candidate> valid, User creator) {
+        if (valid.isEmpty()) {
+            return new ImportContext(creator, Map.of(), Map.of(), Set.of(), new HashSet<>(), Map.of());
+        }
+        Set<Long> tutorIds = valid.stream().map(candidate -> candidate.request.getTutorId()).collect(Collectors.toSet());
+        Set<Long> courseIds = valid.stream().map(candidate -> candidate.request.getCourseId()).collect(Collectors.toSet());
+        LocalDate firstWeek = valid.stream().map(candidate -> candidate.request.getWeekStartDate())
+            .min(Comparator.naturalOrder()).orElseThrow();
+        LocalDate lastWeek = valid.stream().map(candidate -> candidate.request.getWeekStartDate())
+            .max(Comparator.naturalOrder()).orElseThrow();
+
+        Map<Long, User> tutors = userRepository.findAllById(tutorIds).stream()
+            .collect(Collectors.toMap(User::getId, Function.identity()));
+        Map<Long, Course> courses = courseRepository.findAllById(courseIds).stream()
+            .collect(Collectors.toMap(Course::getId, Function.identity()));
+        Set<TutorCourse> assignments = tutorAssignmentRepository.findByCourseIdIn(List.copyOf(courseIds)).stream()
+            .map(assignment -> new TutorCourse(assignment.getTutorId(), assignment.getCourseId()))
+            .collect(Collectors.toSet());
+        Set<TimesheetWeekKey> takenWeeks = new HashSet<>(
+            timesheetRepository.findWeekKeys(tutorIds, courseIds, firstWeek, lastWeek));
+
+        Map<TutorialRepeatKey, Set<LocalDate>> repeatSessions = new HashMap<>();
+        for (Candidate candidate : valid) {
+            TimesheetCreateRequest request = candidate.request;
+            if (request.getTaskType() == TimesheetTaskType.TUTORIAL && request.isRepeat()) {
+                repeatSessions.computeIfAbsent(repeatKey(request.getCourseId(), request.getDescription()),
+                        key -> new HashSet<>())
+                    .add(request.getSessionDate());
+            }
+        }
+        Map<TutorialRepeatKey, Set<LocalDate>> repeatEligible = repeatSessions.isEmpty()
+            ? Map.of()
+            : timesheetQueryService.findTutorialRepeatEligibleDates(repeatSessions);
+
+        return new ImportContext(creator, tutors, courses, assignments, takenWeeks, repeatEligible);
+    }
+
+    private void prepare(Candidate candidate, ImportContext context) {
+        TimesheetCreateRequest request = candidate.request;
+        User creator = context.creator();
+        User tutor = context.tutors().get(request.getTutorId());
+        if (tutor == null) {
+            throw new ResourceNotFoundException("User", String.valueOf(request.getTutorId()),
+                "Tutor " + request.getTutorId() + " not found");
+        }
+        Course course = context.courses().get(request.getCourseId());
+        if (course == null) {
+            throw new ResourceNotFoundException("Course", String.valueOf(request.getCourseId()),
+                "Course " + request.getCourseId() + " not found");
+        }
+
+        if (!permissionPolicy.canCreateTimesheetFor(creator, tutor, course)) {
+            throw new AuthorizationException("User " + creator.getId() + " (" + creator.getRole() + ") is not authorized to create timesheet for tutor " + tutor.getId() + " in course " + course.getId());
+        }
+        if (tutor.getRole() != UserRole.TUTOR) {
+            throw new BusinessRuleException(
+                "User assigned as tutor must have TUTOR role. User role: " + tutor.getRole() + " (ID: " + tutor.getId() + ")",
+                ErrorCodes.VALIDATION_FAILED);
+        }
+        timesheetValidationService.validateMonday(request.getWeekStartDate(), "weekStartDate");
+
+        TimesheetWeekKey week = new TimesheetWeekKey(tutor.getId(), course.getId(), request.getWeekStartDate());
+        if (context.takenWeeks().contains(week)) {
+            throw new BusinessConflictException(ErrorCodes.RESOURCE_CONFLICT,
+                "Timesheet already exists for this tutor, course, and week. " +
+                "Tutor ID: " + tutor.getId() + ", Course ID: " + course.getId() + ", Week: " + request.getWeekStartDate());
+        }
+
+        Schedule1CalculationResult calculation = timesheetCalculationService.calculateForCreateOrUpdate(
+            request.getCourseId(),
+            request.getTaskType(),
+            request.getSessionDate(),
+            request.getDeliveryHours(),
+            request.isRepeat(),
+            request.getQualification());
+
+        if (request.getTaskType() == TimesheetTaskType.TUTORIAL
+                && calculation.isRepeat()
+                && !context.isRepeatEligible(repeatKey(course.getId(), request.getDescription()),
+                    calculation.getSessionDate(), policyProvider.getRepeatEligibilityWindowDays())) {
+            throw new BusinessRuleException(
+                "Repeat Tutorial requires same content delivered within the last "
+                    + policyProvider.getRepeatEligibilityWindowDays() + " days to a different group.",
+                ErrorCodes.VALIDATION_FAILED);
+        }
+
+        if (creator.getRole() != UserRole.ADMIN
+                && !context.assignments().contains(new TutorCourse(tutor.getId(), course.getId()))) {
+            throw new AuthorizationException(
+                "Tutor " + tutor.getId() + " is not assigned to course " + course.getId() + ". Please assign via admin.");
+        }
+
+        BigDecimal payableHours = calculation.getPayableHours();
+        BigDecimal hourlyRate = calculation.getHourlyRate();
+        timesheetValidationService.validateInputs(payableHours, hourlyRate);
+        String description = timesheetDomainService.validateTimesheetCreation(
+            creator, tutor, course, request.getWeekStartDate(), payableHours, hourlyRate, request.getDescription());
+
+        Timesheet timesheet = new Timesheet(tutor.getId(), course.getId(), request.getWeekStartDate(),
+            payableHours, hourlyRate, description, creator.getId());
+        TimesheetApplicationService.applySchedule1Calculation(timesheet, calculation, request.getTaskType());
+        candidate.timesheet = timesheet;
+
+        // Later rows see this one, as they would if created one by one
+        context.takenWeeks().add(week);
+        if (request.getTaskType() == TimesheetTaskType.TUTORIAL) {
+            context.recordTutorial(timesheet);
+        }
+    }
+
+    private static TutorialRepeatKey repeatKey(Long courseId, String description) {
+        return new TutorialRepeatKey(courseId, Timesheet.descriptionHashOf(description));
+    }
+
+    private void insertInBatches(List<Candidate> accepted) {
+        for (int from = 0; from < accepted.size(); from += FLUSH_CHUNK_SIZE) {
+            List<Timesheet> chunk = accepted.subList(from, Math.min(from + FLUSH_CHUNK_SIZE, accepted.size()))
+                .stream()
+                .map(candidate -> candidate.timesheet)
+                .toList();
+            timesheetRepository.saveAll(chunk);
+            entityManager.flush();
+            // One grouped upsert per chunk: rows sharing a (course, tutor, week, status) key collapse
+            TimesheetWeeklyRollupService.Batch rollup = weeklyRollupService.batch();
+            chunk.forEach(rollup::created);
+            weeklyRollupService.apply(rollup);
+            entityManager.clear();
+        }
+    }
+
+    private void publishImported(List<Candidate> accepted, ImportContext context) {
+        Map<Long, List<Candidate>> byCourse = accepted.stream()
+            .collect(Collectors.groupingBy(candidate -> candidate.request.getCourseId(), TreeMap::new,
+                Collectors.toList()));
+        String triggeredBy = context.creator().getId().toString();
+        String correlationId = UUID.randomUUID().toString();
+        byCourse.forEach((courseId, rows) -> {
+            Course course = context.courses().get(courseId);
+            List<Long> tutorIds = rows.stream()
+                .map(candidate -> candidate.request.getTutorId())
+                .distinct()
+                .sorted()
+                .toList();
+            eventPublisher.publish(new CourseEvent.CourseTimesheetsImportedEvent(
+                courseId.toString(), course.getCode(), course.getName(), course.getLecturerId(), course.getSemester(),
+                tutorIds, rows.size(), triggeredBy, correlationId));
+        });
+    }
+
+    private static final class Candidate {
+        private final int row;
+        private final TimesheetCreateRequest request;
+        private final List<String> errors;
+        private Timesheet timesheet;
+
+        private Candidate(int row, TimesheetCreateRequest request, List<String> errors) {
+            this.row = row;
+            this.request = request;
+            this.errors = errors;
+        }
+
+        private boolean isValid() {
+            return errors.isEmpty();
+        }
+    }
+
+    private record TutorCourse(Long tutorId, Long courseId) { }
+
+    private record ImportContext(User creator,
+                                 Map<Long, User> tutors,
+                                 Map<Long, Course> courses,
+                                 Set<TutorCourse> assignments,
+                                 Set<TimesheetWeekKey> takenWeeks,
+                                 Map<TutorialRepeatKey, Set<LocalDate>> repeatEligible,
+                                 Map<TutorialRepeatKey, NavigableSet<LocalDate>> importedTutorialDates) {
+
+        private ImportContext(User creator,
+                              Map<Long, User> tutors,
+                              Map<Long, Course> courses,
+                              Set<TutorCourse> assignments,
+                              Set<TimesheetWeekKey> takenWeeks,
+                              Map<TutorialRepeatKey, Set<LocalDate>> repeatEligible) {
+            this(creator, tutors, courses, assignments, takenWeeks, repeatEligible, new HashMap<>());
+        }
+
+        /**
+         * Eligible if the database already has a qualifying tutorial, or an earlier row of this import does.
+         */
+        private boolean isRepeatEligible(TutorialRepeatKey key, LocalDate sessionDate, int windowDays) {
+            if (repeatEligible.getOrDefault(key, Set.of()).contains(sessionDate)) {
+                return true;
+            }
+            NavigableSet<LocalDate> imported = importedTutorialDates.get(key);
+            if (imported == null) {
+                return false;
+            }
+            LocalDate firstInWindow = imported.ceiling(sessionDate.minusDays(windowDays));
+            return firstInWindow != null && firstInWindow.isBefore(sessionDate);
+        }
+
+        private void recordTutorial(Timesheet timesheet) {
+            for (TutorialRepeatKey key : List.of(new TutorialRepeatKey(timesheet.getCourseId(), null),
+                    new TutorialRepeatKey(timesheet.getCourseId(), timesheet.getDescriptionHash()))) {
+                NavigableSet<LocalDate> dates = importedTutorialDates.computeIfAbsent(key, k -> new TreeSet<>());
+                dates.add(timesheet.getWeekStartDate());
+                dates.add(timesheet.getSessionDate());
+            }
+        }
+    }
+}
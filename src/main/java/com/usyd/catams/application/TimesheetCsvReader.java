@@ -0,0 +1,161 @@
+package com.usyd.catams.application;
+
+import com.usyd.catams.dto.request.TimesheetCreateRequest;
+import com.usyd.catams.enums.TimesheetTaskType;
+import com.usyd.catams.enums.TutorQualification;
+import com.usyd.catams.exception.BusinessRuleException;
+import com.usyd.catams.exception.ErrorCodes;
+import java.math.BigDecimal;
+import java.time.LocalDate;
+import java.time.format.DateTimeParseException;
+import java.util.ArrayList;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Locale;
+import java.util.Map;
+import java.util.function.BiConsumer;
+import java.util.function.Function;
+
+/**
+ * Reads bulk-import CSV into {@link TimesheetCreateRequest}s.
+ *
+ * The header row names columns after the JSON fields of the create request (case-insensitive,
+ * any order). Fields are RFC 4180 style: comma separated, optionally double-quoted, with
+ * {@code ""} escaping a quote inside a quoted field. A malformed value rejects only its row.
+ */
+final class TimesheetCsvReader {
+
+    private static final List<String> REQUIRED_COLUMNS =
+        List.of("tutorid", "courseid", "weekstartdate", "deliveryhours", "description");
+
+    private static final Map<String, Column<?>> COLUMNS = Map.of(
+        "tutorid", new Column<>(Long::valueOf, TimesheetCreateRequest::setTutorId),
+        "courseid", new Column<>(Long::valueOf, TimesheetCreateRequest::setCourseId),
+        "weekstartdate", new Column<>(LocalDate::parse, TimesheetCreateRequest::setWeekStartDate),
+        "sessiondate", new Column<>(LocalDate::parse, TimesheetCreateRequest::setSessionDate),
+        "tasktype", new Column<>(value -> TimesheetTaskType.valueOf(value.toUpperCase(Locale.ROOT)),
+            TimesheetCreateRequest::setTaskType),
+        "qualification", new Column<>(value -> TutorQualification.valueOf(value.toUpperCase(Locale.ROOT)),
+            TimesheetCreateRequest::setQualification),
+        "isrepeat", new Column<>(TimesheetCsvReader::parseBoolean, TimesheetCreateRequest::setIsRepeat),
+        "deliveryhours", new Column<>(BigDecimal::new, TimesheetCreateRequest::setDeliveryHours),
+        "description", new Column<>(Function.identity(), TimesheetCreateRequest::setDescription)
+    );
+
+    private TimesheetCsvReader() {
+    }
+
+    /**
+     * A data row: the parsed request plus any per-field parse errors.
+     */
+    record Row(int number, TimesheetCreateRequest request, List<String> errors) { }
+
+    static List<Row> read(String csv) {
+        List<List<String>> records = parseRecords(csv == null ? "" : csv);
+        if (records.isEmpty()) {
+            throw new BusinessRuleException("CSV must contain a header row", ErrorCodes.VALIDATION_FAILED);
+        }
+
+        List<String> header = records.get(0).stream()
+            .map(name -> name.trim().toLowerCase(Locale.ROOT))
+            .toList();
+        for (String required : REQUIRED_COLUMNS) {
+            if (!header.contains(required)) {
+                throw new BusinessRuleException("CSV header is missing column " + required, ErrorCodes.VALIDATION_FAILED);
+            }
+        }
+
+        List<Row> rows = new ArrayList<>(records.size() - 1);
+        for (int i = 1; i < records.size(); i++) {
+            rows.add(toRow(i, header, records.get(i)));
+        }
+        return rows;
+    }
+
+    private static Row toRow(int number, List<String> header, List<String> values) {
+        TimesheetCreateRequest request = new TimesheetCreateRequest();
+        List<String> errors = new ArrayList<>();
+        if (values.size() != header.size()) {
+            errors.add("Expected " + header.size() + " columns but found " + values.size());
+            return new Row(number, request, errors);
+        }
+        for (int c = 0; c < header.size(); c++) {
+            Column<?> column = COLUMNS.get(header.get(c));
+            String value = values.get(c).trim();
+            if (column == null || value.isEmpty()) {
+                continue;
+            }
+            try {
+                column.apply(request, value);
+            } catch (IllegalArgumentException | DateTimeParseException ex) {
+                errors.add("Invalid " + header.get(c) + ": " + value);
+            }
+        }
+        // Session date defaults to the week start, as in the JSON create request
+        if (request.getSessionDate() == null) {
+            request.setSessionDate(request.getWeekStartDate());
+        }
+        return new Row(number, request, errors);
+    }
+
+    private static Boolean parseBoolean(String value) {
+        if ("true".equalsIgnoreCase(value)) {
+            return Boolean.TRUE;
+        }
+        if ("false".equalsIgnoreCase(value)) {
+            return Boolean.FALSE;
+        }
+        throw new IllegalArgumentException(value);
+    }
+
+    private static List<List<String>> parseRecords(String csv) {
+        List<List<String>> records = new ArrayList<>();
+        List<String> fields = new ArrayList<>();
+        StringBuilder field = new StringBuilder();
+        boolean quoted = false;
+        for (int i = 0; i < csv.length(); i++) {
+            char ch = csv.charAt(i);
+            if (quoted) {
+                if (ch == '"' && i + 1 < csv.length() && csv.charAt(i + 1) == '"') {
+                    field.append('"');
+                    i++;
+                } else if (ch == '"') {
+                    quoted = false;
+                } else {
+                    field.append(ch);
+                }
+            } else if (ch == '"') {
+                quoted = true;
+            } else if (ch == ',') {
+                fields.add(field.toString());
+                field.setLength(0);
+            } else if (ch == '\n' || ch == '\r') {
+                if (ch == '\r' && i + 1 < csv.length() && csv.charAt(i + 1) == '\n') {
+                    i++;
+                }
+                endRecord(records, fields, field);
+                fields = new ArrayList<>();
+            } else {
+                field.append(ch);
+            }
+        }
+        endRecord(records, fields, field);
+        return records;
+    }
+
+    private static void endRecord(List<List<String>> records, List<String> fields, StringBuilder field) {
+        fields.add(field.toString());
+        field.setLength(0);
+        // Skip blank lines, including the one after a trailing newline
+        if (fields.size() > 1 || !fields.get(0).isBlank()) {
+            records.add(fields);
+        }
+    }
+
+    private record Column<T>(Function<String, T> parser, BiConsumer<TimesheetCreateRequest, T> setter) {
+
+        private void apply(TimesheetCreateRequest request, String value) {
+            setter.accept(request, parser.apply(value));
+        }
+    }
+}
@@ -0,0 +1,97 @@
+package com.usyd.catams.common.application;
+
+import com.usyd.catams.entity.Course;
+import com.usyd.catams.entity.User;
+import org.springframework.stereotype.Component;
+import org.springframework.web.context.request.RequestAttributes;
+import org.springframework.web.context.request.RequestContextHolder;
+
+import java.util.HashMap;
+import java.util.Map;
+import java.util.Optional;
+import java.util.function.Function;
+
+/**
+ * Per-request identity map for {@link User} and {@link Course} lookups.
+ *
+ * Application services resolve the requester, tutor and course several times while handling a
+ * single request; this keeps the first instance loaded for each id and hands it back on later
+ * lookups in the same request. State lives in the current request's attributes, so it is dropped
+ * with the request. Outside a request (scheduled jobs, plain unit tests) every lookup goes straight
+ * to the loader.
+ *
+ * The authenticated user is seeded by the JWT filter, so resolving the requester usually costs no
+ * query at all. Cached entities are shared across the services of one request and must be treated
+ * as read-only.
+ *
+ * @author Development Team
+ * @since 1.2
+ */
+@Component
+public class RequestEntityCache {
+
+    static final String ATTRIBUTE = RequestEntityCache.class.getName() + ".lookups";
+
+    /**
+     * Remember an already loaded user, typically the authenticated principal
+     */
+    public void seedUser(User user) {
+        Lookups lookups = currentLookups();
+        if (lookups != null && user != null && user.getId() != null) {
+            lookups.users.putIfAbsent(user.getId(), user);
+        }
+    }
+
+    public Optional<User> findUser(Long userId, Function<Long, Optional<User>> loader) {
+        Lookups lookups = currentLookups();
+        return lookups == null ? loader.apply(userId) : lookups.find(lookups.users, userId, loader);
+    }
+
+    public Optional<Course> findCourse(Long courseId, Function<Long, Optional<Course>> loader) {
+        Lookups lookups = currentLookups();
+        return lookups == null ? loader.apply(courseId) : lookups.find(lookups.courses, courseId, loader);
+    }
+
+    /**
+     * Number of lookups answered from the cache during the current request; 0 outside a request
+     */
+    public int getHitCount() {
+        Lookups lookups = currentLookups();
+        return lookups == null ? 0 : lookups.hits;
+    }
+
+    private static Lookups currentLookups() {
+        RequestAttributes attributes = RequestContextHolder.getRequestAttributes();
+        if (attributes == null) {
+            return null;
+        }
+        Object existing = attributes.getAttribute(ATTRIBUTE, RequestAttributes.SCOPE_REQUEST);
+        if (existing instanceof Lookups lookups) {
+            return lookups;
+        }
+        Lookups created = new Lookups();
+        attributes.setAttribute(ATTRIBUTE, created, RequestAttributes.SCOPE_REQUEST);
+        return created;
+    }
+
+    private static final class Lookups {
+        private final Map<Long, User> users = new HashMap<>();
+        private final Map<Long, Course> courses = new HashMap<>();
+        private int hits;
+
+        // Absent ids are not remembered, so an entity created later in the request is still found
+        private <T> Optional<T> find(Map<Long, T> cache, Long id, Function<Long, Optional<T>> loader) {
+            if (id == null) {
+                return loader.apply(null);
+            }
+            T cached = cache.get(id);
+            if (cached != null) {
+                hits++;
+                return Optional.of(cached);
+            }
+            Optional<T> loaded = loader.apply(id);
+            loaded.ifPresent(entity -> cache.put(id, entity));
+            return loaded;
+        }
+    }
+}
@@ -18,6 +18,7 @@ import java.util.Map;
  * - CourseBudgetUpdatedEvent: Course budget modified
  * - CourseTutorAssignedEvent: Tutor assigned to course
  * - CourseTutorUnassignedEvent: Tutor removed from course
+ * - CourseTimesheetsImportedEvent: Timesheets bulk-imported into course
  * 
  * @author Development Team
  * @since 2.0 - Microservices-Ready Architecture
@@ -364,4 +365,38 @@ public abstract class CourseEvent extends AbstractDomainEvent {
             return metadata;
         }
     }
-}
\ No newline at end of file
+    
+    /**
+     * Event fired once per course when a bulk import created timesheets in it
+     */
+        public static class CourseTimesheetsImportedEvent extends CourseEvent {
+            private static final long serialVersionUID = 1L;
+        
+        private final java.util.ArrayList<Long> tutorIds;
+        private final int importedCount;
+        
+        public CourseTimesheetsImportedEvent(String courseId, String courseCode, String courseName,
+                                            Long lecturerId, String semester, java.util.List<Long> tutorIds,
+                                            int importedCount, String triggeredBy, String correlationId) {
+            super(courseId, courseCode, courseName, lecturerId, semester, triggeredBy, correlationId);
+            this.tutorIds = new java.util.ArrayList<>(tutorIds);
+            this.importedCount = importedCount;
+        }
+        
+        @Override
+        public String getEventType() {
+            return "COURSE_TIMESHEETS_IMPORTED";
+        }
+        
+        public java.util.List<Long> getTutorIds() { return java.util.Collections.unmodifiableList(tutorIds); }
+        public int getImportedCount() { return importedCount; }
+        
+        @Override
+        public Map<String, java.io.Serializable> getMetadata() {
+            Map<String, java.io.Serializable> metadata = new java.util.HashMap<>(super.getMetadata());
+            metadata.put("tutorCount", tutorIds.size());
+            metadata.put("importedCount", importedCount);
+            return metadata;
+        }
+    }
+}
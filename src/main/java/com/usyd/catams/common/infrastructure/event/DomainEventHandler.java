@@ -1,8 +1,10 @@
 package com.usyd.catams.common.infrastructure.event;
 
 import com.usyd.catams.common.domain.event.*;
+import com.usyd.catams.service.EventStreamService;
+import io.micrometer.core.instrument.MeterRegistry;
+import io.micrometer.core.instrument.Timer;
 import org.springframework.context.event.EventListener;
-import org.springframework.scheduling.annotation.Async;
 import org.springframework.stereotype.Component;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
@@ -20,10 +22,17 @@ import java.util.concurrent.CompletableFuture;
  * - Monolith Mode: Handles Spring ApplicationEvents for in-process communication
  * - Future Microservices Mode: Will handle events from message queues
  * 
+ * Each category runs on its own bounded executor (see {@link EventExecutors}), so a burst
+ * of timesheet approvals cannot starve user or course handlers. The handlers themselves are
+ * synchronous: {@link EventOutboxDrainer} and {@link DomainEventPublisher} move delivery onto the
+ * executor and wait for the outcome, so a handler that throws leaves its event to be retried
+ * and eventually dead-lettered instead of being lost.
+ * 
  * Handler Categories:
  * - Timesheet Event Handlers: React to timesheet lifecycle events
  * - User Event Handlers: React to user management events  
  * - Course Event Handlers: React to course management events
+ * - Live Update Handlers: Push change notifications to open dashboards
  * - Cross-Service Coordination: Handle multi-service workflows
  * 
  * @author Development Team
@@ -34,6 +43,14 @@ public class DomainEventHandler {
     
     private static final Logger logger = LoggerFactory.getLogger(DomainEventHandler.class);
     
+    private final MeterRegistry meterRegistry;
+    private final EventStreamService eventStreamService;
+    
+    public DomainEventHandler(MeterRegistry meterRegistry, EventStreamService eventStreamService) {
+        this.meterRegistry = meterRegistry;
+        this.eventStreamService = eventStreamService;
+    }
+    
     // =================== Timesheet Event Handlers ===================
     
     /**
@@ -42,12 +59,11 @@ public class DomainEventHandler {
      * know about new timesheets being created
      */
     @EventListener
-    @Async
     public void handleTimesheetCreated(TimesheetEvent.TimesheetCreatedEvent event) {
         logger.info("Handling timesheet created event: timesheetId={}, tutorId={}, courseId={}", 
             event.getAggregateId(), event.getTutorId(), event.getCourseId());
         
-        try {
+        timed("handleTimesheetCreated", event, () -> {
             // Example cross-service operations that would happen:
             
             // 1. Update user statistics (future User Service)
@@ -61,11 +77,7 @@ public class DomainEventHandler {
             
             // 4. Log for audit purposes (future Audit Service)
             auditTimesheetCreation(event);
-            
-        } catch (Exception e) {
-            logger.error("Error handling timesheet created event: {}", event.getEventId(), e);
-            // In microservices, this might trigger a compensation action
-        }
+        });
     }
     
     /**
@@ -73,12 +85,11 @@ public class DomainEventHandler {
      * This triggers the approval workflow coordination
      */
     @EventListener
-    @Async
     public void handleTimesheetSubmitted(TimesheetEvent.TimesheetSubmittedEvent event) {
         logger.info("Handling timesheet submitted event: timesheetId={}, newStatus={}, nextApproverId={}", 
             event.getAggregateId(), event.getNewStatus(), event.getNextApproverId());
         
-        try {
+        timed("handleTimesheetSubmitted", event, () -> {
             // Cross-service coordination for approval workflow:
             
             // 1. Notify the next approver (future Notification Service)
@@ -94,10 +105,7 @@ public class DomainEventHandler {
             
             // 4. Update tutor dashboard (future User Service)
             updateTutorDashboard(event.getTutorId(), "SUBMITTED", event.getAggregateId());
-            
-        } catch (Exception e) {
-            logger.error("Error handling timesheet submitted event: {}", event.getEventId(), e);
-        }
+        });
     }
     
     /**
@@ -105,12 +113,11 @@ public class DomainEventHandler {
      * This coordinates the response to approval decisions
      */
     @EventListener
-    @Async
     public void handleTimesheetApprovalProcessed(TimesheetEvent.TimesheetApprovalProcessedEvent event) {
         logger.info("Handling timesheet approval processed: timesheetId={}, action={}, approverId={}", 
             event.getAggregateId(), event.getAction(), event.getApproverId());
         
-        try {
+        timed("handleTimesheetApprovalProcessed", event, () -> {
             // Cross-service coordination for approval results:
             
             if (event.isFinalApproval()) {
@@ -140,10 +147,7 @@ public class DomainEventHandler {
             
             // Always update approval statistics
             updateApprovalStatistics(event);
-            
-        } catch (Exception e) {
-            logger.error("Error handling timesheet approval processed event: {}", event.getEventId(), e);
-        }
+        });
     }
     
     /**
@@ -151,12 +155,11 @@ public class DomainEventHandler {
      * This coordinates cleanup across services
      */
     @EventListener
-    @Async
     public void handleTimesheetDeleted(TimesheetEvent.TimesheetDeletedEvent event) {
         logger.info("Handling timesheet deleted event: timesheetId={}, reason={}", 
             event.getAggregateId(), event.getReason());
         
-        try {
+        timed("handleTimesheetDeleted", event, () -> {
             // Cross-service cleanup coordination:
             
             // 1. Revert user statistics (future User Service)
@@ -170,10 +173,7 @@ public class DomainEventHandler {
             
             // 4. Log deletion for audit (future Audit Service)
             auditTimesheetDeletion(event);
-            
-        } catch (Exception e) {
-            logger.error("Error handling timesheet deleted event: {}", event.getEventId(), e);
-        }
+        });
     }
     
     // =================== User Event Handlers ===================
@@ -183,16 +183,15 @@ public class DomainEventHandler {
      * This coordinates user setup across services
      */
     @EventListener
-    @Async
     public void handleUserCreated(UserEvent.UserCreatedEvent event) {
         logger.info("Handling user created event: userId={}, role={}, email={}", 
             event.getAggregateId(), event.getRole(), event.getEmail());
         
-        try {
+        timed("handleUserCreated", event, () -> {
             // Cross-service user setup coordination:
             
             // 1. Send welcome email (future Notification Service)
-            if (event.getMetadata().get("welcomeEmailRequired").equals(true)) {
+            if (Boolean.TRUE.equals(event.getMetadata().get("welcomeEmailRequired"))) {
                 sendWelcomeEmail(event);
             }
             
@@ -204,10 +203,7 @@ public class DomainEventHandler {
             
             // 4. Log user creation (future Audit Service)
             auditUserCreation(event);
-            
-        } catch (Exception e) {
-            logger.error("Error handling user created event: {}", event.getEventId(), e);
-        }
+        });
     }
     
     /**
@@ -215,12 +211,11 @@ public class DomainEventHandler {
      * This coordinates permission updates across services
      */
     @EventListener
-    @Async
     public void handleUserRoleChanged(UserEvent.UserRoleChangedEvent event) {
         logger.info("Handling user role changed event: userId={}, oldRole={}, newRole={}", 
             event.getAggregateId(), event.getPreviousRole(), event.getNewRole());
         
-        try {
+        timed("handleUserRoleChanged", event, () -> {
             // Cross-service role change coordination:
             
             // 1. Update permissions (future Auth Service)
@@ -236,10 +231,7 @@ public class DomainEventHandler {
             if (event.getPreviousRole() != event.getNewRole()) {
                 updateCourseAccess(event);
             }
-            
-        } catch (Exception e) {
-            logger.error("Error handling user role changed event: {}", event.getEventId(), e);
-        }
+        });
     }
     
     // =================== Course Event Handlers ===================
@@ -249,12 +241,11 @@ public class DomainEventHandler {
      * This coordinates course setup across services
      */
     @EventListener
-    @Async
     public void handleCourseCreated(CourseEvent.CourseCreatedEvent event) {
         logger.info("Handling course created event: courseId={}, courseCode={}, lecturerId={}", 
             event.getAggregateId(), event.getCourseCode(), event.getLecturerId());
         
-        try {
+        timed("handleCourseCreated", event, () -> {
             // Cross-service course setup coordination:
             
             // 1. Initialize budget tracking (future Finance Service)
@@ -268,10 +259,7 @@ public class DomainEventHandler {
             
             // 4. Set up default approval workflow (future Workflow Service)
             initializeCourseWorkflow(event);
-            
-        } catch (Exception e) {
-            logger.error("Error handling course created event: {}", event.getEventId(), e);
-        }
+        });
     }
     
     /**
@@ -279,12 +267,11 @@ public class DomainEventHandler {
      * This coordinates budget-related changes across services
      */
     @EventListener
-    @Async
     public void handleCourseBudgetUpdated(CourseEvent.CourseBudgetUpdatedEvent event) {
         logger.info("Handling course budget updated event: courseId={}, newBudget={}, change={}", 
             event.getAggregateId(), event.getNewBudgetAllocated(), event.getBudgetChange());
         
-        try {
+        timed("handleCourseBudgetUpdated", event, () -> {
             // Cross-service budget coordination:
             
             // 1. Update financial tracking (future Finance Service)
@@ -302,9 +289,52 @@ public class DomainEventHandler {
             
             // 4. Update course capacity calculations (future Course Service)
             recalculateCourseCapacity(event);
-            
-        } catch (Exception e) {
-            logger.error("Error handling course budget updated event: {}", event.getEventId(), e);
+        });
+    }
+    
+    // =================== Live Update Handlers ===================
+    
+    /**
+     * Push timesheet changes to subscribed dashboards so they refetch instead of polling
+     */
+    @EventListener
+    public void pushTimesheetChange(TimesheetEvent event) {
+        if (event instanceof TimesheetEvent.TimesheetDeadlineEvent) {
+            return; // reminders do not change any data
+        }
+        timed("pushTimesheetChange", event, () -> eventStreamService.timesheetChanged(event));
+    }
+    
+    /**
+     * Push course changes that affect dashboard summaries
+     */
+    @EventListener
+    public void pushCourseChange(CourseEvent event) {
+        timed("pushCourseChange", event, () -> eventStreamService.courseChanged(event));
+    }
+    
+    // =================== Metrics ===================
+    
+    /**
+     * Run a handler body and record its run time as domain.events.handler{handler, event.type, outcome}.
+     * Failures are logged and rethrown so the event is retried.
+     */
+    private void timed(String handler, DomainEvent event, Runnable body) {
+        Timer.Sample sample = Timer.start(meterRegistry);
+        String outcome = "success";
+        try {
+            body.run();
+        } catch (RuntimeException e) {
+            outcome = "error";
+            logger.error("Event handler {} failed for event: {} {}", handler, event.getEventType(), event.getEventId(), e);
+            throw e;
+        } finally {
+            sample.stop(Timer.builder("domain.events.handler")
+                .description("Domain event handler run time")
+                .tag("handler", handler)
+                .tag("event.type", event.getEventType())
+                .tag("outcome", outcome)
+                .register(meterRegistry));
         }
     }
     
@@ -312,6 +342,8 @@ public class DomainEventHandler {
     // These methods represent the actual service calls that would be made
     // in a microservices architecture
     
+    // Weekly hours/pay totals are maintained transactionally by TimesheetWeeklyRollupService at the
+    // write site; these asynchronous hooks run outside the timesheet transaction and must not touch them.
     private void updateTutorStatistics(Long tutorId, java.math.BigDecimal hours) {
         logger.debug("Updating tutor statistics for tutor {} with {} hours", tutorId, hours);
     }
@@ -1,13 +1,22 @@
 package com.usyd.catams.common.infrastructure.event;
 
 import com.usyd.catams.common.domain.event.DomainEvent;
+import io.micrometer.core.instrument.Counter;
+import io.micrometer.core.instrument.MeterRegistry;
+import io.micrometer.core.instrument.Timer;
+import org.springframework.beans.factory.annotation.Value;
 import org.springframework.context.ApplicationEventPublisher;
 import org.springframework.stereotype.Service;
+import org.springframework.transaction.support.TransactionSynchronizationManager;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
 
 import java.util.List;
 import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.RejectedExecutionException;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.atomic.LongAdder;
+import java.util.function.Consumer;
 
 /**
  * Domain Event Publisher with dual-mode capability
@@ -19,11 +28,18 @@ import java.util.concurrent.CompletableFuture;
  * Current Implementation:
  * - Monolith Mode: Uses Spring's ApplicationEventPublisher for in-process events
  * - Future Microservices Mode: Will integrate with message queues (RabbitMQ, Kafka)
+ * - Outbox: when a transaction is active and app.events.outbox.enabled is set (default),
+ *   events are written to the event_outbox table in that transaction and delivered
+ *   by {@link EventOutboxDrainer} after commit, so they survive a crash between
+ *   commit and handling and are dropped if the transaction rolls back
+ * - Direct delivery (no transaction, or the outbox disabled) runs the listeners on the
+ *   category executor with {@link #publishWithRetry}, so listener failures are retried and
+ *   dead-lettered instead of being lost
  * 
  * Design Features:
  * - Dual publishing modes (sync/async)
  * - Event filtering and routing
- * - Error handling and retry logic
+ * - Error handling and non-blocking retry with dead-lettering
  * - Event serialization for external publishing
  * - Correlation ID propagation
  * - Event audit logging
@@ -38,54 +54,118 @@ public class DomainEventPublisher {
     
     private final ApplicationEventPublisher applicationEventPublisher;
     private final EventPublishingConfiguration config;
+    private final EventOutboxStore outboxStore;
+    private final EventExecutors eventExecutors;
+    private final EventRetryScheduler retryScheduler;
+    private final EventDeadLetterStore deadLetterStore;
+    private final boolean outboxEnabled;
+    private final int directMaxRetries;
     
     public DomainEventPublisher(ApplicationEventPublisher applicationEventPublisher,
-                               EventPublishingConfiguration config) {
+                               EventPublishingConfiguration config,
+                               EventOutboxStore outboxStore,
+                               EventExecutors eventExecutors,
+                               EventRetryScheduler retryScheduler,
+                               EventDeadLetterStore deadLetterStore,
+                               @Value("${app.events.outbox.enabled:true}") boolean outboxEnabled,
+                               @Value("${app.events.retry.max-retries:3}") int directMaxRetries) {
         this.applicationEventPublisher = applicationEventPublisher;
         this.config = config;
+        this.outboxStore = outboxStore;
+        this.eventExecutors = eventExecutors;
+        this.retryScheduler = retryScheduler;
+        this.deadLetterStore = deadLetterStore;
+        this.outboxEnabled = outboxEnabled;
+        this.directMaxRetries = directMaxRetries;
     }
     
     /**
      * Publish a single domain event synchronously
      * 
      * @param event The domain event to publish
+     * Outside the outbox the listeners run on the event's category executor and the caller
+     * does not wait for them.
+     * 
      * @throws EventPublishingException if publishing fails
      */
     public void publish(DomainEvent event) {
+        publishOrHandOff(event, this::appendToOutbox);
+    }
+    
+    /**
+     * Publish an event again under its original id, e.g. when replaying a dead letter
+     * 
+     * An outbox row left from earlier attempts is reopened rather than inserted again,
+     * which the unique event_id would reject.
+     * 
+     * @throws EventPublishingException if publishing fails
+     */
+    public void republish(DomainEvent event) {
+        publishOrHandOff(event, this::requeueInOutbox);
+    }
+    
+    /**
+     * Write to the outbox when a transaction is active, otherwise hand the event to
+     * {@link #publishWithRetry}, whose attempts record the outcome in the stats themselves
+     */
+    private void publishOrHandOff(DomainEvent event, Consumer<DomainEvent> outboxWrite) {
+        if (event != null && !shouldUseOutbox()) {
+            handOff(event);
+        } else {
+            publish(event, outboxWrite);
+        }
+    }
+    
+    /**
+     * Record the event in the outbox when a transaction is active, otherwise run the listeners
+     * on the current thread; either way the outcome is recorded once in the stats
+     * 
+     * @param outboxWrite how to record the event when a transaction is active
+     */
+    private void publish(DomainEvent event, Consumer<DomainEvent> outboxWrite) {
         if (event == null) {
             logger.warn("Attempted to publish null event");
             return;
         }
         
+        long started = System.nanoTime();
         try {
             logEventPublishing(event);
             
             if (shouldPublishEvent(event)) {
-                if (config.isMonolithMode()) {
-                    publishToSpringContext(event);
+                if (shouldUseOutbox()) {
+                    outboxWrite.accept(event);
                 } else {
-                    publishToMessageQueue(event);
+                    deliver(event);
                 }
                 
+                config.getStats().recordPublished(event, System.nanoTime() - started);
                 logEventPublished(event);
             } else {
+                config.getStats().recordFiltered(event);
                 logger.debug("Event filtered out: {} {}", event.getEventType(), event.getEventId());
             }
             
         } catch (Exception e) {
+            config.getStats().recordFailed(event, System.nanoTime() - started);
             logger.error("Failed to publish event: {} {}", event.getEventType(), event.getEventId(), e);
             throw new EventPublishingException("Failed to publish event: " + event.getEventId(), e);
         }
     }
     
     /**
-     * Publish a single domain event asynchronously
+     * Publish a single domain event asynchronously on the bounded executor for its category
      * 
      * @param event The domain event to publish
-     * @return CompletableFuture that completes when publishing is done
+     * @return CompletableFuture that completes when the listeners have run
      */
     public CompletableFuture<Void> publishAsync(DomainEvent event) {
-        return CompletableFuture.runAsync(() -> publish(event));
+        if (event == null) {
+            logger.warn("Attempted to publish null event");
+            return CompletableFuture.completedFuture(null);
+        }
+        return CompletableFuture.runAsync(() -> publish(event, this::appendToOutbox), 
+            eventExecutors.forAggregateType(event.getAggregateType()));
     }
     
     /**
@@ -127,47 +207,118 @@ public class DomainEventPublisher {
     }
     
     /**
-     * Publish event with retry logic
+     * Publish event with retry logic, without blocking the caller
+     * 
+     * Every attempt runs on the event's category executor, outside the caller's transaction,
+     * so events are delivered directly rather than through the outbox. Failed attempts are
+     * re-scheduled with jittered exponential backoff; once the retries are used up the event
+     * is written to the dead-letter store and the future completes exceptionally.
      * 
      * @param event The domain event to publish
-     * @param maxRetries Maximum number of retry attempts
-     * @return true if publishing succeeded, false otherwise
+     * @param maxRetries Maximum number of retry attempts after the first one
+     * @return CompletableFuture that completes when an attempt succeeds
      */
-    public boolean publishWithRetry(DomainEvent event, int maxRetries) {
-        int attempts = 0;
-        Exception lastException = null;
-        
-        while (attempts <= maxRetries) {
-            try {
-                publish(event);
-                return true;
-                
-            } catch (Exception e) {
-                lastException = e;
-                attempts++;
-                
-                if (attempts <= maxRetries) {
-                    long delay = calculateRetryDelay(attempts);
-                    logger.warn("Publishing attempt {} failed for event {}, retrying in {}ms", 
-                        attempts, event.getEventId(), delay, e);
-                    
-                    try {
-                        Thread.sleep(delay);
-                    } catch (InterruptedException ie) {
-                        Thread.currentThread().interrupt();
-                        break;
-                    }
-                } else {
-                    logger.error("All {} publishing attempts failed for event {}", 
-                        maxRetries + 1, event.getEventId(), lastException);
+    public CompletableFuture<Void> publishWithRetry(DomainEvent event, int maxRetries) {
+        CompletableFuture<Void> result = new CompletableFuture<>();
+        if (event == null) {
+            logger.warn("Attempted to publish null event");
+            result.complete(null);
+            return result;
+        }
+        attemptPublish(event, 1, Math.max(0, maxRetries), result);
+        return result;
+    }
+    
+    // =================== Internal Publishing Methods ===================
+    
+    /**
+     * Run one publish attempt on the category executor; a full executor counts as a failed attempt
+     */
+    private void attemptPublish(DomainEvent event, int attempt, int maxRetries, CompletableFuture<Void> result) {
+        try {
+            eventExecutors.forAggregateType(event.getAggregateType()).execute(() -> {
+                try {
+                    publish(event, this::appendToOutbox);
+                    result.complete(null);
+                } catch (RuntimeException e) {
+                    onAttemptFailed(event, attempt, maxRetries, e, result);
                 }
+            });
+        } catch (RejectedExecutionException e) {
+            onAttemptFailed(event, attempt, maxRetries, e, result);
+        }
+    }
+    
+    private void onAttemptFailed(DomainEvent event, int attempt, int maxRetries, 
+                                 RuntimeException failure, CompletableFuture<Void> result) {
+        if (attempt <= maxRetries) {
+            logger.warn("Publishing attempt {} failed for event {}, scheduling retry", 
+                attempt, event.getEventId(), failure);
+            try {
+                retryScheduler.scheduleRetry(attempt, () -> attemptPublish(event, attempt + 1, maxRetries, result));
+                return;
+            } catch (RejectedExecutionException e) {
+                logger.warn("Retry scheduler unavailable for event {}", event.getEventId(), e);
             }
         }
         
-        return false;
+        logger.error("All {} publishing attempts failed for event {}", 
+            attempt, event.getEventId(), failure);
+        EventPublishingException exhausted = new EventPublishingException(
+            "Failed to publish event " + event.getEventId() + " after " + attempt + " attempts", failure);
+        try {
+            deadLetterStore.add(event, EventDeadLetterStore.SOURCE_RETRY, attempt, 
+                failure.getClass().getSimpleName() + ": " + failure.getMessage());
+        } catch (RuntimeException e) {
+            logger.error("Failed to dead-letter event {}", event.getEventId(), e);
+            exhausted.addSuppressed(e);
+        }
+        result.completeExceptionally(exhausted);
     }
     
-    // =================== Internal Publishing Methods ===================
+    /**
+     * Events raised outside a transaction have no commit to attach to and are delivered directly
+     */
+    private boolean shouldUseOutbox() {
+        return outboxEnabled && TransactionSynchronizationManager.isActualTransactionActive();
+    }
+    
+    /**
+     * Record event in the transactional outbox; delivery happens after commit
+     */
+    private void appendToOutbox(DomainEvent event) {
+        outboxStore.append(event);
+        logger.debug("Appended event to outbox: {} {}", 
+            event.getEventType(), event.getEventId());
+    }
+    
+    /**
+     * Run the listeners on the event's category executor without waiting for them; failures
+     * are retried and finally dead-lettered by {@link #publishWithRetry}
+     */
+    private void handOff(DomainEvent event) {
+        publishWithRetry(event, directMaxRetries);
+    }
+    
+    /**
+     * Run the listeners on the current thread; listener failures propagate
+     */
+    private void deliver(DomainEvent event) {
+        if (config.isMonolithMode()) {
+            publishToSpringContext(event);
+        } else {
+            publishToMessageQueue(event);
+        }
+    }
+    
+    /**
+     * Queue an event that may already have an outbox row for delivery after commit
+     */
+    private void requeueInOutbox(DomainEvent event) {
+        outboxStore.requeue(event);
+        logger.debug("Requeued event in outbox: {} {}", 
+            event.getEventType(), event.getEventId());
+    }
     
     /**
      * Publish event to Spring application context (monolith mode)
@@ -238,15 +389,6 @@ public class DomainEventPublisher {
             event.getEventType(), event.getEventId());
     }
     
-    // =================== Utility Methods ===================
-    
-    /**
-     * Calculate exponential backoff delay for retry attempts
-     */
-    private long calculateRetryDelay(int attempt) {
-        return Math.min(1000L * (1L << (attempt - 1)), 10000L); // Max 10 seconds
-    }
-    
     // =================== Configuration Methods ===================
     
     /**
@@ -263,6 +405,13 @@ public class DomainEventPublisher {
         return config.isAsyncEnabled();
     }
     
+    /**
+     * Check if transactional events are routed through the outbox
+     */
+    public boolean isOutboxEnabled() {
+        return outboxEnabled;
+    }
+    
     /**
      * Get current publishing statistics
      */
@@ -296,7 +445,11 @@ class EventPublishingConfiguration {
     private boolean asyncEnabled = true;
     private java.util.Set<String> allowedEventTypes = java.util.Collections.emptySet();
     private java.util.Set<String> allowedAggregateTypes = java.util.Collections.emptySet();
-    private final EventPublishingStats stats = new EventPublishingStats();
+    private final EventPublishingStats stats;
+    
+    public EventPublishingConfiguration(MeterRegistry meterRegistry) {
+        this.stats = new EventPublishingStats(meterRegistry);
+    }
     
     public boolean isMonolithMode() { return monolithMode; }
     public void setMonolithMode(boolean monolithMode) { this.monolithMode = monolithMode; }
@@ -325,22 +478,62 @@ class EventPublishingConfiguration {
 
 /**
  * Statistics for event publishing
+ * 
+ * Totals are LongAdders so concurrent publishers never lose increments; each outcome is also
+ * a Micrometer counter tagged by event and aggregate type, and publish latency is a timer per
+ * event type, all visible under /actuator/metrics/domain.events.*
  */
 class EventPublishingStats {
-    private long totalEventsPublished = 0;
-    private long totalEventsFailed = 0;
-    private long totalEventsFiltered = 0;
+    private final MeterRegistry meterRegistry;
+    private final LongAdder totalEventsPublished = new LongAdder();
+    private final LongAdder totalEventsFailed = new LongAdder();
+    private final LongAdder totalEventsFiltered = new LongAdder();
     
-    public void incrementPublished() { totalEventsPublished++; }
-    public void incrementFailed() { totalEventsFailed++; }
-    public void incrementFiltered() { totalEventsFiltered++; }
+    EventPublishingStats(MeterRegistry meterRegistry) {
+        this.meterRegistry = meterRegistry;
+    }
+    
+    public void recordPublished(DomainEvent event, long durationNanos) {
+        totalEventsPublished.increment();
+        counter("domain.events.published", event).increment();
+        publishTimer(event, "published").record(durationNanos, TimeUnit.NANOSECONDS);
+    }
     
-    public long getTotalEventsPublished() { return totalEventsPublished; }
-    public long getTotalEventsFailed() { return totalEventsFailed; }
-    public long getTotalEventsFiltered() { return totalEventsFiltered; }
+    public void recordFailed(DomainEvent event, long durationNanos) {
+        totalEventsFailed.increment();
+        counter("domain.events.failed", event).increment();
+        publishTimer(event, "failed").record(durationNanos, TimeUnit.NANOSECONDS);
+    }
+    
+    public void recordFiltered(DomainEvent event) {
+        totalEventsFiltered.increment();
+        counter("domain.events.filtered", event).increment();
+    }
+    
+    public long getTotalEventsPublished() { return totalEventsPublished.sum(); }
+    public long getTotalEventsFailed() { return totalEventsFailed.sum(); }
+    public long getTotalEventsFiltered() { return totalEventsFiltered.sum(); }
     
     public double getSuccessRate() {
-        long total = totalEventsPublished + totalEventsFailed;
-        return total > 0 ? (double) totalEventsPublished / total : 0.0;
+        long published = getTotalEventsPublished();
+        long total = published + getTotalEventsFailed();
+        return total > 0 ? (double) published / total : 0.0;
+    }
+    
+    // Registration is idempotent: the registry returns the existing meter for the same name and tags
+    private Counter counter(String name, DomainEvent event) {
+        return Counter.builder(name)
+            .tag("event.type", event.getEventType())
+            .tag("aggregate.type", event.getAggregateType())
+            .register(meterRegistry);
+    }
+    
+    private Timer publishTimer(DomainEvent event, String outcome) {
+        return Timer.builder("domain.events.publish")
+            .description("Time to publish a domain event (in-process dispatch or outbox append)")
+            .tag("event.type", event.getEventType())
+            .tag("aggregate.type", event.getAggregateType())
+            .tag("outcome", outcome)
+            .register(meterRegistry);
     }
 }
@@ -0,0 +1,137 @@
+package com.usyd.catams.common.infrastructure.event;
+
+import com.usyd.catams.common.domain.event.DomainEvent;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.jdbc.core.RowMapper;
+import org.springframework.stereotype.Component;
+
+import java.io.IOException;
+import java.sql.Timestamp;
+import java.time.LocalDateTime;
+import java.util.List;
+import java.util.Optional;
+import java.util.UUID;
+
+/**
+ * JDBC access to the {@code event_dead_letter} table.
+ *
+ * Payloads use the same Java serialization as {@link EventOutboxStore}, so outbox rows can be
+ * copied across verbatim even when they could not be deserialized.
+ */
+@Component
+public class EventDeadLetterStore {
+
+    public static final String SOURCE_RETRY = "RETRY";
+    public static final String SOURCE_OUTBOX = "OUTBOX";
+
+    private static final int MAX_ERROR_LENGTH = 1000;
+
+    private static final String COLUMNS =
+        "id, event_id, event_type, aggregate_type, aggregate_id, source, attempts, last_error, " +
+        "dead_lettered_at, replayed_at";
+
+    private static final String INSERT_SQL =
+        "INSERT INTO event_dead_letter (event_id, event_type, aggregate_type, aggregate_id, payload, source, " +
+        "attempts, last_error) VALUES (?, ?, ?, ?, ?, ?, ?, ?)";
+
+    private static final String COPY_FROM_OUTBOX_SQL =
+        "INSERT INTO event_dead_letter (event_id, event_type, aggregate_type, aggregate_id, payload, source, " +
+        "attempts, last_error) " +
+        "SELECT event_id, event_type, aggregate_type, aggregate_id, payload, '" + SOURCE_OUTBOX + "', ?, ? " +
+        "FROM event_outbox WHERE id = ?";
+
+    private static final String FIND_PENDING_SQL =
+        "SELECT " + COLUMNS + " FROM event_dead_letter WHERE replayed_at IS NULL " +
+        "ORDER BY dead_lettered_at DESC, id DESC LIMIT ?";
+
+    private static final String FIND_BY_ID_FOR_UPDATE_SQL =
+        "SELECT " + COLUMNS + ", payload FROM event_dead_letter WHERE id = ? FOR UPDATE";
+
+    private static final String MARK_REPLAYED_SQL =
+        "UPDATE event_dead_letter SET replayed_at = CURRENT_TIMESTAMP WHERE id = ?";
+
+    /**
+     * A dead-lettered event without its payload.
+     */
+    public record DeadLetter(long id, UUID eventId, String eventType, String aggregateType, String aggregateId,
+                             String source, int attempts, String lastError,
+                             LocalDateTime deadLetteredAt, LocalDateTime replayedAt) {
+
+        public boolean isReplayed() {
+            return replayedAt != null;
+        }
+    }
+
+    /**
+     * A dead-lettered row locked for replay, with its payload.
+     */
+    public record LockedDeadLetter(DeadLetter deadLetter, byte[] payload) {
+
+        public DomainEvent readEvent() throws IOException, ClassNotFoundException {
+            return EventOutboxStore.deserialize(payload);
+        }
+    }
+
+    private static final RowMapper<DeadLetter> DEAD_LETTER_MAPPER = (rs, rowNum) -> new DeadLetter(
+        rs.getLong("id"),
+        rs.getObject("event_id", UUID.class),
+        rs.getString("event_type"),
+        rs.getString("aggregate_type"),
+        rs.getString("aggregate_id"),
+        rs.getString("source"),
+        rs.getInt("attempts"),
+        rs.getString("last_error"),
+        toLocalDateTime(rs.getTimestamp("dead_lettered_at")),
+        toLocalDateTime(rs.getTimestamp("replayed_at")));
+
+    private final JdbcTemplate jdbcTemplate;
+
+    public EventDeadLetterStore(JdbcTemplate jdbcTemplate) {
+        this.jdbcTemplate = jdbcTemplate;
+    }
+
+    public void add(DomainEvent event, String source, int attempts, String lastError) {
+        jdbcTemplate.update(INSERT_SQL,
+            event.getEventId(),
+            event.getEventType(),
+            event.getAggregateType(),
+            event.getAggregateId(),
+            EventOutboxStore.serialize(event),
+            source,
+            attempts,
+            truncate(lastError));
+    }
+
+    /**
+     * Copy an outbox row (payload included) into the dead-letter store in the current transaction.
+     */
+    public void addFromOutbox(long outboxId, int attempts, String lastError) {
+        jdbcTemplate.update(COPY_FROM_OUTBOX_SQL, attempts, truncate(lastError), outboxId);
+    }
+
+    public List<DeadLetter> findPending(int limit) {
+        return jdbcTemplate.query(FIND_PENDING_SQL, DEAD_LETTER_MAPPER, limit);
+    }
+
+    /**
+     * Lock a dead-letter row for replay; must run inside a transaction.
+     */
+    public Optional<LockedDeadLetter> lockForReplay(long id) {
+        return jdbcTemplate.query(FIND_BY_ID_FOR_UPDATE_SQL, (rs, rowNum) ->
+                new LockedDeadLetter(DEAD_LETTER_MAPPER.mapRow(rs, rowNum), rs.getBytes("payload")), id)
+            .stream()
+            .findFirst();
+    }
+
+    public void markReplayed(long id) {
+        jdbcTemplate.update(MARK_REPLAYED_SQL, id);
+    }
+
+    private static String truncate(String error) {
+        return error != null && error.length() > MAX_ERROR_LENGTH ? error.substring(0, MAX_ERROR_LENGTH) : error;
+    }
+
+    private static LocalDateTime toLocalDateTime(Timestamp timestamp) {
+        return timestamp != null ? timestamp.toLocalDateTime() : null;
+    }
+}
@@ -0,0 +1,79 @@
+package com.usyd.catams.common.infrastructure.event;
+
+import org.springframework.boot.context.properties.ConfigurationProperties;
+
+import java.time.Duration;
+
+/**
+ * Thread pool sizing for asynchronous domain event handling, one pool per event category.
+ *
+ * Note: This bean is registered via @EnableConfigurationProperties in EventExecutorConfig.
+ */
+@ConfigurationProperties(prefix = "app.events.executors")
+public class EventExecutorProperties {
+
+    /**
+     * What to do with a task when the pool is at max size and its queue is full.
+     */
+    public enum RejectionPolicy {
+        /** Run the handler on the publishing thread (back-pressure, nothing is lost). */
+        CALLER_RUNS,
+        /** Throw TaskRejectedException to the publisher, which counts it as a failed attempt. */
+        ABORT
+    }
+
+    /**
+     * Sizing of a single bounded pool.
+     */
+    public static class Pool {
+        private int coreSize;
+        private int maxSize;
+        private int queueCapacity;
+        private Duration keepAlive = Duration.ofSeconds(60);
+        private RejectionPolicy rejectionPolicy = RejectionPolicy.CALLER_RUNS;
+
+        public Pool() {
+        }
+
+        Pool(int coreSize, int maxSize, int queueCapacity) {
+            this.coreSize = coreSize;
+            this.maxSize = maxSize;
+            this.queueCapacity = queueCapacity;
+        }
+
+        public int getCoreSize() { return coreSize; }
+        public void setCoreSize(int coreSize) { this.coreSize = coreSize; }
+
+        public int getMaxSize() { return maxSize; }
+        public void setMaxSize(int maxSize) { this.maxSize = maxSize; }
+
+        public int getQueueCapacity() { return queueCapacity; }
+        public void setQueueCapacity(int queueCapacity) { this.queueCapacity = queueCapacity; }
+
+        public Duration getKeepAlive() { return keepAlive; }
+        public void setKeepAlive(Duration keepAlive) { this.keepAlive = keepAlive; }
+
+        public RejectionPolicy getRejectionPolicy() { return rejectionPolicy; }
+        public void setRejectionPolicy(RejectionPolicy rejectionPolicy) { this.rejectionPolicy = rejectionPolicy; }
+    }
+
+    /** Timesheet lifecycle and approval events; by far the busiest category. */
+    private final Pool timesheet = new Pool(4, 8, 500);
+    /** User management events. */
+    private final Pool user = new Pool(1, 2, 100);
+    /** Course management events. */
+    private final Pool course = new Pool(1, 2, 100);
+
+    /** How long shutdown waits for queued handlers to finish. */
+    private Duration shutdownTimeout = Duration.ofSeconds(30);
+
+    public Pool getTimesheet() { return timesheet; }
+
+    public Pool getUser() { return user; }
+
+    public Pool getCourse() { return course; }
+
+    public Duration getShutdownTimeout() { return shutdownTimeout; }
+
+    public void setShutdownTimeout(Duration shutdownTimeout) { this.shutdownTimeout = shutdownTimeout; }
+}
@@ -0,0 +1,45 @@
+package com.usyd.catams.common.infrastructure.event;
+
+import org.springframework.beans.factory.annotation.Qualifier;
+import org.springframework.stereotype.Component;
+
+import java.util.concurrent.Executor;
+
+/**
+ * Bean names of the per-category domain event executors and routing of events to them.
+ *
+ * The outbox drainer and {@link DomainEventPublisher} run listeners on the executor chosen here.
+ */
+@Component
+public class EventExecutors {
+
+    public static final String TIMESHEET = "timesheetEventExecutor";
+    public static final String USER = "userEventExecutor";
+    public static final String COURSE = "courseEventExecutor";
+
+    private final Executor timesheetExecutor;
+    private final Executor userExecutor;
+    private final Executor courseExecutor;
+
+    public EventExecutors(@Qualifier(TIMESHEET) Executor timesheetExecutor,
+                          @Qualifier(USER) Executor userExecutor,
+                          @Qualifier(COURSE) Executor courseExecutor) {
+        this.timesheetExecutor = timesheetExecutor;
+        this.userExecutor = userExecutor;
+        this.courseExecutor = courseExecutor;
+    }
+
+    /**
+     * Executor for events of the given aggregate type ("TIMESHEET", "USER", "COURSE").
+     * Unknown aggregate types share the timesheet pool.
+     */
+    public Executor forAggregateType(String aggregateType) {
+        if ("USER".equals(aggregateType)) {
+            return userExecutor;
+        }
+        if ("COURSE".equals(aggregateType)) {
+            return courseExecutor;
+        }
+        return timesheetExecutor;
+    }
+}
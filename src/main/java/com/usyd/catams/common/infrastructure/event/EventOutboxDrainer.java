@@ -0,0 +1,240 @@
+package com.usyd.catams.common.infrastructure.event;
+
+import io.micrometer.core.instrument.Counter;
+import io.micrometer.core.instrument.Gauge;
+import io.micrometer.core.instrument.MeterRegistry;
+import io.micrometer.core.instrument.TimeGauge;
+import io.micrometer.core.instrument.Timer;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+import org.springframework.beans.factory.annotation.Value;
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty;
+import org.springframework.context.ApplicationEventPublisher;
+import org.springframework.scheduling.annotation.Scheduled;
+import org.springframework.stereotype.Component;
+import org.springframework.transaction.PlatformTransactionManager;
+import org.springframework.transaction.support.TransactionTemplate;
+
+import java.time.Duration;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.CompletionException;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.RejectedExecutionException;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.TimeoutException;
+import java.util.concurrent.atomic.AtomicLong;
+
+/**
+ * Background worker that delivers outbox rows to the in-process event listeners
+ * ({@link DomainEventHandler} and any other {@code @EventListener}).
+ *
+ * A batch is claimed in one short statement that leases the rows ({@code claimed_until}, taken with
+ * {@code FOR UPDATE SKIP LOCKED}), so concurrent nodes never deliver the same row at the same time.
+ * The listeners then run with no transaction, connection or row lock held, and a second short
+ * transaction closes the delivered rows. Delivery is at-least-once: rows of a node that dies
+ * mid-batch are claimed again once their lease (twice the dispatch timeout) runs out, so handlers
+ * should tolerate a repeated {@code eventId}. A row whose dispatch fails has its attempt count
+ * bumped and its lease released, and is retried on a later poll; once
+ * {@code app.events.outbox.max-attempts} is reached it is copied to the dead-letter store
+ * ({@link EventDeadLetterStore}) and closed.
+ *
+ * Listeners run on the event's category executor ({@link EventExecutors}) and the batch waits for
+ * them, up to {@code app.events.outbox.dispatch-timeout}, before marking anything: a row is only
+ * closed once every listener returned. A listener that throws, a full executor with the ABORT
+ * policy and a dispatch that outlives the timeout all count as a failed attempt. With the default
+ * CALLER_RUNS policy a full executor runs the listeners on the drainer's own thread instead,
+ * which slows draining down rather than failing the row.
+ */
+@Component
+@ConditionalOnProperty(prefix = "app.events.outbox", name = "enabled", havingValue = "true", matchIfMissing = true)
+public class EventOutboxDrainer {
+
+    private static final Logger logger = LoggerFactory.getLogger(EventOutboxDrainer.class);
+
+    // Upper bound on batches per poll so one node does not monopolise a large backlog
+    private static final int MAX_BATCHES_PER_POLL = 20;
+
+    private final EventOutboxStore outboxStore;
+    private final EventDeadLetterStore deadLetterStore;
+    private final ApplicationEventPublisher applicationEventPublisher;
+    private final EventExecutors eventExecutors;
+    private final TransactionTemplate transactionTemplate;
+    private final int batchSize;
+    private final int maxAttempts;
+    private final Duration dispatchTimeout;
+    private final Duration claimLease;
+
+    private final Counter dispatchedCounter;
+    private final Counter failedCounter;
+    private final Counter deadLetteredCounter;
+    private final Timer lagTimer;
+    private final AtomicLong pendingEvents = new AtomicLong();
+    private final AtomicLong oldestPendingAgeMillis = new AtomicLong();
+
+    public EventOutboxDrainer(EventOutboxStore outboxStore,
+                              EventDeadLetterStore deadLetterStore,
+                              ApplicationEventPublisher applicationEventPublisher,
+                              EventExecutors eventExecutors,
+                              PlatformTransactionManager transactionManager,
+                              MeterRegistry meterRegistry,
+                              @Value("${app.events.outbox.batch-size:100}") int batchSize,
+                              @Value("${app.events.outbox.max-attempts:10}") int maxAttempts,
+                              @Value("${app.events.outbox.dispatch-timeout:PT30S}") Duration dispatchTimeout) {
+        this.outboxStore = outboxStore;
+        this.deadLetterStore = deadLetterStore;
+        this.applicationEventPublisher = applicationEventPublisher;
+        this.eventExecutors = eventExecutors;
+        this.transactionTemplate = new TransactionTemplate(transactionManager);
+        this.batchSize = batchSize;
+        this.maxAttempts = maxAttempts;
+        this.dispatchTimeout = dispatchTimeout;
+        this.claimLease = dispatchTimeout.multipliedBy(2);
+
+        this.dispatchedCounter = Counter.builder("domain.events.outbox.dispatched")
+            .description("Outbox events delivered to in-process listeners")
+            .register(meterRegistry);
+        this.failedCounter = Counter.builder("domain.events.outbox.failed")
+            .description("Outbox dispatch attempts that failed")
+            .register(meterRegistry);
+        this.deadLetteredCounter = Counter.builder("domain.events.outbox.dead.lettered")
+            .description("Outbox events moved to the dead-letter store after exhausting their attempts")
+            .register(meterRegistry);
+        this.lagTimer = Timer.builder("domain.events.outbox.lag")
+            .description("Time from outbox insert to dispatch")
+            .publishPercentiles(0.5, 0.95, 0.99)
+            .register(meterRegistry);
+        Gauge.builder("domain.events.outbox.pending", pendingEvents, AtomicLong::get)
+            .description("Unprocessed outbox rows at the last poll")
+            .register(meterRegistry);
+        TimeGauge.builder("domain.events.outbox.oldest.age", oldestPendingAgeMillis, TimeUnit.MILLISECONDS,
+                AtomicLong::get)
+            .description("Age of the oldest unprocessed outbox row at the last poll")
+            .register(meterRegistry);
+    }
+
+    /**
+     * Drain the outbox until it is empty or the per-poll batch limit is reached.
+     */
+    @Scheduled(fixedDelayString = "${app.events.outbox.poll-interval:PT1S}",
+               initialDelayString = "${app.events.outbox.initial-delay:PT10S}")
+    public void drain() {
+        try {
+            for (int batch = 0; batch < MAX_BATCHES_PER_POLL; batch++) {
+                if (drainBatch() < batchSize) {
+                    break;
+                }
+            }
+            refreshBacklog();
+        } catch (RuntimeException e) {
+            logger.error("Event outbox drain failed", e);
+        }
+    }
+
+    /**
+     * Claim one batch, dispatch it, then mark the outcome in a separate transaction.
+     *
+     * @return number of rows claimed
+     */
+    public int drainBatch() {
+        List<EventOutboxStore.OutboxEntry> entries = outboxStore.claimBatch(batchSize, maxAttempts, claimLease);
+        if (entries.isEmpty()) {
+            return 0;
+        }
+        List<CompletableFuture<Void>> dispatches = new ArrayList<>(entries.size());
+        for (EventOutboxStore.OutboxEntry entry : entries) {
+            dispatches.add(entry.event() != null ? dispatch(entry) : null);
+        }
+        long deadline = System.nanoTime() + dispatchTimeout.toNanos();
+        List<String> errors = new ArrayList<>(entries.size());
+        for (int i = 0; i < entries.size(); i++) {
+            EventOutboxStore.OutboxEntry entry = entries.get(i);
+            errors.add(entry.event() != null ? await(dispatches.get(i), deadline) : entry.readError());
+        }
+
+        transactionTemplate.executeWithoutResult(status -> {
+            List<Long> processed = new ArrayList<>(entries.size());
+            for (int i = 0; i < entries.size(); i++) {
+                EventOutboxStore.OutboxEntry entry = entries.get(i);
+                String error = errors.get(i);
+                if (error == null) {
+                    dispatchedCounter.increment();
+                    lagTimer.record(entry.age());
+                }
+                if (error == null || recordFailure(entry, error)) {
+                    processed.add(entry.id());
+                }
+            }
+            outboxStore.markProcessed(processed);
+        });
+        return entries.size();
+    }
+
+    /**
+     * Run the listeners for one row on its category executor.
+     *
+     * @return completes once every listener returned, or exceptionally with the first failure
+     */
+    private CompletableFuture<Void> dispatch(EventOutboxStore.OutboxEntry entry) {
+        try {
+            return CompletableFuture.runAsync(() -> applicationEventPublisher.publishEvent(entry.event()),
+                eventExecutors.forAggregateType(entry.event().getAggregateType()));
+        } catch (RejectedExecutionException e) {
+            return CompletableFuture.failedFuture(e);
+        }
+    }
+
+    /**
+     * Wait for a dispatch until the batch deadline; a dispatch still running then is retried
+     * on a later poll, so its listeners may see the event twice.
+     *
+     * @return null if the listeners completed, otherwise the failure description
+     */
+    private String await(CompletableFuture<Void> dispatch, long deadline) {
+        try {
+            dispatch.get(Math.max(0, deadline - System.nanoTime()), TimeUnit.NANOSECONDS);
+            return null;
+        } catch (ExecutionException e) {
+            return describe(e.getCause());
+        } catch (TimeoutException e) {
+            return "Listeners did not finish within " + dispatchTimeout;
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+            return "Interrupted while waiting for listeners";
+        }
+    }
+
+    private static String describe(Throwable failure) {
+        Throwable cause = failure instanceof CompletionException && failure.getCause() != null
+            ? failure.getCause() : failure;
+        return cause.getClass().getSimpleName() + ": " + cause.getMessage();
+    }
+
+    /**
+     * Count a failed attempt; dead-letter the row once it has used up its attempts.
+     *
+     * @return true if the row was dead-lettered and can be closed
+     */
+    private boolean recordFailure(EventOutboxStore.OutboxEntry entry, String error) {
+        failedCounter.increment();
+        int attempts = entry.attempts() + 1;
+        outboxStore.recordFailure(entry.id(), error);
+        if (attempts < maxAttempts) {
+            logger.warn("Outbox event {} ({}) dispatch failed (attempt {}): {}",
+                entry.eventId(), entry.eventType(), attempts, error);
+            return false;
+        }
+        deadLetterStore.addFromOutbox(entry.id(), attempts, error);
+        deadLetteredCounter.increment();
+        logger.error("Outbox event {} ({}) failed {} times and was dead-lettered: {}",
+            entry.eventId(), entry.eventType(), attempts, error);
+        return true;
+    }
+
+    private void refreshBacklog() {
+        EventOutboxStore.Backlog backlog = outboxStore.backlog();
+        pendingEvents.set(backlog.pending());
+        oldestPendingAgeMillis.set(backlog.oldestAge().toMillis());
+    }
+}
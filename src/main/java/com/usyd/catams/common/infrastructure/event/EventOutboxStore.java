@@ -0,0 +1,178 @@
+package com.usyd.catams.common.infrastructure.event;
+
+import com.usyd.catams.common.domain.event.DomainEvent;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.stereotype.Component;
+
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.IOException;
+import java.io.ObjectInputFilter;
+import java.io.ObjectInputStream;
+import java.io.ObjectOutputStream;
+import java.sql.Timestamp;
+import java.time.Duration;
+import java.util.Comparator;
+import java.util.List;
+import java.util.UUID;
+
+/**
+ * JDBC access to the {@code event_outbox} table.
+ *
+ * Events are stored as Java-serialized payloads (every {@link DomainEvent} is {@code Serializable}
+ * and immutable, with no JSON creators), so the drainer gets back the exact event type that was
+ * published. Writes join the caller's transaction. {@link #claimBatch} leases the rows it returns
+ * instead of holding locks, so it is meant to run on its own, outside a long transaction.
+ */
+@Component
+public class EventOutboxStore {
+
+    // Payloads are only ever written by this application; refuse anything else on read
+    private static final ObjectInputFilter PAYLOAD_FILTER =
+        ObjectInputFilter.Config.createFilter("com.usyd.catams.**;java.**;!*");
+
+    private static final int MAX_ERROR_LENGTH = 1000;
+
+    private static final String INSERT_SQL =
+        "INSERT INTO event_outbox (event_id, event_type, aggregate_type, aggregate_id, payload, occurred_at) " +
+        "VALUES (?, ?, ?, ?, ?, ?)";
+
+    // SKIP LOCKED lets several nodes claim concurrently; the lease keeps a claimed row away from
+    // other nodes after the claiming statement has committed
+    private static final String CLAIM_SQL =
+        "UPDATE event_outbox SET claimed_until = CURRENT_TIMESTAMP + ? * INTERVAL '1 millisecond' " +
+        "WHERE id IN (" +
+        "SELECT id FROM event_outbox " +
+        "WHERE processed_at IS NULL AND attempts < ? " +
+        "AND (claimed_until IS NULL OR claimed_until < CURRENT_TIMESTAMP) " +
+        "ORDER BY id " +
+        "LIMIT ? " +
+        "FOR UPDATE SKIP LOCKED) " +
+        "RETURNING id, event_id, event_type, payload, attempts, " +
+        "(EXTRACT(EPOCH FROM (CURRENT_TIMESTAMP - created_at)) * 1000)::bigint AS age_ms";
+
+    private static final String MARK_PROCESSED_SQL =
+        "UPDATE event_outbox SET processed_at = CURRENT_TIMESTAMP, claimed_until = NULL WHERE id = ?";
+
+    // A replayed event starts over: fresh attempts and age, so it neither skips the claim nor skews the lag
+    private static final String REOPEN_SQL =
+        "UPDATE event_outbox SET processed_at = NULL, attempts = 0, last_error = NULL, " +
+        "claimed_until = NULL, created_at = CURRENT_TIMESTAMP WHERE event_id = ?";
+
+    // Releases the lease, so the next poll can try again
+    private static final String RECORD_FAILURE_SQL =
+        "UPDATE event_outbox SET attempts = attempts + 1, last_error = ?, claimed_until = NULL WHERE id = ?";
+
+    private static final String BACKLOG_SQL =
+        "SELECT COUNT(*) AS pending, " +
+        "COALESCE((EXTRACT(EPOCH FROM (CURRENT_TIMESTAMP - MIN(created_at))) * 1000)::bigint, 0) AS oldest_age_ms " +
+        "FROM event_outbox WHERE processed_at IS NULL";
+
+    /**
+     * A claimed outbox row. {@code event} is null when the payload could not be deserialized.
+     */
+    public record OutboxEntry(long id, UUID eventId, String eventType, DomainEvent event,
+                              int attempts, Duration age, String readError) {
+    }
+
+    /**
+     * Unprocessed rows and the age of the oldest one.
+     */
+    public record Backlog(long pending, Duration oldestAge) {
+    }
+
+    private final JdbcTemplate jdbcTemplate;
+
+    public EventOutboxStore(JdbcTemplate jdbcTemplate) {
+        this.jdbcTemplate = jdbcTemplate;
+    }
+
+    /**
+     * Append an event to the outbox in the current transaction.
+     */
+    public void append(DomainEvent event) {
+        jdbcTemplate.update(INSERT_SQL,
+            event.getEventId(),
+            event.getEventType(),
+            event.getAggregateType(),
+            event.getAggregateId(),
+            serialize(event),
+            Timestamp.valueOf(event.getOccurredAt()));
+    }
+
+    /**
+     * Queue an event for delivery again in the current transaction: reopen its existing row,
+     * or append it if the outbox never held it.
+     */
+    public void requeue(DomainEvent event) {
+        if (jdbcTemplate.update(REOPEN_SQL, event.getEventId()) == 0) {
+            append(event);
+        }
+    }
+
+    /**
+     * Lease and return up to {@code limit} unprocessed rows, oldest first, that have not yet
+     * used up {@code maxAttempts}. Rows leased or locked by another node are skipped rather than
+     * waited on; the lease ends when the row is marked processed or its failure is recorded, or
+     * after {@code lease} if neither happens.
+     */
+    public List<OutboxEntry> claimBatch(int limit, int maxAttempts, Duration lease) {
+        List<OutboxEntry> entries = jdbcTemplate.query(CLAIM_SQL, (rs, rowNum) -> {
+            DomainEvent event = null;
+            String readError = null;
+            try {
+                event = deserialize(rs.getBytes("payload"));
+            } catch (IOException | ClassNotFoundException | ClassCastException e) {
+                readError = e.getClass().getSimpleName() + ": " + e.getMessage();
+            }
+            return new OutboxEntry(
+                rs.getLong("id"),
+                rs.getObject("event_id", UUID.class),
+                rs.getString("event_type"),
+                event,
+                rs.getInt("attempts"),
+                Duration.ofMillis(Math.max(0L, rs.getLong("age_ms"))),
+                readError);
+        }, lease.toMillis(), maxAttempts, limit);
+        // RETURNING does not keep the subquery's order
+        entries.sort(Comparator.comparingLong(OutboxEntry::id));
+        return entries;
+    }
+
+    public void markProcessed(List<Long> ids) {
+        if (ids.isEmpty()) {
+            return;
+        }
+        jdbcTemplate.batchUpdate(MARK_PROCESSED_SQL, ids, ids.size(),
+            (ps, id) -> ps.setLong(1, id));
+    }
+
+    public void recordFailure(long id, String error) {
+        String truncated = error != null && error.length() > MAX_ERROR_LENGTH
+            ? error.substring(0, MAX_ERROR_LENGTH)
+            : error;
+        jdbcTemplate.update(RECORD_FAILURE_SQL, truncated, id);
+    }
+
+    public Backlog backlog() {
+        return jdbcTemplate.queryForObject(BACKLOG_SQL, (rs, rowNum) ->
+            new Backlog(rs.getLong("pending"), Duration.ofMillis(Math.max(0L, rs.getLong("oldest_age_ms")))));
+    }
+
+    static byte[] serialize(DomainEvent event) {
+        ByteArrayOutputStream bytes = new ByteArrayOutputStream(512);
+        try (ObjectOutputStream out = new ObjectOutputStream(bytes)) {
+            out.writeObject(event);
+        } catch (IOException e) {
+            throw new EventPublishingException("Failed to serialize event: " + event.getEventId(), e);
+        }
+        return bytes.toByteArray();
+    }
+
+    static DomainEvent deserialize(byte[] payload) throws IOException, ClassNotFoundException {
+        try (ObjectInputStream in = new ObjectInputStream(new ByteArrayInputStream(payload))) {
+            in.setObjectInputFilter(PAYLOAD_FILTER);
+            return (DomainEvent) in.readObject();
+        }
+    }
+}
@@ -0,0 +1,86 @@
+package com.usyd.catams.common.infrastructure.event;
+
+import jakarta.annotation.PreDestroy;
+import org.springframework.beans.factory.annotation.Value;
+import org.springframework.stereotype.Component;
+
+import java.time.Duration;
+import java.util.concurrent.Executors;
+import java.util.concurrent.ScheduledExecutorService;
+import java.util.concurrent.ThreadFactory;
+import java.util.concurrent.ThreadLocalRandom;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.atomic.AtomicInteger;
+
+/**
+ * Timer for delayed publish retries, with jittered exponential backoff.
+ *
+ * The scheduler thread only waits out the delay; the retry itself is handed back to the
+ * event's category executor, so a slow listener never occupies it. When that executor is full
+ * the retry is rejected rather than run here, even under {@code CALLER_RUNS} (see
+ * {@link #isRetryThread()}), and counts as another failed attempt. The executor is kept
+ * private rather than exposed as a bean, which would displace Boot's {@code taskScheduler}
+ * used by {@code @Scheduled} jobs.
+ */
+@Component
+public class EventRetryScheduler {
+
+    private static final ThreadLocal<Boolean> RETRY_THREAD = new ThreadLocal<>();
+
+    private final ScheduledExecutorService scheduler;
+    private final Duration initialDelay;
+    private final Duration maxDelay;
+
+    public EventRetryScheduler(@Value("${app.events.retry.scheduler-threads:1}") int schedulerThreads,
+                               @Value("${app.events.retry.initial-delay:PT1S}") Duration initialDelay,
+                               @Value("${app.events.retry.max-delay:PT10S}") Duration maxDelay) {
+        this.scheduler = Executors.newScheduledThreadPool(Math.max(1, schedulerThreads), threadFactory());
+        this.initialDelay = initialDelay;
+        this.maxDelay = maxDelay;
+    }
+
+    /**
+     * Run {@code task} after the backoff delay for the given (1-based) failed attempt.
+     *
+     * @throws java.util.concurrent.RejectedExecutionException if the scheduler is shut down
+     */
+    public void scheduleRetry(int failedAttempt, Runnable task) {
+        scheduler.schedule(task, backoffDelay(failedAttempt).toMillis(), TimeUnit.MILLISECONDS);
+    }
+
+    /**
+     * Whether the current thread is a retry scheduler thread; rejection policies use this to
+     * refuse running a listener on it
+     */
+    public static boolean isRetryThread() {
+        return RETRY_THREAD.get() != null;
+    }
+
+    /**
+     * Exponential backoff capped at the max delay, with "equal jitter": a uniformly random
+     * point in the upper half of the window, so retries from a burst do not line up.
+     */
+    Duration backoffDelay(int failedAttempt) {
+        int exponent = Math.min(Math.max(failedAttempt, 1) - 1, 20);
+        long ceiling = Math.min(initialDelay.toMillis() << exponent, maxDelay.toMillis());
+        long half = ceiling / 2;
+        return Duration.ofMillis(half + ThreadLocalRandom.current().nextLong(ceiling - half + 1));
+    }
+
+    @PreDestroy
+    void shutdown() {
+        scheduler.shutdownNow();
+    }
+
+    private static ThreadFactory threadFactory() {
+        AtomicInteger sequence = new AtomicInteger();
+        return runnable -> {
+            Thread thread = new Thread(() -> {
+                RETRY_THREAD.set(Boolean.TRUE);
+                runnable.run();
+            }, "event-retry-" + sequence.incrementAndGet());
+            thread.setDaemon(true);
+            return thread;
+        };
+    }
+}
@@ -0,0 +1,145 @@
+package com.usyd.catams.config;
+
+import com.usyd.catams.common.infrastructure.event.EventExecutorProperties;
+import com.usyd.catams.common.infrastructure.event.EventExecutors;
+import com.usyd.catams.common.infrastructure.event.EventRetryScheduler;
+import io.micrometer.core.instrument.Counter;
+import io.micrometer.core.instrument.Gauge;
+import io.micrometer.core.instrument.MeterRegistry;
+import io.micrometer.core.instrument.Tags;
+import io.micrometer.core.instrument.Timer;
+import org.springframework.boot.context.properties.EnableConfigurationProperties;
+import org.springframework.boot.task.ThreadPoolTaskExecutorBuilder;
+import org.springframework.context.annotation.Bean;
+import org.springframework.context.annotation.Configuration;
+import org.springframework.scheduling.concurrent.ThreadPoolTaskExecutor;
+
+import java.util.concurrent.RejectedExecutionException;
+import java.util.concurrent.RejectedExecutionHandler;
+import java.util.concurrent.ThreadPoolExecutor;
+import java.util.concurrent.TimeUnit;
+
+/**
+ * Bounded executors for domain event listeners, one per event category. The outbox drainer and
+ * {@code DomainEventPublisher} run listeners on them and see their failures, which is why the
+ * handlers are plain synchronous {@code @EventListener}s rather than {@code @Async}.
+ *
+ * Each pool gets Micrometer gauges (active threads, queue depth, pool size), a rejected-task
+ * counter and timers for queue wait and handler run time, all under {@code domain.events.executor.*}
+ * and tagged with {@code category}.
+ */
+@Configuration
+@EnableConfigurationProperties(EventExecutorProperties.class)
+public class EventExecutorConfig {
+
+    private final EventExecutorProperties properties;
+    private final MeterRegistry meterRegistry;
+
+    public EventExecutorConfig(EventExecutorProperties properties, MeterRegistry meterRegistry) {
+        this.properties = properties;
+        this.meterRegistry = meterRegistry;
+    }
+
+    /**
+     * Declaring our own executors switches off Boot's default one, which MVC async requests
+     * (e.g. streamed payroll exports) rely on; keep it explicitly.
+     */
+    @Bean(name = {"applicationTaskExecutor", "taskExecutor"})
+    public ThreadPoolTaskExecutor applicationTaskExecutor(ThreadPoolTaskExecutorBuilder builder) {
+        return builder.build();
+    }
+
+    @Bean(name = EventExecutors.TIMESHEET)
+    public ThreadPoolTaskExecutor timesheetEventExecutor() {
+        return eventExecutor("timesheet", properties.getTimesheet());
+    }
+
+    @Bean(name = EventExecutors.USER)
+    public ThreadPoolTaskExecutor userEventExecutor() {
+        return eventExecutor("user", properties.getUser());
+    }
+
+    @Bean(name = EventExecutors.COURSE)
+    public ThreadPoolTaskExecutor courseEventExecutor() {
+        return eventExecutor("course", properties.getCourse());
+    }
+
+    private ThreadPoolTaskExecutor eventExecutor(String category, EventExecutorProperties.Pool pool) {
+        Tags tags = Tags.of("category", category);
+
+        ThreadPoolTaskExecutor executor = new ThreadPoolTaskExecutor();
+        executor.setThreadNamePrefix("event-" + category + "-");
+        executor.setCorePoolSize(pool.getCoreSize());
+        executor.setMaxPoolSize(Math.max(pool.getCoreSize(), pool.getMaxSize()));
+        executor.setQueueCapacity(pool.getQueueCapacity());
+        executor.setKeepAliveSeconds((int) pool.getKeepAlive().toSeconds());
+        executor.setRejectedExecutionHandler(countingRejections(pool.getRejectionPolicy(), tags));
+        executor.setWaitForTasksToCompleteOnShutdown(true);
+        executor.setAwaitTerminationMillis(properties.getShutdownTimeout().toMillis());
+
+        Timer waitTimer = Timer.builder("domain.events.executor.wait")
+            .description("Time event handler tasks spend queued before starting")
+            .tags(tags)
+            .register(meterRegistry);
+        Timer runTimer = Timer.builder("domain.events.executor.duration")
+            .description("Event handler task run time")
+            .tags(tags)
+            .register(meterRegistry);
+        // The decorator runs at submission, so the captured start time includes queueing
+        executor.setTaskDecorator(task -> {
+            long submittedAt = System.nanoTime();
+            return () -> {
+                long startedAt = System.nanoTime();
+                waitTimer.record(startedAt - submittedAt, TimeUnit.NANOSECONDS);
+                try {
+                    task.run();
+                } finally {
+                    runTimer.record(System.nanoTime() - startedAt, TimeUnit.NANOSECONDS);
+                }
+            };
+        });
+
+        Gauge.builder("domain.events.executor.active", executor, ThreadPoolTaskExecutor::getActiveCount)
+            .description("Threads currently running event handlers")
+            .tags(tags)
+            .register(meterRegistry);
+        Gauge.builder("domain.events.executor.queued", executor, ThreadPoolTaskExecutor::getQueueSize)
+            .description("Event handler tasks waiting for a thread")
+            .tags(tags)
+            .register(meterRegistry);
+        Gauge.builder("domain.events.executor.pool.size", executor, ThreadPoolTaskExecutor::getPoolSize)
+            .description("Current number of threads in the pool")
+            .tags(tags)
+            .register(meterRegistry);
+        return executor;
+    }
+
+    private RejectedExecutionHandler countingRejections(EventExecutorProperties.RejectionPolicy policy, Tags tags) {
+        Counter rejected = Counter.builder("domain.events.executor.rejected")
+            .description("Event handler tasks that hit a full pool and queue")
+            .tags(tags.and("policy", policy.name()))
+            .register(meterRegistry);
+        RejectedExecutionHandler delegate = switch (policy) {
+            case CALLER_RUNS -> callerRunsOffRetryThread();
+            case ABORT -> new ThreadPoolExecutor.AbortPolicy();
+        };
+        return (task, threadPool) -> {
+            rejected.increment();
+            delegate.rejectedExecution(task, threadPool);
+        };
+    }
+
+    /**
+     * Caller-runs, except that a retry coming off the retry scheduler is rejected: running the
+     * listener there would stall every other pending retry
+     */
+    private static RejectedExecutionHandler callerRunsOffRetryThread() {
+        RejectedExecutionHandler callerRuns = new ThreadPoolExecutor.CallerRunsPolicy();
+        return (task, threadPool) -> {
+            if (EventRetryScheduler.isRetryThread()) {
+                throw new RejectedExecutionException("Event executor is full; retry goes back to the scheduler");
+            }
+            callerRuns.rejectedExecution(task, threadPool);
+        };
+    }
+}
@@ -0,0 +1,35 @@
+package com.usyd.catams.config;
+
+import jakarta.servlet.http.HttpServletRequest;
+import jakarta.servlet.http.HttpServletResponse;
+import org.springframework.core.annotation.AnnotatedElementUtils;
+import org.springframework.web.method.HandlerMethod;
+import org.springframework.web.servlet.AsyncHandlerInterceptor;
+
+/**
+ * Pins the reads of {@link ReadsFromPrimary} handlers to the primary for the rest of the request
+ */
+class PrimaryReadInterceptor implements AsyncHandlerInterceptor {
+
+    @Override
+    public boolean preHandle(HttpServletRequest request, HttpServletResponse response, Object handler) {
+        if (handler instanceof HandlerMethod method
+                && (method.hasMethodAnnotation(ReadsFromPrimary.class)
+                    || AnnotatedElementUtils.hasAnnotation(method.getBeanType(), ReadsFromPrimary.class))) {
+            ReadReplicaRoutingDataSource.requirePrimary();
+        }
+        return true;
+    }
+
+    @Override
+    public void afterConcurrentHandlingStarted(HttpServletRequest request, HttpServletResponse response,
+                                               Object handler) {
+        ReadReplicaRoutingDataSource.clearPrimaryRequired();
+    }
+
+    @Override
+    public void afterCompletion(HttpServletRequest request, HttpServletResponse response, Object handler,
+                                Exception ex) {
+        ReadReplicaRoutingDataSource.clearPrimaryRequired();
+    }
+}
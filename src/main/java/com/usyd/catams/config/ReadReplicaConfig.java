@@ -0,0 +1,111 @@
+package com.usyd.catams.config;
+
+import com.zaxxer.hikari.HikariDataSource;
+import com.zaxxer.hikari.metrics.micrometer.MicrometerMetricsTrackerFactory;
+import io.micrometer.core.instrument.MeterRegistry;
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty;
+import org.springframework.boot.autoconfigure.jdbc.DataSourceProperties;
+import org.springframework.boot.context.properties.EnableConfigurationProperties;
+import org.springframework.context.annotation.Bean;
+import org.springframework.context.annotation.Configuration;
+import org.springframework.context.annotation.Primary;
+import org.springframework.jdbc.datasource.LazyConnectionDataSourceProxy;
+import org.springframework.scheduling.annotation.Scheduled;
+import org.springframework.util.StringUtils;
+import org.springframework.web.servlet.config.annotation.InterceptorRegistry;
+import org.springframework.web.servlet.config.annotation.WebMvcConfigurer;
+
+import javax.sql.DataSource;
+import java.util.LinkedHashMap;
+import java.util.Map;
+
+/**
+ * Sends {@code @Transactional(readOnly = true)} work to read replicas.
+ *
+ * Replaces Boot's single pool with a primary pool ({@code spring.datasource.*}) and one pool per
+ * entry in {@code app.datasource.read-replicas.replicas}, routed by {@link ReadReplicaRoutingDataSource}.
+ * The application sees a {@link LazyConnectionDataSourceProxy} in front of the router: the
+ * transaction manager marks a transaction read-only after it has asked for a connection, so the
+ * physical connection, and with it the routing decision, is deferred to the first statement.
+ * Work outside a transaction (Flyway, the outbox drainer, {@code LISTEN}) always uses the primary,
+ * and so do requests to {@link ReadsFromPrimary} handlers: their ETags and the refetches triggered
+ * by live updates are based on the primary's change versions, which a lagging replica can trail.
+ */
+@Configuration
+@ConditionalOnProperty(prefix = "app.datasource.read-replicas", name = "enabled", havingValue = "true")
+@EnableConfigurationProperties(ReadReplicaProperties.class)
+public class ReadReplicaConfig implements WebMvcConfigurer {
+
+    private final ReadReplicaProperties properties;
+    private final DataSourceProperties dataSourceProperties;
+    private final MeterRegistry meterRegistry;
+
+    public ReadReplicaConfig(ReadReplicaProperties properties,
+                             DataSourceProperties dataSourceProperties,
+                             MeterRegistry meterRegistry) {
+        this.properties = properties;
+        this.dataSourceProperties = dataSourceProperties;
+        this.meterRegistry = meterRegistry;
+    }
+
+    /**
+     * Not an autowire candidate: code that injects a DataSource must get the lazy proxy
+     */
+    @Bean(autowireCandidate = false)
+    public ReadReplicaRoutingDataSource readReplicaRoutingDataSource() {
+        HikariDataSource primary = dataSourceProperties.initializeDataSourceBuilder()
+            .type(HikariDataSource.class)
+            .build();
+        primary.setPoolName("catams-" + ReadReplicaRoutingDataSource.PRIMARY);
+        primary.setMetricsTrackerFactory(new MicrometerMetricsTrackerFactory(meterRegistry));
+
+        Map<String, DataSource> replicas = new LinkedHashMap<>();
+        int index = 1;
+        for (ReadReplicaProperties.Replica replica : properties.getReplicas()) {
+            String name = StringUtils.hasText(replica.getName()) ? replica.getName() : "replica-" + index;
+            index++;
+            if (replicas.containsKey(name) || ReadReplicaRoutingDataSource.PRIMARY.equals(name)) {
+                throw new IllegalStateException("Duplicate read replica name: " + name);
+            }
+            replicas.put(name, replicaPool(name, replica));
+        }
+        return new ReadReplicaRoutingDataSource(primary, replicas, properties.getMaxLag(), meterRegistry);
+    }
+
+    @Bean
+    @Primary
+    public DataSource dataSource() {
+        return new LazyConnectionDataSourceProxy(readReplicaRoutingDataSource());
+    }
+
+    @Override
+    public void addInterceptors(InterceptorRegistry registry) {
+        registry.addInterceptor(new PrimaryReadInterceptor());
+    }
+
+    @Scheduled(fixedDelayString = "${app.datasource.read-replicas.check-interval:PT5S}")
+    public void checkReplicaHealth() {
+        readReplicaRoutingDataSource().refreshReplicaHealth();
+    }
+
+    private HikariDataSource replicaPool(String name, ReadReplicaProperties.Replica replica) {
+        if (!StringUtils.hasText(replica.getUrl())) {
+            throw new IllegalStateException("Read replica " + name + " has no url");
+        }
+        HikariDataSource pool = new HikariDataSource();
+        pool.setPoolName("catams-" + name);
+        pool.setJdbcUrl(replica.getUrl());
+        pool.setDriverClassName(dataSourceProperties.determineDriverClassName());
+        pool.setUsername(StringUtils.hasText(replica.getUsername())
+            ? replica.getUsername() : dataSourceProperties.determineUsername());
+        pool.setPassword(replica.getPassword() != null
+            ? replica.getPassword() : dataSourceProperties.determinePassword());
+        pool.setMaximumPoolSize(replica.getMaximumPoolSize());
+        pool.setConnectionTimeout(properties.getConnectionTimeout().toMillis());
+        pool.setReadOnly(true);
+        // Start even when a replica is down; the router skips it until a health check succeeds
+        pool.setInitializationFailTimeout(-1);
+        pool.setMetricsTrackerFactory(new MicrometerMetricsTrackerFactory(meterRegistry));
+        return pool;
+    }
+}
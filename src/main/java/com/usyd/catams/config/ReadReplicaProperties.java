@@ -0,0 +1,67 @@
+package com.usyd.catams.config;
+
+import org.springframework.boot.context.properties.ConfigurationProperties;
+
+import java.time.Duration;
+import java.util.ArrayList;
+import java.util.List;
+
+/**
+ * Read replicas that serve read-only transactions.
+ *
+ * Note: This bean is registered via @EnableConfigurationProperties in ReadReplicaConfig.
+ */
+@ConfigurationProperties(prefix = "app.datasource.read-replicas")
+public class ReadReplicaProperties {
+
+    /**
+     * Connection settings of a single replica; credentials default to the primary's.
+     */
+    public static class Replica {
+        private String name;
+        private String url;
+        private String username;
+        private String password;
+        private int maximumPoolSize = 10;
+
+        public String getName() { return name; }
+        public void setName(String name) { this.name = name; }
+
+        public String getUrl() { return url; }
+        public void setUrl(String url) { this.url = url; }
+
+        public String getUsername() { return username; }
+        public void setUsername(String username) { this.username = username; }
+
+        public String getPassword() { return password; }
+        public void setPassword(String password) { this.password = password; }
+
+        public int getMaximumPoolSize() { return maximumPoolSize; }
+        public void setMaximumPoolSize(int maximumPoolSize) { this.maximumPoolSize = maximumPoolSize; }
+    }
+
+    /** Route read-only transactions to the replicas below; everything uses the primary when false. */
+    private boolean enabled = false;
+    /** Replay lag above which a replica stops receiving reads until it catches up. */
+    private Duration maxLag = Duration.ofSeconds(5);
+    /** How often replica lag and reachability are measured. */
+    private Duration checkInterval = Duration.ofSeconds(5);
+    /** How long a read waits for a replica connection before falling back to the primary. */
+    private Duration connectionTimeout = Duration.ofSeconds(2);
+
+    private final List<Replica> replicas = new ArrayList<>();
+
+    public boolean isEnabled() { return enabled; }
+    public void setEnabled(boolean enabled) { this.enabled = enabled; }
+
+    public Duration getMaxLag() { return maxLag; }
+    public void setMaxLag(Duration maxLag) { this.maxLag = maxLag; }
+
+    public Duration getCheckInterval() { return checkInterval; }
+    public void setCheckInterval(Duration checkInterval) { this.checkInterval = checkInterval; }
+
+    public Duration getConnectionTimeout() { return connectionTimeout; }
+    public void setConnectionTimeout(Duration connectionTimeout) { this.connectionTimeout = connectionTimeout; }
+
+    public List<Replica> getReplicas() { return replicas; }
+}
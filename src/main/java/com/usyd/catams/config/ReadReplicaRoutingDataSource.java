@@ -0,0 +1,225 @@
+package com.usyd.catams.config;
+
+import io.micrometer.core.instrument.Counter;
+import io.micrometer.core.instrument.Gauge;
+import io.micrometer.core.instrument.MeterRegistry;
+import io.opentelemetry.api.trace.Span;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+import org.springframework.jdbc.datasource.AbstractDataSource;
+import org.springframework.transaction.support.TransactionSynchronizationManager;
+
+import javax.sql.DataSource;
+import java.sql.Connection;
+import java.sql.ResultSet;
+import java.sql.SQLException;
+import java.sql.Statement;
+import java.time.Duration;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.Map;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.atomic.AtomicInteger;
+
+/**
+ * DataSource that sends read-only transactions to a replica and everything else to the primary
+ *
+ * The routing decision is taken when a physical connection is first needed, so this must sit
+ * behind a {@link org.springframework.jdbc.datasource.LazyConnectionDataSourceProxy}: only then has
+ * the transaction manager marked the transaction read-only (see {@link ReadReplicaConfig}).
+ *
+ * Replicas take turns. A replica is skipped while its replay lag exceeds {@code maxLag} or after
+ * it failed to hand out a connection, until {@link #refreshReplicaHealth()} finds it healthy
+ * again. With no usable replica, reads fall back to the primary. A thread can also pin its reads
+ * to the primary with {@link #requirePrimary()}, for responses that must reflect the latest writes.
+ *
+ * Each routed connection increments {@code catams.datasource.route} tagged with {@code target} and
+ * {@code reason}, and tags the current span with {@code db.route.target}. Replica lag and
+ * availability are published as {@code catams.datasource.replica.lag} and
+ * {@code catams.datasource.replica.available}, tagged with {@code replica}.
+ */
+public class ReadReplicaRoutingDataSource extends AbstractDataSource implements AutoCloseable {
+
+    private static final Logger logger = LoggerFactory.getLogger(ReadReplicaRoutingDataSource.class);
+
+    public static final String PRIMARY = "primary";
+
+    static final String REASON_READ_WRITE = "read-write";
+    static final String REASON_READ_ONLY = "read-only";
+    static final String REASON_NO_REPLICA = "no-replica-available";
+    static final String REASON_REPLICA_ERROR = "replica-error";
+    static final String REASON_PRIMARY_REQUIRED = "primary-required";
+
+    private static final ThreadLocal<Boolean> PRIMARY_REQUIRED = new ThreadLocal<>();
+
+    // A caught-up standby reports no lag even when the primary has been idle for a while
+    private static final String LAG_SQL =
+        "SELECT CASE WHEN NOT pg_is_in_recovery() THEN 0 " +
+        "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 " +
+        "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END";
+
+    private final DataSource primary;
+    private final List<Replica> replicas;
+    private final Duration maxLag;
+    private final MeterRegistry meterRegistry;
+    private final Map<String, Counter> routeCounters = new ConcurrentHashMap<>();
+    private final AtomicInteger next = new AtomicInteger();
+
+    public ReadReplicaRoutingDataSource(DataSource primary,
+                                        Map<String, DataSource> replicas,
+                                        Duration maxLag,
+                                        MeterRegistry meterRegistry) {
+        this.primary = primary;
+        this.maxLag = maxLag;
+        this.meterRegistry = meterRegistry;
+        List<Replica> targets = new ArrayList<>();
+        replicas.forEach((name, dataSource) -> targets.add(new Replica(name, dataSource)));
+        this.replicas = List.copyOf(targets);
+        for (Replica replica : this.replicas) {
+            Gauge.builder("catams.datasource.replica.lag", replica, r -> r.lagSeconds)
+                .description("Replay lag of a read replica in seconds")
+                .baseUnit("seconds")
+                .tag("replica", replica.name)
+                .register(meterRegistry);
+            Gauge.builder("catams.datasource.replica.available", replica, r -> r.isUsable(maxLag) ? 1 : 0)
+                .description("Whether a read replica currently receives read-only transactions")
+                .tag("replica", replica.name)
+                .register(meterRegistry);
+        }
+    }
+
+    /**
+     * Send read-only work on the current thread to the primary until {@link #clearPrimaryRequired()}
+     */
+    public static void requirePrimary() {
+        PRIMARY_REQUIRED.set(Boolean.TRUE);
+    }
+
+    public static void clearPrimaryRequired() {
+        PRIMARY_REQUIRED.remove();
+    }
+
+    @Override
+    public Connection getConnection() throws SQLException {
+        if (!TransactionSynchronizationManager.isCurrentTransactionReadOnly()) {
+            return route(PRIMARY, REASON_READ_WRITE, primary);
+        }
+        if (PRIMARY_REQUIRED.get() != null) {
+            return route(PRIMARY, REASON_PRIMARY_REQUIRED, primary);
+        }
+        int attempts = replicas.size();
+        for (int i = 0; i < attempts; i++) {
+            Replica replica = replicas.get(Math.floorMod(next.getAndIncrement(), attempts));
+            if (!replica.isUsable(maxLag)) {
+                continue;
+            }
+            try {
+                return route(replica.name, REASON_READ_ONLY, replica.dataSource);
+            } catch (SQLException e) {
+                replica.reachable = false;
+                logger.warn("Read replica {} unavailable, falling back: {}", replica.name, e.getMessage());
+                return route(PRIMARY, REASON_REPLICA_ERROR, primary);
+            }
+        }
+        return route(PRIMARY, REASON_NO_REPLICA, primary);
+    }
+
+    /**
+     * Credentials other than the configured ones are only meaningful for the primary
+     */
+    @Override
+    public Connection getConnection(String username, String password) throws SQLException {
+        return primary.getConnection(username, password);
+    }
+
+    /**
+     * Measure every replica's reachability and replay lag; called on a schedule
+     */
+    public void refreshReplicaHealth() {
+        for (Replica replica : replicas) {
+            try (Connection connection = replica.dataSource.getConnection();
+                 Statement statement = connection.createStatement();
+                 ResultSet rs = statement.executeQuery(LAG_SQL)) {
+                rs.next();
+                applyLag(replica, rs.getDouble(1));
+            } catch (SQLException e) {
+                if (replica.reachable) {
+                    logger.warn("Read replica {} failed its health check: {}", replica.name, e.getMessage());
+                }
+                replica.reachable = false;
+            }
+        }
+    }
+
+    /**
+     * Names of the replicas that would currently receive reads
+     */
+    public List<String> availableReplicas() {
+        return replicas.stream().filter(r -> r.isUsable(maxLag)).map(r -> r.name).toList();
+    }
+
+    void applyLag(String replicaName, double lagSeconds) {
+        replicas.stream().filter(r -> r.name.equals(replicaName)).findFirst()
+            .ifPresent(replica -> applyLag(replica, lagSeconds));
+    }
+
+    private void applyLag(Replica replica, double lagSeconds) {
+        boolean wasUsable = replica.isUsable(maxLag);
+        replica.lagSeconds = lagSeconds;
+        replica.reachable = true;
+        boolean usable = replica.isUsable(maxLag);
+        if (wasUsable != usable) {
+            logger.info("Read replica {} {} (lag {}s, tolerance {}s)", replica.name,
+                usable ? "back in rotation" : "out of rotation", lagSeconds, maxLag.toMillis() / 1000.0);
+        }
+    }
+
+    private Connection route(String target, String reason, DataSource dataSource) throws SQLException {
+        Connection connection = dataSource.getConnection();
+        routeCounters.computeIfAbsent(target + '|' + reason, key -> Counter.builder("catams.datasource.route")
+                .description("Physical connections handed out, by routing target")
+                .tag("target", target)
+                .tag("reason", reason)
+                .register(meterRegistry))
+            .increment();
+        Span span = Span.current();
+        span.setAttribute("db.route.target", target);
+        span.setAttribute("db.route.reason", reason);
+        return connection;
+    }
+
+    @Override
+    public void close() {
+        for (Replica replica : replicas) {
+            closeQuietly(replica.dataSource);
+        }
+        closeQuietly(primary);
+    }
+
+    private static void closeQuietly(DataSource dataSource) {
+        if (dataSource instanceof AutoCloseable closeable) {
+            try {
+                closeable.close();
+            } catch (Exception e) {
+                logger.debug("Ignoring error while closing pool: {}", e.getMessage());
+            }
+        }
+    }
+
+    private static final class Replica {
+        private final String name;
+        private final DataSource dataSource;
+        // Optimistic until the first health check, so reads use replicas right after startup
+        private volatile boolean reachable = true;
+        private volatile double lagSeconds;
+
+        private Replica(String name, DataSource dataSource) {
+            this.name = name;
+            this.dataSource = dataSource;
+        }
+
+        private boolean isUsable(Duration maxLag) {
+            return reachable && lagSeconds * 1000 <= maxLag.toMillis();
+        }
+    }
+}
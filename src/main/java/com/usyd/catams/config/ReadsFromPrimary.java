@@ -0,0 +1,21 @@
+package com.usyd.catams.config;
+
+import java.lang.annotation.Documented;
+import java.lang.annotation.ElementType;
+import java.lang.annotation.Retention;
+import java.lang.annotation.RetentionPolicy;
+import java.lang.annotation.Target;
+
+/**
+ * Marks a controller, or one handler method, whose reads must not be served by a read replica
+ *
+ * Used where a response is checked against change versions (ETags) or refetched right after a
+ * live-update push: both reflect the primary, and a lagging replica would let a client cache or
+ * display data older than what it was told about. Only has an effect with read replicas enabled
+ * (see {@link ReadReplicaConfig}).
+ */
+@Target({ElementType.TYPE, ElementType.METHOD})
+@Retention(RetentionPolicy.RUNTIME)
+@Documented
+public @interface ReadsFromPrimary {
+}
@@ -0,0 +1,12 @@
+package com.usyd.catams.config;
+
+import org.springframework.context.annotation.Configuration;
+import org.springframework.scheduling.annotation.EnableScheduling;
+
+/**
+ * Enables {@code @Scheduled} background workers (e.g. the domain event outbox drainer).
+ */
+@Configuration
+@EnableScheduling
+public class SchedulingConfig {
+}
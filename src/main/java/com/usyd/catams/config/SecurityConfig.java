@@ -1,6 +1,7 @@
 package com.usyd.catams.config;
 
 import com.usyd.catams.security.JwtAuthenticationFilter;
+import jakarta.servlet.DispatcherType;
 import org.springframework.context.annotation.Bean;
 import org.springframework.context.annotation.Configuration;
 import org.springframework.core.env.Environment;
@@ -72,8 +73,11 @@ public class SecurityConfig {
             .sessionManagement(session -> session.sessionCreationPolicy(SessionCreationPolicy.STATELESS))
             .authorizeHttpRequests(auth -> {
                 auth
+                    // Completion dispatch of streamed responses; the original request was already authorized
+                    .dispatcherTypeMatchers(DispatcherType.ASYNC).permitAll()
                     .requestMatchers("/api/auth/login").permitAll()
                     .requestMatchers("/actuator/health").permitAll()
+                    .requestMatchers(HttpMethod.GET, "/actuator/metrics", "/actuator/metrics/**").hasRole("ADMIN")
                     .requestMatchers(HttpMethod.GET, "/api/timesheets/config").permitAll()
                     .requestMatchers(HttpMethod.POST, "/actuator/shutdown").hasRole("ADMIN");
 
@@ -137,6 +141,8 @@ public class SecurityConfig {
 
         // Allow all headers to simplify CORS for E2E/dev
         configuration.setAllowedHeaders(java.util.List.of("*"));
+        // Cross-origin clients need the validator to send If-None-Match
+        configuration.setExposedHeaders(java.util.List.of("ETag"));
 
         configuration.setAllowCredentials(true);
         configuration.setMaxAge(3600L);
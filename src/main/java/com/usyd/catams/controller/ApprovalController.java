@@ -1,7 +1,10 @@
 package com.usyd.catams.controller;
 
+import com.usyd.catams.config.ReadsFromPrimary;
 import com.usyd.catams.dto.request.ApprovalActionRequest;
+import com.usyd.catams.dto.request.ApprovalBatchRequest;
 import com.usyd.catams.dto.response.ApprovalActionResponse;
+import com.usyd.catams.dto.response.ApprovalBatchResponse;
 import com.usyd.catams.dto.response.TimesheetResponse;
 import com.usyd.catams.mapper.ApprovalMapper;
 import com.usyd.catams.mapper.TimesheetMapper;
@@ -11,6 +14,8 @@ import jakarta.validation.Valid;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
 import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.data.domain.PageRequest;
+import org.springframework.data.domain.Pageable;
 import org.springframework.http.ResponseEntity;
 import org.springframework.security.access.prepost.PreAuthorize;
 import org.springframework.web.bind.annotation.*;
@@ -55,6 +60,18 @@ public class ApprovalController {
         return ResponseEntity.ok(approvalMapper.toResponse(approval));
     }
 
+    @PostMapping("/batch")
+    @PreAuthorize("hasRole('TUTOR') or hasRole('LECTURER') or hasRole('ADMIN')")
+    public ResponseEntity<ApprovalBatchResponse> performBatchConfirmationAction(
+            @Valid @RequestBody ApprovalBatchRequest request) {
+        Long requesterId = authenticationFacade.getCurrentUserId();
+        logger.info("HTTP batch approve: action={}, count={}, requesterId={}",
+                request.getAction(), request.getTimesheetIds().size(), requesterId);
+        ApprovalBatchResponse response = approvalService.performBatchApprovalAction(
+                request.getTimesheetIds(), request.getAction(), request.getComment(), requesterId);
+        return ResponseEntity.ok(response);
+    }
+
     @GetMapping("/history/{timesheetId}")
     @PreAuthorize("hasRole('TUTOR') or hasRole('LECTURER') or hasRole('ADMIN')")
     public ResponseEntity<java.util.List<ApprovalActionResponse>> getConfirmationHistory(
@@ -66,12 +83,22 @@ public class ApprovalController {
     }
 
     @GetMapping("/pending")
+    @ReadsFromPrimary
     @org.springframework.transaction.annotation.Transactional(readOnly = true)
     @PreAuthorize("hasAnyRole('ADMIN','LECTURER','TUTOR')")
-    public ResponseEntity<List<TimesheetResponse>> getPendingConfirmations() {
+    public ResponseEntity<List<TimesheetResponse>> getPendingConfirmations(
+            @RequestParam(value = "page", required = false) Integer page,
+            @RequestParam(value = "size", required = false) Integer size) {
         Long requesterId = authenticationFacade.getCurrentUserId();
+        // Without paging parameters the whole queue is returned, as before
+        Pageable pageable = Pageable.unpaged();
+        if (page != null || size != null) {
+            int pageNumber = page == null || page < 0 ? 0 : page;
+            int pageSize = size == null || size <= 0 || size > 100 ? 20 : size;
+            pageable = PageRequest.of(pageNumber, pageSize);
+        }
         List<TimesheetResponse> responses = timesheetMapper.toResponseList(
-            approvalService.getPendingApprovalsForUser(requesterId)
+            approvalService.getPendingApprovalsForUser(requesterId, pageable).getContent()
         );
         return ResponseEntity.ok(responses);
     }
@@ -1,7 +1,7 @@
 package com.usyd.catams.controller;
 
 import com.usyd.catams.repository.TutorAssignmentRepository;
-import com.usyd.catams.repository.LecturerAssignmentRepository;
+import com.usyd.catams.service.CourseScopeCache;
 import com.usyd.catams.e2e.E2EAssignmentState;
 import org.springframework.core.env.Environment;
 import org.springframework.core.env.Profiles;
@@ -38,7 +38,7 @@ public class CourseUsersController {
     private static final org.slf4j.Logger log = org.slf4j.LoggerFactory.getLogger(CourseUsersController.class);
 
     private final TutorAssignmentRepository tutorAssignmentRepository;
-    private final LecturerAssignmentRepository lecturerAssignmentRepository;
+    private final CourseScopeCache courseScopeCache;
     private final E2EAssignmentState e2eState; // may be null outside e2e-local
     private final Environment environment; // may be null in some contexts
     private final AuthenticationFacade authenticationFacade;
@@ -47,18 +47,18 @@ public class CourseUsersController {
      * Constructs a new CourseUsersController with required dependencies.
      *
      * @param tutorAssignmentRepository repository for tutor assignment data
-     * @param lecturerAssignmentRepository repository for lecturer assignment data
+     * @param courseScopeCache cached lecturer course scopes
      * @param authenticationFacade facade for accessing authentication context
      * @param e2eState optional E2E assignment state for deterministic testing
      * @param environment optional Spring environment for profile checks
      */
     public CourseUsersController(TutorAssignmentRepository tutorAssignmentRepository,
-                                 LecturerAssignmentRepository lecturerAssignmentRepository,
+                                 CourseScopeCache courseScopeCache,
                                  AuthenticationFacade authenticationFacade,
                                  @org.springframework.beans.factory.annotation.Autowired(required = false) E2EAssignmentState e2eState,
                                  @org.springframework.beans.factory.annotation.Autowired(required = false) Environment environment) {
         this.tutorAssignmentRepository = tutorAssignmentRepository;
-        this.lecturerAssignmentRepository = lecturerAssignmentRepository;
+        this.courseScopeCache = courseScopeCache;
         this.e2eState = e2eState;
         this.environment = environment;
         this.authenticationFacade = authenticationFacade;
@@ -106,7 +106,7 @@ public class CourseUsersController {
                 try { assigned = e2eState.getLecturerCourses(userId).contains(courseId); } catch (Exception ignored) {}
             }
             if (!assigned) {
-                try { assigned = lecturerAssignmentRepository.existsByLecturerIdAndCourseId(userId, courseId); } catch (Exception ignored) {}
+                try { assigned = courseScopeCache.isLecturerAssigned(userId, courseId); } catch (Exception ignored) {}
             }
             if (!assigned) {
                 return ResponseEntity.status(403).build();
@@ -1,16 +1,20 @@
 package com.usyd.catams.controller;
 
+import com.usyd.catams.config.ReadsFromPrimary;
 import com.usyd.catams.dto.response.DashboardSummaryResponse;
 import com.usyd.catams.enums.UserRole;
 import com.usyd.catams.exception.BusinessException;
+import com.usyd.catams.service.ChangeVersionService;
 import com.usyd.catams.service.DashboardService;
 import org.springframework.beans.factory.annotation.Autowired;
 import org.springframework.format.annotation.DateTimeFormat;
+import org.springframework.http.CacheControl;
 import org.springframework.http.ResponseEntity;
 import org.springframework.security.access.prepost.PreAuthorize;
 import org.springframework.security.core.Authentication;
 import org.springframework.security.core.GrantedAuthority;
 import org.springframework.web.bind.annotation.*;
+import org.springframework.web.context.request.WebRequest;
 
 import java.time.LocalDate;
 import java.time.Clock;
@@ -29,17 +33,26 @@ import java.util.regex.Pattern;
  */
 @RestController
 @RequestMapping("/api/dashboard")
+@ReadsFromPrimary
 @PreAuthorize("hasRole('TUTOR') or hasRole('LECTURER') or hasRole('ADMIN')")
 public class DashboardController {
 
     private final DashboardService dashboardService;
     private final Clock clock;
+    private final ChangeVersionService changeVersionService;
     private static final Pattern SEMESTER_PATTERN = Pattern.compile("^\\d{4}-[12]$");
 
     @Autowired
-    public DashboardController(DashboardService dashboardService, Clock clock) {
+    public DashboardController(DashboardService dashboardService, Clock clock,
+                               ChangeVersionService changeVersionService) {
         this.dashboardService = dashboardService;
         this.clock = (clock != null ? clock : Clock.systemDefaultZone());
+        this.changeVersionService = changeVersionService;
+    }
+
+    // Convenience constructor for tests that inject a fixed Clock
+    public DashboardController(DashboardService dashboardService, Clock clock) {
+        this(dashboardService, clock, new ChangeVersionService());
     }
 
     // Convenience constructor for tests that manually construct the controller
@@ -63,7 +76,8 @@ public class DashboardController {
      * @param startDate Optional start date for metrics calculation (YYYY-MM-DD)
      * @param endDate Optional end date for metrics calculation (YYYY-MM-DD)
      * @param authentication Current user authentication context
-     * @return Role-appropriate dashboard summary
+     * @param webRequest Current request, used to answer {@code If-None-Match} with 304
+     * @return Role-appropriate dashboard summary, or null when a 304 has been prepared
      * @throws BusinessException when TUTOR attempts course filtering or invalid parameters
      */
     @GetMapping("/summary")
@@ -74,7 +88,8 @@ public class DashboardController {
                 @DateTimeFormat(iso = DateTimeFormat.ISO.DATE) LocalDate startDate,
             @RequestParam(value = "endDate", required = false) 
                 @DateTimeFormat(iso = DateTimeFormat.ISO.DATE) LocalDate endDate,
-            Authentication authentication) {
+            Authentication authentication,
+            WebRequest webRequest) {
 
         // Extract user details from authentication
         Long userId = extractUserId(authentication);
@@ -85,6 +100,13 @@ public class DashboardController {
         LocalDate effectiveStartDate = dateRange[0];
         LocalDate effectiveEndDate = dateRange[1];
 
+        // Unchanged scope: answer 304 before running the aggregation queries
+        String etag = changeVersionService.dashboardSummaryTag(userId, userRole, courseId,
+            effectiveStartDate, effectiveEndDate, LocalDate.now(clock));
+        if (webRequest.checkNotModified(etag)) {
+            return null;
+        }
+
         // Get role-appropriate dashboard summary
         DashboardSummaryResponse summary = dashboardService.getDashboardSummary(
             userId, 
@@ -94,14 +116,17 @@ public class DashboardController {
             effectiveEndDate
         );
 
-        return ResponseEntity.ok(summary);
+        return ResponseEntity.ok()
+            .eTag(etag)
+            .cacheControl(CacheControl.noCache().cachePrivate())
+            .body(summary);
     }
 
     /**
      * GET /api/dashboard (root endpoint)
      *
      * Provides a sensible default for clients requesting the dashboard root path
-     * without the explicit "/summary" suffix. Delegates to {@link #getDashboardSummary(Long, String, LocalDate, LocalDate, Authentication)}
+     * without the explicit "/summary" suffix. Delegates to {@link #getDashboardSummary(Long, String, LocalDate, LocalDate, Authentication, WebRequest)}
      * with default parameters, following the Single Source of Truth principle for controller logic.
      *
      * Design by Contract:
@@ -110,8 +135,9 @@ public class DashboardController {
      * - Invariant: No business logic duplication; this method strictly delegates to the summary method
      */
     @GetMapping
-    public ResponseEntity<DashboardSummaryResponse> getDashboardRoot(Authentication authentication) {
-        return getDashboardSummary(null, null, null, null, authentication);
+    public ResponseEntity<DashboardSummaryResponse> getDashboardRoot(Authentication authentication,
+                                                                     WebRequest webRequest) {
+        return getDashboardSummary(null, null, null, null, authentication, webRequest);
     }
 
     /**
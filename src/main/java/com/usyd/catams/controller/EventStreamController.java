@@ -0,0 +1,53 @@
+package com.usyd.catams.controller;
+
+import com.usyd.catams.enums.UserRole;
+import com.usyd.catams.policy.AuthenticationFacade;
+import com.usyd.catams.service.EventStreamService;
+import jakarta.servlet.http.HttpServletResponse;
+import org.springframework.http.MediaType;
+import org.springframework.security.access.prepost.PreAuthorize;
+import org.springframework.web.bind.annotation.GetMapping;
+import org.springframework.web.bind.annotation.RequestMapping;
+import org.springframework.web.bind.annotation.RestController;
+import org.springframework.web.servlet.mvc.method.annotation.SseEmitter;
+
+/**
+ * Server-sent event feed of dashboard change notifications.
+ *
+ * Emits {@code timesheet-changed} and {@code summary-invalidated} events scoped to the caller's
+ * role and courses; see {@link EventStreamService}.
+ */
+@RestController
+@RequestMapping("/api/events")
+public class EventStreamController {
+
+    private final EventStreamService eventStreamService;
+    private final AuthenticationFacade authenticationFacade;
+
+    public EventStreamController(EventStreamService eventStreamService, AuthenticationFacade authenticationFacade) {
+        this.eventStreamService = eventStreamService;
+        this.authenticationFacade = authenticationFacade;
+    }
+
+    @GetMapping(path = "/stream", produces = MediaType.TEXT_EVENT_STREAM_VALUE)
+    @PreAuthorize("hasRole('TUTOR') or hasRole('LECTURER') or hasRole('ADMIN')")
+    public SseEmitter stream(HttpServletResponse response) {
+        // Stop reverse proxies from buffering the stream
+        response.setHeader("X-Accel-Buffering", "no");
+        response.setHeader("Cache-Control", "no-cache");
+        return eventStreamService.subscribe(authenticationFacade.getCurrentUserId(), currentRole());
+    }
+
+    private UserRole currentRole() {
+        for (String authority : authenticationFacade.getCurrentUserRoles()) {
+            if (authority.startsWith("ROLE_")) {
+                try {
+                    return UserRole.valueOf(authority.substring(5));
+                } catch (IllegalArgumentException ignored) {
+                    // Not an application role
+                }
+            }
+        }
+        throw new IllegalStateException("No application role in the current authentication");
+    }
+}
@@ -1,32 +1,43 @@
 package com.usyd.catams.controller;
 
+import com.usyd.catams.config.ReadsFromPrimary;
 import com.usyd.catams.service.TimesheetApplicationFacade;
 import com.usyd.catams.dto.request.TimesheetCreateRequest;
+import com.usyd.catams.dto.request.TimesheetQuoteBatchRequest;
 import com.usyd.catams.dto.request.TimesheetQuoteRequest;
 import com.usyd.catams.dto.request.TimesheetUpdateRequest;
 import com.usyd.catams.dto.response.PagedTimesheetResponse;
+import com.usyd.catams.dto.response.TimesheetBulkImportResponse;
 import com.usyd.catams.dto.response.TimesheetResponse;
+import com.usyd.catams.dto.response.TimesheetQuoteBatchResponse;
 import com.usyd.catams.dto.response.TimesheetQuoteResponse;
 import com.usyd.catams.enums.ApprovalStatus;
 import com.usyd.catams.enums.TimesheetTaskType;
+import com.usyd.catams.enums.UserRole;
 import com.usyd.catams.dto.response.ApprovalActionResponse;
 import com.usyd.catams.enums.ApprovalAction;
 import com.usyd.catams.exception.ResourceNotFoundException;
 import com.usyd.catams.mapper.ApprovalMapper;
 import com.usyd.catams.policy.AuthenticationFacade;
 import com.usyd.catams.service.ApprovalService;
+import com.usyd.catams.service.ChangeVersionService;
 import com.usyd.catams.service.Schedule1CalculationResult;
+import com.usyd.catams.service.TimesheetBulkImportFacade;
 import com.usyd.catams.service.TimesheetCalculationService;
 import jakarta.validation.Valid;
 import org.springframework.beans.factory.annotation.Autowired;
 import org.springframework.data.domain.PageRequest;
 import org.springframework.data.domain.Pageable;
 import org.springframework.data.domain.Sort;
+import org.springframework.http.CacheControl;
 import org.springframework.http.HttpStatus;
+import org.springframework.http.MediaType;
 import org.springframework.http.ResponseEntity;
 import org.springframework.security.access.prepost.PreAuthorize;
 import org.springframework.web.bind.annotation.*;
+import org.springframework.web.context.request.WebRequest;
 
+import java.util.List;
 import java.util.Optional;
 
 /**
@@ -34,25 +45,32 @@ import java.util.Optional;
  */
 @RestController
 @RequestMapping("/api/timesheets")
+@ReadsFromPrimary
 public class TimesheetController {
 
     private final TimesheetApplicationFacade timesheetService;
     private final TimesheetCalculationService timesheetCalculationService;
+    private final TimesheetBulkImportFacade bulkImportService;
     private final AuthenticationFacade authenticationFacade;
     private final ApprovalService approvalService;
     private final ApprovalMapper approvalMapper;
+    private final ChangeVersionService changeVersionService;
 
     @Autowired
     public TimesheetController(TimesheetApplicationFacade timesheetService,
                                TimesheetCalculationService timesheetCalculationService,
+                               TimesheetBulkImportFacade bulkImportService,
                                AuthenticationFacade authenticationFacade,
                                ApprovalService approvalService,
-                               ApprovalMapper approvalMapper) {
+                               ApprovalMapper approvalMapper,
+                               ChangeVersionService changeVersionService) {
         this.timesheetService = timesheetService;
         this.timesheetCalculationService = timesheetCalculationService;
+        this.bulkImportService = bulkImportService;
         this.authenticationFacade = authenticationFacade;
         this.approvalService = approvalService;
         this.approvalMapper = approvalMapper;
+        this.changeVersionService = changeVersionService;
     }
 
     @PostMapping("/quote")
@@ -70,6 +88,15 @@ public class TimesheetController {
         return ResponseEntity.ok(TimesheetQuoteResponse.from(request.getTaskType(), calculation));
     }
 
+    @PostMapping("/quote/batch")
+    @PreAuthorize("hasAnyRole('LECTURER','TUTOR','ADMIN')")
+    public ResponseEntity<TimesheetQuoteBatchResponse> quoteTimesheets(
+            @Valid @RequestBody TimesheetQuoteBatchRequest request) {
+        List<Schedule1CalculationResult> calculations =
+                timesheetCalculationService.calculateBatchForQuote(request.getQuotes());
+        return ResponseEntity.ok(TimesheetQuoteBatchResponse.from(request.getQuotes(), calculations));
+    }
+
     @PostMapping
     @PreAuthorize("hasAnyRole('ADMIN','LECTURER')")
     public ResponseEntity<TimesheetResponse> createTimesheet(
@@ -95,6 +122,25 @@ public class TimesheetController {
         return new ResponseEntity<>(responseBody, HttpStatus.CREATED);
     }
 
+    /**
+     * Bulk create from a JSON array of create requests. Rows are validated individually;
+     * the report lists the outcome of each row.
+     */
+    @PostMapping(value = "/bulk", consumes = MediaType.APPLICATION_JSON_VALUE)
+    @PreAuthorize("hasAnyRole('ADMIN','LECTURER')")
+    public ResponseEntity<TimesheetBulkImportResponse> bulkImportTimesheets(
+            @RequestBody List<TimesheetCreateRequest> rows) {
+        Long creatorId = authenticationFacade.getCurrentUserId();
+        return ResponseEntity.ok(bulkImportService.importRows(rows, creatorId));
+    }
+
+    @PostMapping(value = "/bulk", consumes = "text/csv")
+    @PreAuthorize("hasAnyRole('ADMIN','LECTURER')")
+    public ResponseEntity<TimesheetBulkImportResponse> bulkImportTimesheetsCsv(@RequestBody String csv) {
+        Long creatorId = authenticationFacade.getCurrentUserId();
+        return ResponseEntity.ok(bulkImportService.importCsv(csv, creatorId));
+    }
+
     @GetMapping
     @PreAuthorize("hasRole('TUTOR') or hasRole('LECTURER') or hasRole('ADMIN')")
     public ResponseEntity<PagedTimesheetResponse> getTimesheets(
@@ -103,17 +149,36 @@ public class TimesheetController {
             @RequestParam(value = "status", required = false) ApprovalStatus status,
             @RequestParam(value = "page", defaultValue = "0") int page,
             @RequestParam(value = "size", defaultValue = "20") int size,
-            @RequestParam(value = "sort", defaultValue = "createdAt,desc") String sort) {
+            @RequestParam(value = "sort", defaultValue = "createdAt,desc") String sort,
+            @RequestParam(value = "cursor", defaultValue = "false") boolean cursor,
+            @RequestParam(value = "after", required = false) String after,
+            WebRequest webRequest) {
 
         if (page < 0) page = 0;
         if (size <= 0 || size > 100) size = 20;
-        Pageable pageable = createPageable(page, size, sort);
 
         Long requesterId = authenticationFacade.getCurrentUserId();
-        PagedTimesheetResponse response = timesheetService.getTimesheetsAsDto(
-                tutorId, courseId, status, requesterId, pageable
-        );
-        return ResponseEntity.ok(response);
+        boolean cursorMode = isCursorMode(cursor, after);
+        String etag = changeVersionService.timesheetListTag(requesterId, currentRole(),
+                tutorId, courseId, status, size, cursorMode ? after : page + ";" + sort, cursorMode);
+        if (webRequest.checkNotModified(etag)) {
+            return null;
+        }
+
+        PagedTimesheetResponse response;
+        if (cursorMode) {
+            response = timesheetService.getTimesheetsAfterCursorAsDto(
+                    tutorId, courseId, status, requesterId, after, size);
+        } else {
+            Pageable pageable = createPageable(page, size, sort);
+            response = timesheetService.getTimesheetsAsDto(
+                    tutorId, courseId, status, requesterId, pageable
+            );
+        }
+        return ResponseEntity.ok()
+                .eTag(etag)
+                .cacheControl(CacheControl.noCache().cachePrivate())
+                .body(response);
     }
 
     /**
@@ -198,11 +263,19 @@ public class TimesheetController {
             @RequestParam(value = "page", defaultValue = "0") int page,
             @RequestParam(value = "size", defaultValue = "20") int size,
             @RequestParam(value = "sort", defaultValue = "createdAt,desc") String sort,
-            @RequestParam(value = "status", required = false) ApprovalStatus status) {
+            @RequestParam(value = "status", required = false) ApprovalStatus status,
+            @RequestParam(value = "cursor", defaultValue = "false") boolean cursor,
+            @RequestParam(value = "after", required = false) String after) {
 
         Long requesterId = authenticationFacade.getCurrentUserId();
         if (page < 0) page = 0;
         if (size <= 0 || size > 100) size = 20;
+        if (isCursorMode(cursor, after)) {
+            PagedTimesheetResponse response = (status != null)
+                    ? timesheetService.getTimesheetsAfterCursorAsDto(requesterId, null, status, requesterId, after, size)
+                    : timesheetService.getTimesheetsByTutorAfterCursorAsDto(requesterId, after, size);
+            return ResponseEntity.ok(response);
+        }
         Pageable pageable = createPageable(page, size, sort);
 
         PagedTimesheetResponse response = (status != null)
@@ -217,16 +290,43 @@ public class TimesheetController {
     public ResponseEntity<PagedTimesheetResponse> getPendingFinalApprovalTimesheets(
             @RequestParam(value = "page", defaultValue = "0") int page,
             @RequestParam(value = "size", defaultValue = "20") int size,
-            @RequestParam(value = "sort", defaultValue = "createdAt,asc") String sort) {
+            @RequestParam(value = "sort", defaultValue = "createdAt,asc") String sort,
+            @RequestParam(value = "cursor", defaultValue = "false") boolean cursor,
+            @RequestParam(value = "after", required = false) String after) {
         if (page < 0) page = 0;
         if (size <= 0 || size > 100) size = 20;
-        Pageable pageable = createPageable(page, size, sort);
         Long requesterId = authenticationFacade.getCurrentUserId();
+        if (isCursorMode(cursor, after)) {
+            return ResponseEntity.ok(
+                    timesheetService.getLecturerFinalApprovalQueueAfterCursorAsDto(requesterId, after, size));
+        }
+        Pageable pageable = createPageable(page, size, sort);
         PagedTimesheetResponse response =
                 timesheetService.getLecturerFinalApprovalQueueAsDto(requesterId, pageable);
         return ResponseEntity.ok(response);
     }
 
+    private UserRole currentRole() {
+        for (String authority : authenticationFacade.getCurrentUserRoles()) {
+            if (authority.startsWith("ROLE_")) {
+                try {
+                    return UserRole.valueOf(authority.substring(5));
+                } catch (IllegalArgumentException ignored) {
+                    // Not an application role
+                }
+            }
+        }
+        return null;
+    }
+
+    /**
+     * Cursor (keyset) mode is opt-in via {@code cursor=true} or by passing an {@code after} token.
+     * It always orders by the endpoint's default (createdAt, id) direction and ignores page/sort.
+     */
+    private boolean isCursorMode(boolean cursor, String after) {
+        return cursor || after != null;
+    }
+
     private Pageable createPageable(int page, int size, String sort) {
         try {
             if (sort == null || sort.trim().isEmpty()) {
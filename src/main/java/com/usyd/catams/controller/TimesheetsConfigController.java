@@ -1,8 +1,12 @@
 package com.usyd.catams.controller;
 
+import com.usyd.catams.service.ChangeVersionService;
+import org.springframework.http.CacheControl;
 import org.springframework.http.MediaType;
+import org.springframework.http.ResponseEntity;
 import org.springframework.web.bind.annotation.GetMapping;
 import org.springframework.web.bind.annotation.RestController;
+import org.springframework.web.context.request.WebRequest;
 
 import java.util.HashMap;
 import java.util.Map;
@@ -21,6 +25,12 @@ import java.util.Map;
 @RestController
 public class TimesheetsConfigController {
 
+    private final ChangeVersionService changeVersionService;
+
+    public TimesheetsConfigController(ChangeVersionService changeVersionService) {
+        this.changeVersionService = changeVersionService;
+    }
+
     /**
      * Returns UI constraint configuration for timesheet entry forms.
      *
@@ -33,10 +43,18 @@ public class TimesheetsConfigController {
      *   <li>{@code currency} - The currency code for monetary values</li>
      * </ul>
      *
-     * @return a map containing UI constraint configuration
+     * <p>The response carries an ETag; a matching {@code If-None-Match} is answered with 304.</p>
+     *
+     * @param webRequest current request, used for the conditional check
+     * @return a map containing UI constraint configuration, or null when a 304 has been prepared
      */
     @GetMapping(path = "/api/timesheets/config", produces = MediaType.APPLICATION_JSON_VALUE)
-    public Map<String, Object> getUiConstraints() {
+    public ResponseEntity<Map<String, Object>> getUiConstraints(WebRequest webRequest) {
+        String etag = changeVersionService.configTag();
+        if (webRequest.checkNotModified(etag)) {
+            return null;
+        }
+
         Map<String, Object> root = new HashMap<>();
 
         Map<String, Object> hours = new HashMap<>();
@@ -51,7 +69,10 @@ public class TimesheetsConfigController {
         root.put("weekStart", weekStart);
         root.put("currency", "AUD");
 
-        return root;
+        return ResponseEntity.ok()
+            .eTag(etag)
+            .cacheControl(CacheControl.noCache())
+            .body(root);
     }
 }
 
@@ -0,0 +1,40 @@
+package com.usyd.catams.controller.admin;
+
+import com.usyd.catams.dto.response.DeadLetteredEventResponse;
+import com.usyd.catams.service.EventDeadLetterService;
+import org.springframework.http.ResponseEntity;
+import org.springframework.security.access.prepost.PreAuthorize;
+import org.springframework.web.bind.annotation.*;
+
+import java.util.List;
+
+/**
+ * Administrative access to domain events that exhausted their delivery attempts.
+ */
+@RestController
+@RequestMapping("/api/admin/events/dead-letters")
+public class EventDeadLetterAdminController {
+
+    private static final int DEFAULT_LIMIT = 100;
+    private static final int MAX_LIMIT = 500;
+
+    private final EventDeadLetterService deadLetterService;
+
+    public EventDeadLetterAdminController(EventDeadLetterService deadLetterService) {
+        this.deadLetterService = deadLetterService;
+    }
+
+    @GetMapping
+    @PreAuthorize("hasRole('ADMIN')")
+    public ResponseEntity<List<DeadLetteredEventResponse>> listPending(
+            @RequestParam(value = "limit", required = false) Integer limit) {
+        int safeLimit = limit == null ? DEFAULT_LIMIT : Math.max(1, Math.min(limit, MAX_LIMIT));
+        return ResponseEntity.ok(deadLetterService.listPending(safeLimit));
+    }
+
+    @PostMapping("/{id}/replay")
+    @PreAuthorize("hasRole('ADMIN')")
+    public ResponseEntity<DeadLetteredEventResponse> replay(@PathVariable("id") Long id) {
+        return ResponseEntity.ok(deadLetterService.replay(id));
+    }
+}
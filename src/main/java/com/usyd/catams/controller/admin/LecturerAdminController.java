@@ -1,7 +1,12 @@
 package com.usyd.catams.controller.admin;
 
+import com.usyd.catams.dto.request.AssignmentBulkRequest;
+import com.usyd.catams.dto.response.AssignmentBulkResponse;
 import com.usyd.catams.entity.LecturerAssignment;
 import com.usyd.catams.repository.LecturerAssignmentRepository;
+import com.usyd.catams.service.AssignmentBulkService;
+import com.usyd.catams.service.CourseScopeCache;
+import jakarta.validation.Valid;
 import jakarta.validation.constraints.NotEmpty;
 import jakarta.validation.constraints.NotNull;
 import org.springframework.core.env.Environment;
@@ -20,12 +25,18 @@ public class LecturerAdminController {
 
     private final LecturerAssignmentRepository lecturerAssignmentRepository;
     private final Environment environment;
+    private final CourseScopeCache courseScopeCache;
+    private final AssignmentBulkService assignmentBulkService;
     private static final org.slf4j.Logger log = org.slf4j.LoggerFactory.getLogger(LecturerAdminController.class);
 
     public LecturerAdminController(LecturerAssignmentRepository lecturerAssignmentRepository,
-                                   Environment environment) {
+                                   Environment environment,
+                                   CourseScopeCache courseScopeCache,
+                                   AssignmentBulkService assignmentBulkService) {
         this.lecturerAssignmentRepository = lecturerAssignmentRepository;
         this.environment = environment;
+        this.courseScopeCache = courseScopeCache;
+        this.assignmentBulkService = assignmentBulkService;
     }
 
     public static class AssignmentRequest {
@@ -81,9 +92,21 @@ public class LecturerAdminController {
         } catch (Exception ex) {
             log.warn("[Lecturer] setAssignments tolerated error (treated as success): {}", ex.getMessage());
             return ResponseEntity.ok(java.util.Map.of("courseIds", request.courseIds));
+        } finally {
+            // Each repository call commits on its own, so evict even after a partial failure
+            courseScopeCache.evictLecturer(request.lecturerId);
         }
     }
 
+    /**
+     * Replace the course assignments of many lecturers at once; each entry is the lecturer's complete set
+     */
+    @PostMapping("/assignments/bulk")
+    @PreAuthorize("hasRole('ADMIN')")
+    public ResponseEntity<AssignmentBulkResponse> setAssignmentsBulk(@Valid @RequestBody AssignmentBulkRequest request) {
+        return ResponseEntity.ok(assignmentBulkService.replaceLecturerAssignments(request));
+    }
+
     @GetMapping("/{lecturerId}/assignments")
     @PreAuthorize("hasRole('ADMIN') or hasRole('LECTURER')")
     public ResponseEntity<Map<String, List<Long>>> getAssignments(@PathVariable("lecturerId") Long lecturerId) {
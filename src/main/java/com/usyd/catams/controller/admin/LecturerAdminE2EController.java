@@ -26,6 +26,7 @@ public class LecturerAdminE2EController {
     private final E2EAssignmentState state;
     private final com.usyd.catams.policy.AuthenticationFacade authenticationFacade;
     private final LecturerAssignmentRepository lecturerAssignmentRepository;
+    private final com.usyd.catams.service.CourseScopeCache courseScopeCache;
 
     public static class AssignmentRequest {
         @NotNull public Long lecturerId;
@@ -34,10 +35,12 @@ public class LecturerAdminE2EController {
 
     public LecturerAdminE2EController(E2EAssignmentState state,
                                       com.usyd.catams.policy.AuthenticationFacade authenticationFacade,
-                                      LecturerAssignmentRepository lecturerAssignmentRepository) {
+                                      LecturerAssignmentRepository lecturerAssignmentRepository,
+                                      com.usyd.catams.service.CourseScopeCache courseScopeCache) {
         this.state = state;
         this.authenticationFacade = authenticationFacade;
         this.lecturerAssignmentRepository = lecturerAssignmentRepository;
+        this.courseScopeCache = courseScopeCache;
     }
 
     @PostMapping("/assignments")
@@ -88,6 +91,8 @@ public class LecturerAdminE2EController {
             log.debug("[E2E-Lecturer] setAssignments lecturerId={} courseIds={}", request.lecturerId, ids);
         } catch (Exception ex) {
             log.warn("[E2E-Lecturer] DB persist failed (in-memory state still set): {}", ex.getMessage());
+        } finally {
+            courseScopeCache.evictLecturer(request.lecturerId);
         }
         
         return ResponseEntity.ok(java.util.Map.of("courseIds", ids));
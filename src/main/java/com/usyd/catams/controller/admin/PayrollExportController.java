@@ -0,0 +1,67 @@
+package com.usyd.catams.controller.admin;
+
+import com.usyd.catams.exception.BusinessRuleException;
+import com.usyd.catams.exception.ErrorCodes;
+import com.usyd.catams.service.PayrollExportService;
+import org.springframework.format.annotation.DateTimeFormat;
+import org.springframework.http.ContentDisposition;
+import org.springframework.http.HttpHeaders;
+import org.springframework.http.ResponseEntity;
+import org.springframework.security.access.prepost.PreAuthorize;
+import org.springframework.web.bind.annotation.*;
+import org.springframework.web.servlet.mvc.method.annotation.StreamingResponseBody;
+
+import java.time.LocalDate;
+import java.time.temporal.ChronoUnit;
+import java.util.Locale;
+
+/**
+ * Payroll export of final-confirmed timesheets with rate-code subtotals.
+ *
+ * The body is streamed while the database cursor is read, so large ranges do not buffer in memory.
+ */
+@RestController
+@RequestMapping("/api/admin/payroll")
+public class PayrollExportController {
+
+    // Guards against accidental multi-year scans; a financial year fits comfortably
+    private static final long MAX_RANGE_DAYS = 400;
+
+    private final PayrollExportService payrollExportService;
+
+    public PayrollExportController(PayrollExportService payrollExportService) {
+        this.payrollExportService = payrollExportService;
+    }
+
+    @GetMapping("/export")
+    @PreAuthorize("hasAnyRole('ADMIN','HR')")
+    public ResponseEntity<StreamingResponseBody> export(
+            @RequestParam("from") @DateTimeFormat(iso = DateTimeFormat.ISO.DATE) LocalDate from,
+            @RequestParam("to") @DateTimeFormat(iso = DateTimeFormat.ISO.DATE) LocalDate to,
+            @RequestParam(value = "format", defaultValue = "csv") String format) {
+        if (to.isBefore(from)) {
+            throw new BusinessRuleException("'to' must not be before 'from'", ErrorCodes.VALIDATION_FAILED);
+        }
+        if (ChronoUnit.DAYS.between(from, to) > MAX_RANGE_DAYS) {
+            throw new BusinessRuleException("Export range cannot exceed " + MAX_RANGE_DAYS + " days",
+                ErrorCodes.VALIDATION_FAILED);
+        }
+        PayrollExportService.Format exportFormat = parseFormat(format);
+
+        String filename = "payroll-" + from + "-to-" + to + "." + exportFormat.getExtension();
+        StreamingResponseBody body = output -> payrollExportService.export(from, to, exportFormat, output);
+        return ResponseEntity.ok()
+            .contentType(exportFormat.getMediaType())
+            .header(HttpHeaders.CONTENT_DISPOSITION, ContentDisposition.attachment().filename(filename).build().toString())
+            .body(body);
+    }
+
+    private static PayrollExportService.Format parseFormat(String format) {
+        try {
+            return PayrollExportService.Format.valueOf(format.trim().toUpperCase(Locale.ROOT));
+        } catch (IllegalArgumentException e) {
+            throw new BusinessRuleException("Unsupported export format: " + format + " (use csv or ndjson)",
+                ErrorCodes.VALIDATION_FAILED);
+        }
+    }
+}
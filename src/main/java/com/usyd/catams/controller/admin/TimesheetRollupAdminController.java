@@ -0,0 +1,36 @@
+package com.usyd.catams.controller.admin;
+
+import com.usyd.catams.dto.response.RollupConsistencyReport;
+import com.usyd.catams.service.TimesheetWeeklyRollupService;
+import org.springframework.http.ResponseEntity;
+import org.springframework.security.access.prepost.PreAuthorize;
+import org.springframework.web.bind.annotation.*;
+
+import java.util.Map;
+
+/**
+ * Administrative operations on the weekly timesheet rollup read model.
+ */
+@RestController
+@RequestMapping("/api/admin/timesheet-rollup")
+public class TimesheetRollupAdminController {
+
+    private final TimesheetWeeklyRollupService rollupService;
+
+    public TimesheetRollupAdminController(TimesheetWeeklyRollupService rollupService) {
+        this.rollupService = rollupService;
+    }
+
+    @PostMapping("/rebuild")
+    @PreAuthorize("hasRole('ADMIN')")
+    public ResponseEntity<Map<String, Object>> rebuild() {
+        int rows = rollupService.rebuild();
+        return ResponseEntity.ok(Map.of("rowsWritten", rows));
+    }
+
+    @GetMapping("/consistency")
+    @PreAuthorize("hasRole('ADMIN')")
+    public ResponseEntity<RollupConsistencyReport> checkConsistency() {
+        return ResponseEntity.ok(rollupService.checkConsistency());
+    }
+}
@@ -1,10 +1,15 @@
 package com.usyd.catams.controller.admin;
 
+import com.usyd.catams.dto.request.AssignmentBulkRequest;
+import com.usyd.catams.dto.response.AssignmentBulkResponse;
 import com.usyd.catams.entity.TutorAssignment;
 import com.usyd.catams.entity.TutorProfileDefaults;
 import com.usyd.catams.enums.TutorQualification;
 import com.usyd.catams.repository.TutorAssignmentRepository;
 import com.usyd.catams.repository.TutorProfileDefaultsRepository;
+import com.usyd.catams.service.AssignmentBulkService;
+import com.usyd.catams.service.CourseScopeCache;
+import jakarta.validation.Valid;
 import jakarta.validation.constraints.NotEmpty;
 import jakarta.validation.constraints.NotNull;
 import org.springframework.http.ResponseEntity;
@@ -26,16 +31,22 @@ public class UserAdminController {
     private final TutorProfileDefaultsRepository defaultsRepository;
     private final Environment environment;
     private final PlatformTransactionManager transactionManager;
+    private final CourseScopeCache courseScopeCache;
+    private final AssignmentBulkService assignmentBulkService;
     public static final java.util.concurrent.ConcurrentHashMap<Long, java.util.List<Long>> E2E_TUTOR_ASSIGNMENTS = new java.util.concurrent.ConcurrentHashMap<>();
 
     public UserAdminController(TutorAssignmentRepository assignmentRepository,
                                TutorProfileDefaultsRepository defaultsRepository,
                                Environment environment,
-                               PlatformTransactionManager transactionManager) {
+                               PlatformTransactionManager transactionManager,
+                               CourseScopeCache courseScopeCache,
+                               AssignmentBulkService assignmentBulkService) {
         this.assignmentRepository = assignmentRepository;
         this.defaultsRepository = defaultsRepository;
         this.environment = environment;
         this.transactionManager = transactionManager;
+        this.courseScopeCache = courseScopeCache;
+        this.assignmentBulkService = assignmentBulkService;
     }
 
     public static class AssignmentRequest {
@@ -76,6 +87,8 @@ public class UserAdminController {
                     }
                 }
                 assignmentRepository.flush();
+                // Evicts again after commit; other instances are notified only if this commits
+                courseScopeCache.evictTutor(request.tutorId);
                 log.debug("setAssignments applied: deleted={}, inserted={}", toDelete, toInsert);
                 return null;
             });
@@ -97,6 +110,15 @@ public class UserAdminController {
         }
     }
 
+    /**
+     * Replace the course assignments of many tutors at once; each entry is the tutor's complete set
+     */
+    @PostMapping("/assignments/bulk")
+    @PreAuthorize("hasRole('ADMIN')")
+    public ResponseEntity<AssignmentBulkResponse> setAssignmentsBulk(@Valid @RequestBody AssignmentBulkRequest request) {
+        return ResponseEntity.ok(assignmentBulkService.replaceTutorAssignments(request));
+    }
+
     @PutMapping("/defaults")
     @PreAuthorize("hasRole('ADMIN')")
     public ResponseEntity<Void> setDefaults(@RequestBody DefaultsRequest request) {
@@ -0,0 +1,34 @@
+package com.usyd.catams.dto;
+
+import java.math.BigDecimal;
+
+/**
+ * DTO for course budget aggregation in repository queries
+ *
+ * Lets system-wide views read course counts and budget totals without
+ * loading every course entity
+ */
+public class CourseBudgetTotals {
+
+    private final Long courseCount;
+    private final BigDecimal totalAllocated;
+    private final BigDecimal totalUsed;
+
+    public CourseBudgetTotals(Long courseCount, BigDecimal totalAllocated, BigDecimal totalUsed) {
+        this.courseCount = courseCount != null ? courseCount : 0L;
+        this.totalAllocated = totalAllocated != null ? totalAllocated : BigDecimal.ZERO;
+        this.totalUsed = totalUsed != null ? totalUsed : BigDecimal.ZERO;
+    }
+
+    public Long getCourseCount() {
+        return courseCount;
+    }
+
+    public BigDecimal getTotalAllocated() {
+        return totalAllocated;
+    }
+
+    public BigDecimal getTotalUsed() {
+        return totalUsed;
+    }
+}
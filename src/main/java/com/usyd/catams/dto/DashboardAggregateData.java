@@ -0,0 +1,41 @@
+package com.usyd.catams.dto;
+
+import java.math.BigDecimal;
+
+/**
+ * DTO for single-pass dashboard aggregation in repository queries
+ *
+ * Carries the requested period summary together with the current-week and
+ * previous-week hour totals, so one scan of timesheets feeds the summary
+ * cards and the workload analysis of a dashboard
+ */
+public class DashboardAggregateData {
+
+    private final TimesheetSummaryData periodSummary;
+    private final BigDecimal currentWeekHours;
+    private final BigDecimal previousWeekHours;
+
+    public DashboardAggregateData(Long totalTimesheets, BigDecimal totalHours,
+                                  BigDecimal totalPay, Long pendingApprovals,
+                                  BigDecimal currentWeekHours, BigDecimal previousWeekHours) {
+        this.periodSummary = new TimesheetSummaryData(totalTimesheets, totalHours, totalPay, pendingApprovals);
+        this.currentWeekHours = currentWeekHours != null ? currentWeekHours : BigDecimal.ZERO;
+        this.previousWeekHours = previousWeekHours != null ? previousWeekHours : BigDecimal.ZERO;
+    }
+
+    public static DashboardAggregateData empty() {
+        return new DashboardAggregateData(0L, BigDecimal.ZERO, BigDecimal.ZERO, 0L, BigDecimal.ZERO, BigDecimal.ZERO);
+    }
+
+    public TimesheetSummaryData getPeriodSummary() {
+        return periodSummary;
+    }
+
+    public BigDecimal getCurrentWeekHours() {
+        return currentWeekHours;
+    }
+
+    public BigDecimal getPreviousWeekHours() {
+        return previousWeekHours;
+    }
+}
@@ -0,0 +1,65 @@
+package com.usyd.catams.dto;
+
+import java.time.DayOfWeek;
+import java.time.LocalDate;
+
+/**
+ * Date windows evaluated by a single dashboard aggregation query
+ *
+ * Holds the requested reporting period plus the Monday-to-Sunday ranges of the
+ * current and previous week, all inclusive
+ */
+public final class DashboardWindows {
+
+    private final LocalDate startDate;
+    private final LocalDate endDate;
+    private final LocalDate currentWeekStart;
+    private final LocalDate currentWeekEnd;
+    private final LocalDate previousWeekStart;
+    private final LocalDate previousWeekEnd;
+
+    private DashboardWindows(LocalDate startDate, LocalDate endDate, LocalDate currentWeekStart) {
+        this.startDate = startDate;
+        this.endDate = endDate;
+        this.currentWeekStart = currentWeekStart;
+        this.currentWeekEnd = currentWeekStart.plusDays(6);
+        this.previousWeekStart = currentWeekStart.minusWeeks(1);
+        this.previousWeekEnd = previousWeekStart.plusDays(6);
+    }
+
+    /**
+     * Build the windows for a reporting period relative to the given day.
+     *
+     * @param startDate period start (inclusive)
+     * @param endDate period end (inclusive)
+     * @param today the reference day; its week's Monday starts the current week
+     * @return the evaluated windows
+     */
+    public static DashboardWindows of(LocalDate startDate, LocalDate endDate, LocalDate today) {
+        return new DashboardWindows(startDate, endDate, today.with(DayOfWeek.MONDAY));
+    }
+
+    public LocalDate getStartDate() {
+        return startDate;
+    }
+
+    public LocalDate getEndDate() {
+        return endDate;
+    }
+
+    public LocalDate getCurrentWeekStart() {
+        return currentWeekStart;
+    }
+
+    public LocalDate getCurrentWeekEnd() {
+        return currentWeekEnd;
+    }
+
+    public LocalDate getPreviousWeekStart() {
+        return previousWeekStart;
+    }
+
+    public LocalDate getPreviousWeekEnd() {
+        return previousWeekEnd;
+    }
+}
@@ -0,0 +1,83 @@
+package com.usyd.catams.dto;
+
+import com.usyd.catams.entity.Timesheet;
+import com.usyd.catams.exception.BusinessRuleException;
+import com.usyd.catams.exception.ErrorCodes;
+
+import java.nio.charset.StandardCharsets;
+import java.time.LocalDateTime;
+import java.time.format.DateTimeParseException;
+import java.time.temporal.ChronoUnit;
+import java.util.Base64;
+
+/**
+ * Keyset position in a timesheet listing ordered by (createdAt, id)
+ *
+ * Encoded as an opaque URL-safe token so clients pass it back verbatim as the
+ * {@code after} parameter; the format is not part of the API contract
+ */
+public final class TimesheetCursor {
+
+    // Sentinels used for the first page so every keyset query can share one predicate
+    private static final LocalDateTime LATEST = LocalDateTime.of(9999, 12, 31, 23, 59, 59);
+    private static final LocalDateTime EARLIEST = LocalDateTime.of(1970, 1, 1, 0, 0);
+
+    private final LocalDateTime createdAt;
+    private final Long id;
+
+    private TimesheetCursor(LocalDateTime createdAt, Long id) {
+        this.createdAt = createdAt;
+        this.id = id;
+    }
+
+    /**
+     * Position before the first row of a listing in the given direction.
+     */
+    public static TimesheetCursor start(boolean descending) {
+        return descending
+            ? new TimesheetCursor(LATEST, Long.MAX_VALUE)
+            : new TimesheetCursor(EARLIEST, 0L);
+    }
+
+    /**
+     * Position just after the given timesheet.
+     */
+    public static TimesheetCursor after(Timesheet timesheet) {
+        // Database timestamps carry microseconds at most
+        return new TimesheetCursor(timesheet.getCreatedAt().truncatedTo(ChronoUnit.MICROS), timesheet.getId());
+    }
+
+    /**
+     * Decode a token previously produced by {@link #encode()}; blank tokens start from the beginning.
+     */
+    public static TimesheetCursor decode(String token, boolean descending) {
+        if (token == null || token.isBlank()) {
+            return start(descending);
+        }
+        try {
+            String raw = new String(Base64.getUrlDecoder().decode(token), StandardCharsets.UTF_8);
+            int separator = raw.lastIndexOf('|');
+            if (separator <= 0) {
+                throw new IllegalArgumentException("missing separator");
+            }
+            return new TimesheetCursor(
+                LocalDateTime.parse(raw.substring(0, separator)),
+                Long.parseLong(raw.substring(separator + 1)));
+        } catch (IllegalArgumentException | DateTimeParseException e) {
+            throw new BusinessRuleException("Invalid pagination cursor", ErrorCodes.VALIDATION_FAILED);
+        }
+    }
+
+    public String encode() {
+        String raw = createdAt + "|" + id;
+        return Base64.getUrlEncoder().withoutPadding().encodeToString(raw.getBytes(StandardCharsets.UTF_8));
+    }
+
+    public LocalDateTime getCreatedAt() {
+        return createdAt;
+    }
+
+    public Long getId() {
+        return id;
+    }
+}
@@ -0,0 +1,50 @@
+package com.usyd.catams.dto;
+
+import java.time.LocalDate;
+import java.util.Objects;
+
+/**
+ * DTO for the (tutor, course, week) uniqueness key of a timesheet
+ *
+ * Used as projection target when checking many candidate timesheets against
+ * existing rows in one query; equality is by value so keys can go in a set
+ */
+public class TimesheetWeekKey {
+
+    private final Long tutorId;
+    private final Long courseId;
+    private final LocalDate weekStartDate;
+
+    public TimesheetWeekKey(Long tutorId, Long courseId, LocalDate weekStartDate) {
+        this.tutorId = tutorId;
+        this.courseId = courseId;
+        this.weekStartDate = weekStartDate;
+    }
+
+    public Long getTutorId() {
+        return tutorId;
+    }
+
+    public Long getCourseId() {
+        return courseId;
+    }
+
+    public LocalDate getWeekStartDate() {
+        return weekStartDate;
+    }
+
+    @Override
+    public boolean equals(Object o) {
+        if (this == o) return true;
+        if (!(o instanceof TimesheetWeekKey)) return false;
+        TimesheetWeekKey that = (TimesheetWeekKey) o;
+        return Objects.equals(tutorId, that.tutorId)
+            && Objects.equals(courseId, that.courseId)
+            && Objects.equals(weekStartDate, that.weekStartDate);
+    }
+
+    @Override
+    public int hashCode() {
+        return Objects.hash(tutorId, courseId, weekStartDate);
+    }
+}
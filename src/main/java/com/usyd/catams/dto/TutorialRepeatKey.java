@@ -0,0 +1,42 @@
+package com.usyd.catams.dto;
+
+import java.util.Objects;
+
+/**
+ * DTO for the content a repeat tutorial must match: the course and the normalised description hash
+ *
+ * A null hash matches any prior tutorial of the course, for callers (such as quotes) that have no
+ * description; equality is by value so keys can index maps
+ */
+public class TutorialRepeatKey {
+
+    private final Long courseId;
+    private final String descriptionHash;
+
+    public TutorialRepeatKey(Long courseId, String descriptionHash) {
+        this.courseId = courseId;
+        this.descriptionHash = descriptionHash;
+    }
+
+    public Long getCourseId() {
+        return courseId;
+    }
+
+    public String getDescriptionHash() {
+        return descriptionHash;
+    }
+
+    @Override
+    public boolean equals(Object o) {
+        if (this == o) return true;
+        if (!(o instanceof TutorialRepeatKey)) return false;
+        TutorialRepeatKey that = (TutorialRepeatKey) o;
+        return Objects.equals(courseId, that.courseId)
+            && Objects.equals(descriptionHash, that.descriptionHash);
+    }
+
+    @Override
+    public int hashCode() {
+        return Objects.hash(courseId, descriptionHash);
+    }
+}
@@ -0,0 +1,40 @@
+package com.usyd.catams.dto;
+
+import java.time.LocalDate;
+
+/**
+ * DTO for the dates of a prior tutorial in repeat-rule queries
+ *
+ * Lets many repeat-eligibility checks share one query instead of
+ * counting matching tutorials once per session
+ */
+public class TutorialSessionDates {
+
+    private final Long courseId;
+    private final LocalDate weekStartDate;
+    private final LocalDate sessionDate;
+    private final String descriptionHash;
+
+    public TutorialSessionDates(Long courseId, LocalDate weekStartDate, LocalDate sessionDate, String descriptionHash) {
+        this.courseId = courseId;
+        this.weekStartDate = weekStartDate;
+        this.sessionDate = sessionDate;
+        this.descriptionHash = descriptionHash;
+    }
+
+    public Long getCourseId() {
+        return courseId;
+    }
+
+    public LocalDate getWeekStartDate() {
+        return weekStartDate;
+    }
+
+    public LocalDate getSessionDate() {
+        return sessionDate;
+    }
+
+    public String getDescriptionHash() {
+        return descriptionHash;
+    }
+}
@@ -0,0 +1,80 @@
+package com.usyd.catams.dto;
+
+import com.usyd.catams.enums.ApprovalStatus;
+
+import java.math.BigDecimal;
+import java.time.LocalDate;
+import java.util.Objects;
+
+/**
+ * DTO for weekly timesheet totals keyed by course, tutor, week and status
+ *
+ * Produced both from the base timesheets table and from the weekly rollup so the
+ * two can be compared by the rollup consistency check
+ */
+public class WeeklyRollupTotals {
+
+    private final Long courseId;
+    private final Long tutorId;
+    private final LocalDate weekStartDate;
+    private final ApprovalStatus status;
+    private final Long timesheetCount;
+    private final BigDecimal totalHours;
+    private final BigDecimal totalPay;
+
+    public WeeklyRollupTotals(Long courseId, Long tutorId, LocalDate weekStartDate, ApprovalStatus status,
+                              Long timesheetCount, BigDecimal totalHours, BigDecimal totalPay) {
+        this.courseId = courseId;
+        this.tutorId = tutorId;
+        this.weekStartDate = weekStartDate;
+        this.status = status;
+        this.timesheetCount = timesheetCount != null ? timesheetCount : 0L;
+        this.totalHours = totalHours != null ? totalHours : BigDecimal.ZERO;
+        this.totalPay = totalPay != null ? totalPay : BigDecimal.ZERO;
+    }
+
+    public Long getCourseId() {
+        return courseId;
+    }
+
+    public Long getTutorId() {
+        return tutorId;
+    }
+
+    public LocalDate getWeekStartDate() {
+        return weekStartDate;
+    }
+
+    public ApprovalStatus getStatus() {
+        return status;
+    }
+
+    public Long getTimesheetCount() {
+        return timesheetCount;
+    }
+
+    public BigDecimal getTotalHours() {
+        return totalHours;
+    }
+
+    public BigDecimal getTotalPay() {
+        return totalPay;
+    }
+
+    /**
+     * Identifies the rollup row these totals belong to.
+     */
+    public String getKey() {
+        return courseId + "/" + tutorId + "/" + weekStartDate + "/" + status;
+    }
+
+    /**
+     * Compare totals ignoring decimal scale differences between the two sources.
+     */
+    public boolean hasSameTotals(WeeklyRollupTotals other) {
+        return other != null
+            && Objects.equals(timesheetCount, other.timesheetCount)
+            && totalHours.compareTo(other.totalHours) == 0
+            && totalPay.compareTo(other.totalPay) == 0;
+    }
+}
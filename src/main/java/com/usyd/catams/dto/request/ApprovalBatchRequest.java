@@ -0,0 +1,56 @@
+package com.usyd.catams.dto.request;
+
+import com.usyd.catams.enums.ApprovalAction;
+import jakarta.validation.constraints.NotEmpty;
+import jakarta.validation.constraints.NotNull;
+import jakarta.validation.constraints.Size;
+import java.util.List;
+
+/**
+ * Request payload for applying one approval action to several timesheets.
+ */
+public class ApprovalBatchRequest {
+
+    @NotEmpty(message = "At least one timesheet ID is required")
+    @Size(max = 500, message = "A batch cannot exceed 500 timesheets")
+    private List<@NotNull Long> timesheetIds;
+
+    @NotNull(message = "Action is required")
+    private ApprovalAction action;
+
+    @Size(max = 500, message = "Comment cannot exceed 500 characters")
+    private String comment;
+
+    public ApprovalBatchRequest() {
+    }
+
+    public ApprovalBatchRequest(List<Long> timesheetIds, ApprovalAction action, String comment) {
+        this.timesheetIds = timesheetIds;
+        this.action = action;
+        this.comment = comment;
+    }
+
+    public List<Long> getTimesheetIds() {
+        return timesheetIds;
+    }
+
+    public void setTimesheetIds(List<Long> timesheetIds) {
+        this.timesheetIds = timesheetIds;
+    }
+
+    public ApprovalAction getAction() {
+        return action;
+    }
+
+    public void setAction(ApprovalAction action) {
+        this.action = action;
+    }
+
+    public String getComment() {
+        return comment;
+    }
+
+    public void setComment(String comment) {
+        this.comment = comment;
+    }
+}
@@ -0,0 +1,68 @@
+package com.usyd.catams.dto.request;
+
+import jakarta.validation.Valid;
+import jakarta.validation.constraints.NotEmpty;
+import jakarta.validation.constraints.NotNull;
+import jakarta.validation.constraints.Size;
+import java.util.List;
+
+/**
+ * Request payload for replacing the course assignments of many tutors or lecturers at once.
+ *
+ * Each entry gives the complete set of courses the user should be assigned to afterwards; an
+ * empty list removes all of the user's assignments.
+ */
+public class AssignmentBulkRequest {
+
+    @NotEmpty(message = "At least one assignment entry is required")
+    @Size(max = 1000, message = "A bulk assignment cannot exceed 1000 users")
+    private List<@Valid @NotNull Entry> assignments;
+
+    public AssignmentBulkRequest() {
+    }
+
+    public AssignmentBulkRequest(List<Entry> assignments) {
+        this.assignments = assignments;
+    }
+
+    public List<Entry> getAssignments() {
+        return assignments;
+    }
+
+    public void setAssignments(List<Entry> assignments) {
+        this.assignments = assignments;
+    }
+
+    public static class Entry {
+
+        @NotNull(message = "User ID is required")
+        private Long userId;
+
+        @NotNull(message = "Course IDs are required")
+        private List<@NotNull Long> courseIds;
+
+        public Entry() {
+        }
+
+        public Entry(Long userId, List<Long> courseIds) {
+            this.userId = userId;
+            this.courseIds = courseIds;
+        }
+
+        public Long getUserId() {
+            return userId;
+        }
+
+        public void setUserId(Long userId) {
+            this.userId = userId;
+        }
+
+        public List<Long> getCourseIds() {
+            return courseIds;
+        }
+
+        public void setCourseIds(List<Long> courseIds) {
+            this.courseIds = courseIds;
+        }
+    }
+}
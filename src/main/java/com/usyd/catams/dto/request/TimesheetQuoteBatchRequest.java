@@ -0,0 +1,24 @@
+package com.usyd.catams.dto.request;
+
+import jakarta.validation.Valid;
+import jakarta.validation.constraints.NotEmpty;
+import jakarta.validation.constraints.Size;
+import java.util.List;
+
+/**
+ * Request payload for the batch Schedule 1 quote endpoint.
+ */
+public class TimesheetQuoteBatchRequest {
+
+    @NotEmpty(message = "At least one quote is required")
+    @Size(max = 1000, message = "A batch cannot exceed 1000 quotes")
+    private List<@Valid TimesheetQuoteRequest> quotes;
+
+    public List<TimesheetQuoteRequest> getQuotes() {
+        return quotes;
+    }
+
+    public void setQuotes(List<TimesheetQuoteRequest> quotes) {
+        this.quotes = quotes;
+    }
+}
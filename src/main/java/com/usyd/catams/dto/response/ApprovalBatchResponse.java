@@ -0,0 +1,100 @@
+package com.usyd.catams.dto.response;
+
+import com.usyd.catams.enums.ApprovalAction;
+import com.usyd.catams.enums.ApprovalStatus;
+
+import java.util.List;
+
+/**
+ * Per-timesheet outcome of a batch approval action
+ *
+ * Results follow the order of the requested IDs. A failed item carries the reason and
+ * leaves its timesheet unchanged; the other items are still applied.
+ */
+public class ApprovalBatchResponse {
+
+    private ApprovalAction action;
+    private int totalCount;
+    private int succeededCount;
+    private int failedCount;
+    private List<ItemResult> results;
+
+    public ApprovalBatchResponse() {}
+
+    public ApprovalBatchResponse(ApprovalAction action, List<ItemResult> results) {
+        this.action = action;
+        this.results = results;
+        this.totalCount = results.size();
+        this.succeededCount = (int) results.stream().filter(ItemResult::isSuccess).count();
+        this.failedCount = totalCount - succeededCount;
+    }
+
+    public ApprovalAction getAction() {
+        return action;
+    }
+
+    public int getTotalCount() {
+        return totalCount;
+    }
+
+    public int getSucceededCount() {
+        return succeededCount;
+    }
+
+    public int getFailedCount() {
+        return failedCount;
+    }
+
+    public List<ItemResult> getResults() {
+        return results;
+    }
+
+    public static class ItemResult {
+
+        private Long timesheetId;
+        private boolean success;
+        private ApprovalStatus previousStatus;
+        private ApprovalStatus newStatus;
+        private String message;
+
+        public ItemResult() {}
+
+        private ItemResult(Long timesheetId, boolean success, ApprovalStatus previousStatus,
+                           ApprovalStatus newStatus, String message) {
+            this.timesheetId = timesheetId;
+            this.success = success;
+            this.previousStatus = previousStatus;
+            this.newStatus = newStatus;
+            this.message = message;
+        }
+
+        public static ItemResult succeeded(Long timesheetId, ApprovalStatus previousStatus, ApprovalStatus newStatus) {
+            return new ItemResult(timesheetId, true, previousStatus, newStatus,
+                "Timesheet moved from " + previousStatus + " to " + newStatus);
+        }
+
+        public static ItemResult failed(Long timesheetId, ApprovalStatus currentStatus, String message) {
+            return new ItemResult(timesheetId, false, currentStatus, currentStatus, message);
+        }
+
+        public Long getTimesheetId() {
+            return timesheetId;
+        }
+
+        public boolean isSuccess() {
+            return success;
+        }
+
+        public ApprovalStatus getPreviousStatus() {
+            return previousStatus;
+        }
+
+        public ApprovalStatus getNewStatus() {
+            return newStatus;
+        }
+
+        public String getMessage() {
+            return message;
+        }
+    }
+}
@@ -0,0 +1,74 @@
+package com.usyd.catams.dto.response;
+
+import java.util.List;
+
+/**
+ * Summary of a bulk assignment replacement
+ *
+ * Lists only the users whose assignments changed; counts cover the whole request.
+ */
+public class AssignmentBulkResponse {
+
+    private int userCount;
+    private int changedUserCount;
+    private int insertedCount;
+    private int deletedCount;
+    private List<UserChange> changes;
+
+    public AssignmentBulkResponse() {}
+
+    public AssignmentBulkResponse(int userCount, List<UserChange> changes) {
+        this.userCount = userCount;
+        this.changes = changes;
+        this.changedUserCount = changes.size();
+        this.insertedCount = changes.stream().mapToInt(change -> change.getAdded().size()).sum();
+        this.deletedCount = changes.stream().mapToInt(change -> change.getRemoved().size()).sum();
+    }
+
+    public int getUserCount() {
+        return userCount;
+    }
+
+    public int getChangedUserCount() {
+        return changedUserCount;
+    }
+
+    public int getInsertedCount() {
+        return insertedCount;
+    }
+
+    public int getDeletedCount() {
+        return deletedCount;
+    }
+
+    public List<UserChange> getChanges() {
+        return changes;
+    }
+
+    public static class UserChange {
+
+        private Long userId;
+        private List<Long> added;
+        private List<Long> removed;
+
+        public UserChange() {}
+
+        public UserChange(Long userId, List<Long> added, List<Long> removed) {
+            this.userId = userId;
+            this.added = added;
+            this.removed = removed;
+        }
+
+        public Long getUserId() {
+            return userId;
+        }
+
+        public List<Long> getAdded() {
+            return added;
+        }
+
+        public List<Long> getRemoved() {
+            return removed;
+        }
+    }
+}
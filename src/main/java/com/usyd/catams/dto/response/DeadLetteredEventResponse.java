@@ -0,0 +1,118 @@
+package com.usyd.catams.dto.response;
+
+import java.time.LocalDateTime;
+import java.util.UUID;
+
+/**
+ * A domain event that exhausted its delivery attempts and is held for replay
+ */
+public class DeadLetteredEventResponse {
+
+    private Long id;
+    private UUID eventId;
+    private String eventType;
+    private String aggregateType;
+    private String aggregateId;
+    private String source;
+    private int attempts;
+    private String lastError;
+    private LocalDateTime deadLetteredAt;
+    private LocalDateTime replayedAt;
+
+    public DeadLetteredEventResponse() {}
+
+    public DeadLetteredEventResponse(Long id, UUID eventId, String eventType, String aggregateType,
+                                     String aggregateId, String source, int attempts, String lastError,
+                                     LocalDateTime deadLetteredAt, LocalDateTime replayedAt) {
+        this.id = id;
+        this.eventId = eventId;
+        this.eventType = eventType;
+        this.aggregateType = aggregateType;
+        this.aggregateId = aggregateId;
+        this.source = source;
+        this.attempts = attempts;
+        this.lastError = lastError;
+        this.deadLetteredAt = deadLetteredAt;
+        this.replayedAt = replayedAt;
+    }
+
+    public Long getId() {
+        return id;
+    }
+
+    public void setId(Long id) {
+        this.id = id;
+    }
+
+    public UUID getEventId() {
+        return eventId;
+    }
+
+    public void setEventId(UUID eventId) {
+        this.eventId = eventId;
+    }
+
+    public String getEventType() {
+        return eventType;
+    }
+
+    public void setEventType(String eventType) {
+        this.eventType = eventType;
+    }
+
+    public String getAggregateType() {
+        return aggregateType;
+    }
+
+    public void setAggregateType(String aggregateType) {
+        this.aggregateType = aggregateType;
+    }
+
+    public String getAggregateId() {
+        return aggregateId;
+    }
+
+    public void setAggregateId(String aggregateId) {
+        this.aggregateId = aggregateId;
+    }
+
+    public String getSource() {
+        return source;
+    }
+
+    public void setSource(String source) {
+        this.source = source;
+    }
+
+    public int getAttempts() {
+        return attempts;
+    }
+
+    public void setAttempts(int attempts) {
+        this.attempts = attempts;
+    }
+
+    public String getLastError() {
+        return lastError;
+    }
+
+    public void setLastError(String lastError) {
+        this.lastError = lastError;
+    }
+
+    public LocalDateTime getDeadLetteredAt() {
+        return deadLetteredAt;
+    }
+
+    public void setDeadLetteredAt(LocalDateTime deadLetteredAt) {
+        this.deadLetteredAt = deadLetteredAt;
+    }
+
+    public LocalDateTime getReplayedAt() {
+        return replayedAt;
+    }
+
+    public void setReplayedAt(LocalDateTime replayedAt) {
+        this.replayedAt = replayedAt;
+    }
+}
@@ -1,5 +1,6 @@
 package com.usyd.catams.dto.response;
 
+import com.fasterxml.jackson.annotation.JsonInclude;
 import com.fasterxml.jackson.annotation.JsonProperty;
 import java.util.List;
 
@@ -9,6 +10,9 @@ import java.util.List;
  * This DTO follows the standard pagination pattern defined in the OpenAPI specification
  * and provides metadata about the page along with the content. Includes success field
  * for consistent API response format.
+ *
+ * In cursor mode the page also carries {@code nextCursor}; it is omitted for offset
+ * pages so existing clients see an unchanged shape.
  */
 public class PagedTimesheetResponse {
 
@@ -21,6 +25,10 @@ public class PagedTimesheetResponse {
     @JsonProperty("pageInfo")
     private PageInfo pageInfo;
 
+    @JsonProperty("nextCursor")
+    @JsonInclude(JsonInclude.Include.NON_NULL)
+    private String nextCursor;
+
     // Default constructor
     public PagedTimesheetResponse() {
     }
@@ -40,6 +48,27 @@ public class PagedTimesheetResponse {
         this.pageInfo = new PageInfo(pageNumber, pageSize, totalElements, totalPages, isFirst, isLast);
     }
 
+    /**
+     * Build a keyset page. Totals are not computed in cursor mode and are reported as -1.
+     *
+     * @param nextCursor token for the following page, or null when this is the last page
+     */
+    public static PagedTimesheetResponse cursorPage(List<TimesheetResponse> timesheets, int pageSize,
+                                                    boolean first, String nextCursor) {
+        PageInfo pageInfo = new PageInfo();
+        pageInfo.setSize(pageSize);
+        pageInfo.setTotalElements(-1);
+        pageInfo.setTotalPages(-1);
+        pageInfo.setFirst(first);
+        pageInfo.setLast(nextCursor == null);
+        pageInfo.setNumberOfElements(timesheets.size());
+        pageInfo.setEmpty(timesheets.isEmpty());
+
+        PagedTimesheetResponse response = new PagedTimesheetResponse(timesheets, pageInfo);
+        response.setNextCursor(nextCursor);
+        return response;
+    }
+
     // Getters and Setters
     public boolean isSuccess() {
         return success;
@@ -67,6 +96,14 @@ public class PagedTimesheetResponse {
         this.pageInfo = pageInfo;
     }
 
+    public String getNextCursor() {
+        return nextCursor;
+    }
+
+    public void setNextCursor(String nextCursor) {
+        this.nextCursor = nextCursor;
+    }
+
     // Legacy aliases removed to enforce single-source response shape (timesheets/pageInfo)
 
     /**
@@ -200,6 +237,7 @@ public class PagedTimesheetResponse {
                 "success=" + success +
                 ", timesheets=" + timesheets +
                 ", pageInfo=" + pageInfo +
+                ", nextCursor=" + nextCursor +
                 '}';
     }
 }
\ No newline at end of file
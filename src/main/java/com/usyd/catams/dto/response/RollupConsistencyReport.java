@@ -0,0 +1,52 @@
+package com.usyd.catams.dto.response;
+
+import java.util.List;
+
+/**
+ * Result of comparing the weekly timesheet rollup against the base timesheets table
+ *
+ * Lists the rollup keys (course/tutor/week/status) whose count, hours or pay
+ * differ, including keys present on only one side
+ */
+public class RollupConsistencyReport {
+
+    private int baseRows;
+    private int rollupRows;
+    private List<String> mismatchedKeys;
+
+    public RollupConsistencyReport() {}
+
+    public RollupConsistencyReport(int baseRows, int rollupRows, List<String> mismatchedKeys) {
+        this.baseRows = baseRows;
+        this.rollupRows = rollupRows;
+        this.mismatchedKeys = mismatchedKeys;
+    }
+
+    public int getBaseRows() {
+        return baseRows;
+    }
+
+    public void setBaseRows(int baseRows) {
+        this.baseRows = baseRows;
+    }
+
+    public int getRollupRows() {
+        return rollupRows;
+    }
+
+    public void setRollupRows(int rollupRows) {
+        this.rollupRows = rollupRows;
+    }
+
+    public List<String> getMismatchedKeys() {
+        return mismatchedKeys;
+    }
+
+    public void setMismatchedKeys(List<String> mismatchedKeys) {
+        this.mismatchedKeys = mismatchedKeys;
+    }
+
+    public boolean isConsistent() {
+        return mismatchedKeys == null || mismatchedKeys.isEmpty();
+    }
+}
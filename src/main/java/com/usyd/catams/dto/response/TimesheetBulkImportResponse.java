@@ -0,0 +1,88 @@
+package com.usyd.catams.dto.response;
+
+import java.util.List;
+
+/**
+ * Per-row outcome of a bulk timesheet import
+ *
+ * Rows are numbered from 1 in submission order (CSV data rows exclude the header).
+ * Rejected rows carry every reason found; accepted rows carry the new timesheet id.
+ */
+public class TimesheetBulkImportResponse {
+
+    private int totalRows;
+    private int createdCount;
+    private int rejectedCount;
+    private List<RowResult> rows;
+
+    public TimesheetBulkImportResponse() {}
+
+    public TimesheetBulkImportResponse(List<RowResult> rows) {
+        this.rows = rows;
+        this.totalRows = rows.size();
+        this.createdCount = (int) rows.stream().filter(row -> row.getStatus() == RowStatus.CREATED).count();
+        this.rejectedCount = totalRows - createdCount;
+    }
+
+    public int getTotalRows() {
+        return totalRows;
+    }
+
+    public int getCreatedCount() {
+        return createdCount;
+    }
+
+    public int getRejectedCount() {
+        return rejectedCount;
+    }
+
+    public List<RowResult> getRows() {
+        return rows;
+    }
+
+    public enum RowStatus {
+        CREATED,
+        REJECTED
+    }
+
+    public static class RowResult {
+
+        private int row;
+        private RowStatus status;
+        private Long timesheetId;
+        private List<String> errors;
+
+        public RowResult() {}
+
+        private RowResult(int row, RowStatus status, Long timesheetId, List<String> errors) {
+            this.row = row;
+            this.status = status;
+            this.timesheetId = timesheetId;
+            this.errors = errors;
+        }
+
+        public static RowResult created(int row, Long timesheetId) {
+            return new RowResult(row, RowStatus.CREATED, timesheetId, List.of());
+        }
+
+        public static RowResult rejected(int row, List<String> errors) {
+            return new RowResult(row, RowStatus.REJECTED, null, List.copyOf(errors));
+        }
+
+        public int getRow() {
+            return row;
+        }
+
+        public RowStatus getStatus() {
+            return status;
+        }
+
+        public Long getTimesheetId() {
+            return timesheetId;
+        }
+
+        public List<String> getErrors() {
+            return errors;
+        }
+    }
+}
@@ -0,0 +1,31 @@
+package com.usyd.catams.dto.response;
+
+import com.fasterxml.jackson.annotation.JsonProperty;
+import com.usyd.catams.dto.request.TimesheetQuoteRequest;
+import com.usyd.catams.service.Schedule1CalculationResult;
+import java.util.ArrayList;
+import java.util.List;
+
+/**
+ * Response payload for the batch quote endpoint; quotes are in request order.
+ */
+public class TimesheetQuoteBatchResponse {
+
+    @JsonProperty("quotes")
+    private List<TimesheetQuoteResponse> quotes;
+
+    public static TimesheetQuoteBatchResponse from(List<TimesheetQuoteRequest> requests,
+                                                   List<Schedule1CalculationResult> calculations) {
+        List<TimesheetQuoteResponse> quotes = new ArrayList<>(calculations.size());
+        for (int i = 0; i < calculations.size(); i++) {
+            quotes.add(TimesheetQuoteResponse.from(requests.get(i).getTaskType(), calculations.get(i)));
+        }
+        TimesheetQuoteBatchResponse response = new TimesheetQuoteBatchResponse();
+        response.quotes = quotes;
+        return response;
+    }
+
+    public List<TimesheetQuoteResponse> getQuotes() {
+        return quotes;
+    }
+}
@@ -45,7 +45,8 @@ import java.util.Objects;
 public class Approval {
     
     @Id
-    @GeneratedValue(strategy = GenerationType.IDENTITY)
+    @GeneratedValue(strategy = GenerationType.SEQUENCE, generator = "approval_id_seq")
+    @SequenceGenerator(name = "approval_id_seq", sequenceName = "approval_id_seq", allocationSize = 50)
     private Long id;
     
     /**
@@ -0,0 +1,209 @@
+package com.usyd.catams.entity;
+
+import jakarta.persistence.PostPersist;
+import jakarta.persistence.PostRemove;
+import jakarta.persistence.PostUpdate;
+import org.springframework.transaction.support.TransactionSynchronization;
+import org.springframework.transaction.support.TransactionSynchronizationManager;
+
+import java.util.HashSet;
+import java.util.Map;
+import java.util.Set;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.atomic.AtomicLong;
+import java.util.function.Consumer;
+
+/**
+ * Entity listener that tracks change versions for the data behind timesheet listings and
+ * dashboard summaries.
+ *
+ * <p>Versions are drawn from one monotonic sequence. A {@link Timesheet} write advances the
+ * timesheet version and records it against the owning tutor, so a tutor's scope only moves when
+ * their own timesheets change. Writes to reference data ({@link Course}, {@link User},
+ * {@link TutorAssignment}, {@link LecturerAssignment}) advance the reference version, which every
+ * scope depends on. As with {@link Schedule1CatalogueListener}, versions move after commit so a
+ * reader never pairs a new version with uncommitted rows.</p>
+ *
+ * <p>Assignment writes also advance a per-user assignment version for the lecturer or tutor
+ * concerned, read by the course scope cache. That version moves immediately and again when the
+ * transaction ends, whatever its outcome, so a cached scope is never served after its own
+ * transaction changed it.</p>
+ *
+ * <p>Writes that bypass JPA (native inserts, table rebuilds) must call {@link #timesheetsChanged()}
+ * or {@link #referenceDataChanged()}. Versions are held per instance and restart from zero, so
+ * validators built from them must also carry an instance epoch.</p>
+ *
+ * <p>Other instances learn about timesheet and reference data changes through the sink set with
+ * {@link #broadcastTo(Consumer)}, which is called while the writing transaction is still open,
+ * once per distinct change; they apply them with {@link #peerChanged(String)}.</p>
+ */
+public class ChangeVersionListener {
+
+    private static final AtomicLong SEQUENCE = new AtomicLong();
+    private static final AtomicLong TIMESHEETS = new AtomicLong();
+    private static final AtomicLong REFERENCE = new AtomicLong();
+    private static final Map<Long, Long> TUTORS = new ConcurrentHashMap<>();
+    private static final Map<Long, Long> ASSIGNEES = new ConcurrentHashMap<>();
+
+    static final String TIMESHEETS_CHANGE = "timesheets";
+    static final String REFERENCE_CHANGE = "reference";
+    static final String TUTOR_CHANGE_PREFIX = "tutor:";
+
+    // Null until a broadcaster registers, and in unit tests that run a single instance
+    private static volatile Consumer<String> peers;
+
+    public static long timesheetVersion() {
+        return TIMESHEETS.get();
+    }
+
+    public static long tutorVersion(Long tutorId) {
+        return TUTORS.getOrDefault(tutorId, 0L);
+    }
+
+    public static long referenceVersion() {
+        return REFERENCE.get();
+    }
+
+    public static long assignmentVersion(Long userId) {
+        return ASSIGNEES.getOrDefault(userId, 0L);
+    }
+
+    /**
+     * Send every change made on this instance to {@code sink}, or stop when it is null
+     */
+    public static void broadcastTo(Consumer<String> sink) {
+        peers = sink;
+    }
+
+    /**
+     * Apply a change broadcast by another instance. It has already committed, so versions move
+     * immediately. A null or unrecognised change moves every scope.
+     */
+    public static void peerChanged(String change) {
+        if (REFERENCE_CHANGE.equals(change)) {
+            bumpReference();
+        } else if (change != null && change.startsWith(TUTOR_CHANGE_PREFIX)) {
+            try {
+                bumpTimesheet(Long.valueOf(change.substring(TUTOR_CHANGE_PREFIX.length())));
+            } catch (NumberFormatException e) {
+                bumpAllTimesheets();
+            }
+        } else {
+            bumpAllTimesheets();
+        }
+    }
+
+    /**
+     * Record a timesheet change that could affect any tutor, e.g. a rollup rebuild
+     */
+    public static void timesheetsChanged() {
+        share(TIMESHEETS_CHANGE);
+        afterCommit(ChangeVersionListener::bumpAllTimesheets);
+    }
+
+    public static void referenceDataChanged() {
+        share(REFERENCE_CHANGE);
+        afterCommit(ChangeVersionListener::bumpReference);
+    }
+
+    @PostPersist
+    @PostUpdate
+    @PostRemove
+    public void onChanged(Object entity) {
+        if (entity instanceof Timesheet timesheet) {
+            Long tutorId = timesheet.getTutorId();
+            share(tutorId != null ? TUTOR_CHANGE_PREFIX + tutorId : TIMESHEETS_CHANGE);
+            afterCommit(() -> bumpTimesheet(tutorId));
+        } else {
+            if (entity instanceof LecturerAssignment assignment) {
+                assignmentsChanged(assignment.getLecturerId());
+            } else if (entity instanceof TutorAssignment assignment) {
+                assignmentsChanged(assignment.getTutorId());
+            }
+            referenceDataChanged();
+        }
+    }
+
+    private static void bumpTimesheet(Long tutorId) {
+        long version = SEQUENCE.incrementAndGet();
+        TIMESHEETS.accumulateAndGet(version, Math::max);
+        if (tutorId != null) {
+            TUTORS.merge(tutorId, version, Math::max);
+        }
+    }
+
+    private static void bumpAllTimesheets() {
+        long version = SEQUENCE.incrementAndGet();
+        TIMESHEETS.accumulateAndGet(version, Math::max);
+        // Tutors fall back to the reference version, so bumping it covers every tutor scope
+        REFERENCE.accumulateAndGet(version, Math::max);
+    }
+
+    private static void bumpReference() {
+        REFERENCE.accumulateAndGet(SEQUENCE.incrementAndGet(), Math::max);
+    }
+
+    /**
+     * Hand a change to the peer sink, at most once per transaction
+     */
+    private static void share(String change) {
+        Consumer<String> sink = peers;
+        if (sink == null) {
+            return;
+        }
+        if (TransactionSynchronizationManager.isSynchronizationActive()) {
+            SharedChanges shared = (SharedChanges) TransactionSynchronizationManager.getResource(SharedChanges.class);
+            if (shared == null) {
+                shared = new SharedChanges();
+                TransactionSynchronizationManager.bindResource(SharedChanges.class, shared);
+                TransactionSynchronizationManager.registerSynchronization(shared);
+            }
+            if (!shared.changes.add(change)) {
+                return;
+            }
+        }
+        sink.accept(change);
+    }
+
+    private static void assignmentsChanged(Long userId) {
+        if (userId == null) {
+            return;
+        }
+        Runnable bump = () -> ASSIGNEES.merge(userId, SEQUENCE.incrementAndGet(), Math::max);
+        bump.run();
+        if (TransactionSynchronizationManager.isSynchronizationActive()) {
+            TransactionSynchronizationManager.registerSynchronization(new TransactionSynchronization() {
+                @Override
+                public void afterCompletion(int status) {
+                    bump.run();
+                }
+            });
+        }
+    }
+
+    private static void afterCommit(Runnable bump) {
+        if (TransactionSynchronizationManager.isSynchronizationActive()) {
+            TransactionSynchronizationManager.registerSynchronization(new TransactionSynchronization() {
+                @Override
+                public void afterCommit() {
+                    bump.run();
+                }
+            });
+        } else {
+            bump.run();
+        }
+    }
+
+    /**
+     * Changes already shared by the current transaction
+     */
+    private static final class SharedChanges implements TransactionSynchronization {
+
+        private final Set<String> changes = new HashSet<>();
+
+        @Override
+        public void afterCompletion(int status) {
+            TransactionSynchronizationManager.unbindResourceIfPossible(SharedChanges.class);
+        }
+    }
+}
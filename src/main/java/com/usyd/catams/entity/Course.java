@@ -9,6 +9,7 @@ import java.time.LocalDateTime;
 import java.util.Objects;
 
 @Entity
+@EntityListeners(ChangeVersionListener.class)
 @Table(name = "courses", indexes = {
     @Index(name = "idx_course_code", columnList = "code_value"),
     @Index(name = "idx_course_lecturer", columnList = "lecturerId"),
@@ -25,6 +25,7 @@ import java.util.Objects;
  * @see Course
  */
 @Entity
+@EntityListeners(ChangeVersionListener.class)
 @Table(name = "lecturer_assignments",
        uniqueConstraints = @UniqueConstraint(name = "ux_lecturer_assignments_lecturer_course", columnNames = {"lecturer_id", "course_id"}),
        indexes = {
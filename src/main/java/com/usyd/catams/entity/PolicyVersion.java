@@ -2,6 +2,7 @@ package com.usyd.catams.entity;
 
 import jakarta.persistence.Column;
 import jakarta.persistence.Entity;
+import jakarta.persistence.EntityListeners;
 import jakarta.persistence.GeneratedValue;
 import jakarta.persistence.GenerationType;
 import jakarta.persistence.Id;
@@ -13,6 +14,7 @@ import java.time.LocalDate;
  * The entity keeps the mapping lightweight so higher level services can compose the data.
  */
 @Entity
+@EntityListeners(Schedule1CatalogueListener.class)
 @Table(name = "policy_version")
 public class PolicyVersion {
 
@@ -3,6 +3,7 @@ package com.usyd.catams.entity;
 import com.usyd.catams.enums.TutorQualification;
 import jakarta.persistence.Column;
 import jakarta.persistence.Entity;
+import jakarta.persistence.EntityListeners;
 import jakarta.persistence.EnumType;
 import jakarta.persistence.Enumerated;
 import jakarta.persistence.FetchType;
@@ -19,6 +20,7 @@ import java.time.LocalDate;
  * JPA entity mapping of the {@code rate_amount} table holding year-specific EA rates.
  */
 @Entity
+@EntityListeners(Schedule1CatalogueListener.class)
 @Table(name = "rate_amount")
 public class RateAmount {
 
@@ -3,6 +3,7 @@ package com.usyd.catams.entity;
 import com.usyd.catams.enums.TimesheetTaskType;
 import jakarta.persistence.Column;
 import jakarta.persistence.Entity;
+import jakarta.persistence.EntityListeners;
 import jakarta.persistence.EnumType;
 import jakarta.persistence.Enumerated;
 import jakarta.persistence.GeneratedValue;
@@ -15,6 +16,7 @@ import java.math.BigDecimal;
  * Maps EA Schedule 1 rate metadata captured in {@code rate_code}.
  */
 @Entity
+@EntityListeners(Schedule1CatalogueListener.class)
 @Table(name = "rate_code")
 public class RateCode {
 
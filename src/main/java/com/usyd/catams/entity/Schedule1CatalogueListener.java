@@ -0,0 +1,42 @@
+package com.usyd.catams.entity;
+
+import jakarta.persistence.PostPersist;
+import jakarta.persistence.PostRemove;
+import jakarta.persistence.PostUpdate;
+import org.springframework.transaction.support.TransactionSynchronization;
+import org.springframework.transaction.support.TransactionSynchronizationManager;
+
+import java.util.concurrent.atomic.AtomicLong;
+
+/**
+ * Entity listener that bumps a generation counter whenever Schedule 1 policy data
+ * ({@link PolicyVersion}, {@link RateCode}, {@link RateAmount}) is written.
+ *
+ * <p>The in-memory policy catalogue compares its loaded generation with {@link #generation()}
+ * and reloads when they differ. The bump happens after commit so a reload never captures
+ * uncommitted rows. Kept free of Spring beans so Hibernate can instantiate it directly.</p>
+ */
+public class Schedule1CatalogueListener {
+
+    private static final AtomicLong GENERATION = new AtomicLong();
+
+    public static long generation() {
+        return GENERATION.get();
+    }
+
+    @PostPersist
+    @PostUpdate
+    @PostRemove
+    public void onPolicyDataChanged(Object entity) {
+        if (TransactionSynchronizationManager.isSynchronizationActive()) {
+            TransactionSynchronizationManager.registerSynchronization(new TransactionSynchronization() {
+                @Override
+                public void afterCommit() {
+                    GENERATION.incrementAndGet();
+                }
+            });
+        } else {
+            GENERATION.incrementAndGet();
+        }
+    }
+}
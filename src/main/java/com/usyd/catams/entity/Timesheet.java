@@ -12,23 +12,33 @@ import org.hibernate.annotations.JdbcTypeCode;
 import org.hibernate.type.SqlTypes;
 import java.math.BigDecimal;
 import java.math.RoundingMode;
+import java.nio.charset.StandardCharsets;
+import java.security.MessageDigest;
+import java.security.NoSuchAlgorithmException;
 import java.time.LocalDate;
 import java.time.LocalDateTime;
 import java.util.ArrayList;
 import java.util.Collections;
+import java.util.HexFormat;
 import java.util.List;
+import java.util.Locale;
 import java.util.Objects;
 import java.util.Optional;
 import java.util.stream.Collectors;
 
 @Entity
+@EntityListeners(ChangeVersionListener.class)
 @Table(name = "timesheets", 
     indexes = {
-        @Index(name = "idx_timesheet_tutor", columnList = "tutorId"),
-        @Index(name = "idx_timesheet_course", columnList = "courseId"),
+        // Mirrors V8__timesheet_query_indexes.sql; the partial indexes there are Postgres-only
+        @Index(name = "idx_timesheet_tutor_week", columnList = "tutorId, weekStartDate"),
+        @Index(name = "idx_timesheet_course_week", columnList = "courseId, weekStartDate"),
+        @Index(name = "idx_timesheet_course_status", columnList = "courseId, status"),
         @Index(name = "idx_timesheet_week_start", columnList = "weekStartDate"),
-        @Index(name = "idx_timesheet_status", columnList = "status"),
-        @Index(name = "idx_timesheet_created_by", columnList = "createdBy")
+        @Index(name = "idx_timesheet_status_created", columnList = "status, createdAt, id"),
+        @Index(name = "idx_timesheet_created_id", columnList = "createdAt, id"),
+        @Index(name = "idx_timesheet_created_by", columnList = "createdBy"),
+        @Index(name = "idx_timesheet_repeat_rule", columnList = "courseId, taskType, descriptionHash, sessionDate")
     },
     uniqueConstraints = {
         @UniqueConstraint(name = "uk_timesheet_tutor_course_week", 
@@ -37,8 +47,10 @@ import java.util.stream.Collectors;
 )
 public class Timesheet {
 
+    // Sequence (not IDENTITY) so inserts can be JDBC-batched; allocationSize matches V9
     @Id
-    @GeneratedValue(strategy = GenerationType.IDENTITY)
+    @GeneratedValue(strategy = GenerationType.SEQUENCE, generator = "timesheet_id_seq")
+    @SequenceGenerator(name = "timesheet_id_seq", sequenceName = "timesheet_id_seq", allocationSize = 50)
     private Long id;
     
     @NotNull
@@ -79,6 +91,14 @@ public class Timesheet {
     @JdbcTypeCode(SqlTypes.VARCHAR)
     private String description;
 
+    /**
+     * MD5 of the normalised description, maintained on every write so the tutorial repeat rule
+     * can match content through an index. Backfilled by V13, which applies the same
+     * normalisation in SQL; see {@link #descriptionHashOf(String)}.
+     */
+    @Column(name = "description_hash", length = 32)
+    private String descriptionHash;
+
     @Enumerated(EnumType.STRING)
     @Column(name = "task_type", nullable = false, length = 20)
     private TimesheetTaskType taskType = TimesheetTaskType.OTHER;
@@ -150,6 +170,7 @@ public class Timesheet {
         this.hours = hours;
         this.hourlyRate = hourlyRate;
         this.description = description;
+        this.descriptionHash = descriptionHashOf(description);
         this.createdBy = createdBy;
         this.status = ApprovalStatus.DRAFT;
         this.taskType = TimesheetTaskType.OTHER;
@@ -176,11 +197,38 @@ public class Timesheet {
         if (this.sessionDate == null && this.weekPeriod != null) {
             this.sessionDate = this.weekPeriod.getStartDate();
         }
+        this.descriptionHash = descriptionHashOf(this.description);
     }
     
     @PreUpdate
     protected void onUpdate() {
         this.updatedAt = LocalDateTime.now();
+        this.descriptionHash = descriptionHashOf(this.description);
+    }
+
+    /**
+     * Hash of a description after lower-casing, collapsing whitespace runs to one space and
+     * trimming. Must stay in step with the SQL expression in V13__timesheet_description_hash.sql.
+     *
+     * @return 32-character lowercase hex digest, or null when the description is null
+     */
+    public static String descriptionHashOf(String description) {
+        if (description == null) {
+            return null;
+        }
+        String normalised = description.toLowerCase(Locale.ROOT).replaceAll("\\s+", " ");
+        if (normalised.startsWith(" ")) {
+            normalised = normalised.substring(1);
+        }
+        if (normalised.endsWith(" ")) {
+            normalised = normalised.substring(0, normalised.length() - 1);
+        }
+        try {
+            MessageDigest md5 = MessageDigest.getInstance("MD5");
+            return HexFormat.of().formatHex(md5.digest(normalised.getBytes(StandardCharsets.UTF_8)));
+        } catch (NoSuchAlgorithmException e) {
+            throw new IllegalStateException("MD5 not available", e);
+        }
     }
     
     // Getters and Setters
@@ -276,6 +324,11 @@ public class Timesheet {
     
     public void setDescription(String description) {
         this.description = description;
+        this.descriptionHash = descriptionHashOf(description);
+    }
+
+    public String getDescriptionHash() {
+        return descriptionHash;
     }
     
     public ApprovalStatus getStatus() {
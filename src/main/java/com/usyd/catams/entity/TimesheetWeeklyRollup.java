@@ -0,0 +1,122 @@
+package com.usyd.catams.entity;
+
+import com.usyd.catams.enums.ApprovalStatus;
+import jakarta.persistence.*;
+import java.math.BigDecimal;
+import java.time.LocalDate;
+import java.time.LocalDateTime;
+import java.util.Objects;
+
+/**
+ * Read model holding weekly timesheet totals per course, tutor, week and status.
+ *
+ * <p>Rows are maintained incrementally inside the transaction that creates, updates,
+ * deletes or transitions a timesheet, so dashboard and budget metrics can be summed
+ * from pre-aggregated weeks instead of re-scanning the {@code timesheets} table.</p>
+ *
+ * @author Development Team
+ * @since 2.0
+ * @see Timesheet
+ */
+@Entity
+@Table(name = "timesheet_weekly_rollup",
+       uniqueConstraints = @UniqueConstraint(name = "ux_timesheet_weekly_rollup_key",
+           columnNames = {"course_id", "tutor_id", "week_start_date", "status"}),
+       indexes = {
+           @Index(name = "ix_timesheet_weekly_rollup_week", columnList = "week_start_date"),
+           @Index(name = "ix_timesheet_weekly_rollup_tutor_week", columnList = "tutor_id, week_start_date")
+       })
+public class TimesheetWeeklyRollup {
+
+    @Id
+    @GeneratedValue(strategy = GenerationType.IDENTITY)
+    private Long id;
+
+    @Column(name = "course_id", nullable = false)
+    private Long courseId;
+
+    @Column(name = "tutor_id", nullable = false)
+    private Long tutorId;
+
+    @Column(name = "week_start_date", nullable = false)
+    private LocalDate weekStartDate;
+
+    @Enumerated(EnumType.STRING)
+    @Column(name = "status", nullable = false, length = 50)
+    private ApprovalStatus status;
+
+    /**
+     * Number of timesheets contributing to this row.
+     */
+    @Column(name = "timesheet_count", nullable = false)
+    private long timesheetCount;
+
+    /**
+     * Sum of timesheet hours.
+     */
+    @Column(name = "total_hours", nullable = false, precision = 12, scale = 1)
+    private BigDecimal totalHours;
+
+    /**
+     * Sum of hours multiplied by hourly rate, kept at full precision.
+     */
+    @Column(name = "total_pay", nullable = false, precision = 15, scale = 3)
+    private BigDecimal totalPay;
+
+    @Column(name = "updated_at", nullable = false)
+    private LocalDateTime updatedAt;
+
+    /**
+     * Protected constructor for JPA.
+     */
+    protected TimesheetWeeklyRollup() {}
+
+    /**
+     * Creates a rollup row seeded with a single contribution.
+     *
+     * @param courseId the course ID
+     * @param tutorId the tutor ID
+     * @param weekStartDate the Monday of the week
+     * @param status the timesheet status bucket
+     * @param timesheetCount number of timesheets
+     * @param totalHours sum of hours
+     * @param totalPay sum of hours multiplied by hourly rate
+     */
+    public TimesheetWeeklyRollup(Long courseId, Long tutorId, LocalDate weekStartDate, ApprovalStatus status,
+                                 long timesheetCount, BigDecimal totalHours, BigDecimal totalPay) {
+        this.courseId = courseId;
+        this.tutorId = tutorId;
+        this.weekStartDate = weekStartDate;
+        this.status = status;
+        this.timesheetCount = timesheetCount;
+        this.totalHours = totalHours;
+        this.totalPay = totalPay;
+        this.updatedAt = LocalDateTime.now();
+    }
+
+    public Long getId() { return id; }
+    public Long getCourseId() { return courseId; }
+    public Long getTutorId() { return tutorId; }
+    public LocalDate getWeekStartDate() { return weekStartDate; }
+    public ApprovalStatus getStatus() { return status; }
+    public long getTimesheetCount() { return timesheetCount; }
+    public BigDecimal getTotalHours() { return totalHours; }
+    public BigDecimal getTotalPay() { return totalPay; }
+    public LocalDateTime getUpdatedAt() { return updatedAt; }
+
+    @Override
+    public boolean equals(Object o) {
+        if (this == o) return true;
+        if (o == null || getClass() != o.getClass()) return false;
+        TimesheetWeeklyRollup that = (TimesheetWeeklyRollup) o;
+        if (this.id != null && that.id != null) {
+            return Objects.equals(this.id, that.id);
+        }
+        return false;
+    }
+
+    @Override
+    public int hashCode() {
+        return id != null ? Objects.hash(id) : System.identityHashCode(this);
+    }
+}
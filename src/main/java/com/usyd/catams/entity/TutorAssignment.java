@@ -24,6 +24,7 @@ import java.util.Objects;
  * @see Course
  */
 @Entity
+@EntityListeners(ChangeVersionListener.class)
 @Table(name = "tutor_assignments",
        uniqueConstraints = @UniqueConstraint(name = "ux_tutor_assignments_tutor_course", columnNames = {"tutor_id", "course_id"}),
        indexes = {
@@ -20,6 +20,7 @@ import java.util.Objects;
  * @since 1.0
  */
 @Entity
+@EntityListeners(ChangeVersionListener.class)
 @Table(name = "users", indexes = {
     @Index(name = "idx_user_email", columnList = "email_value", unique = true),
     @Index(name = "idx_user_role", columnList = "role"),
@@ -25,6 +25,15 @@ public class ApprovalMapper {
         if (approval == null) return null;
         User approver = userRepository.findById(approval.getApproverId()).orElse(null);
         String approverName = approver != null ? approver.getName() : "Unknown User";
+        return toResponse(approval, approverName);
+    }
+
+    /**
+     * Convert Approval to ApprovalActionResponse using an approver name resolved by the caller,
+     * so list mappings can batch the user lookups.
+     */
+    public ApprovalActionResponse toResponse(Approval approval, String approverName) {
+        if (approval == null) return null;
         String responseComment = approval.getAction() == com.usyd.catams.enums.ApprovalAction.SUBMIT_FOR_APPROVAL
                 ? null : approval.getComment();
         ApprovalActionResponse response = new ApprovalActionResponse(
@@ -7,6 +7,7 @@ import com.usyd.catams.entity.User;
 import com.usyd.catams.entity.Course;
 import com.usyd.catams.repository.UserRepository;
 import com.usyd.catams.repository.CourseRepository;
+import com.usyd.catams.entity.Approval;
 import com.usyd.catams.mapper.ApprovalMapper;
 import org.hibernate.Hibernate;
 import org.springframework.beans.factory.annotation.Autowired;
@@ -14,7 +15,11 @@ import org.springframework.data.domain.Page;
 import org.springframework.stereotype.Component;
 
 import java.util.Collections;
+import java.util.HashMap;
+import java.util.LinkedHashSet;
 import java.util.List;
+import java.util.Map;
+import java.util.Set;
 import java.util.stream.Collectors;
 
 /**
@@ -49,28 +54,25 @@ public class TimesheetMapper {
         if (timesheet == null) {
             return null;
         }
+        return toResponseList(Collections.singletonList(timesheet)).get(0);
+    }
 
-        // Fetch tutor and course names
-        String tutorName = userRepository.findById(timesheet.getTutorId())
-            .map(User::getName)
-            .orElse("Unknown Tutor");
-        
-        String courseName = courseRepository.findById(timesheet.getCourseId())
-            .map(Course::getName)
-            .orElse("Unknown Course");
+    private TimesheetResponse toResponse(Timesheet timesheet,
+                                         Map<Long, String> userNames,
+                                         Map<Long, String> courseNames) {
+        String tutorName = userNames.getOrDefault(timesheet.getTutorId(), "Unknown Tutor");
+        String courseName = courseNames.getOrDefault(timesheet.getCourseId(), "Unknown Course");
 
         // Get rejection reason from approval history if applicable
         String rejectionReason = null;
         if (timesheet.getStatus() == com.usyd.catams.enums.ApprovalStatus.REJECTED) {
             // Avoid triggering lazy initialization when approvals are not loaded
-            if (timesheet.getApprovals() != null && org.hibernate.Hibernate.isInitialized(timesheet.getApprovals())) {
+            if (hasLoadedApprovals(timesheet)) {
                 rejectionReason = timesheet.getApprovalsByAction(com.usyd.catams.enums.ApprovalAction.REJECT)
                     .stream()
                     .reduce((first, second) -> second) // most recent rejection
                     .map(approval -> approval.getComment())
                     .orElse(null);
-            } else {
-                rejectionReason = null;
             }
         }
 
@@ -100,12 +102,11 @@ public class TimesheetMapper {
         response.setCalculationFormula(timesheet.getCalculationFormula());
         response.setClauseReference(timesheet.getClauseReference());
         response.setSessionDate(timesheet.getSessionDate());
-        if (timesheet.getApprovals() != null
-                && Hibernate.isInitialized(timesheet.getApprovals())
-                && !timesheet.getApprovals().isEmpty()) {
+        if (hasLoadedApprovals(timesheet) && !timesheet.getApprovals().isEmpty()) {
             response.setApprovals(
                 timesheet.getApprovals().stream()
-                    .map(approvalMapper::toResponse)
+                    .map(approval -> approvalMapper.toResponse(approval,
+                        userNames.getOrDefault(approval.getApproverId(), "Unknown User")))
                     .collect(Collectors.toList())
             );
         } else {
@@ -125,11 +126,62 @@ public class TimesheetMapper {
             return null;
         }
 
+        if (timesheets.isEmpty()) {
+            return new java.util.ArrayList<>();
+        }
+
+        // Resolve every referenced user (tutors and approvers) and course in one query each
+        // instead of one lookup per row.
+        Set<Long> userIds = new LinkedHashSet<>();
+        Set<Long> courseIds = new LinkedHashSet<>();
+        for (Timesheet timesheet : timesheets) {
+            if (timesheet == null) {
+                continue;
+            }
+            userIds.add(timesheet.getTutorId());
+            courseIds.add(timesheet.getCourseId());
+            if (hasLoadedApprovals(timesheet)) {
+                for (Approval approval : timesheet.getApprovals()) {
+                    userIds.add(approval.getApproverId());
+                }
+            }
+        }
+        Map<Long, String> userNames = loadUserNames(userIds);
+        Map<Long, String> courseNames = loadCourseNames(courseIds);
+
         return timesheets.stream()
-            .map(this::toResponse)
+            .map(timesheet -> timesheet == null ? null : toResponse(timesheet, userNames, courseNames))
             .collect(Collectors.toList());
     }
 
+    private Map<Long, String> loadUserNames(Set<Long> userIds) {
+        userIds.remove(null);
+        Map<Long, String> names = new HashMap<>();
+        if (userIds.isEmpty()) {
+            return names;
+        }
+        for (User user : userRepository.findAllById(userIds)) {
+            names.put(user.getId(), user.getName());
+        }
+        return names;
+    }
+
+    private Map<Long, String> loadCourseNames(Set<Long> courseIds) {
+        courseIds.remove(null);
+        Map<Long, String> names = new HashMap<>();
+        if (courseIds.isEmpty()) {
+            return names;
+        }
+        for (Course course : courseRepository.findAllById(courseIds)) {
+            names.put(course.getId(), course.getName());
+        }
+        return names;
+    }
+
+    private boolean hasLoadedApprovals(Timesheet timesheet) {
+        return timesheet.getApprovals() != null && Hibernate.isInitialized(timesheet.getApprovals());
+    }
+
     /**
      * Convert a Spring Data Page of Timesheet entities to PagedTimesheetResponse DTO.
      * 
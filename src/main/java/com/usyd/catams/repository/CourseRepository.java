@@ -1,5 +1,6 @@
 package com.usyd.catams.repository;
 
+import com.usyd.catams.dto.CourseBudgetTotals;
 import com.usyd.catams.entity.Course;
 import org.springframework.data.domain.Page;
 import org.springframework.data.domain.Pageable;
@@ -155,6 +156,17 @@ public interface CourseRepository extends JpaRepository<Course, Long> {
     @Query("SELECT COALESCE(SUM(c.budgetUsed.amount), 0) FROM Course c WHERE c.lecturerId = :lecturerId AND c.isActive = true")
     Double getTotalBudgetUsedByLecturer(@Param("lecturerId") Long lecturerId);
     
+    /**
+     * Get the number of active courses with their allocated and used budget totals.
+     * Used by system-wide dashboards so they do not need to load every course.
+     *
+     * @return active course count and budget totals
+     */
+    @Query("SELECT new com.usyd.catams.dto.CourseBudgetTotals(COUNT(c), " +
+           "COALESCE(SUM(c.budgetAllocated.amount), 0), COALESCE(SUM(c.budgetUsed.amount), 0)) " +
+           "FROM Course c WHERE c.isActive = true")
+    CourseBudgetTotals summarizeActiveCourseBudgets();
+    
     /**
      * Check if a lecturer has access to a specific course.
      * Used for authorization checks in dashboard filtering.
@@ -0,0 +1,21 @@
+package com.usyd.catams.repository;
+
+import com.usyd.catams.dto.DashboardAggregateData;
+import com.usyd.catams.dto.DashboardWindows;
+
+import java.util.List;
+
+/**
+ * Single-pass dashboard aggregation, implemented both over the timesheets table and
+ * over the weekly rollup read model so the dashboard can read from either source.
+ */
+public interface DashboardAggregateQueries {
+
+    DashboardAggregateData aggregateDashboardByTutor(Long tutorId, DashboardWindows windows);
+
+    DashboardAggregateData aggregateDashboardByCourses(List<Long> courseIds, DashboardWindows windows);
+
+    DashboardAggregateData aggregateDashboardByCourse(Long courseId, DashboardWindows windows);
+
+    DashboardAggregateData aggregateDashboardSystemWide(DashboardWindows windows);
+}
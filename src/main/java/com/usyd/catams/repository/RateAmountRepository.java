@@ -37,5 +37,11 @@ public interface RateAmountRepository extends JpaRepository<RateAmount, Long> {
             @Param("qualification") TutorQualification qualification,
             @Param("targetDate") LocalDate targetDate);
 
+    /**
+     * Every rate amount with its rate code, for building the in-memory Schedule 1 catalogue.
+     */
+    @Query("SELECT ra FROM RateAmount ra JOIN FETCH ra.rateCode ORDER BY ra.effectiveFrom DESC")
+    List<RateAmount> findAllWithRateCode();
+
     Optional<RateAmount> findByRateCodeAndPolicyVersionAndQualification(RateCode rateCode, PolicyVersion policyVersion, TutorQualification qualification);
 }
@@ -0,0 +1,22 @@
+package com.usyd.catams.repository;
+
+import com.usyd.catams.entity.Timesheet;
+import org.springframework.data.domain.Page;
+import org.springframework.data.domain.Pageable;
+import org.springframework.data.jpa.domain.Specification;
+
+/**
+ * First phase of two-phase paging: page over timesheet IDs only.
+ *
+ * Paging an {@code approvals} fetch makes Hibernate load every matching row and paginate in
+ * memory (HHH90003004). Callers page IDs here and then load just that page with
+ * {@link TimesheetRepository#findAllWithApprovalsByIdIn(java.util.List)}.
+ */
+public interface TimesheetIdPagingRepository {
+
+    /**
+     * IDs matching the specification, ordered and limited by the pageable; the total comes from
+     * a count query only when the page alone cannot determine it.
+     */
+    Page<Long> findIds(Specification<Timesheet> spec, Pageable pageable);
+}
@@ -0,0 +1,69 @@
+package com.usyd.catams.repository;
+
+import com.usyd.catams.entity.Timesheet;
+import jakarta.persistence.EntityManager;
+import jakarta.persistence.PersistenceContext;
+import jakarta.persistence.TypedQuery;
+import jakarta.persistence.criteria.CriteriaBuilder;
+import jakarta.persistence.criteria.CriteriaQuery;
+import jakarta.persistence.criteria.Predicate;
+import jakarta.persistence.criteria.Root;
+import org.springframework.data.domain.Page;
+import org.springframework.data.domain.Pageable;
+import org.springframework.data.jpa.domain.Specification;
+import org.springframework.data.jpa.repository.query.QueryUtils;
+import org.springframework.data.support.PageableExecutionUtils;
+
+import java.util.List;
+
+/**
+ * Criteria implementation of {@link TimesheetIdPagingRepository}, picked up by Spring Data as a
+ * fragment of {@link TimesheetRepository}.
+ */
+class TimesheetIdPagingRepositoryImpl implements TimesheetIdPagingRepository {
+
+    @PersistenceContext
+    private EntityManager entityManager;
+
+    @Override
+    public Page<Long> findIds(Specification<Timesheet> spec, Pageable pageable) {
+        CriteriaBuilder cb = entityManager.getCriteriaBuilder();
+
+        CriteriaQuery<Long> idQuery = cb.createQuery(Long.class);
+        Root<Timesheet> root = idQuery.from(Timesheet.class);
+        idQuery.select(root.get("id"));
+        Predicate predicate = toPredicate(spec, root, idQuery, cb);
+        if (predicate != null) {
+            idQuery.where(predicate);
+        }
+        if (pageable.getSort().isSorted()) {
+            idQuery.orderBy(QueryUtils.toOrders(pageable.getSort(), root, cb));
+        }
+
+        TypedQuery<Long> query = entityManager.createQuery(idQuery);
+        if (pageable.isPaged()) {
+            query.setFirstResult((int) pageable.getOffset());
+            query.setMaxResults(pageable.getPageSize());
+        }
+        List<Long> ids = query.getResultList();
+
+        return PageableExecutionUtils.getPage(ids, pageable, () -> count(spec));
+    }
+
+    private long count(Specification<Timesheet> spec) {
+        CriteriaBuilder cb = entityManager.getCriteriaBuilder();
+        CriteriaQuery<Long> countQuery = cb.createQuery(Long.class);
+        Root<Timesheet> root = countQuery.from(Timesheet.class);
+        countQuery.select(cb.count(root));
+        Predicate predicate = toPredicate(spec, root, countQuery, cb);
+        if (predicate != null) {
+            countQuery.where(predicate);
+        }
+        return entityManager.createQuery(countQuery).getSingleResult();
+    }
+
+    private static Predicate toPredicate(Specification<Timesheet> spec, Root<Timesheet> root,
+                                         CriteriaQuery<?> query, CriteriaBuilder cb) {
+        return spec == null ? null : spec.toPredicate(root, query, cb);
+    }
+}
@@ -1,23 +1,31 @@
 package com.usyd.catams.repository;
 
+import com.usyd.catams.dto.DashboardAggregateData;
+import com.usyd.catams.dto.DashboardWindows;
 import com.usyd.catams.dto.TimesheetSummaryData;
+import com.usyd.catams.dto.TimesheetWeekKey;
+import com.usyd.catams.dto.TutorialSessionDates;
 import com.usyd.catams.entity.Timesheet;
 import com.usyd.catams.enums.ApprovalStatus;
 import org.springframework.data.domain.Page;
 import org.springframework.data.domain.Pageable;
 import org.springframework.data.jpa.repository.EntityGraph;
 import org.springframework.data.jpa.repository.JpaRepository;
+import org.springframework.data.jpa.repository.JpaSpecificationExecutor;
 import org.springframework.data.jpa.repository.Query;
 import org.springframework.data.repository.query.Param;
 import org.springframework.stereotype.Repository;
 
 import java.math.BigDecimal;
 import java.time.LocalDate;
+import java.time.LocalDateTime;
+import java.util.Collection;
 import java.util.List;
 import java.util.Optional;
 
 @Repository
-public interface TimesheetRepository extends JpaRepository<Timesheet, Long> {
+public interface TimesheetRepository extends JpaRepository<Timesheet, Long>, JpaSpecificationExecutor<Timesheet>,
+        TimesheetIdPagingRepository, DashboardAggregateQueries {
     
     @EntityGraph(attributePaths = {"approvals"})
     @Query("SELECT t FROM Timesheet t WHERE t.id = :id")
@@ -320,20 +328,70 @@ public interface TimesheetRepository extends JpaRepository<Timesheet, Long> {
     Page<Timesheet> findByStatusOrderByCreatedAtAsc(ApprovalStatus status, Pageable pageable);
 
     /**
-     * Counts tutorial entries for the same course within a date window. Optionally
-     * matches on description (case-insensitive) when provided to approximate
-     * "same content" semantics for repeat tutorials.
+     * Counts tutorial entries for the same course within a date window. When a description is
+     * given, only entries with the same normalised content count, matched through
+     * {@code description_hash} rather than by comparing text.
+     */
+    default long countTutorialsForRepeatRule(Long courseId, LocalDate from, LocalDate to, String description) {
+        return description == null
+            ? countTutorialsInRepeatWindow(courseId, from, to)
+            : countTutorialRepeatsOfContent(courseId, Timesheet.descriptionHashOf(description), from, to);
+    }
+
+    /**
+     * Date-only form of the repeat rule, served by the partial TUTORIAL indexes from V8.
      */
     @Query(value = "SELECT COUNT(*) FROM timesheets t " +
            "WHERE t.task_type = 'TUTORIAL' " +
            "AND t.course_id = :courseId " +
-           "AND (t.week_start_date BETWEEN :from AND :to OR t.session_date BETWEEN :from AND :to) " +
-           "AND (:description IS NULL OR LOWER(CAST(t.description AS TEXT)) = LOWER(CAST(:description AS TEXT)))", 
+           "AND (t.week_start_date BETWEEN :from AND :to OR t.session_date BETWEEN :from AND :to)",
            nativeQuery = true)
-    long countTutorialsForRepeatRule(@Param("courseId") Long courseId,
-                                     @Param("from") LocalDate from,
-                                     @Param("to") LocalDate to,
-                                     @Param("description") String description);
+    long countTutorialsInRepeatWindow(@Param("courseId") Long courseId,
+                                      @Param("from") LocalDate from,
+                                      @Param("to") LocalDate to);
+
+    /**
+     * Content-matching form of the repeat rule, served by {@code idx_timesheet_repeat_rule}
+     * (course_id, task_type, description_hash, session_date).
+     */
+    @Query(value = "SELECT COUNT(*) FROM timesheets t " +
+           "WHERE t.course_id = :courseId " +
+           "AND t.task_type = 'TUTORIAL' " +
+           "AND t.description_hash = :descriptionHash " +
+           "AND (t.session_date BETWEEN :from AND :to OR t.week_start_date BETWEEN :from AND :to)",
+           nativeQuery = true)
+    long countTutorialRepeatsOfContent(@Param("courseId") Long courseId,
+                                       @Param("descriptionHash") String descriptionHash,
+                                       @Param("from") LocalDate from,
+                                       @Param("to") LocalDate to);
+
+    /**
+     * Set-based form of {@link #existsByTutorIdAndCourseIdAndWeekPeriod_WeekStartDate} for bulk
+     * imports: the existing (tutor, course, week) keys among the given tutors and courses.
+     */
+    @Query("SELECT new com.usyd.catams.dto.TimesheetWeekKey(t.tutorId, t.courseId, t.weekPeriod.weekStartDate) " +
+           "FROM Timesheet t " +
+           "WHERE t.tutorId IN :tutorIds AND t.courseId IN :courseIds " +
+           "AND t.weekPeriod.weekStartDate BETWEEN :from AND :to")
+    List<TimesheetWeekKey> findWeekKeys(@Param("tutorIds") Collection<Long> tutorIds,
+                                        @Param("courseIds") Collection<Long> courseIds,
+                                        @Param("from") LocalDate from,
+                                        @Param("to") LocalDate to);
+
+    /**
+     * Batch form of {@link #countTutorialsForRepeatRule}: the distinct tutorial dates and content
+     * hashes per course within one window spanning every session being checked, so callers can
+     * evaluate the repeat rule for many sessions from a single query.
+     */
+    @Query("SELECT DISTINCT new com.usyd.catams.dto.TutorialSessionDates(" +
+           "t.courseId, t.weekPeriod.weekStartDate, t.sessionDate, t.descriptionHash) " +
+           "FROM Timesheet t " +
+           "WHERE t.taskType = com.usyd.catams.enums.TimesheetTaskType.TUTORIAL " +
+           "AND t.courseId IN :courseIds " +
+           "AND (t.weekPeriod.weekStartDate BETWEEN :from AND :to OR t.sessionDate BETWEEN :from AND :to)")
+    List<TutorialSessionDates> findTutorialSessionDatesForRepeatRule(@Param("courseIds") Collection<Long> courseIds,
+                                                                     @Param("from") LocalDate from,
+                                                                     @Param("to") LocalDate to);
 
     boolean existsByCourseIdAndWeekPeriod_WeekStartDate(Long courseId, LocalDate weekStartDate);
 
@@ -367,7 +425,68 @@ public interface TimesheetRepository extends JpaRepository<Timesheet, Long> {
      */
     @Query("select t from Timesheet t left join fetch t.approvals where t.id = :id")
     Optional<Timesheet> findWithApprovalsById(@Param("id") Long id);
-    
+
+    /**
+     * Load a set of timesheets with their approvals in one query. Callers restore ordering.
+     * Second phase of ID paging (see {@link TimesheetIdPagingRepository}) and cursor pages.
+     */
+    @Query("select distinct t from Timesheet t left join fetch t.approvals where t.id in :ids")
+    List<Timesheet> findAllWithApprovalsByIdIn(@Param("ids") List<Long> ids);
+
+    // ==================== KEYSET (CURSOR) PAGINATION ====================
+    // Each query returns the next IDs after a (createdAt, id) position; the limit comes from the
+    // Pageable and no count query is issued. Entities are then loaded via findAllWithApprovalsByIdIn.
+
+    @Query("SELECT t.id FROM Timesheet t WHERE " +
+           "(:tutorId IS NULL OR t.tutorId = :tutorId) AND " +
+           "(:courseId IS NULL OR t.courseId = :courseId) AND " +
+           "(:status IS NULL OR t.status = :status) AND " +
+           "(t.createdAt < :afterCreatedAt OR (t.createdAt = :afterCreatedAt AND t.id < :afterId)) " +
+           "ORDER BY t.createdAt DESC, t.id DESC")
+    List<Long> findIdsWithFiltersBefore(@Param("tutorId") Long tutorId,
+                                       @Param("courseId") Long courseId,
+                                       @Param("status") ApprovalStatus status,
+                                       @Param("afterCreatedAt") LocalDateTime afterCreatedAt,
+                                       @Param("afterId") Long afterId,
+                                       Pageable limit);
+
+    @Query("SELECT t.id FROM Timesheet t WHERE " +
+           "(:tutorId IS NULL OR t.tutorId = :tutorId) AND " +
+           "(:courseId IS NULL OR t.courseId = :courseId) AND " +
+           "(:status IS NULL OR t.status = :status) AND " +
+           "(t.createdAt > :afterCreatedAt OR (t.createdAt = :afterCreatedAt AND t.id > :afterId)) " +
+           "ORDER BY t.createdAt ASC, t.id ASC")
+    List<Long> findIdsWithFiltersAfter(@Param("tutorId") Long tutorId,
+                                      @Param("courseId") Long courseId,
+                                      @Param("status") ApprovalStatus status,
+                                      @Param("afterCreatedAt") LocalDateTime afterCreatedAt,
+                                      @Param("afterId") Long afterId,
+                                      Pageable limit);
+
+    @Query("SELECT t.id FROM Timesheet t WHERE " +
+           "t.courseId IN (SELECT la.courseId FROM LecturerAssignment la WHERE la.lecturerId = :lecturerId) AND " +
+           "EXISTS (SELECT 1 FROM TutorAssignment a WHERE a.tutorId = t.tutorId AND a.courseId = t.courseId) AND " +
+           "(:courseId IS NULL OR t.courseId = :courseId) AND " +
+           "(:status IS NULL OR t.status = :status) AND " +
+           "(t.createdAt < :afterCreatedAt OR (t.createdAt = :afterCreatedAt AND t.id < :afterId)) " +
+           "ORDER BY t.createdAt DESC, t.id DESC")
+    List<Long> findIdsWithLecturerScopeBefore(@Param("lecturerId") Long lecturerId,
+                                             @Param("courseId") Long courseId,
+                                             @Param("status") ApprovalStatus status,
+                                             @Param("afterCreatedAt") LocalDateTime afterCreatedAt,
+                                             @Param("afterId") Long afterId,
+                                             Pageable limit);
+
+    @Query("SELECT t.id FROM Timesheet t WHERE t.status = 'TUTOR_CONFIRMED' AND t.courseId IN " +
+           "(SELECT la.courseId FROM LecturerAssignment la WHERE la.lecturerId = :lecturerId) AND EXISTS (" +
+           "SELECT 1 FROM TutorAssignment a WHERE a.tutorId = t.tutorId AND a.courseId = t.courseId) AND " +
+           "(t.createdAt > :afterCreatedAt OR (t.createdAt = :afterCreatedAt AND t.id > :afterId)) " +
+           "ORDER BY t.createdAt ASC, t.id ASC")
+    List<Long> findIdsApprovedByTutorByCoursesWithAssignmentAfter(@Param("lecturerId") Long lecturerId,
+                                                                 @Param("afterCreatedAt") LocalDateTime afterCreatedAt,
+                                                                 @Param("afterId") Long afterId,
+                                                                 Pageable limit);
+
     // ==================== DASHBOARD AGGREGATION QUERIES ====================
     
     /**
@@ -512,6 +631,154 @@ public interface TimesheetRepository extends JpaRepository<Timesheet, Long> {
         Long courseId, LocalDate startDate, LocalDate endDate) {
         return findTimesheetSummaryByCourseNative(courseId, startDate, endDate);
     }
-    
-    
+
+    // ==================== SINGLE-PASS DASHBOARD AGGREGATION ====================
+
+    /**
+     * Aggregate the dashboard period summary together with current/previous week hours - TUTOR scope.
+     * Conditional sums evaluate every window in one scan instead of one query per window.
+     */
+    @Query("SELECT new com.usyd.catams.dto.DashboardAggregateData(" +
+           "SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :startDate AND :endDate THEN 1L ELSE 0L END), " +
+           "COALESCE(SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :startDate AND :endDate THEN t.hours END), 0), " +
+           "COALESCE(SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :startDate AND :endDate THEN t.hours * t.hourlyRate.amount END), 0), " +
+           "SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :startDate AND :endDate " +
+           "AND t.status IN ('PENDING_TUTOR_CONFIRMATION', 'TUTOR_CONFIRMED', 'LECTURER_CONFIRMED', " +
+           "'MODIFICATION_REQUESTED') THEN 1L ELSE 0L END), " +
+           "COALESCE(SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :currentWeekStart AND :currentWeekEnd THEN t.hours END), 0), " +
+           "COALESCE(SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :previousWeekStart AND :previousWeekEnd THEN t.hours END), 0)) " +
+           "FROM Timesheet t " +
+           "WHERE t.tutorId = :tutorId AND (t.weekPeriod.weekStartDate BETWEEN :startDate AND :endDate " +
+           "OR t.weekPeriod.weekStartDate BETWEEN :previousWeekStart AND :currentWeekEnd)")
+    DashboardAggregateData aggregateDashboardByTutorNative(
+        @Param("tutorId") Long tutorId,
+        @Param("startDate") LocalDate startDate,
+        @Param("endDate") LocalDate endDate,
+        @Param("currentWeekStart") LocalDate currentWeekStart,
+        @Param("currentWeekEnd") LocalDate currentWeekEnd,
+        @Param("previousWeekStart") LocalDate previousWeekStart,
+        @Param("previousWeekEnd") LocalDate previousWeekEnd
+    );
+
+    /**
+     * Aggregate all dashboard windows for a tutor in one query.
+     *
+     * @param tutorId the tutor's ID
+     * @param windows the period and week windows to evaluate
+     * @return aggregated dashboard data
+     */
+    default DashboardAggregateData aggregateDashboardByTutor(Long tutorId, DashboardWindows windows) {
+        return aggregateDashboardByTutorNative(tutorId, windows.getStartDate(), windows.getEndDate(),
+            windows.getCurrentWeekStart(), windows.getCurrentWeekEnd(),
+            windows.getPreviousWeekStart(), windows.getPreviousWeekEnd());
+    }
+
+    /**
+     * Aggregate the dashboard period summary together with current/previous week hours - LECTURER scope.
+     */
+    @Query("SELECT new com.usyd.catams.dto.DashboardAggregateData(" +
+           "SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :startDate AND :endDate THEN 1L ELSE 0L END), " +
+           "COALESCE(SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :startDate AND :endDate THEN t.hours END), 0), " +
+           "COALESCE(SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :startDate AND :endDate THEN t.hours * t.hourlyRate.amount END), 0), " +
+           "SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :startDate AND :endDate " +
+           "AND t.status IN ('TUTOR_CONFIRMED', 'MODIFICATION_REQUESTED') THEN 1L ELSE 0L END), " +
+           "COALESCE(SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :currentWeekStart AND :currentWeekEnd THEN t.hours END), 0), " +
+           "COALESCE(SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :previousWeekStart AND :previousWeekEnd THEN t.hours END), 0)) " +
+           "FROM Timesheet t " +
+           "WHERE t.courseId IN :courseIds AND (t.weekPeriod.weekStartDate BETWEEN :startDate AND :endDate " +
+           "OR t.weekPeriod.weekStartDate BETWEEN :previousWeekStart AND :currentWeekEnd)")
+    DashboardAggregateData aggregateDashboardByCoursesNative(
+        @Param("courseIds") List<Long> courseIds,
+        @Param("startDate") LocalDate startDate,
+        @Param("endDate") LocalDate endDate,
+        @Param("currentWeekStart") LocalDate currentWeekStart,
+        @Param("currentWeekEnd") LocalDate currentWeekEnd,
+        @Param("previousWeekStart") LocalDate previousWeekStart,
+        @Param("previousWeekEnd") LocalDate previousWeekEnd
+    );
+
+    /**
+     * Aggregate all dashboard windows for a set of courses in one query.
+     *
+     * @param courseIds list of course IDs managed by the lecturer
+     * @param windows the period and week windows to evaluate
+     * @return aggregated dashboard data
+     */
+    default DashboardAggregateData aggregateDashboardByCourses(List<Long> courseIds, DashboardWindows windows) {
+        return aggregateDashboardByCoursesNative(courseIds, windows.getStartDate(), windows.getEndDate(),
+            windows.getCurrentWeekStart(), windows.getCurrentWeekEnd(),
+            windows.getPreviousWeekStart(), windows.getPreviousWeekEnd());
+    }
+
+    /**
+     * Aggregate the dashboard period summary together with current/previous week hours - single course (ADMIN filter).
+     */
+    @Query("SELECT new com.usyd.catams.dto.DashboardAggregateData(" +
+           "SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :startDate AND :endDate THEN 1L ELSE 0L END), " +
+           "COALESCE(SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :startDate AND :endDate THEN t.hours END), 0), " +
+           "COALESCE(SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :startDate AND :endDate THEN t.hours * t.hourlyRate.amount END), 0), " +
+           "SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :startDate AND :endDate " +
+           "AND t.status IN ('LECTURER_CONFIRMED') THEN 1L ELSE 0L END), " +
+           "COALESCE(SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :currentWeekStart AND :currentWeekEnd THEN t.hours END), 0), " +
+           "COALESCE(SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :previousWeekStart AND :previousWeekEnd THEN t.hours END), 0)) " +
+           "FROM Timesheet t " +
+           "WHERE t.courseId = :courseId AND (t.weekPeriod.weekStartDate BETWEEN :startDate AND :endDate " +
+           "OR t.weekPeriod.weekStartDate BETWEEN :previousWeekStart AND :currentWeekEnd)")
+    DashboardAggregateData aggregateDashboardByCourseNative(
+        @Param("courseId") Long courseId,
+        @Param("startDate") LocalDate startDate,
+        @Param("endDate") LocalDate endDate,
+        @Param("currentWeekStart") LocalDate currentWeekStart,
+        @Param("currentWeekEnd") LocalDate currentWeekEnd,
+        @Param("previousWeekStart") LocalDate previousWeekStart,
+        @Param("previousWeekEnd") LocalDate previousWeekEnd
+    );
+
+    /**
+     * Aggregate all dashboard windows for a single course in one query.
+     *
+     * @param courseId the course ID
+     * @param windows the period and week windows to evaluate
+     * @return aggregated dashboard data
+     */
+    default DashboardAggregateData aggregateDashboardByCourse(Long courseId, DashboardWindows windows) {
+        return aggregateDashboardByCourseNative(courseId, windows.getStartDate(), windows.getEndDate(),
+            windows.getCurrentWeekStart(), windows.getCurrentWeekEnd(),
+            windows.getPreviousWeekStart(), windows.getPreviousWeekEnd());
+    }
+
+    /**
+     * Aggregate the dashboard period summary together with current/previous week hours - ADMIN scope.
+     */
+    @Query("SELECT new com.usyd.catams.dto.DashboardAggregateData(" +
+           "SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :startDate AND :endDate THEN 1L ELSE 0L END), " +
+           "COALESCE(SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :startDate AND :endDate THEN t.hours END), 0), " +
+           "COALESCE(SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :startDate AND :endDate THEN t.hours * t.hourlyRate.amount END), 0), " +
+           "SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :startDate AND :endDate " +
+           "AND t.status IN ('LECTURER_CONFIRMED') THEN 1L ELSE 0L END), " +
+           "COALESCE(SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :currentWeekStart AND :currentWeekEnd THEN t.hours END), 0), " +
+           "COALESCE(SUM(CASE WHEN t.weekPeriod.weekStartDate BETWEEN :previousWeekStart AND :previousWeekEnd THEN t.hours END), 0)) " +
+           "FROM Timesheet t " +
+           "WHERE (t.weekPeriod.weekStartDate BETWEEN :startDate AND :endDate " +
+           "OR t.weekPeriod.weekStartDate BETWEEN :previousWeekStart AND :currentWeekEnd)")
+    DashboardAggregateData aggregateDashboardSystemWideNative(
+        @Param("startDate") LocalDate startDate,
+        @Param("endDate") LocalDate endDate,
+        @Param("currentWeekStart") LocalDate currentWeekStart,
+        @Param("currentWeekEnd") LocalDate currentWeekEnd,
+        @Param("previousWeekStart") LocalDate previousWeekStart,
+        @Param("previousWeekEnd") LocalDate previousWeekEnd
+    );
+
+    /**
+     * Aggregate all system-wide dashboard windows in one query.
+     *
+     * @param windows the period and week windows to evaluate
+     * @return aggregated dashboard data
+     */
+    default DashboardAggregateData aggregateDashboardSystemWide(DashboardWindows windows) {
+        return aggregateDashboardSystemWideNative(windows.getStartDate(), windows.getEndDate(),
+            windows.getCurrentWeekStart(), windows.getCurrentWeekEnd(),
+            windows.getPreviousWeekStart(), windows.getPreviousWeekEnd());
+    }
 }
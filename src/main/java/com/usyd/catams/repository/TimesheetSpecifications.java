@@ -0,0 +1,112 @@
+package com.usyd.catams.repository;
+
+import com.usyd.catams.entity.Course;
+import com.usyd.catams.entity.LecturerAssignment;
+import com.usyd.catams.entity.Timesheet;
+import com.usyd.catams.entity.TutorAssignment;
+import com.usyd.catams.enums.ApprovalStatus;
+import com.usyd.catams.enums.UserRole;
+import jakarta.persistence.criteria.Root;
+import jakarta.persistence.criteria.Subquery;
+import org.springframework.data.jpa.domain.Specification;
+
+import java.util.Collection;
+
+/**
+ * Criteria builders for timesheet listings.
+ *
+ * Unlike the {@code (:x IS NULL OR t.x = :x)} JPQL queries, these only emit predicates for
+ * the filters that are actually set, so each filter combination produces its own SQL shape
+ * that PostgreSQL can plan against the matching index. Values are bound as parameters, keeping
+ * the generated SQL stable (and cacheable) per combination.
+ */
+public final class TimesheetSpecifications {
+
+    private TimesheetSpecifications() {
+    }
+
+    /**
+     * Admin/tutor listing: any combination of tutor, course and status.
+     */
+    public static Specification<Timesheet> withFilters(Long tutorId, Long courseId, ApprovalStatus status) {
+        return Specification.where(hasTutor(tutorId))
+            .and(hasCourse(courseId))
+            .and(hasStatus(status));
+    }
+
+    /**
+     * Lecturer listing: courses the lecturer is assigned to, tutors assigned to those courses,
+     * optionally narrowed to one course and/or status.
+     */
+    public static Specification<Timesheet> withLecturerScope(Long lecturerId, Long courseId, ApprovalStatus status) {
+        return Specification.where(hasCourse(courseId))
+            .and(hasStatus(status))
+            .and(inLecturerCourses(lecturerId))
+            .and(tutorAssignedToCourse());
+    }
+
+    /**
+     * Approval queue: timesheets in one of {@code statuses} that the user may act on.
+     *
+     * SQL form of the {@code WorkflowRulesRegistry} conditions, which cannot be evaluated in the
+     * database directly: tutors act on their own timesheets, lecturers on timesheets of courses
+     * they lead whose tutor is assigned to the course (the assignment check every lecturer
+     * action enforces), HR and admins on any. {@code statuses} must come from
+     * {@code ApprovalDomainService.getRelevantStatusesForRole} for the same role.
+     */
+    public static Specification<Timesheet> pendingApprovalFor(UserRole role, Long userId,
+                                                              Collection<ApprovalStatus> statuses) {
+        Specification<Timesheet> inStatuses = (root, query, cb) -> root.get("status").in(statuses);
+        return switch (role) {
+            case ADMIN, HR -> inStatuses;
+            case LECTURER -> inStatuses.and(inCoursesLedBy(userId)).and(tutorAssignedToCourse());
+            case TUTOR -> inStatuses.and(hasTutor(userId));
+        };
+    }
+
+    /**
+     * Null filters contribute no predicate.
+     */
+    public static Specification<Timesheet> hasTutor(Long tutorId) {
+        return tutorId == null ? null : (root, query, cb) -> cb.equal(root.get("tutorId"), tutorId);
+    }
+
+    public static Specification<Timesheet> hasCourse(Long courseId) {
+        return courseId == null ? null : (root, query, cb) -> cb.equal(root.get("courseId"), courseId);
+    }
+
+    public static Specification<Timesheet> hasStatus(ApprovalStatus status) {
+        return status == null ? null : (root, query, cb) -> cb.equal(root.get("status"), status);
+    }
+
+    public static Specification<Timesheet> inLecturerCourses(Long lecturerId) {
+        return (root, query, cb) -> {
+            Subquery<Long> courses = query.subquery(Long.class);
+            Root<LecturerAssignment> assignment = courses.from(LecturerAssignment.class);
+            courses.select(assignment.get("courseId"))
+                .where(cb.equal(assignment.get("lecturerId"), lecturerId));
+            return root.get("courseId").in(courses);
+        };
+    }
+
+    public static Specification<Timesheet> inCoursesLedBy(Long lecturerId) {
+        return (root, query, cb) -> {
+            Subquery<Long> courses = query.subquery(Long.class);
+            Root<Course> course = courses.from(Course.class);
+            courses.select(course.get("id"))
+                .where(cb.equal(course.get("lecturerId"), lecturerId));
+            return root.get("courseId").in(courses);
+        };
+    }
+
+    public static Specification<Timesheet> tutorAssignedToCourse() {
+        return (root, query, cb) -> {
+            Subquery<Integer> assigned = query.subquery(Integer.class);
+            Root<TutorAssignment> assignment = assigned.from(TutorAssignment.class);
+            assigned.select(cb.literal(1))
+                .where(cb.equal(assignment.get("tutorId"), root.get("tutorId")),
+                       cb.equal(assignment.get("courseId"), root.get("courseId")));
+            return cb.exists(assigned);
+        };
+    }
+}
@@ -0,0 +1,182 @@
+package com.usyd.catams.repository;
+
+import com.usyd.catams.dto.DashboardAggregateData;
+import com.usyd.catams.dto.DashboardWindows;
+import com.usyd.catams.dto.WeeklyRollupTotals;
+import com.usyd.catams.entity.TimesheetWeeklyRollup;
+import com.usyd.catams.enums.ApprovalStatus;
+import org.springframework.data.jpa.repository.JpaRepository;
+import org.springframework.data.jpa.repository.Modifying;
+import org.springframework.data.jpa.repository.Query;
+import org.springframework.data.repository.query.Param;
+import org.springframework.stereotype.Repository;
+
+import java.time.LocalDate;
+import java.util.List;
+
+@Repository
+public interface TimesheetWeeklyRollupRepository extends JpaRepository<TimesheetWeeklyRollup, Long>, DashboardAggregateQueries {
+
+    // Incremental maintenance is a set-based upsert issued by TimesheetWeeklyRollupService
+
+    // ==================== REBUILD & CONSISTENCY ====================
+
+    @Modifying
+    @Query(value = "DELETE FROM timesheet_weekly_rollup", nativeQuery = true)
+    int deleteAllRows();
+
+    /**
+     * Repopulate the rollup from the base table in one set-based statement.
+     *
+     * @return number of rollup rows written
+     */
+    @Modifying
+    @Query(value = "INSERT INTO timesheet_weekly_rollup (course_id, tutor_id, week_start_date, status, " +
+                   "timesheet_count, total_hours, total_pay, updated_at) " +
+                   "SELECT t.course_id, t.tutor_id, t.week_start_date, t.status, " +
+                   "COUNT(*), SUM(t.hours), SUM(t.hours * t.hourly_rate), CURRENT_TIMESTAMP " +
+                   "FROM timesheets t " +
+                   "GROUP BY t.course_id, t.tutor_id, t.week_start_date, t.status",
+           nativeQuery = true)
+    int insertFromTimesheets();
+
+    /**
+     * Weekly totals recomputed from the base timesheets table.
+     */
+    @Query("SELECT new com.usyd.catams.dto.WeeklyRollupTotals(" +
+           "t.courseId, t.tutorId, t.weekPeriod.weekStartDate, t.status, " +
+           "COUNT(t), SUM(t.hours), SUM(t.hours * t.hourlyRate.amount)) " +
+           "FROM Timesheet t " +
+           "GROUP BY t.courseId, t.tutorId, t.weekPeriod.weekStartDate, t.status")
+    List<WeeklyRollupTotals> computeTotalsFromTimesheets();
+
+    /**
+     * Weekly totals as currently held by the rollup.
+     */
+    @Query("SELECT new com.usyd.catams.dto.WeeklyRollupTotals(" +
+           "r.courseId, r.tutorId, r.weekStartDate, r.status, r.timesheetCount, r.totalHours, r.totalPay) " +
+           "FROM TimesheetWeeklyRollup r")
+    List<WeeklyRollupTotals> findAllTotals();
+
+    // ==================== DASHBOARD AGGREGATION ====================
+
+    /**
+     * Aggregate dashboard windows from the rollup - TUTOR scope.
+     */
+    @Query("SELECT new com.usyd.catams.dto.DashboardAggregateData(" +
+           "SUM(CASE WHEN r.weekStartDate BETWEEN :startDate AND :endDate THEN r.timesheetCount ELSE 0L END), " +
+           "COALESCE(SUM(CASE WHEN r.weekStartDate BETWEEN :startDate AND :endDate THEN r.totalHours END), 0), " +
+           "COALESCE(SUM(CASE WHEN r.weekStartDate BETWEEN :startDate AND :endDate THEN r.totalPay END), 0), " +
+           "SUM(CASE WHEN r.weekStartDate BETWEEN :startDate AND :endDate " +
+           "AND r.status IN ('PENDING_TUTOR_CONFIRMATION', 'TUTOR_CONFIRMED', 'LECTURER_CONFIRMED', " +
+           "'MODIFICATION_REQUESTED') THEN r.timesheetCount ELSE 0L END), " +
+           "COALESCE(SUM(CASE WHEN r.weekStartDate BETWEEN :currentWeekStart AND :currentWeekEnd THEN r.totalHours END), 0), " +
+           "COALESCE(SUM(CASE WHEN r.weekStartDate BETWEEN :previousWeekStart AND :previousWeekEnd THEN r.totalHours END), 0)) " +
+           "FROM TimesheetWeeklyRollup r " +
+           "WHERE r.tutorId = :tutorId AND (r.weekStartDate BETWEEN :startDate AND :endDate " +
+           "OR r.weekStartDate BETWEEN :previousWeekStart AND :currentWeekEnd)")
+    DashboardAggregateData aggregateDashboardByTutorNative(
+        @Param("tutorId") Long tutorId,
+        @Param("startDate") LocalDate startDate,
+        @Param("endDate") LocalDate endDate,
+        @Param("currentWeekStart") LocalDate currentWeekStart,
+        @Param("currentWeekEnd") LocalDate currentWeekEnd,
+        @Param("previousWeekStart") LocalDate previousWeekStart,
+        @Param("previousWeekEnd") LocalDate previousWeekEnd
+    );
+
+    default DashboardAggregateData aggregateDashboardByTutor(Long tutorId, DashboardWindows windows) {
+        return aggregateDashboardByTutorNative(tutorId, windows.getStartDate(), windows.getEndDate(),
+            windows.getCurrentWeekStart(), windows.getCurrentWeekEnd(),
+            windows.getPreviousWeekStart(), windows.getPreviousWeekEnd());
+    }
+
+    /**
+     * Aggregate dashboard windows from the rollup - LECTURER scope.
+     */
+    @Query("SELECT new com.usyd.catams.dto.DashboardAggregateData(" +
+           "SUM(CASE WHEN r.weekStartDate BETWEEN :startDate AND :endDate THEN r.timesheetCount ELSE 0L END), " +
+           "COALESCE(SUM(CASE WHEN r.weekStartDate BETWEEN :startDate AND :endDate THEN r.totalHours END), 0), " +
+           "COALESCE(SUM(CASE WHEN r.weekStartDate BETWEEN :startDate AND :endDate THEN r.totalPay END), 0), " +
+           "SUM(CASE WHEN r.weekStartDate BETWEEN :startDate AND :endDate " +
+           "AND r.status IN ('TUTOR_CONFIRMED', 'MODIFICATION_REQUESTED') THEN r.timesheetCount ELSE 0L END), " +
+           "COALESCE(SUM(CASE WHEN r.weekStartDate BETWEEN :currentWeekStart AND :currentWeekEnd THEN r.totalHours END), 0), " +
+           "COALESCE(SUM(CASE WHEN r.weekStartDate BETWEEN :previousWeekStart AND :previousWeekEnd THEN r.totalHours END), 0)) " +
+           "FROM TimesheetWeeklyRollup r " +
+           "WHERE r.courseId IN :courseIds AND (r.weekStartDate BETWEEN :startDate AND :endDate " +
+           "OR r.weekStartDate BETWEEN :previousWeekStart AND :currentWeekEnd)")
+    DashboardAggregateData aggregateDashboardByCoursesNative(
+        @Param("courseIds") List<Long> courseIds,
+        @Param("startDate") LocalDate startDate,
+        @Param("endDate") LocalDate endDate,
+        @Param("currentWeekStart") LocalDate currentWeekStart,
+        @Param("currentWeekEnd") LocalDate currentWeekEnd,
+        @Param("previousWeekStart") LocalDate previousWeekStart,
+        @Param("previousWeekEnd") LocalDate previousWeekEnd
+    );
+
+    default DashboardAggregateData aggregateDashboardByCourses(List<Long> courseIds, DashboardWindows windows) {
+        return aggregateDashboardByCoursesNative(courseIds, windows.getStartDate(), windows.getEndDate(),
+            windows.getCurrentWeekStart(), windows.getCurrentWeekEnd(),
+            windows.getPreviousWeekStart(), windows.getPreviousWeekEnd());
+    }
+
+    /**
+     * Aggregate dashboard windows from the rollup - single course.
+     */
+    @Query("SELECT new com.usyd.catams.dto.DashboardAggregateData(" +
+           "SUM(CASE WHEN r.weekStartDate BETWEEN :startDate AND :endDate THEN r.timesheetCount ELSE 0L END), " +
+           "COALESCE(SUM(CASE WHEN r.weekStartDate BETWEEN :startDate AND :endDate THEN r.totalHours END), 0), " +
+           "COALESCE(SUM(CASE WHEN r.weekStartDate BETWEEN :startDate AND :endDate THEN r.totalPay END), 0), " +
+           "SUM(CASE WHEN r.weekStartDate BETWEEN :startDate AND :endDate " +
+           "AND r.status IN ('LECTURER_CONFIRMED') THEN r.timesheetCount ELSE 0L END), " +
+           "COALESCE(SUM(CASE WHEN r.weekStartDate BETWEEN :currentWeekStart AND :currentWeekEnd THEN r.totalHours END), 0), " +
+           "COALESCE(SUM(CASE WHEN r.weekStartDate BETWEEN :previousWeekStart AND :previousWeekEnd THEN r.totalHours END), 0)) " +
+           "FROM TimesheetWeeklyRollup r " +
+           "WHERE r.courseId = :courseId AND (r.weekStartDate BETWEEN :startDate AND :endDate " +
+           "OR r.weekStartDate BETWEEN :previousWeekStart AND :currentWeekEnd)")
+    DashboardAggregateData aggregateDashboardByCourseNative(
+        @Param("courseId") Long courseId,
+        @Param("startDate") LocalDate startDate,
+        @Param("endDate") LocalDate endDate,
+        @Param("currentWeekStart") LocalDate currentWeekStart,
+        @Param("currentWeekEnd") LocalDate currentWeekEnd,
+        @Param("previousWeekStart") LocalDate previousWeekStart,
+        @Param("previousWeekEnd") LocalDate previousWeekEnd
+    );
+
+    default DashboardAggregateData aggregateDashboardByCourse(Long courseId, DashboardWindows windows) {
+        return aggregateDashboardByCourseNative(courseId, windows.getStartDate(), windows.getEndDate(),
+            windows.getCurrentWeekStart(), windows.getCurrentWeekEnd(),
+            windows.getPreviousWeekStart(), windows.getPreviousWeekEnd());
+    }
+
+    /**
+     * Aggregate dashboard windows from the rollup - ADMIN scope.
+     */
+    @Query("SELECT new com.usyd.catams.dto.DashboardAggregateData(" +
+           "SUM(CASE WHEN r.weekStartDate BETWEEN :startDate AND :endDate THEN r.timesheetCount ELSE 0L END), " +
+           "COALESCE(SUM(CASE WHEN r.weekStartDate BETWEEN :startDate AND :endDate THEN r.totalHours END), 0), " +
+           "COALESCE(SUM(CASE WHEN r.weekStartDate BETWEEN :startDate AND :endDate THEN r.totalPay END), 0), " +
+           "SUM(CASE WHEN r.weekStartDate BETWEEN :startDate AND :endDate " +
+           "AND r.status IN ('LECTURER_CONFIRMED') THEN r.timesheetCount ELSE 0L END), " +
+           "COALESCE(SUM(CASE WHEN r.weekStartDate BETWEEN :currentWeekStart AND :currentWeekEnd THEN r.totalHours END), 0), " +
+           "COALESCE(SUM(CASE WHEN r.weekStartDate BETWEEN :previousWeekStart AND :previousWeekEnd THEN r.totalHours END), 0)) " +
+           "FROM TimesheetWeeklyRollup r " +
+           "WHERE (r.weekStartDate BETWEEN :startDate AND :endDate " +
+           "OR r.weekStartDate BETWEEN :previousWeekStart AND :currentWeekEnd)")
+    DashboardAggregateData aggregateDashboardSystemWideNative(
+        @Param("startDate") LocalDate startDate,
+        @Param("endDate") LocalDate endDate,
+        @Param("currentWeekStart") LocalDate currentWeekStart,
+        @Param("currentWeekEnd") LocalDate currentWeekEnd,
+        @Param("previousWeekStart") LocalDate previousWeekStart,
+        @Param("previousWeekEnd") LocalDate previousWeekEnd
+    );
+
+    default DashboardAggregateData aggregateDashboardSystemWide(DashboardWindows windows) {
+        return aggregateDashboardSystemWideNative(windows.getStartDate(), windows.getEndDate(),
+            windows.getCurrentWeekStart(), windows.getCurrentWeekEnd(),
+            windows.getPreviousWeekStart(), windows.getPreviousWeekEnd());
+    }
+}
@@ -0,0 +1,107 @@
+package com.usyd.catams.security;
+
+import com.usyd.catams.entity.User;
+import org.springframework.beans.factory.annotation.Value;
+import org.springframework.stereotype.Component;
+import org.springframework.transaction.support.TransactionSynchronization;
+import org.springframework.transaction.support.TransactionSynchronizationManager;
+
+import java.time.Clock;
+import java.time.Duration;
+import java.time.Instant;
+import java.util.Collections;
+import java.util.LinkedHashMap;
+import java.util.Map;
+import java.util.Optional;
+import java.util.function.Function;
+
+/**
+ * Bounded TTL cache of active users keyed by user id
+ *
+ * Used by {@link JwtAuthenticationFilter} so authenticating a request does not hit the
+ * users table every time. Entries are detached, read-only snapshots; writes that change
+ * whether a user may authenticate must call {@link #evict(Long)}. The TTL bounds staleness
+ * for any change that bypasses eviction.
+ *
+ * @author Development Team
+ * @since 1.0
+ */
+@Component
+public class ActiveUserCache {
+
+    private final Map<Long, Entry> entries;
+    private final Duration ttl;
+    private final Clock clock;
+
+    public ActiveUserCache(@Value("${app.security.user-cache.ttl:PT1M}") Duration ttl,
+                           @Value("${app.security.user-cache.max-size:10000}") int maxSize,
+                           Clock clock) {
+        if (maxSize <= 0) {
+            throw new IllegalArgumentException("User cache size must be positive");
+        }
+        this.ttl = ttl;
+        this.clock = clock;
+        // Access-ordered map evicts the least recently used user once full
+        this.entries = Collections.synchronizedMap(new LinkedHashMap<>(64, 0.75f, true) {
+            @Override
+            protected boolean removeEldestEntry(Map.Entry<Long, Entry> eldest) {
+                return size() > maxSize;
+            }
+        });
+    }
+
+    /**
+     * Return the cached active user, loading it on a miss or after expiry
+     *
+     * Absent or inactive users are not cached, so a reactivated user is picked up immediately.
+     *
+     * @param userId user id from the token
+     * @param loader loads the user when it is not cached
+     * @return the active user, or empty if none
+     */
+    public Optional<User> get(Long userId, Function<Long, Optional<User>> loader) {
+        Instant now = clock.instant();
+        Entry cached = entries.get(userId);
+        if (cached != null && now.isBefore(cached.expiresAt())) {
+            return Optional.of(cached.user());
+        }
+
+        Optional<User> loaded = loader.apply(userId)
+            .filter(user -> Boolean.TRUE.equals(user.getIsActive()));
+        if (loaded.isPresent()) {
+            entries.put(userId, new Entry(loaded.get(), now.plus(ttl)));
+        } else {
+            entries.remove(userId);
+        }
+        return loaded;
+    }
+
+    /**
+     * Drop a user's snapshot now and, inside a transaction, again after commit so a
+     * concurrent request cannot re-cache the pre-commit state.
+     *
+     * @param userId user whose snapshot is stale
+     */
+    public void evict(Long userId) {
+        entries.remove(userId);
+        if (TransactionSynchronizationManager.isSynchronizationActive()) {
+            TransactionSynchronizationManager.registerSynchronization(new TransactionSynchronization() {
+                @Override
+                public void afterCommit() {
+                    entries.remove(userId);
+                }
+            });
+        }
+    }
+
+    public void clear() {
+        entries.clear();
+    }
+
+    public int size() {
+        return entries.size();
+    }
+
+    private record Entry(User user, Instant expiresAt) {
+    }
+}
@@ -1,13 +1,16 @@
 package com.usyd.catams.security;
 
+import com.usyd.catams.common.application.RequestEntityCache;
 import com.usyd.catams.entity.User;
 import com.usyd.catams.repository.UserRepository;
+import io.jsonwebtoken.Claims;
 import jakarta.servlet.FilterChain;
 import jakarta.servlet.ServletException;
 import jakarta.servlet.http.HttpServletRequest;
 import jakarta.servlet.http.HttpServletResponse;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
+import org.springframework.beans.factory.annotation.Autowired;
 import org.springframework.security.authentication.UsernamePasswordAuthenticationToken;
 import org.springframework.security.core.authority.SimpleGrantedAuthority;
 import org.springframework.security.core.context.SecurityContextHolder;
@@ -47,10 +50,23 @@ public class JwtAuthenticationFilter extends OncePerRequestFilter {
     
     private final JwtTokenProvider jwtTokenProvider;
     private final UserRepository userRepository;
+    private final ActiveUserCache activeUserCache;
+    private final RequestEntityCache requestEntityCache;
     
-    public JwtAuthenticationFilter(JwtTokenProvider jwtTokenProvider, UserRepository userRepository) {
+    @Autowired
+    public JwtAuthenticationFilter(JwtTokenProvider jwtTokenProvider, UserRepository userRepository,
+                                   ActiveUserCache activeUserCache, RequestEntityCache requestEntityCache) {
         this.jwtTokenProvider = jwtTokenProvider;
         this.userRepository = userRepository;
+        this.activeUserCache = activeUserCache;
+        this.requestEntityCache = requestEntityCache;
+    }
+
+    /**
+     * Backward-compatible constructor used by certain tests; looks users up without caching.
+     */
+    public JwtAuthenticationFilter(JwtTokenProvider jwtTokenProvider, UserRepository userRepository) {
+        this(jwtTokenProvider, userRepository, null, null);
     }
     
     @Override
@@ -62,8 +78,12 @@ public class JwtAuthenticationFilter extends OncePerRequestFilter {
             String authHeader = request.getHeader(AUTHORIZATION_HEADER);
             String token = jwtTokenProvider.extractTokenFromHeader(authHeader);
             
-            if (token != null && jwtTokenProvider.validateToken(token)) {
-                authenticateUser(token, request);
+            if (token != null) {
+                // Single signature check; claims are read from the same parse
+                Claims claims = jwtTokenProvider.validateAndGetClaims(token);
+                if (claims != null) {
+                    authenticateUser(claims, request);
+                }
             }
         } catch (Exception e) {
             logger.warn("JWT authentication failed: {}", e.getMessage());
@@ -77,24 +97,25 @@ public class JwtAuthenticationFilter extends OncePerRequestFilter {
     /**
      * Authenticate user based on valid JWT token
      * 
-     * @param token Valid JWT token
+     * @param claims Claims of a validated JWT token
      * @param request HTTP request for authentication details
      */
-    private void authenticateUser(String token, HttpServletRequest request) {
-        String userEmail = jwtTokenProvider.getUserEmailFromToken(token);
-        Long userId = jwtTokenProvider.getUserIdFromToken(token);
-        String role = jwtTokenProvider.getUserRoleFromToken(token);
+    private void authenticateUser(Claims claims, HttpServletRequest request) {
+        String userEmail = claims.getSubject();
+        Long userId = claims.get("userId", Long.class);
+        String role = claims.get("role", String.class);
         
         if (userEmail != null && userId != null && role != null && 
             SecurityContextHolder.getContext().getAuthentication() == null) {
             
             // Verify user still exists and is active
-            Optional<User> userOpt = userRepository.findByEmailAndIsActive(userEmail, true);
+            Optional<User> userOpt = findActiveUser(userId, userEmail);
             if (userOpt.isPresent()) {
                 User user = userOpt.get();
                 
                 // Verify token claims match database record
-                if (user.getId().equals(userId) && user.getRole().name().equals(role)) {
+                if (user.getId().equals(userId) && user.getEmail().equalsIgnoreCase(userEmail)
+                        && user.getRole().name().equals(role)) {
                     
                     // Create authentication with user details and role
                     SimpleGrantedAuthority authority = new SimpleGrantedAuthority("ROLE_" + role);
@@ -107,6 +128,10 @@ public class JwtAuthenticationFilter extends OncePerRequestFilter {
                     
                     authentication.setDetails(new WebAuthenticationDetailsSource().buildDetails(request));
                     SecurityContextHolder.getContext().setAuthentication(authentication);
+                    if (requestEntityCache != null) {
+                        // Application services resolve the requester by id; reuse this instance
+                        requestEntityCache.seedUser(user);
+                    }
                     
                     logger.debug("JWT authentication successful for user: {} with role: {}", userEmail, role);
                 } else {
@@ -118,6 +143,16 @@ public class JwtAuthenticationFilter extends OncePerRequestFilter {
         }
     }
     
+    /**
+     * Active user for the token, from the snapshot cache when available
+     */
+    private Optional<User> findActiveUser(Long userId, String userEmail) {
+        if (activeUserCache == null) {
+            return userRepository.findByEmailAndIsActive(userEmail, true);
+        }
+        return activeUserCache.get(userId, userRepository::findById);
+    }
+    
     @Override
     protected boolean shouldNotFilter(HttpServletRequest request) throws ServletException {
         String path = request.getRequestURI();
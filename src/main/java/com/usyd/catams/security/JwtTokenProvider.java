@@ -3,6 +3,7 @@ package com.usyd.catams.security;
 import io.jsonwebtoken.Claims;
 import io.jsonwebtoken.ExpiredJwtException;
 import io.jsonwebtoken.JwtException;
+import io.jsonwebtoken.JwtParser;
 import io.jsonwebtoken.Jwts;
 import io.jsonwebtoken.security.Keys;
 import org.slf4j.Logger;
@@ -28,6 +29,7 @@ public class JwtTokenProvider {
     private static final Logger logger = LoggerFactory.getLogger(JwtTokenProvider.class);
 
     private final SecretKey secretKey;
+    private final JwtParser parser;
     private final long tokenValidityInMilliseconds;
 
     /**
@@ -59,6 +61,8 @@ public class JwtTokenProvider {
         }
         
         this.secretKey = Keys.hmacShaKeyFor(keyBytes);
+        // Parsers are immutable and thread-safe; build once instead of per call
+        this.parser = Jwts.parser().verifyWith(secretKey).build();
         
         // Validate token validity period
         if (validityInMilliseconds <= 0) {
@@ -122,12 +126,20 @@ public class JwtTokenProvider {
      * @return true if token is valid, false otherwise
      */
     public boolean validateToken(String token) {
+        return validateAndGetClaims(token) != null;
+    }
+
+    /**
+     * Validate JWT token and return its claims from the same parse
+     * 
+     * Lets per-request callers verify the signature once instead of re-parsing for each claim
+     * 
+     * @param token JWT token to validate
+     * @return Claims if the token is valid, null otherwise
+     */
+    public Claims validateAndGetClaims(String token) {
         try {
-            Jwts.parser()
-                .verifyWith(secretKey)
-                .build()
-                .parseSignedClaims(token);
-            return true;
+            return parser.parseSignedClaims(token).getPayload();
         } catch (ExpiredJwtException e) {
             logger.warn("JWT token is expired: {}", e.getMessage());
         } catch (JwtException e) {
@@ -135,7 +147,7 @@ public class JwtTokenProvider {
         } catch (Exception e) {
             logger.warn("JWT token validation failed: {}", e.getMessage());
         }
-        return false;
+        return null;
     }
     
     /**
@@ -146,11 +158,7 @@ public class JwtTokenProvider {
      */
     public String getUserEmailFromToken(String token) {
         try {
-            Claims claims = Jwts.parser()
-                .verifyWith(secretKey)
-                .build()
-                .parseSignedClaims(token)
-                .getPayload();
+            Claims claims = parser.parseSignedClaims(token).getPayload();
             return claims.getSubject();
         } catch (JwtException e) {
             logger.warn("Failed to extract email from JWT token: {}", e.getMessage());
@@ -166,11 +174,7 @@ public class JwtTokenProvider {
      */
     public Long getUserIdFromToken(String token) {
         try {
-            Claims claims = Jwts.parser()
-                .verifyWith(secretKey)
-                .build()
-                .parseSignedClaims(token)
-                .getPayload();
+            Claims claims = parser.parseSignedClaims(token).getPayload();
             return claims.get("userId", Long.class);
         } catch (JwtException e) {
             logger.warn("Failed to extract user ID from JWT token: {}", e.getMessage());
@@ -186,11 +190,7 @@ public class JwtTokenProvider {
      */
     public String getUserRoleFromToken(String token) {
         try {
-            Claims claims = Jwts.parser()
-                .verifyWith(secretKey)
-                .build()
-                .parseSignedClaims(token)
-                .getPayload();
+            Claims claims = parser.parseSignedClaims(token).getPayload();
             return claims.get("role", String.class);
         } catch (JwtException e) {
             logger.warn("Failed to extract role from JWT token: {}", e.getMessage());
@@ -206,11 +206,7 @@ public class JwtTokenProvider {
      */
     public Claims getClaimsFromToken(String token) {
         try {
-            return Jwts.parser()
-                .verifyWith(secretKey)
-                .build()
-                .parseSignedClaims(token)
-                .getPayload();
+            return parser.parseSignedClaims(token).getPayload();
         } catch (JwtException e) {
             logger.warn("Failed to extract claims from JWT token: {}", e.getMessage());
             return null;
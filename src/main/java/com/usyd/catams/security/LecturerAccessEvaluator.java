@@ -1,7 +1,7 @@
 package com.usyd.catams.security;
 
 import com.usyd.catams.e2e.E2EAssignmentState;
-import com.usyd.catams.repository.LecturerAssignmentRepository;
+import com.usyd.catams.service.CourseScopeCache;
 import org.springframework.core.env.Environment;
 import org.springframework.security.core.Authentication;
 import org.springframework.stereotype.Component;
@@ -9,14 +9,14 @@ import org.springframework.stereotype.Component;
 @Component("lecturerAccessEvaluator")
 public class LecturerAccessEvaluator {
 
-    private final LecturerAssignmentRepository lecturerAssignmentRepository;
+    private final CourseScopeCache courseScopeCache;
     private final Environment environment;
     private final E2EAssignmentState e2eState; // may be null outside e2e-local
 
-    public LecturerAccessEvaluator(LecturerAssignmentRepository lecturerAssignmentRepository,
+    public LecturerAccessEvaluator(CourseScopeCache courseScopeCache,
                                    Environment environment,
                                    @org.springframework.beans.factory.annotation.Autowired(required = false) E2EAssignmentState e2eState) {
-        this.lecturerAssignmentRepository = lecturerAssignmentRepository;
+        this.courseScopeCache = courseScopeCache;
         this.environment = environment;
         this.e2eState = e2eState;
     }
@@ -41,8 +41,8 @@ public class LecturerAccessEvaluator {
                     return courses.contains(courseId);
                 }
             }
-            // Fallback to DB
-            return lecturerAssignmentRepository.existsByLecturerIdAndCourseId(userId, courseId);
+            // Fallback to DB (through the per-user scope cache)
+            return courseScopeCache.isLecturerAssigned(userId, courseId);
         } catch (Exception ex) {
             if (isE2ELocal() && e2eState != null) {
                 var courses = e2eState.getLecturerCourses(userId);
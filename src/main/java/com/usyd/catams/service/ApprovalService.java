@@ -1,10 +1,14 @@
 package com.usyd.catams.service;
 
+import com.usyd.catams.dto.response.ApprovalBatchResponse;
 import com.usyd.catams.entity.Approval;
 import com.usyd.catams.entity.Timesheet;
 import com.usyd.catams.enums.ApprovalAction;
 import com.usyd.catams.enums.ApprovalStatus;
 
+import org.springframework.data.domain.Page;
+import org.springframework.data.domain.Pageable;
+
 import java.util.List;
 
 /**
@@ -61,6 +65,21 @@ public interface ApprovalService {
      */
     Approval performApprovalAction(Long timesheetId, ApprovalAction action, String comment, Long requesterId);
 
+    /**
+     * Apply one approval action to several timesheets in a single transaction.
+     * 
+     * Each timesheet is checked with the same rules as {@link #performApprovalAction}; one that
+     * fails is reported and left unchanged while the rest are applied.
+     * 
+     * @param timesheetIds IDs of the timesheets, in the order results are reported
+     * @param action the approval action to perform on every timesheet
+     * @param comment optional comment applied to every approval record
+     * @param requesterId ID of the user performing the action
+     * @return per-timesheet outcomes
+     */
+    ApprovalBatchResponse performBatchApprovalAction(List<Long> timesheetIds, ApprovalAction action,
+                                                     String comment, Long requesterId);
+
     /**
      * Get approval history for a specific timesheet.
      * 
@@ -79,6 +98,15 @@ public interface ApprovalService {
      */
     List<Timesheet> getPendingApprovalsForUser(Long approverId);
 
+    /**
+     * Get one page of the timesheets a user can act on, oldest first.
+     * 
+     * @param approverId ID of the user whose queue is requested
+     * @param pageable page number and size; any sort is ignored in favour of queue order
+     * @return page of actionable timesheets with their approval history loaded
+     */
+    Page<Timesheet> getPendingApprovalsForUser(Long approverId, Pageable pageable);
+
     /**
      * Check if a user can perform a specific approval action on a timesheet.
      * 
@@ -0,0 +1,200 @@
+package com.usyd.catams.service;
+
+import com.usyd.catams.dto.request.AssignmentBulkRequest;
+import com.usyd.catams.dto.response.AssignmentBulkResponse;
+import com.usyd.catams.dto.response.AssignmentBulkResponse.UserChange;
+import com.usyd.catams.entity.ChangeVersionListener;
+import com.usyd.catams.entity.Course;
+import com.usyd.catams.entity.User;
+import com.usyd.catams.enums.UserRole;
+import com.usyd.catams.exception.BusinessRuleException;
+import com.usyd.catams.exception.ErrorCodes;
+import com.usyd.catams.exception.ResourceNotFoundException;
+import com.usyd.catams.repository.CourseRepository;
+import com.usyd.catams.repository.UserRepository;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.jdbc.core.namedparam.MapSqlParameterSource;
+import org.springframework.jdbc.core.namedparam.NamedParameterJdbcTemplate;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+
+import java.util.ArrayList;
+import java.util.HashMap;
+import java.util.LinkedHashMap;
+import java.util.LinkedHashSet;
+import java.util.List;
+import java.util.Map;
+import java.util.Set;
+import java.util.TreeSet;
+import java.util.stream.Collectors;
+
+/**
+ * Set-based replacement of tutor and lecturer course assignments.
+ *
+ * <p>Reads the current assignments of every user in the request with one query, diffs them
+ * against the requested sets, and applies the difference as batched
+ * {@code INSERT ... ON CONFLICT DO NOTHING} and {@code DELETE} statements, so a concurrent
+ * writer adding the same pair is not an error. The writes bypass JPA, so this service
+ * invalidates the course scope cache and the reference change version itself.</p>
+ */
+@Service
+public class AssignmentBulkService {
+
+    // Multiple of hibernate.jdbc.batch_size, matching the bulk timesheet import
+    private static final int BATCH_SIZE = 500;
+
+    // Beyond this many changed users one cache-wide invalidation is cheaper than per-user ones
+    private static final int PER_USER_EVICTION_LIMIT = 20;
+
+    private final NamedParameterJdbcTemplate jdbcTemplate;
+    private final UserRepository userRepository;
+    private final CourseRepository courseRepository;
+    private final CourseScopeCache courseScopeCache;
+
+    public AssignmentBulkService(JdbcTemplate jdbcTemplate,
+                                 UserRepository userRepository,
+                                 CourseRepository courseRepository,
+                                 CourseScopeCache courseScopeCache) {
+        this.jdbcTemplate = new NamedParameterJdbcTemplate(jdbcTemplate);
+        this.userRepository = userRepository;
+        this.courseRepository = courseRepository;
+        this.courseScopeCache = courseScopeCache;
+    }
+
+    @Transactional
+    public AssignmentBulkResponse replaceTutorAssignments(AssignmentBulkRequest request) {
+        return replace(Kind.TUTOR, request);
+    }
+
+    @Transactional
+    public AssignmentBulkResponse replaceLecturerAssignments(AssignmentBulkRequest request) {
+        return replace(Kind.LECTURER, request);
+    }
+
+    private AssignmentBulkResponse replace(Kind kind, AssignmentBulkRequest request) {
+        Map<Long, Set<Long>> requested = requestedAssignments(request);
+        validateUsers(kind, requested.keySet());
+        validateCourses(requested.values().stream().flatMap(Set::stream).collect(Collectors.toSet()));
+
+        Map<Long, Set<Long>> current = new HashMap<>();
+        jdbcTemplate.query(kind.selectSql, new MapSqlParameterSource("userIds", requested.keySet()), rs -> {
+            current.computeIfAbsent(rs.getLong(1), id -> new TreeSet<>()).add(rs.getLong(2));
+        });
+
+        List<UserChange> changes = new ArrayList<>();
+        List<long[]> inserts = new ArrayList<>();
+        List<long[]> deletes = new ArrayList<>();
+        requested.forEach((userId, courseIds) -> {
+            Set<Long> existing = current.getOrDefault(userId, Set.of());
+            List<Long> added = courseIds.stream().filter(id -> !existing.contains(id)).sorted().toList();
+            List<Long> removed = existing.stream().filter(id -> !courseIds.contains(id)).sorted().toList();
+            added.forEach(courseId -> inserts.add(new long[] {userId, courseId}));
+            removed.forEach(courseId -> deletes.add(new long[] {userId, courseId}));
+            if (!added.isEmpty() || !removed.isEmpty()) {
+                changes.add(new UserChange(userId, added, removed));
+            }
+        });
+
+        batch(kind.deleteSql, deletes);
+        batch(kind.insertSql, inserts);
+
+        if (!changes.isEmpty()) {
+            invalidate(kind, changes);
+        }
+        return new AssignmentBulkResponse(requested.size(), changes);
+    }
+
+    private Map<Long, Set<Long>> requestedAssignments(AssignmentBulkRequest request) {
+        if (request == null || request.getAssignments() == null || request.getAssignments().isEmpty()) {
+            throw new BusinessRuleException("Bulk assignment requires at least one entry", ErrorCodes.VALIDATION_FAILED);
+        }
+        Map<Long, Set<Long>> requested = new LinkedHashMap<>();
+        for (AssignmentBulkRequest.Entry entry : request.getAssignments()) {
+            if (requested.put(entry.getUserId(), new LinkedHashSet<>(entry.getCourseIds())) != null) {
+                throw new BusinessRuleException(
+                    "User " + entry.getUserId() + " appears more than once in the bulk assignment",
+                    ErrorCodes.VALIDATION_FAILED);
+            }
+        }
+        return requested;
+    }
+
+    private void validateUsers(Kind kind, Set<Long> userIds) {
+        Map<Long, User> users = userRepository.findAllById(userIds).stream()
+            .collect(Collectors.toMap(User::getId, user -> user));
+        for (Long userId : userIds) {
+            User user = users.get(userId);
+            if (user == null) {
+                throw new ResourceNotFoundException("User", String.valueOf(userId));
+            }
+            if (user.getRole() != kind.role) {
+                throw new BusinessRuleException(
+                    "User " + userId + " is not a " + kind.role.name().toLowerCase() + " and cannot be assigned as one",
+                    ErrorCodes.VALIDATION_FAILED);
+            }
+        }
+    }
+
+    private void validateCourses(Set<Long> courseIds) {
+        if (courseIds.isEmpty()) {
+            return;
+        }
+        Set<Long> found = courseRepository.findAllById(courseIds).stream()
+            .map(Course::getId)
+            .collect(Collectors.toSet());
+        for (Long courseId : courseIds) {
+            if (!found.contains(courseId)) {
+                throw new ResourceNotFoundException("Course", String.valueOf(courseId));
+            }
+        }
+    }
+
+    private void batch(String sql, List<long[]> pairs) {
+        if (pairs.isEmpty()) {
+            return;
+        }
+        jdbcTemplate.getJdbcTemplate().batchUpdate(sql, pairs, BATCH_SIZE, (statement, pair) -> {
+            statement.setLong(1, pair[0]);
+            statement.setLong(2, pair[1]);
+        });
+    }
+
+    private void invalidate(Kind kind, List<UserChange> changes) {
+        ChangeVersionListener.referenceDataChanged();
+        if (changes.size() > PER_USER_EVICTION_LIMIT) {
+            courseScopeCache.evictAll();
+            return;
+        }
+        for (UserChange change : changes) {
+            if (kind == Kind.TUTOR) {
+                courseScopeCache.evictTutor(change.getUserId());
+            } else {
+                courseScopeCache.evictLecturer(change.getUserId());
+            }
+        }
+    }
+
+    private enum Kind {
+        TUTOR(UserRole.TUTOR,
+            "SELECT tutor_id, course_id FROM tutor_assignments WHERE tutor_id IN (:userIds)",
+            "INSERT INTO tutor_assignments (tutor_id, course_id, created_at) VALUES (?, ?, CURRENT_TIMESTAMP) " +
+                "ON CONFLICT DO NOTHING",
+            "DELETE FROM tutor_assignments WHERE tutor_id = ? AND course_id = ?"),
+        LECTURER(UserRole.LECTURER,
+            "SELECT lecturer_id, course_id FROM lecturer_assignments WHERE lecturer_id IN (:userIds)",
+            "INSERT INTO lecturer_assignments (lecturer_id, course_id) VALUES (?, ?) ON CONFLICT DO NOTHING",
+            "DELETE FROM lecturer_assignments WHERE lecturer_id = ? AND course_id = ?");
+
+        private final UserRole role;
+        private final String selectSql;
+        private final String insertSql;
+        private final String deleteSql;
+
+        Kind(UserRole role, String selectSql, String insertSql, String deleteSql) {
+            this.role = role;
+            this.selectSql = selectSql;
+            this.insertSql = insertSql;
+            this.deleteSql = deleteSql;
+        }
+    }
+}
@@ -0,0 +1,47 @@
+package com.usyd.catams.service;
+
+import com.usyd.catams.entity.ChangeVersionListener;
+import jakarta.annotation.PostConstruct;
+import org.springframework.stereotype.Component;
+
+/**
+ * Keeps change versions moving on every instance, so an ETag issued by one node is not
+ * confirmed by another that has not seen the write
+ *
+ * {@link ChangeVersionListener} hands each change over while the writing transaction is still
+ * open, and it goes out as a Postgres {@code NOTIFY} on {@value #CHANNEL}; peers only hear about
+ * writes that commit and then move their own versions (see {@link PeerNotificationListener}).
+ * A (re)connect moves every version, since changes sent in the meantime are lost. Off the
+ * Postgres profile versions stay per instance, which is safe for a single node.
+ */
+@Component
+public class ChangeVersionBroadcaster implements PeerNotificationHandler {
+
+    public static final String CHANNEL = "change_version_changed";
+
+    private final PeerNotificationPublisher peerNotificationPublisher;
+
+    public ChangeVersionBroadcaster(PeerNotificationPublisher peerNotificationPublisher) {
+        this.peerNotificationPublisher = peerNotificationPublisher;
+    }
+
+    @PostConstruct
+    void register() {
+        ChangeVersionListener.broadcastTo(change -> peerNotificationPublisher.notifyPeers(CHANNEL, change));
+    }
+
+    @Override
+    public String channel() {
+        return CHANNEL;
+    }
+
+    @Override
+    public void onNotification(String payload) {
+        ChangeVersionListener.peerChanged(payload);
+    }
+
+    @Override
+    public void resync() {
+        ChangeVersionListener.peerChanged(null);
+    }
+}
@@ -0,0 +1,70 @@
+package com.usyd.catams.service;
+
+import com.usyd.catams.entity.ChangeVersionListener;
+import com.usyd.catams.enums.UserRole;
+import org.springframework.stereotype.Service;
+import org.springframework.util.DigestUtils;
+
+import java.nio.charset.StandardCharsets;
+import java.time.LocalDate;
+import java.util.Arrays;
+import java.util.Objects;
+import java.util.UUID;
+
+/**
+ * Builds strong ETags for read endpoints from change versions rather than response bodies.
+ *
+ * A tag combines the instance epoch, the versions of the data scope the caller can see and the
+ * request parameters that shape the response, so it can be checked before any query runs. Tutors
+ * only see their own timesheets and are scoped to their own version; lecturers and administrators
+ * use the global timesheet version. Every scope also depends on the reference data version.
+ * Tags are taken before the data is read, so a concurrent commit can cost an extra full response
+ * but never produces a 304 for data the client has not seen.
+ *
+ * Versions are kept per instance (see {@link ChangeVersionListener}) and follow writes made on
+ * other instances through {@link ChangeVersionBroadcaster}, so a node never confirms a tag for
+ * data another node has since changed. The epoch makes tags from a previous run or another
+ * instance miss instead of matching unrelated version numbers.
+ */
+@Service
+public class ChangeVersionService {
+
+    private final String epoch = UUID.randomUUID().toString();
+
+    /**
+     * ETag for a dashboard summary. {@code today} covers figures that age with the calendar.
+     */
+    public String dashboardSummaryTag(Long userId, UserRole role, Long courseId,
+                                      LocalDate startDate, LocalDate endDate, LocalDate today) {
+        return tag("dashboard", scopeVersion(userId, role), userId, role, courseId, startDate, endDate, today);
+    }
+
+    /**
+     * ETag for a timesheet listing; {@code parameters} are the normalised query parameters.
+     */
+    public String timesheetListTag(Long requesterId, UserRole role, Object... parameters) {
+        return tag("timesheets", scopeVersion(requesterId, role), requesterId, role, Arrays.asList(parameters));
+    }
+
+    /**
+     * ETag for the UI constraint configuration, which only changes with a deployment.
+     */
+    public String configTag() {
+        return tag("config");
+    }
+
+    private static String scopeVersion(Long userId, UserRole role) {
+        long timesheets = role == UserRole.TUTOR
+            ? ChangeVersionListener.tutorVersion(userId)
+            : ChangeVersionListener.timesheetVersion();
+        return timesheets + "." + ChangeVersionListener.referenceVersion();
+    }
+
+    private String tag(String resource, Object... parts) {
+        StringBuilder key = new StringBuilder(epoch).append('|').append(resource);
+        for (Object part : parts) {
+            key.append('|').append(Objects.toString(part, ""));
+        }
+        return "\"" + DigestUtils.md5DigestAsHex(key.toString().getBytes(StandardCharsets.UTF_8)) + "\"";
+    }
+}
@@ -0,0 +1,297 @@
+package com.usyd.catams.service;
+
+import com.usyd.catams.entity.ChangeVersionListener;
+import com.usyd.catams.entity.LecturerAssignment;
+import com.usyd.catams.entity.TutorAssignment;
+import com.usyd.catams.repository.LecturerAssignmentRepository;
+import com.usyd.catams.repository.TutorAssignmentRepository;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+import org.springframework.beans.factory.annotation.Value;
+import org.springframework.dao.DataAccessException;
+import org.springframework.jdbc.core.ConnectionCallback;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.stereotype.Component;
+import org.springframework.transaction.support.TransactionSynchronization;
+import org.springframework.transaction.support.TransactionSynchronizationManager;
+
+import java.time.Clock;
+import java.time.Duration;
+import java.time.Instant;
+import java.util.Arrays;
+import java.util.Collection;
+import java.util.List;
+import java.util.Map;
+import java.util.Objects;
+import java.util.Set;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.atomic.AtomicLong;
+import java.util.function.Function;
+import java.util.stream.Collectors;
+
+/**
+ * Per-user cache of the courses a lecturer or tutor is assigned to
+ *
+ * Assignment checks run on nearly every lecturer and tutor request, but assignments only change
+ * when an administrator edits them. Scopes are immutable snapshots of sorted course ids.
+ *
+ * On this instance, JPA writes to an assignment invalidate the affected user's scope through
+ * {@link ChangeVersionListener#assignmentVersion(Long)}. Admin assignment endpoints also call
+ * {@link #evictLecturer(Long)} or {@link #evictTutor(Long)}, which tell other instances through a
+ * Postgres {@code NOTIFY} on {@value #CHANNEL}; the database only delivers it if the write
+ * commits (see {@link PeerNotificationListener}). Native writes must evict explicitly. The TTL
+ * bounds staleness for anything that slips past both.
+ *
+ * @author Development Team
+ * @since 1.0
+ */
+@Component
+public class CourseScopeCache implements PeerNotificationHandler {
+
+    private static final Logger logger = LoggerFactory.getLogger(CourseScopeCache.class);
+
+    public static final String CHANNEL = "course_scope_changed";
+
+    private static final String LECTURER_PREFIX = "lecturer:";
+    private static final String TUTOR_PREFIX = "tutor:";
+    private static final String ALL = "all";
+
+    private final LecturerAssignmentRepository lecturerAssignmentRepository;
+    private final TutorAssignmentRepository tutorAssignmentRepository;
+    private final JdbcTemplate jdbcTemplate;
+    private final Clock clock;
+    private final Duration ttl;
+
+    private final Map<Long, Entry> lecturers = new ConcurrentHashMap<>();
+    private final Map<Long, Entry> tutors = new ConcurrentHashMap<>();
+    // Bumped by every eviction so a load that raced with one is not cached
+    private final AtomicLong generation = new AtomicLong();
+    private volatile Boolean postgres;
+
+    public CourseScopeCache(LecturerAssignmentRepository lecturerAssignmentRepository,
+                            TutorAssignmentRepository tutorAssignmentRepository,
+                            JdbcTemplate jdbcTemplate,
+                            Clock clock,
+                            @Value("${app.security.course-scope-cache.ttl:PT10M}") Duration ttl) {
+        this.lecturerAssignmentRepository = lecturerAssignmentRepository;
+        this.tutorAssignmentRepository = tutorAssignmentRepository;
+        this.jdbcTemplate = jdbcTemplate;
+        this.clock = clock;
+        this.ttl = ttl;
+    }
+
+    public CourseScope lecturerCourses(Long lecturerId) {
+        return scope(lecturers, lecturerId, id -> CourseScope.of(lecturerAssignmentRepository.findByLecturerId(id).stream()
+            .map(LecturerAssignment::getCourseId)
+            .toList()));
+    }
+
+    public CourseScope tutorCourses(Long tutorId) {
+        return scope(tutors, tutorId, id -> CourseScope.of(tutorAssignmentRepository.findByTutorId(id).stream()
+            .map(TutorAssignment::getCourseId)
+            .toList()));
+    }
+
+    public boolean isLecturerAssigned(Long lecturerId, Long courseId) {
+        return lecturerCourses(lecturerId).contains(courseId);
+    }
+
+    public boolean isTutorAssigned(Long tutorId, Long courseId) {
+        return tutorCourses(tutorId).contains(courseId);
+    }
+
+    /**
+     * Drop a lecturer's scope on this instance and every other one
+     *
+     * @param lecturerId lecturer whose assignments changed
+     */
+    public void evictLecturer(Long lecturerId) {
+        evict(lecturers, lecturerId);
+        notifyPeers(LECTURER_PREFIX + lecturerId);
+    }
+
+    /**
+     * Drop a tutor's scope on this instance and every other one
+     *
+     * @param tutorId tutor whose assignments changed
+     */
+    public void evictTutor(Long tutorId) {
+        evict(tutors, tutorId);
+        notifyPeers(TUTOR_PREFIX + tutorId);
+    }
+
+    /**
+     * Drop every scope on this instance and every other one, e.g. after a bulk write
+     */
+    public void evictAll() {
+        clearLocally();
+        afterCommit(this::clearLocally);
+        notifyPeers(ALL);
+    }
+
+    public int size() {
+        return lecturers.size() + tutors.size();
+    }
+
+    @Override
+    public String channel() {
+        return CHANNEL;
+    }
+
+    @Override
+    public void onNotification(String payload) {
+        applyRemoteInvalidation(payload);
+    }
+
+    @Override
+    public void resync() {
+        clearLocally();
+    }
+
+    /**
+     * Apply an invalidation received from another instance
+     */
+    void applyRemoteInvalidation(String payload) {
+        if (payload == null) {
+            return;
+        }
+        try {
+            if (payload.startsWith(LECTURER_PREFIX)) {
+                evictLocally(lecturers, Long.valueOf(payload.substring(LECTURER_PREFIX.length())));
+            } else if (payload.startsWith(TUTOR_PREFIX)) {
+                evictLocally(tutors, Long.valueOf(payload.substring(TUTOR_PREFIX.length())));
+            } else {
+                clearLocally();
+            }
+        } catch (NumberFormatException e) {
+            clearLocally();
+        }
+    }
+
+    void clearLocally() {
+        generation.incrementAndGet();
+        lecturers.clear();
+        tutors.clear();
+    }
+
+    private CourseScope scope(Map<Long, Entry> entries, Long userId, Function<Long, CourseScope> loader) {
+        if (userId == null) {
+            return CourseScope.EMPTY;
+        }
+        Instant now = clock.instant();
+        long version = ChangeVersionListener.assignmentVersion(userId);
+        Entry cached = entries.get(userId);
+        if (cached != null && cached.version() == version && now.isBefore(cached.expiresAt())) {
+            return cached.scope();
+        }
+
+        long observed = generation.get();
+        CourseScope loaded = loader.apply(userId);
+        // compute() serialises with evictLocally() on the same key, so a concurrent eviction wins
+        entries.compute(userId, (id, current) -> generation.get() == observed
+            ? new Entry(loaded, version, now.plus(ttl))
+            : current);
+        return loaded;
+    }
+
+    private void evict(Map<Long, Entry> entries, Long userId) {
+        if (userId == null) {
+            return;
+        }
+        evictLocally(entries, userId);
+        afterCommit(() -> evictLocally(entries, userId));
+    }
+
+    private void evictLocally(Map<Long, Entry> entries, Long userId) {
+        generation.incrementAndGet();
+        entries.compute(userId, (id, current) -> null);
+    }
+
+    private void notifyPeers(String payload) {
+        // Null only in unit tests that exercise a single instance
+        if (jdbcTemplate == null || !isPostgres()) {
+            return;
+        }
+        try {
+            // NOTIFY is transactional: peers hear about the write only once it commits
+            jdbcTemplate.query("SELECT pg_notify(?, ?)", rs -> null, CHANNEL, payload);
+        } catch (DataAccessException e) {
+            logger.warn("Could not notify peers of course scope change {}: {}", payload, e.getMessage());
+        }
+    }
+
+    private boolean isPostgres() {
+        Boolean known = postgres;
+        if (known == null) {
+            try {
+                known = jdbcTemplate.execute((ConnectionCallback<Boolean>) connection ->
+                    "PostgreSQL".equalsIgnoreCase(connection.getMetaData().getDatabaseProductName()));
+            } catch (DataAccessException e) {
+                return false;
+            }
+            postgres = known;
+        }
+        return Boolean.TRUE.equals(known);
+    }
+
+    private static void afterCommit(Runnable action) {
+        if (TransactionSynchronizationManager.isSynchronizationActive()) {
+            TransactionSynchronizationManager.registerSynchronization(new TransactionSynchronization() {
+                @Override
+                public void afterCommit() {
+                    action.run();
+                }
+            });
+        }
+    }
+
+    private record Entry(CourseScope scope, long version, Instant expiresAt) {
+    }
+
+    /**
+     * Immutable set of course ids held as a sorted {@code long[]}
+     */
+    public static final class CourseScope {
+
+        static final CourseScope EMPTY = new CourseScope(new long[0]);
+
+        private final long[] courseIds;
+
+        private CourseScope(long[] courseIds) {
+            this.courseIds = courseIds;
+        }
+
+        static CourseScope of(Collection<Long> courseIds) {
+            long[] ids = courseIds.stream()
+                .filter(Objects::nonNull)
+                .mapToLong(Long::longValue)
+                .distinct()
+                .sorted()
+                .toArray();
+            return ids.length == 0 ? EMPTY : new CourseScope(ids);
+        }
+
+        public boolean contains(Long courseId) {
+            return courseId != null && Arrays.binarySearch(courseIds, courseId) >= 0;
+        }
+
+        public boolean isEmpty() {
+            return courseIds.length == 0;
+        }
+
+        public int size() {
+            return courseIds.length;
+        }
+
+        /**
+         * Course ids in ascending order, as a fresh list for query parameters
+         */
+        public List<Long> toList() {
+            return Arrays.stream(courseIds).boxed().toList();
+        }
+
+        public Set<Long> toSet() {
+            return Arrays.stream(courseIds).boxed().collect(Collectors.toUnmodifiableSet());
+        }
+    }
+}
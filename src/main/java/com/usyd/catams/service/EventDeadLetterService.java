@@ -0,0 +1,87 @@
+package com.usyd.catams.service;
+
+import com.usyd.catams.common.domain.event.DomainEvent;
+import com.usyd.catams.common.infrastructure.event.DomainEventPublisher;
+import com.usyd.catams.common.infrastructure.event.EventDeadLetterStore;
+import com.usyd.catams.dto.response.DeadLetteredEventResponse;
+import com.usyd.catams.exception.BusinessConflictException;
+import com.usyd.catams.exception.ErrorCodes;
+import com.usyd.catams.exception.ResourceNotFoundException;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+
+import java.io.IOException;
+import java.time.LocalDateTime;
+import java.util.List;
+
+/**
+ * Inspection and replay of dead-lettered domain events.
+ *
+ * A replay re-publishes the stored event inside this service's transaction, so with the outbox
+ * enabled it is queued for the drainer and the dead-letter row is marked replayed atomically.
+ * Events dead-lettered by the drainer still have their outbox row, which is reopened.
+ */
+@Service
+@Transactional
+public class EventDeadLetterService {
+
+    private static final Logger logger = LoggerFactory.getLogger(EventDeadLetterService.class);
+
+    private final EventDeadLetterStore deadLetterStore;
+    private final DomainEventPublisher domainEventPublisher;
+
+    public EventDeadLetterService(EventDeadLetterStore deadLetterStore, DomainEventPublisher domainEventPublisher) {
+        this.deadLetterStore = deadLetterStore;
+        this.domainEventPublisher = domainEventPublisher;
+    }
+
+    @Transactional(readOnly = true)
+    public List<DeadLetteredEventResponse> listPending(int limit) {
+        return deadLetterStore.findPending(limit).stream()
+            .map(EventDeadLetterService::toResponse)
+            .toList();
+    }
+
+    public DeadLetteredEventResponse replay(long id) {
+        EventDeadLetterStore.LockedDeadLetter locked = deadLetterStore.lockForReplay(id)
+            .orElseThrow(() -> new ResourceNotFoundException("DeadLetteredEvent", String.valueOf(id)));
+        EventDeadLetterStore.DeadLetter deadLetter = locked.deadLetter();
+        if (deadLetter.isReplayed()) {
+            throw new BusinessConflictException(ErrorCodes.RESOURCE_INVALID_STATE,
+                "Dead-lettered event " + id + " was already replayed at " + deadLetter.replayedAt());
+        }
+
+        DomainEvent event;
+        try {
+            event = locked.readEvent();
+        } catch (IOException | ClassNotFoundException | ClassCastException e) {
+            throw new BusinessConflictException(ErrorCodes.RESOURCE_INVALID_STATE,
+                "Dead-lettered event " + id + " cannot be read: " + e.getMessage());
+        }
+
+        domainEventPublisher.republish(event);
+        deadLetterStore.markReplayed(id);
+        logger.info("Replayed dead-lettered event: id={}, eventId={}, type={}",
+            id, deadLetter.eventId(), deadLetter.eventType());
+
+        DeadLetteredEventResponse response = toResponse(deadLetter);
+        response.setReplayedAt(LocalDateTime.now());
+        return response;
+    }
+
+    private static DeadLetteredEventResponse toResponse(EventDeadLetterStore.DeadLetter deadLetter) {
+        return new DeadLetteredEventResponse(
+            deadLetter.id(),
+            deadLetter.eventId(),
+            deadLetter.eventType(),
+            deadLetter.aggregateType(),
+            deadLetter.aggregateId(),
+            deadLetter.source(),
+            deadLetter.attempts(),
+            deadLetter.lastError(),
+            deadLetter.deadLetteredAt(),
+            deadLetter.replayedAt());
+    }
+}
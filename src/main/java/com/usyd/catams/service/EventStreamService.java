@@ -0,0 +1,320 @@
+package com.usyd.catams.service;
+
+import com.usyd.catams.common.domain.event.CourseEvent;
+import com.usyd.catams.common.domain.event.TimesheetEvent;
+import com.usyd.catams.enums.UserRole;
+import io.micrometer.core.instrument.Gauge;
+import io.micrometer.core.instrument.MeterRegistry;
+import jakarta.annotation.PreDestroy;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+import org.springframework.beans.factory.annotation.Value;
+import org.springframework.http.MediaType;
+import org.springframework.scheduling.annotation.Scheduled;
+import org.springframework.stereotype.Service;
+import org.springframework.web.servlet.mvc.method.annotation.SseEmitter;
+
+import java.io.IOException;
+import java.time.Duration;
+import java.util.Arrays;
+import java.util.Comparator;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.Objects;
+import java.util.Set;
+import java.util.UUID;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.regex.Pattern;
+import java.util.stream.Collectors;
+
+/**
+ * Server-sent event feed that tells open dashboards when their data changed.
+ *
+ * Each subscriber is scoped when it connects: tutors see their own timesheets, lecturers the
+ * courses they are assigned to, administrators everything. Domain events are turned into two
+ * notifications, {@value #TIMESHEET_CHANGED} and {@value #SUMMARY_INVALIDATED}; they carry ids
+ * only, and clients refetch through the regular endpoints (which answer 304 when nothing in their
+ * scope moved). A lecturer's course set is read once per connection, so assignment changes apply
+ * when the client reconnects after {@code app.events.stream.timeout}. A bulk import arrives as one
+ * course-level change that names the tutors whose timesheets it created.
+ *
+ * A domain event is handled on one instance only, while its subscribers may be connected to any
+ * of them. The handling instance therefore forwards each change as a Postgres {@code NOTIFY} on
+ * {@value #CHANNEL} (see {@link PeerNotificationListener}), and every other instance pushes it to
+ * its own subscribers. Messages carry the sender's node id so the sender skips its own.
+ */
+@Service
+public class EventStreamService implements PeerNotificationHandler {
+
+    private static final Logger logger = LoggerFactory.getLogger(EventStreamService.class);
+
+    public static final String TIMESHEET_CHANGED = "timesheet-changed";
+    public static final String SUMMARY_INVALIDATED = "summary-invalidated";
+
+    public static final String CHANNEL = "event_stream_changed";
+
+    private static final long RECONNECT_DELAY_MS = 5_000;
+
+    // Payload: node|kind|fields..., with ids that never contain the separator
+    private static final String SEPARATOR = "|";
+    private static final String TIMESHEET_KIND = "timesheet";
+    private static final String COURSE_KIND = "course";
+    private static final String IMPORT_KIND = "import";
+    private static final String ID_SEPARATOR = ",";
+
+    // Keeps each import message well under the 8000-byte NOTIFY payload limit
+    private static final int IMPORT_TUTORS_PER_MESSAGE = 200;
+
+    private final CourseScopeCache courseScopeCache;
+    private final PeerNotificationPublisher peerNotificationPublisher;
+    private final String nodeId = UUID.randomUUID().toString();
+    private final Duration timeout;
+    private final int maxConnectionsPerUser;
+    private final Set<Subscriber> subscribers = ConcurrentHashMap.newKeySet();
+
+    public EventStreamService(CourseScopeCache courseScopeCache,
+                              PeerNotificationPublisher peerNotificationPublisher,
+                              MeterRegistry meterRegistry,
+                              @Value("${app.events.stream.timeout:PT30M}") Duration timeout,
+                              @Value("${app.events.stream.max-connections-per-user:5}") int maxConnectionsPerUser) {
+        if (maxConnectionsPerUser <= 0) {
+            throw new IllegalArgumentException("Event stream connection limit must be positive");
+        }
+        this.courseScopeCache = courseScopeCache;
+        this.peerNotificationPublisher = peerNotificationPublisher;
+        this.timeout = timeout;
+        this.maxConnectionsPerUser = maxConnectionsPerUser;
+        Gauge.builder("domain.events.stream.subscribers", subscribers, Set::size)
+            .description("Open server-sent event connections")
+            .register(meterRegistry);
+    }
+
+    /**
+     * Open a stream for the caller. When the caller already holds the maximum number of
+     * connections, the oldest one is closed.
+     */
+    public SseEmitter subscribe(Long userId, UserRole role) {
+        Set<Long> courseIds = role == UserRole.LECTURER
+            ? courseScopeCache.lecturerCourses(userId).toSet()
+            : Set.of();
+
+        SseEmitter emitter = new SseEmitter(timeout.toMillis());
+        Subscriber subscriber = new Subscriber(userId, role, courseIds, emitter, System.nanoTime());
+        emitter.onCompletion(() -> subscribers.remove(subscriber));
+        emitter.onTimeout(() -> subscribers.remove(subscriber));
+        emitter.onError(error -> subscribers.remove(subscriber));
+
+        evictOldestBeyondLimit(userId);
+        subscribers.add(subscriber);
+        try {
+            emitter.send(SseEmitter.event().comment("connected").reconnectTime(RECONNECT_DELAY_MS));
+        } catch (IOException | IllegalStateException e) {
+            drop(subscriber);
+        }
+        logger.debug("Event stream opened: userId={}, role={}, courses={}", userId, role, courseIds.size());
+        return emitter;
+    }
+
+    /**
+     * Notify every subscriber, on this instance and the others, that can see the timesheet.
+     */
+    public void timesheetChanged(TimesheetEvent event) {
+        pushTimesheetChange(event.getAggregateId(), event.getTutorId(), event.getCourseId(), event.getEventType());
+        notifyPeers(TIMESHEET_KIND, event.getAggregateId(), event.getTutorId(), event.getCourseId(),
+            event.getEventType());
+    }
+
+    /**
+     * Course changes (budget, activation) only affect summaries, except a bulk import, which
+     * changes timesheets of the course and of each imported tutor.
+     */
+    public void courseChanged(CourseEvent event) {
+        Long courseId = parseId(event.getAggregateId());
+        if (event instanceof CourseEvent.CourseTimesheetsImportedEvent imported) {
+            importChanged(courseId, imported.getTutorIds(), imported.getEventType());
+            return;
+        }
+        pushCourseChange(courseId);
+        notifyPeers(COURSE_KIND, courseId);
+    }
+
+    @Override
+    public String channel() {
+        return CHANNEL;
+    }
+
+    /**
+     * Push a change another instance handled to the subscribers connected here
+     */
+    @Override
+    public void onNotification(String payload) {
+        if (payload == null) {
+            return;
+        }
+        String[] parts = payload.split(Pattern.quote(SEPARATOR), -1);
+        if (parts.length < 2 || nodeId.equals(parts[0])) {
+            return;
+        }
+        if (TIMESHEET_KIND.equals(parts[1]) && parts.length == 6) {
+            pushTimesheetChange(parts[2], parseId(parts[3]), parseId(parts[4]), parts[5]);
+        } else if (COURSE_KIND.equals(parts[1]) && parts.length == 3) {
+            pushCourseChange(parseId(parts[2]));
+        } else if (IMPORT_KIND.equals(parts[1]) && parts.length == 6) {
+            pushImportChange(parseId(parts[2]), parseIds(parts[5]), parts[3], Boolean.parseBoolean(parts[4]));
+        }
+    }
+
+    /**
+     * Nothing to catch up on: clients refetch when they reconnect
+     */
+    @Override
+    public void resync() {
+    }
+
+    /**
+     * Close every open stream, e.g. on shutdown; clients reconnect to another instance
+     */
+    @PreDestroy
+    public void closeAll() {
+        subscribers.forEach(this::drop);
+    }
+
+    /**
+     * Comment frame that keeps idle connections open through proxies and detects dead clients.
+     */
+    @Scheduled(fixedDelayString = "${app.events.stream.heartbeat-interval:PT25S}")
+    public void heartbeat() {
+        for (Subscriber subscriber : subscribers) {
+            try {
+                subscriber.emitter().send(SseEmitter.event().comment("heartbeat"));
+            } catch (IOException | IllegalStateException e) {
+                drop(subscriber);
+            }
+        }
+    }
+
+    public int getSubscriberCount() {
+        return subscribers.size();
+    }
+
+    private void pushTimesheetChange(String timesheetId, Long tutorId, Long courseId, String eventType) {
+        Map<String, Object> change = new LinkedHashMap<>();
+        change.put("timesheetId", timesheetId);
+        change.put("tutorId", tutorId);
+        change.put("courseId", courseId);
+        change.put("eventType", eventType);
+        Map<String, Object> invalidation = new LinkedHashMap<>();
+        invalidation.put("courseId", courseId);
+
+        for (Subscriber subscriber : subscribers) {
+            if (subscriber.canSee(tutorId, courseId)) {
+                send(subscriber, TIMESHEET_CHANGED, change);
+                send(subscriber, SUMMARY_INVALIDATED, invalidation);
+            }
+        }
+    }
+
+    private void importChanged(Long courseId, List<Long> tutorIds, String eventType) {
+        pushImportChange(courseId, Set.copyOf(tutorIds), eventType, true);
+        // Long tutor lists are split; only the first message also reaches course-wide subscribers
+        for (int from = 0; from == 0 || from < tutorIds.size(); from += IMPORT_TUTORS_PER_MESSAGE) {
+            List<Long> chunk = tutorIds.subList(from, Math.min(from + IMPORT_TUTORS_PER_MESSAGE, tutorIds.size()));
+            notifyPeers(IMPORT_KIND, courseId, eventType, from == 0,
+                chunk.stream().map(String::valueOf).collect(Collectors.joining(ID_SEPARATOR)));
+        }
+    }
+
+    private void pushImportChange(Long courseId, Set<Long> tutorIds, String eventType, boolean courseWide) {
+        Map<String, Object> change = new LinkedHashMap<>();
+        change.put("timesheetId", null);
+        change.put("tutorId", null);
+        change.put("courseId", courseId);
+        change.put("eventType", eventType);
+        Map<String, Object> invalidation = new LinkedHashMap<>();
+        invalidation.put("courseId", courseId);
+
+        for (Subscriber subscriber : subscribers) {
+            if ((courseWide && subscriber.canSee(null, courseId)) || tutorIds.contains(subscriber.userId())) {
+                send(subscriber, TIMESHEET_CHANGED, change);
+                send(subscriber, SUMMARY_INVALIDATED, invalidation);
+            }
+        }
+    }
+
+    private void pushCourseChange(Long courseId) {
+        Map<String, Object> invalidation = new LinkedHashMap<>();
+        invalidation.put("courseId", courseId);
+
+        for (Subscriber subscriber : subscribers) {
+            if (subscriber.role() == UserRole.ADMIN
+                    || (courseId != null && subscriber.courseIds().contains(courseId))) {
+                send(subscriber, SUMMARY_INVALIDATED, invalidation);
+            }
+        }
+    }
+
+    private void notifyPeers(String kind, Object... fields) {
+        StringBuilder payload = new StringBuilder(nodeId).append(SEPARATOR).append(kind);
+        for (Object field : fields) {
+            payload.append(SEPARATOR).append(Objects.toString(field, ""));
+        }
+        peerNotificationPublisher.notifyPeers(CHANNEL, payload.toString());
+    }
+
+    private void send(Subscriber subscriber, String name, Map<String, Object> data) {
+        try {
+            subscriber.emitter().send(SseEmitter.event().name(name).data(data, MediaType.APPLICATION_JSON));
+        } catch (IOException | IllegalStateException e) {
+            logger.debug("Dropping event stream for user {}: {}", subscriber.userId(), e.getMessage());
+            drop(subscriber);
+        }
+    }
+
+    private void evictOldestBeyondLimit(Long userId) {
+        while (true) {
+            var own = subscribers.stream().filter(s -> s.userId().equals(userId)).toList();
+            if (own.size() < maxConnectionsPerUser) {
+                return;
+            }
+            own.stream().min(Comparator.comparingLong(Subscriber::openedAt)).ifPresent(this::drop);
+        }
+    }
+
+    private void drop(Subscriber subscriber) {
+        if (subscribers.remove(subscriber)) {
+            try {
+                subscriber.emitter().complete();
+            } catch (IllegalStateException ignored) {
+                // Already completed by the container
+            }
+        }
+    }
+
+    private static Long parseId(String aggregateId) {
+        try {
+            return aggregateId == null || aggregateId.isEmpty() ? null : Long.valueOf(aggregateId);
+        } catch (NumberFormatException e) {
+            return null;
+        }
+    }
+
+    private static Set<Long> parseIds(String ids) {
+        return Arrays.stream(ids.split(ID_SEPARATOR))
+            .map(EventStreamService::parseId)
+            .filter(Objects::nonNull)
+            .collect(Collectors.toSet());
+    }
+
+    private record Subscriber(Long userId, UserRole role, Set<Long> courseIds, SseEmitter emitter, long openedAt) {
+
+        boolean canSee(Long tutorId, Long courseId) {
+            return switch (role) {
+                case ADMIN -> true;
+                case LECTURER -> courseId != null && courseIds.contains(courseId);
+                case TUTOR -> userId.equals(tutorId);
+                case HR -> false;
+            };
+        }
+    }
+}
@@ -0,0 +1,372 @@
+package com.usyd.catams.service;
+
+import com.fasterxml.jackson.core.JsonGenerator;
+import com.fasterxml.jackson.databind.ObjectMapper;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+import org.springframework.http.MediaType;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.jdbc.core.RowCallbackHandler;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.PlatformTransactionManager;
+import org.springframework.transaction.support.TransactionTemplate;
+
+import javax.sql.DataSource;
+import java.io.BufferedWriter;
+import java.io.IOException;
+import java.io.OutputStream;
+import java.io.OutputStreamWriter;
+import java.io.UncheckedIOException;
+import java.io.Writer;
+import java.math.BigDecimal;
+import java.nio.charset.StandardCharsets;
+import java.sql.Date;
+import java.sql.ResultSet;
+import java.sql.SQLException;
+import java.time.LocalDate;
+
+/**
+ * Payroll export of final-confirmed timesheets, grouped by Schedule 1 rate code.
+ *
+ * Rows are read through a forward-only JDBC cursor (fetch size {@value #FETCH_SIZE}) inside a
+ * read-only transaction and written to the output as they arrive, so memory does not grow
+ * with the size of the export. The query is ordered by rate code; a subtotal is emitted each
+ * time the rate code changes and a grand total at the end.
+ */
+@Service
+public class PayrollExportService {
+
+    private static final Logger logger = LoggerFactory.getLogger(PayrollExportService.class);
+
+    // PostgreSQL only uses a server-side cursor when autocommit is off and a fetch size is set
+    static final int FETCH_SIZE = 1000;
+
+    static final String UNCODED = "UNCODED";
+
+    private static final String EXPORT_SQL =
+        "SELECT t.id, t.tutor_id, u.name AS tutor_name, u.email_value AS tutor_email, c.code_value AS course_code, " +
+        "t.week_start_date, t.session_date, t.task_type, t.qualification, t.is_repeat, t.rate_code, " +
+        "t.delivery_hours, t.associated_hours, t.hours, t.hourly_rate, t.calculated_amount " +
+        "FROM timesheets t " +
+        "JOIN users u ON u.id = t.tutor_id " +
+        "JOIN courses c ON c.id = t.course_id " +
+        "WHERE t.status = 'FINAL_CONFIRMED' AND t.week_start_date BETWEEN ? AND ? " +
+        "ORDER BY t.rate_code NULLS LAST, t.week_start_date, t.id";
+
+    public enum Format {
+        CSV(new MediaType("text", "csv", StandardCharsets.UTF_8), "csv"),
+        NDJSON(new MediaType("application", "x-ndjson", StandardCharsets.UTF_8), "ndjson");
+
+        private final MediaType mediaType;
+        private final String extension;
+
+        Format(MediaType mediaType, String extension) {
+            this.mediaType = mediaType;
+            this.extension = extension;
+        }
+
+        public MediaType getMediaType() {
+            return mediaType;
+        }
+
+        public String getExtension() {
+            return extension;
+        }
+    }
+
+    private final JdbcTemplate jdbcTemplate;
+    private final TransactionTemplate readOnlyTransaction;
+    private final ObjectMapper objectMapper;
+
+    public PayrollExportService(DataSource dataSource,
+                                PlatformTransactionManager transactionManager,
+                                ObjectMapper objectMapper) {
+        this.jdbcTemplate = new JdbcTemplate(dataSource);
+        this.jdbcTemplate.setFetchSize(FETCH_SIZE);
+        this.readOnlyTransaction = new TransactionTemplate(transactionManager);
+        this.readOnlyTransaction.setReadOnly(true);
+        this.objectMapper = objectMapper;
+    }
+
+    /**
+     * Write the export for timesheets whose week starts between {@code from} and {@code to}
+     * (inclusive). The stream is flushed but not closed.
+     *
+     * @return number of detail rows written
+     */
+    public long export(LocalDate from, LocalDate to, Format format, OutputStream output) {
+        Writer writer = new BufferedWriter(new OutputStreamWriter(output, StandardCharsets.UTF_8));
+        try (ExportSink sink = format == Format.NDJSON ? new NdjsonSink(objectMapper, writer) : new CsvSink(writer)) {
+            GroupingHandler handler = new GroupingHandler(sink);
+            readOnlyTransaction.executeWithoutResult(status ->
+                jdbcTemplate.query(EXPORT_SQL, handler, Date.valueOf(from), Date.valueOf(to)));
+            handler.finish();
+            logger.info("Payroll export written: from={}, to={}, format={}, rows={}", from, to, format, handler.grand.count);
+            return handler.grand.count;
+        } catch (IOException e) {
+            throw new UncheckedIOException("Payroll export failed while writing", e);
+        }
+    }
+
+    /**
+     * Folds the ordered rows into rate-code groups, emitting a subtotal whenever the code changes.
+     */
+    private static final class GroupingHandler implements RowCallbackHandler {
+        private final ExportSink sink;
+        private final Totals grand = new Totals(null);
+        private Totals group;
+
+        GroupingHandler(ExportSink sink) {
+            this.sink = sink;
+        }
+
+        @Override
+        public void processRow(ResultSet rs) throws SQLException {
+            PayrollRow row = PayrollRow.from(rs);
+            try {
+                if (group != null && !group.rateCode.equals(row.rateCode())) {
+                    sink.subtotal(group);
+                    group = null;
+                }
+                if (group == null) {
+                    group = new Totals(row.rateCode());
+                }
+                group.add(row);
+                grand.add(row);
+                sink.detail(row);
+            } catch (IOException e) {
+                throw new UncheckedIOException(e);
+            }
+        }
+
+        void finish() throws IOException {
+            if (group != null) {
+                sink.subtotal(group);
+            }
+            sink.total(grand);
+        }
+    }
+
+    record PayrollRow(long timesheetId, long tutorId, String tutorName, String tutorEmail, String courseCode,
+                      LocalDate weekStartDate, LocalDate sessionDate, String taskType, String qualification,
+                      boolean repeat, String rateCode, BigDecimal deliveryHours, BigDecimal associatedHours,
+                      BigDecimal payableHours, BigDecimal hourlyRate, BigDecimal amount) {
+
+        static PayrollRow from(ResultSet rs) throws SQLException {
+            String rateCode = rs.getString("rate_code");
+            Date sessionDate = rs.getDate("session_date");
+            return new PayrollRow(
+                rs.getLong("id"),
+                rs.getLong("tutor_id"),
+                rs.getString("tutor_name"),
+                rs.getString("tutor_email"),
+                rs.getString("course_code"),
+                rs.getDate("week_start_date").toLocalDate(),
+                sessionDate != null ? sessionDate.toLocalDate() : null,
+                rs.getString("task_type"),
+                rs.getString("qualification"),
+                rs.getBoolean("is_repeat"),
+                rateCode != null ? rateCode : UNCODED,
+                rs.getBigDecimal("delivery_hours"),
+                rs.getBigDecimal("associated_hours"),
+                rs.getBigDecimal("hours"),
+                rs.getBigDecimal("hourly_rate"),
+                rs.getBigDecimal("calculated_amount"));
+        }
+    }
+
+    static final class Totals {
+        private final String rateCode;
+        private long count;
+        private BigDecimal deliveryHours = BigDecimal.ZERO;
+        private BigDecimal associatedHours = BigDecimal.ZERO;
+        private BigDecimal payableHours = BigDecimal.ZERO;
+        private BigDecimal amount = BigDecimal.ZERO;
+
+        Totals(String rateCode) {
+            this.rateCode = rateCode;
+        }
+
+        void add(PayrollRow row) {
+            count++;
+            deliveryHours = deliveryHours.add(orZero(row.deliveryHours()));
+            associatedHours = associatedHours.add(orZero(row.associatedHours()));
+            payableHours = payableHours.add(orZero(row.payableHours()));
+            amount = amount.add(orZero(row.amount()));
+        }
+
+        private static BigDecimal orZero(BigDecimal value) {
+            return value != null ? value : BigDecimal.ZERO;
+        }
+    }
+
+    private interface ExportSink extends AutoCloseable {
+        void detail(PayrollRow row) throws IOException;
+
+        void subtotal(Totals totals) throws IOException;
+
+        void total(Totals totals) throws IOException;
+
+        @Override
+        void close() throws IOException;
+    }
+
+    /**
+     * One CSV table; {@code record_type} distinguishes DETAIL, SUBTOTAL and TOTAL lines.
+     */
+    private static final class CsvSink implements ExportSink {
+        private static final String HEADER = "record_type,rate_code,timesheet_id,tutor_id,tutor_name,tutor_email,"
+            + "course_code,week_start_date,session_date,task_type,qualification,is_repeat,"
+            + "timesheet_count,delivery_hours,associated_hours,payable_hours,hourly_rate,amount";
+
+        // Leading characters that make spreadsheet applications treat a cell as a formula
+        private static final String FORMULA_PREFIXES = "=+-@\t\r";
+
+        private final Writer writer;
+
+        CsvSink(Writer writer) throws IOException {
+            this.writer = writer;
+            writer.write(HEADER);
+            writer.write('\n');
+        }
+
+        @Override
+        public void detail(PayrollRow row) throws IOException {
+            line("DETAIL", row.rateCode(), row.timesheetId(), row.tutorId(), row.tutorName(), row.tutorEmail(),
+                row.courseCode(), row.weekStartDate(), row.sessionDate(), row.taskType(), row.qualification(),
+                row.repeat(), 1, row.deliveryHours(), row.associatedHours(), row.payableHours(),
+                row.hourlyRate(), row.amount());
+        }
+
+        @Override
+        public void subtotal(Totals totals) throws IOException {
+            summary("SUBTOTAL", totals.rateCode, totals);
+        }
+
+        @Override
+        public void total(Totals totals) throws IOException {
+            summary("TOTAL", null, totals);
+        }
+
+        private void summary(String type, String rateCode, Totals totals) throws IOException {
+            line(type, rateCode, null, null, null, null, null, null, null, null, null, null,
+                totals.count, totals.deliveryHours, totals.associatedHours, totals.payableHours, null, totals.amount);
+        }
+
+        private void line(Object... values) throws IOException {
+            for (int i = 0; i < values.length; i++) {
+                if (i > 0) {
+                    writer.write(',');
+                }
+                writer.write(escape(values[i]));
+            }
+            writer.write('\n');
+        }
+
+        /**
+         * Quote per RFC 4180. Text that a spreadsheet would evaluate as a formula gets a leading
+         * apostrophe (OWASP CSV injection guidance); numbers are written as they are.
+         */
+        private static String escape(Object value) {
+            if (value == null) {
+                return "";
+            }
+            String text = value instanceof BigDecimal decimal ? decimal.toPlainString() : value.toString();
+            if (!(value instanceof Number) && !text.isEmpty() && FORMULA_PREFIXES.indexOf(text.charAt(0)) >= 0) {
+                text = "'" + text;
+            }
+            if (text.indexOf(',') < 0 && text.indexOf('"') < 0 && text.indexOf('\n') < 0 && text.indexOf('\r') < 0) {
+                return text;
+            }
+            return '"' + text.replace("\"", "\"\"") + '"';
+        }
+
+        @Override
+        public void close() throws IOException {
+            writer.flush();
+        }
+    }
+
+    /**
+     * One JSON object per line; {@code type} is detail, subtotal or total.
+     */
+    private static final class NdjsonSink implements ExportSink {
+        private final Writer writer;
+        private final JsonGenerator json;
+
+        NdjsonSink(ObjectMapper objectMapper, Writer writer) throws IOException {
+            this.writer = writer;
+            this.json = objectMapper.getFactory().createGenerator(writer);
+            this.json.disable(JsonGenerator.Feature.AUTO_CLOSE_TARGET);
+            // Per-line flushes only move bytes into the buffered writer, not onto the socket
+            this.json.disable(JsonGenerator.Feature.FLUSH_PASSED_TO_STREAM);
+        }
+
+        @Override
+        public void detail(PayrollRow row) throws IOException {
+            json.writeStartObject();
+            json.writeStringField("type", "detail");
+            json.writeStringField("rateCode", row.rateCode());
+            json.writeNumberField("timesheetId", row.timesheetId());
+            json.writeNumberField("tutorId", row.tutorId());
+            json.writeStringField("tutorName", row.tutorName());
+            json.writeStringField("tutorEmail", row.tutorEmail());
+            json.writeStringField("courseCode", row.courseCode());
+            json.writeStringField("weekStartDate", row.weekStartDate().toString());
+            json.writeStringField("sessionDate", row.sessionDate() != null ? row.sessionDate().toString() : null);
+            json.writeStringField("taskType", row.taskType());
+            json.writeStringField("qualification", row.qualification());
+            json.writeBooleanField("isRepeat", row.repeat());
+            writeDecimal("deliveryHours", row.deliveryHours());
+            writeDecimal("associatedHours", row.associatedHours());
+            writeDecimal("payableHours", row.payableHours());
+            writeDecimal("hourlyRate", row.hourlyRate());
+            writeDecimal("amount", row.amount());
+            endLine();
+        }
+
+        @Override
+        public void subtotal(Totals totals) throws IOException {
+            summary("subtotal", totals);
+        }
+
+        @Override
+        public void total(Totals totals) throws IOException {
+            summary("total", totals);
+        }
+
+        private void summary(String type, Totals totals) throws IOException {
+            json.writeStartObject();
+            json.writeStringField("type", type);
+            if (totals.rateCode != null) {
+                json.writeStringField("rateCode", totals.rateCode);
+            }
+            json.writeNumberField("timesheetCount", totals.count);
+            writeDecimal("deliveryHours", totals.deliveryHours);
+            writeDecimal("associatedHours", totals.associatedHours);
+            writeDecimal("payableHours", totals.payableHours);
+            writeDecimal("amount", totals.amount);
+            endLine();
+        }
+
+        private void writeDecimal(String name, BigDecimal value) throws IOException {
+            if (value == null) {
+                json.writeNullField(name);
+            } else {
+                json.writeNumberField(name, value);
+            }
+        }
+
+        private void endLine() throws IOException {
+            json.writeEndObject();
+            json.flush();
+            writer.write('\n');
+        }
+
+        @Override
+        public void close() throws IOException {
+            json.close();
+            writer.flush();
+        }
+    }
+}
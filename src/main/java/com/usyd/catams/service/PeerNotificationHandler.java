@@ -0,0 +1,23 @@
+package com.usyd.catams.service;
+
+/**
+ * Receiver of Postgres {@code NOTIFY} messages that other instances send on one channel
+ *
+ * Implementations are picked up by {@link PeerNotificationListener}. Senders use
+ * {@code SELECT pg_notify(channel, payload)} inside the writing transaction, so a message only
+ * arrives if that write commits.
+ */
+public interface PeerNotificationHandler {
+
+    /**
+     * Channel to {@code LISTEN} on; a plain lower-case identifier
+     */
+    String channel();
+
+    void onNotification(String payload);
+
+    /**
+     * Called on every (re)connect, since messages sent while disconnected are lost
+     */
+    void resync();
+}
@@ -0,0 +1,134 @@
+package com.usyd.catams.service;
+
+import org.postgresql.PGConnection;
+import org.postgresql.PGNotification;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+import org.springframework.beans.factory.annotation.Value;
+import org.springframework.context.SmartLifecycle;
+import org.springframework.stereotype.Component;
+
+import javax.sql.DataSource;
+import java.sql.Connection;
+import java.sql.SQLException;
+import java.sql.Statement;
+import java.util.List;
+import java.util.Map;
+import java.util.function.Function;
+import java.util.stream.Collectors;
+
+/**
+ * Background worker that delivers messages published by other instances
+ *
+ * Holds one connection from the pool with {@code LISTEN} on the channel of every
+ * {@link PeerNotificationHandler} (course scope invalidations, change versions, live update
+ * pushes) and hands each notification to its handler. Notifications sent while the listener is
+ * disconnected are lost, so every (re)connect asks each handler to resync. Does nothing when the
+ * datasource is not Postgres (the H2 test profile) or {@code app.cluster.listen} is false; each
+ * handler's own fallback (cache TTLs, per-instance epochs) then bounds cross-instance staleness.
+ */
+@Component
+public class PeerNotificationListener implements SmartLifecycle {
+
+    private static final Logger logger = LoggerFactory.getLogger(PeerNotificationListener.class);
+
+    private static final int POLL_TIMEOUT_MS = 5_000;
+    private static final long MAX_BACKOFF_MS = 60_000;
+
+    private final DataSource dataSource;
+    private final Map<String, PeerNotificationHandler> handlers;
+    private final boolean enabled;
+
+    private volatile boolean running;
+    private Thread worker;
+
+    public PeerNotificationListener(DataSource dataSource,
+                                    List<PeerNotificationHandler> handlers,
+                                    @Value("${app.cluster.listen:true}") boolean enabled) {
+        this.dataSource = dataSource;
+        this.handlers = handlers.stream()
+            .collect(Collectors.toUnmodifiableMap(PeerNotificationHandler::channel, Function.identity()));
+        this.enabled = enabled;
+    }
+
+    @Override
+    public synchronized void start() {
+        if (!enabled || running || handlers.isEmpty()) {
+            return;
+        }
+        running = true;
+        worker = new Thread(this::listen, "peer-notification-listener");
+        worker.setDaemon(true);
+        worker.start();
+    }
+
+    @Override
+    public synchronized void stop() {
+        running = false;
+        if (worker != null) {
+            worker.interrupt();
+            worker = null;
+        }
+    }
+
+    @Override
+    public boolean isRunning() {
+        return running;
+    }
+
+    private void listen() {
+        long backoff = 1_000;
+        while (running) {
+            try (Connection connection = dataSource.getConnection()) {
+                if (!connection.isWrapperFor(PGConnection.class)) {
+                    logger.info("Datasource is not Postgres; cross-instance notifications are off");
+                    running = false;
+                    return;
+                }
+                PGConnection pgConnection = connection.unwrap(PGConnection.class);
+                try (Statement statement = connection.createStatement()) {
+                    for (String channel : handlers.keySet()) {
+                        statement.execute("LISTEN " + channel);
+                    }
+                }
+                handlers.values().forEach(PeerNotificationHandler::resync);
+                backoff = 1_000;
+                logger.debug("Listening for peer notifications on {}", handlers.keySet());
+
+                while (running) {
+                    PGNotification[] notifications = pgConnection.getNotifications(POLL_TIMEOUT_MS);
+                    if (notifications == null) {
+                        continue;
+                    }
+                    for (PGNotification notification : notifications) {
+                        deliver(notification);
+                    }
+                }
+            } catch (SQLException e) {
+                if (!running) {
+                    return;
+                }
+                logger.warn("Peer notification listener disconnected, retrying in {} ms: {}", backoff, e.getMessage());
+                try {
+                    Thread.sleep(backoff);
+                } catch (InterruptedException interrupted) {
+                    Thread.currentThread().interrupt();
+                    return;
+                }
+                backoff = Math.min(backoff * 2, MAX_BACKOFF_MS);
+            }
+        }
+    }
+
+    private void deliver(PGNotification notification) {
+        PeerNotificationHandler handler = handlers.get(notification.getName());
+        if (handler == null) {
+            return;
+        }
+        try {
+            handler.onNotification(notification.getParameter());
+        } catch (RuntimeException e) {
+            logger.warn("Peer notification on {} could not be applied: {}", notification.getName(), e.getMessage());
+        }
+    }
+}
@@ -0,0 +1,79 @@
+package com.usyd.catams.service;
+
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+import org.springframework.dao.DataAccessException;
+import org.springframework.jdbc.core.ConnectionCallback;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.stereotype.Component;
+
+import java.sql.Connection;
+import java.sql.PreparedStatement;
+import java.sql.SQLException;
+import java.sql.Savepoint;
+
+/**
+ * Sends Postgres {@code NOTIFY} messages to the other instances' {@link PeerNotificationHandler}s
+ *
+ * Inside a transaction the message is only delivered if it commits; outside one it goes out
+ * immediately. Best effort: failures are logged, and nothing is sent when the datasource is not
+ * Postgres (the H2 test profile). Within a transaction the {@code NOTIFY} runs under a savepoint,
+ * since a failed statement would otherwise abort the caller's transaction.
+ */
+@Component
+public class PeerNotificationPublisher {
+
+    private static final Logger logger = LoggerFactory.getLogger(PeerNotificationPublisher.class);
+
+    private final JdbcTemplate jdbcTemplate;
+    private volatile Boolean postgres;
+
+    public PeerNotificationPublisher(JdbcTemplate jdbcTemplate) {
+        this.jdbcTemplate = jdbcTemplate;
+    }
+
+    public void notifyPeers(String channel, String payload) {
+        if (!isPostgres()) {
+            return;
+        }
+        try {
+            jdbcTemplate.execute((ConnectionCallback<Void>) connection -> {
+                notify(connection, channel, payload);
+                return null;
+            });
+        } catch (DataAccessException e) {
+            logger.warn("Could not notify peers on {} of {}: {}", channel, payload, e.getMessage());
+        }
+    }
+
+    private static void notify(Connection connection, String channel, String payload) throws SQLException {
+        Savepoint savepoint = connection.getAutoCommit() ? null : connection.setSavepoint();
+        try (PreparedStatement statement = connection.prepareStatement("SELECT pg_notify(?, ?)")) {
+            statement.setString(1, channel);
+            statement.setString(2, payload);
+            statement.execute();
+        } catch (SQLException e) {
+            if (savepoint != null) {
+                connection.rollback(savepoint);
+            }
+            throw e;
+        }
+        if (savepoint != null) {
+            connection.releaseSavepoint(savepoint);
+        }
+    }
+
+    private boolean isPostgres() {
+        Boolean known = postgres;
+        if (known == null) {
+            try {
+                known = jdbcTemplate.execute((ConnectionCallback<Boolean>) connection ->
+                    "PostgreSQL".equalsIgnoreCase(connection.getMetaData().getDatabaseProductName()));
+            } catch (DataAccessException e) {
+                return false;
+            }
+            postgres = known;
+        }
+        return Boolean.TRUE.equals(known);
+    }
+}
@@ -7,6 +7,10 @@ import com.usyd.catams.service.strategy.TaskCalculationStrategyFactory;
 import java.math.BigDecimal;
 import java.math.RoundingMode;
 import java.time.LocalDate;
+import java.util.ArrayList;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
 import java.util.Objects;
 import org.springframework.stereotype.Service;
 
@@ -42,13 +46,31 @@ public class Schedule1Calculator {
      * Calculates the EA compliant outcome for the supplied Schedule 1 task.
      */
     public Schedule1CalculationResult calculate(CalculationInput input) {
-        Objects.requireNonNull(input, "input");
-        Objects.requireNonNull(input.getTaskType(), "taskType");
-        Objects.requireNonNull(input.getSessionDate(), "sessionDate");
-        Objects.requireNonNull(input.getDeliveryHours(), "deliveryHours");
+        requireComplete(input);
+        return calculate(input, resolvePolicy(input));
+    }
 
+    /**
+     * Calculates many Schedule 1 tasks at once, returning results in input order.
+     *
+     * Inputs sharing task type, qualification, repeat flag and session date resolve their
+     * policy once; the per-entry arithmetic is unchanged from {@link #calculate(CalculationInput)}.
+     */
+    public List<Schedule1CalculationResult> calculateAll(List<CalculationInput> inputs) {
+        Objects.requireNonNull(inputs, "inputs");
+        Map<PolicyGroup, Schedule1PolicyProvider.RatePolicy> policies = new HashMap<>();
+        List<Schedule1CalculationResult> results = new ArrayList<>(inputs.size());
+        for (CalculationInput input : inputs) {
+            requireComplete(input);
+            Schedule1PolicyProvider.RatePolicy policy = policies.computeIfAbsent(
+                    PolicyGroup.of(input), unused -> resolvePolicy(input));
+            results.add(calculate(input, policy));
+        }
+        return results;
+    }
+
+    private Schedule1CalculationResult calculate(CalculationInput input, Schedule1PolicyProvider.RatePolicy policy) {
         TimesheetTaskType taskType = input.getTaskType();
-        Schedule1PolicyProvider.RatePolicy policy = resolvePolicy(input);
 
         BigDecimal normalisedDelivery = normaliseHours(input.getDeliveryHours());
         BigDecimal associatedEntitlement = policy.determineAssociatedHours(normalisedDelivery);
@@ -86,6 +108,13 @@ public class Schedule1Calculator {
         );
     }
 
+    private void requireComplete(CalculationInput input) {
+        Objects.requireNonNull(input, "input");
+        Objects.requireNonNull(input.getTaskType(), "taskType");
+        Objects.requireNonNull(input.getSessionDate(), "sessionDate");
+        Objects.requireNonNull(input.getDeliveryHours(), "deliveryHours");
+    }
+
     private Schedule1PolicyProvider.RatePolicy resolvePolicy(CalculationInput input) {
         TaskCalculationStrategy strategy = strategyFactory.getStrategy(input.getTaskType());
         return strategy.resolvePolicy(input, policyProvider);
@@ -112,6 +141,20 @@ public class Schedule1Calculator {
         return hours.stripTrailingZeros().toPlainString() + "h";
     }
 
+    /**
+     * Everything policy resolution depends on; session dates are Monday-aligned, so this
+     * groups a batch by week.
+     */
+    private record PolicyGroup(TimesheetTaskType taskType,
+                               TutorQualification qualification,
+                               boolean repeat,
+                               LocalDate sessionDate) {
+
+        private static PolicyGroup of(CalculationInput input) {
+            return new PolicyGroup(input.getTaskType(), input.getQualification(), input.isRepeat(), input.getSessionDate());
+        }
+    }
+
     /**
      * Normalised calculation input used by the calculator for any Schedule 1 task.
      */
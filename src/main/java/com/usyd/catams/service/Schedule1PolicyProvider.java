@@ -2,11 +2,17 @@ package com.usyd.catams.service;
 
 import com.usyd.catams.entity.RateAmount;
 import com.usyd.catams.entity.RateCode;
+import com.usyd.catams.entity.Schedule1CatalogueListener;
 import com.usyd.catams.enums.TimesheetTaskType;
 import com.usyd.catams.enums.TutorQualification;
 import com.usyd.catams.repository.PolicyVersionRepository;
 import com.usyd.catams.repository.RateAmountRepository;
 import com.usyd.catams.repository.RateCodeRepository;
+import io.micrometer.core.instrument.Counter;
+import io.micrometer.core.instrument.Gauge;
+import io.micrometer.core.instrument.MeterRegistry;
+import io.micrometer.core.instrument.Timer;
+import io.micrometer.core.instrument.simple.SimpleMeterRegistry;
 import org.springframework.beans.factory.annotation.Autowired;
 import org.springframework.core.env.Environment;
 import org.springframework.context.annotation.DependsOn;
@@ -17,13 +23,15 @@ import java.math.RoundingMode;
 import java.time.Clock;
 import java.time.LocalDate;
 import java.util.ArrayList;
+import java.util.Arrays;
 import java.util.Collections;
+import java.util.Comparator;
+import java.util.EnumMap;
 import java.util.HashMap;
 import java.util.List;
 import java.util.Map;
 import java.util.Objects;
 import java.util.Optional;
-import java.util.stream.Collectors;
 
 /**
  * Provides Schedule 1 policy data to calculation services.
@@ -31,6 +39,10 @@ import java.util.stream.Collectors;
  * <p>Fail-fast policy: provider initialization requires database-backed rate
  * configuration. Missing repository data is treated as startup/configuration
  * failure and must not silently fallback.</p>
+ *
+ * <p>Rates are served from an immutable in-memory catalogue loaded at startup and
+ * reloaded after policy data changes, so quotes and creates do not query the
+ * rate tables.</p>
  */
 @Service
 @DependsOn("schedule1TestBootstrap")
@@ -41,14 +53,30 @@ public class Schedule1PolicyProvider {
     private final PolicyVersionRepository policyVersionRepository;
     private final Environment environment;
     private final Clock clock;
-    private final Map<PolicyKey, List<RateSnapshot>> tutorialSnapshotIndex;
+
+    private final Counter lookupHits;
+    private final Counter lookupMisses;
+    private final Timer reloadTimer;
+
+    // Immutable snapshot swapped atomically on reload; readers never see a partial catalogue
+    private volatile PolicyCatalogue catalogue;
 
     @Autowired
+    public Schedule1PolicyProvider(RateCodeRepository rateCodeRepository,
+                                   RateAmountRepository rateAmountRepository,
+                                   PolicyVersionRepository policyVersionRepository,
+                                   Environment environment,
+                                   MeterRegistry meterRegistry) {
+        this(rateCodeRepository, rateAmountRepository, policyVersionRepository, environment,
+            Clock.systemDefaultZone(), meterRegistry);
+    }
+
     public Schedule1PolicyProvider(RateCodeRepository rateCodeRepository,
                                    RateAmountRepository rateAmountRepository,
                                    PolicyVersionRepository policyVersionRepository,
                                    Environment environment) {
-        this(rateCodeRepository, rateAmountRepository, policyVersionRepository, environment, Clock.systemDefaultZone());
+        this(rateCodeRepository, rateAmountRepository, policyVersionRepository, environment,
+            Clock.systemDefaultZone(), null);
     }
 
     Schedule1PolicyProvider(RateCodeRepository rateCodeRepository,
@@ -56,12 +84,38 @@ public class Schedule1PolicyProvider {
                             PolicyVersionRepository policyVersionRepository,
                             Environment environment,
                             Clock clock) {
+        this(rateCodeRepository, rateAmountRepository, policyVersionRepository, environment, clock, null);
+    }
+
+    Schedule1PolicyProvider(RateCodeRepository rateCodeRepository,
+                            RateAmountRepository rateAmountRepository,
+                            PolicyVersionRepository policyVersionRepository,
+                            Environment environment,
+                            Clock clock,
+                            MeterRegistry meterRegistry) {
         this.rateCodeRepository = Objects.requireNonNull(rateCodeRepository, "rateCodeRepository");
         this.rateAmountRepository = Objects.requireNonNull(rateAmountRepository, "rateAmountRepository");
         this.policyVersionRepository = Objects.requireNonNull(policyVersionRepository, "policyVersionRepository");
         this.environment = environment;
         this.clock = clock == null ? Clock.systemDefaultZone() : clock;
-        this.tutorialSnapshotIndex = initialiseTutorialSnapshotIndex();
+
+        MeterRegistry registry = meterRegistry != null ? meterRegistry : new SimpleMeterRegistry();
+        this.lookupHits = Counter.builder("schedule1.policy.lookups")
+            .description("Schedule 1 policy lookups, by whether a rate covered the session date")
+            .tag("result", "hit")
+            .register(registry);
+        this.lookupMisses = Counter.builder("schedule1.policy.lookups")
+            .description("Schedule 1 policy lookups, by whether a rate covered the session date")
+            .tag("result", "miss")
+            .register(registry);
+        this.reloadTimer = Timer.builder("schedule1.policy.catalogue.reloads")
+            .description("Schedule 1 policy catalogue reloads")
+            .register(registry);
+
+        reload();
+        Gauge.builder("schedule1.policy.catalogue.rates", this, provider -> provider.catalogue.size())
+            .description("Rate amounts held in the Schedule 1 policy catalogue")
+            .register(registry);
     }
 
     /**
@@ -71,30 +125,28 @@ public class Schedule1PolicyProvider {
                                             boolean repeat,
                                             LocalDate sessionDate) {
         Objects.requireNonNull(qualification, "qualification");
-        LocalDate targetDate = sessionDate != null ? sessionDate : LocalDate.now(clock);
-        PolicyKey key = new PolicyKey(TimesheetTaskType.TUTORIAL, qualification, repeat);
-
-        List<RateSnapshot> snapshots = new ArrayList<>(tutorialSnapshotIndex.getOrDefault(key, Collections.emptyList()));
-        if (snapshots.isEmpty()) {
-            for (Map.Entry<PolicyKey, List<RateSnapshot>> entry : tutorialSnapshotIndex.entrySet()) {
-                PolicyKey candidate = entry.getKey();
-                if (candidate.taskType() == TimesheetTaskType.TUTORIAL && candidate.repeat() == repeat) {
-                    snapshots.addAll(entry.getValue());
-                }
-            }
-        }
+        LocalDate today = LocalDate.now(clock);
+        LocalDate targetDate = sessionDate != null ? sessionDate : today;
+        PolicyCatalogue current = currentCatalogue();
 
-        if (snapshots.isEmpty()) {
+        EffectiveIntervals intervals = current.tutorial(new PolicyKey(TimesheetTaskType.TUTORIAL, qualification, repeat));
+        if (intervals == null) {
+            intervals = current.tutorialAnyQualification(repeat);
+        }
+        if (intervals == null) {
             throw new RatePolicyNotFoundException(
                 "No tutorial policy configured for qualification=%s, repeat=%s".formatted(qualification, repeat)
             );
         }
 
-        return snapshots.stream()
-            .filter(snapshot -> snapshot.isEffectiveOn(targetDate))
-            .findFirst()
-            .map(snapshot -> snapshot.toPolicy(targetDate))
-            .orElseGet(() -> snapshots.get(0).toPolicy(targetDate));
+        RateSnapshot selected = intervals.effectiveOn(targetDate);
+        if (selected != null) {
+            lookupHits.increment();
+        } else {
+            lookupMisses.increment();
+            selected = intervals.currentOrLatest(today);
+        }
+        return selected.toPolicy(targetDate);
     }
 
     /**
@@ -104,45 +156,39 @@ public class Schedule1PolicyProvider {
                                               TutorQualification qualification,
                                               LocalDate sessionDate) {
         Objects.requireNonNull(rateCode, "rateCode");
-        LocalDate targetDate = sessionDate != null ? sessionDate : LocalDate.now(clock);
-
-        RateCode code = rateCodeRepository.findByCode(rateCode)
-            .orElseThrow(() -> new RatePolicyNotFoundException(
-                "No Schedule1 rate code found for %s".formatted(rateCode)
-            ));
+        LocalDate today = LocalDate.now(clock);
+        LocalDate targetDate = sessionDate != null ? sessionDate : today;
 
-        List<RateSnapshot> snapshots = loadSnapshotsFor(code);
-        if (snapshots.isEmpty()) {
+        RateCodeEntry entry = currentCatalogue().rateCode(rateCode);
+        if (entry == null) {
             throw new RatePolicyNotFoundException(
-                "No active Schedule1 rates configured for rate code %s".formatted(rateCode)
+                "No Schedule1 rate code found for %s".formatted(rateCode)
             );
         }
 
-        List<RateSnapshot> matches = snapshots.stream()
-            .filter(snapshot -> qualification == null || snapshot.policyKey().qualification() == qualification)
-            .filter(snapshot -> snapshot.isEffectiveOn(targetDate))
-            .collect(Collectors.toList());
-
-        if (matches.isEmpty() && qualification == TutorQualification.COORDINATOR) {
-            matches = snapshots.stream()
-                .filter(snapshot -> snapshot.policyKey().qualification() == TutorQualification.PHD)
-                .filter(snapshot -> snapshot.isEffectiveOn(targetDate))
-                .collect(Collectors.toList());
-        } else if (matches.isEmpty() && qualification == TutorQualification.PHD) {
-            matches = snapshots.stream()
-                .filter(snapshot -> snapshot.policyKey().qualification() == TutorQualification.COORDINATOR)
-                .filter(snapshot -> snapshot.isEffectiveOn(targetDate))
-                .collect(Collectors.toList());
+        RateSnapshot selected = qualification == null
+            ? entry.all().effectiveOn(targetDate)
+            : entry.forQualification(qualification, targetDate);
+        if (selected == null && qualification == TutorQualification.COORDINATOR) {
+            selected = entry.forQualification(TutorQualification.PHD, targetDate);
+        } else if (selected == null && qualification == TutorQualification.PHD) {
+            selected = entry.forQualification(TutorQualification.COORDINATOR, targetDate);
+        }
+        if (selected == null) {
+            selected = entry.all().effectiveOn(targetDate);
         }
 
-        RateSnapshot selected;
-        if (!matches.isEmpty()) {
-            selected = matches.get(0);
+        if (selected != null) {
+            lookupHits.increment();
         } else {
-            selected = snapshots.stream()
-                .filter(snapshot -> snapshot.isEffectiveOn(targetDate))
-                .findFirst()
-                .orElse(snapshots.get(0));
+            lookupMisses.increment();
+            // No rate covers the session date: fall back to the rate in force today
+            selected = entry.all().effectiveOn(today);
+        }
+        if (selected == null) {
+            throw new RatePolicyNotFoundException(
+                "No active Schedule1 rates configured for rate code %s".formatted(rateCode)
+            );
         }
 
         return selected.toPolicy(targetDate);
@@ -152,38 +198,190 @@ public class Schedule1PolicyProvider {
         return 7;
     }
 
-    private Map<PolicyKey, List<RateSnapshot>> initialiseTutorialSnapshotIndex() {
-        List<RateCode> tutorialCodes = rateCodeRepository.findByTaskType(TimesheetTaskType.TUTORIAL);
-        if (tutorialCodes.isEmpty()) {
-            throw new IllegalStateException("No tutorial rate codes configured for Schedule1PolicyProvider");
+    /**
+     * Rebuilds the catalogue from the database and swaps it in atomically.
+     *
+     * <p>Called at startup and whenever {@link Schedule1CatalogueListener} reports committed
+     * changes to policy versions, rate codes or rate amounts.</p>
+     */
+    public synchronized void reload() {
+        long generation = Schedule1CatalogueListener.generation();
+        catalogue = reloadTimer.record(() -> PolicyCatalogue.load(rateCodeRepository, rateAmountRepository, generation));
+    }
+
+    private PolicyCatalogue currentCatalogue() {
+        PolicyCatalogue current = catalogue;
+        if (current.generation() != Schedule1CatalogueListener.generation()) {
+            synchronized (this) {
+                if (catalogue.generation() != Schedule1CatalogueListener.generation()) {
+                    reload();
+                }
+                current = catalogue;
+            }
+        }
+        return current;
+    }
+
+    /**
+     * Immutable view of all Schedule 1 rates, indexed by rate code and qualification and, for
+     * tutorials, by policy key. Each index holds effective-date intervals sorted for binary search.
+     */
+    private static final class PolicyCatalogue {
+        private final long generation;
+        private final int size;
+        private final Map<String, RateCodeEntry> byRateCode;
+        private final Map<PolicyKey, EffectiveIntervals> tutorialByKey;
+        private final Map<Boolean, EffectiveIntervals> tutorialByRepeat;
+
+        private PolicyCatalogue(long generation,
+                                int size,
+                                Map<String, RateCodeEntry> byRateCode,
+                                Map<PolicyKey, EffectiveIntervals> tutorialByKey,
+                                Map<Boolean, EffectiveIntervals> tutorialByRepeat) {
+            this.generation = generation;
+            this.size = size;
+            this.byRateCode = byRateCode;
+            this.tutorialByKey = tutorialByKey;
+            this.tutorialByRepeat = tutorialByRepeat;
         }
 
-        Map<PolicyKey, List<RateSnapshot>> index = new HashMap<>();
-        for (RateCode code : tutorialCodes) {
-            for (RateSnapshot snapshot : loadSnapshotsFor(code)) {
-                index.computeIfAbsent(snapshot.policyKey(), unused -> new ArrayList<>()).add(snapshot);
+        private static PolicyCatalogue load(RateCodeRepository rateCodeRepository,
+                                            RateAmountRepository rateAmountRepository,
+                                            long generation) {
+            if (rateCodeRepository.findByTaskType(TimesheetTaskType.TUTORIAL).isEmpty()) {
+                throw new IllegalStateException("No tutorial rate codes configured for Schedule1PolicyProvider");
+            }
+
+            Map<String, List<RateSnapshot>> snapshotsByCode = new HashMap<>();
+            for (RateCode code : rateCodeRepository.findAll()) {
+                snapshotsByCode.put(code.getCode(), new ArrayList<>());
             }
+            List<RateAmount> amounts = rateAmountRepository.findAllWithRateCode();
+            Map<PolicyKey, List<RateSnapshot>> tutorialSnapshots = new HashMap<>();
+            for (RateAmount amount : amounts) {
+                RateCode code = amount.getRateCode();
+                TutorQualification qualification = Optional.ofNullable(amount.getQualification())
+                    .orElse(TutorQualification.STANDARD);
+                RateSnapshot snapshot = RateSnapshot.from(code, amount, qualification, code.isRepeatable());
+                snapshotsByCode.computeIfAbsent(code.getCode(), unused -> new ArrayList<>()).add(snapshot);
+                if (code.getTaskType() == TimesheetTaskType.TUTORIAL) {
+                    tutorialSnapshots.computeIfAbsent(snapshot.policyKey(), unused -> new ArrayList<>()).add(snapshot);
+                }
+            }
+
+            if (tutorialSnapshots.isEmpty()) {
+                throw new IllegalStateException("No active tutorial rate amounts configured for Schedule1PolicyProvider");
+            }
+
+            Map<String, RateCodeEntry> byRateCode = new HashMap<>();
+            snapshotsByCode.forEach((code, snapshots) -> byRateCode.put(code, RateCodeEntry.of(snapshots)));
+
+            Map<PolicyKey, EffectiveIntervals> tutorialByKey = new HashMap<>();
+            Map<Boolean, List<RateSnapshot>> tutorialRepeatSnapshots = new HashMap<>();
+            tutorialSnapshots.forEach((key, snapshots) -> {
+                tutorialByKey.put(key, EffectiveIntervals.of(snapshots));
+                tutorialRepeatSnapshots.computeIfAbsent(key.repeat(), unused -> new ArrayList<>()).addAll(snapshots);
+            });
+            Map<Boolean, EffectiveIntervals> tutorialByRepeat = new HashMap<>();
+            tutorialRepeatSnapshots.forEach((repeat, snapshots) -> tutorialByRepeat.put(repeat, EffectiveIntervals.of(snapshots)));
+
+            return new PolicyCatalogue(generation, amounts.size(), Map.copyOf(byRateCode),
+                Map.copyOf(tutorialByKey), Map.copyOf(tutorialByRepeat));
         }
 
-        if (index.isEmpty()) {
-            throw new IllegalStateException("No active tutorial rate amounts configured for Schedule1PolicyProvider");
+        private long generation() {
+            return generation;
+        }
+
+        private int size() {
+            return size;
+        }
+
+        private RateCodeEntry rateCode(String code) {
+            return byRateCode.get(code);
+        }
+
+        private EffectiveIntervals tutorial(PolicyKey key) {
+            return tutorialByKey.get(key);
+        }
+
+        private EffectiveIntervals tutorialAnyQualification(boolean repeat) {
+            return tutorialByRepeat.get(repeat);
+        }
+    }
+
+    /**
+     * Intervals for one rate code, overall and per qualification.
+     */
+    private record RateCodeEntry(EffectiveIntervals all, Map<TutorQualification, EffectiveIntervals> byQualification) {
+
+        private static RateCodeEntry of(List<RateSnapshot> snapshots) {
+            Map<TutorQualification, List<RateSnapshot>> grouped = new EnumMap<>(TutorQualification.class);
+            for (RateSnapshot snapshot : snapshots) {
+                grouped.computeIfAbsent(snapshot.policyKey().qualification(), unused -> new ArrayList<>()).add(snapshot);
+            }
+            Map<TutorQualification, EffectiveIntervals> byQualification = new EnumMap<>(TutorQualification.class);
+            grouped.forEach((qualification, list) -> byQualification.put(qualification, EffectiveIntervals.of(list)));
+            return new RateCodeEntry(EffectiveIntervals.of(snapshots), Collections.unmodifiableMap(byQualification));
         }
 
-        index.values().forEach(list -> list.sort((a, b) -> b.effectiveFrom.compareTo(a.effectiveFrom)));
-        return Collections.unmodifiableMap(index);
+        private RateSnapshot forQualification(TutorQualification qualification, LocalDate date) {
+            EffectiveIntervals intervals = byQualification.get(qualification);
+            return intervals == null ? null : intervals.effectiveOn(date);
+        }
     }
 
-    private List<RateSnapshot> loadSnapshotsFor(RateCode rateCode) {
-        List<RateSnapshot> snapshots = new ArrayList<>();
-        List<RateAmount> rateAmounts = rateAmountRepository.findActiveAmounts(rateCode, LocalDate.now(clock));
-        for (RateAmount amount : rateAmounts) {
-            TutorQualification qualification = Optional.ofNullable(amount.getQualification())
-                .orElse(TutorQualification.STANDARD);
-            boolean repeat = rateCode.isRepeatable();
-            snapshots.add(RateSnapshot.from(rateCode, amount, qualification, repeat));
-        }
-        snapshots.sort((a, b) -> b.effectiveFrom.compareTo(a.effectiveFrom));
-        return snapshots;
+    /**
+     * Snapshots sorted by effective-from date. Lookup binary-searches for the latest start on or
+     * before the date, then walks back past any interval that has already ended.
+     */
+    private static final class EffectiveIntervals {
+        private final RateSnapshot[] snapshots;
+        private final LocalDate[] starts;
+
+        private EffectiveIntervals(RateSnapshot[] snapshots) {
+            this.snapshots = snapshots;
+            this.starts = new LocalDate[snapshots.length];
+            for (int i = 0; i < snapshots.length; i++) {
+                starts[i] = snapshots[i].effectiveFrom;
+            }
+        }
+
+        private static EffectiveIntervals of(List<RateSnapshot> snapshots) {
+            RateSnapshot[] sorted = snapshots.toArray(new RateSnapshot[0]);
+            Arrays.sort(sorted, Comparator.comparing(snapshot -> snapshot.effectiveFrom));
+            return new EffectiveIntervals(sorted);
+        }
+
+        private RateSnapshot effectiveOn(LocalDate date) {
+            for (int i = lastStartingOnOrBefore(date); i >= 0; i--) {
+                if (snapshots[i].isEffectiveOn(date)) {
+                    return snapshots[i];
+                }
+            }
+            return null;
+        }
+
+        private RateSnapshot currentOrLatest(LocalDate today) {
+            RateSnapshot current = effectiveOn(today);
+            return current != null ? current : snapshots[snapshots.length - 1];
+        }
+
+        private int lastStartingOnOrBefore(LocalDate date) {
+            int low = 0;
+            int high = starts.length - 1;
+            int found = -1;
+            while (low <= high) {
+                int mid = (low + high) >>> 1;
+                if (starts[mid].isAfter(date)) {
+                    high = mid - 1;
+                } else {
+                    found = mid;
+                    low = mid + 1;
+                }
+            }
+            return found;
+        }
     }
 
     private record PolicyKey(TimesheetTaskType taskType, TutorQualification qualification, boolean repeat) { }
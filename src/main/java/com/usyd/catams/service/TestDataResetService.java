@@ -1,5 +1,6 @@
 package com.usyd.catams.service;
 
+import com.usyd.catams.entity.ChangeVersionListener;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
 import org.springframework.context.annotation.Profile;
@@ -23,7 +24,7 @@ import java.util.Locale;
 public class TestDataResetService {
 
     private static final Logger LOGGER = LoggerFactory.getLogger(TestDataResetService.class);
-    private static final List<String> TARGET_TABLES = List.of("approvals", "timesheets");
+    private static final List<String> TARGET_TABLES = List.of("approvals", "timesheets", "timesheet_weekly_rollup");
 
     private final JdbcTemplate jdbcTemplate;
 
@@ -39,6 +40,7 @@ public class TestDataResetService {
     public void resetDatabase() {
         // Delete child records first to satisfy FK constraints.
         TARGET_TABLES.forEach(table -> jdbcTemplate.execute("DELETE FROM " + table));
+        ChangeVersionListener.timesheetsChanged();
 
         resetIdentities();
     }
@@ -60,6 +62,7 @@ public class TestDataResetService {
                 LOGGER.warn("Failed to delete demo users matching {}: {}", pattern, ex.getMessage());
             }
         }
+        ChangeVersionListener.referenceDataChanged();
         LOGGER.info("Cleaned up {} demo users", totalDeleted);
         return totalDeleted;
     }
@@ -48,9 +48,30 @@ public interface TimesheetApplicationFacade {
 
     PagedTimesheetResponse getLecturerFinalApprovalQueueAsDto(Long requesterId, Pageable pageable);
 
+    /**
+     * Keyset variant of {@link #getTimesheetsAsDto}: newest first, continuing after the
+     * opaque {@code after} cursor (blank for the first page), without a count query.
+     */
+    PagedTimesheetResponse getTimesheetsAfterCursorAsDto(Long tutorId,
+                                                         Long courseId,
+                                                         ApprovalStatus status,
+                                                         Long requesterId,
+                                                         String after,
+                                                         int size);
+
+    /**
+     * Keyset variant of {@link #getTimesheetsByTutorAsDto}.
+     */
+    PagedTimesheetResponse getTimesheetsByTutorAfterCursorAsDto(Long tutorId, String after, int size);
+
+    /**
+     * Keyset variant of {@link #getLecturerFinalApprovalQueueAsDto}: oldest first.
+     */
+    PagedTimesheetResponse getLecturerFinalApprovalQueueAfterCursorAsDto(Long requesterId, String after, int size);
+
     /**
      * Resolve whether a tutorial repeat request is eligible against the configured
-     * rolling window policy.
+     * rolling window policy. A null description matches prior tutorials of any content.
      */
-    boolean isTutorialRepeatEligible(Long courseId, LocalDate sessionDate);
+    boolean isTutorialRepeatEligible(Long courseId, LocalDate sessionDate, String description);
 }
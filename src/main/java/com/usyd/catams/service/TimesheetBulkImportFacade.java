@@ -0,0 +1,22 @@
+package com.usyd.catams.service;
+
+import com.usyd.catams.dto.request.TimesheetCreateRequest;
+import com.usyd.catams.dto.response.TimesheetBulkImportResponse;
+
+import java.util.List;
+
+/**
+ * Bulk timesheet creation for start-of-semester loads.
+ *
+ * <p>Each row is validated and authorized with the same rules as single creation; valid rows
+ * are inserted together and invalid rows are reported without aborting the import.</p>
+ */
+public interface TimesheetBulkImportFacade {
+
+    TimesheetBulkImportResponse importRows(List<TimesheetCreateRequest> rows, Long creatorId);
+
+    /**
+     * Same as {@link #importRows} for a CSV document whose header names the create-request fields.
+     */
+    TimesheetBulkImportResponse importCsv(String csv, Long creatorId);
+}
@@ -1,6 +1,8 @@
 package com.usyd.catams.service;
 
 import com.usyd.catams.domain.service.TimesheetValidationService;
+import com.usyd.catams.dto.TutorialRepeatKey;
+import com.usyd.catams.dto.request.TimesheetQuoteRequest;
 import com.usyd.catams.enums.TimesheetTaskType;
 import com.usyd.catams.enums.TutorQualification;
 import com.usyd.catams.exception.BusinessRuleException;
@@ -8,7 +10,13 @@ import com.usyd.catams.exception.ErrorCodes;
 import java.math.BigDecimal;
 import java.math.RoundingMode;
 import java.time.LocalDate;
+import java.util.ArrayList;
+import java.util.HashMap;
+import java.util.HashSet;
+import java.util.List;
+import java.util.Map;
 import java.util.Objects;
+import java.util.Set;
 import org.springframework.stereotype.Service;
 import org.springframework.transaction.annotation.Transactional;
 
@@ -45,6 +53,52 @@ public class TimesheetCalculationService {
         return calculate(courseId, taskType, sessionDate, deliveryHours, repeat, qualification, "sessionDate");
     }
 
+    /**
+     * Quotes many entries in one pass, returning results in request order.
+     *
+     * Validation matches {@link #calculateForQuote}; repeat eligibility for every requested
+     * repeat tutorial is resolved with a single query before the batch is priced.
+     */
+    public List<Schedule1CalculationResult> calculateBatchForQuote(List<TimesheetQuoteRequest> requests) {
+        Objects.requireNonNull(requests, "requests");
+
+        // Quotes carry no description, so repeats match prior tutorials of any content
+        Map<TutorialRepeatKey, Set<LocalDate>> repeatSessions = new HashMap<>();
+        for (TimesheetQuoteRequest request : requests) {
+            Objects.requireNonNull(request.getTaskType(), "taskType");
+            Objects.requireNonNull(request.getSessionDate(), "sessionDate");
+            Objects.requireNonNull(request.getDeliveryHours(), "deliveryHours");
+
+            timesheetValidationService.validateMonday(request.getSessionDate(), "sessionDate");
+            validateTutorialDeliveryHours(request.getTaskType(), request.getDeliveryHours());
+            if (isRepeatTutorial(request)) {
+                repeatSessions.computeIfAbsent(anyContent(request.getCourseId()), key -> new HashSet<>())
+                    .add(request.getSessionDate());
+            }
+        }
+
+        Map<TutorialRepeatKey, Set<LocalDate>> eligibleRepeats = repeatSessions.isEmpty()
+            ? Map.of()
+            : timesheetQueryService.findTutorialRepeatEligibleDates(repeatSessions);
+
+        List<Schedule1Calculator.CalculationInput> inputs = new ArrayList<>(requests.size());
+        for (TimesheetQuoteRequest request : requests) {
+            boolean effectiveRepeat = request.isRepeat();
+            if (isRepeatTutorial(request)) {
+                effectiveRepeat = eligibleRepeats.getOrDefault(anyContent(request.getCourseId()), Set.of())
+                    .contains(request.getSessionDate());
+            }
+            inputs.add(new Schedule1Calculator.CalculationInput(
+                request.getTaskType(),
+                request.getSessionDate(),
+                request.getDeliveryHours(),
+                effectiveRepeat,
+                request.getQualification() != null ? request.getQualification() : TutorQualification.STANDARD
+            ));
+        }
+        return schedule1Calculator.calculateAll(inputs);
+    }
+
     public Schedule1CalculationResult calculateForCreateOrUpdate(
         Long courseId,
         TimesheetTaskType taskType,
@@ -74,7 +128,7 @@ public class TimesheetCalculationService {
 
         boolean effectiveRepeat = repeat;
         if (taskType == TimesheetTaskType.TUTORIAL && repeat && courseId != null) {
-            effectiveRepeat = timesheetQueryService.isTutorialRepeatEligible(courseId, sessionDate);
+            effectiveRepeat = timesheetQueryService.isTutorialRepeatEligible(courseId, sessionDate, null);
         }
 
         return buildCalculation(taskType, sessionDate, deliveryHours, effectiveRepeat, qualification);
@@ -136,6 +190,14 @@ public class TimesheetCalculationService {
         );
     }
 
+    private boolean isRepeatTutorial(TimesheetQuoteRequest request) {
+        return request.getTaskType() == TimesheetTaskType.TUTORIAL && request.isRepeat() && request.getCourseId() != null;
+    }
+
+    private static TutorialRepeatKey anyContent(Long courseId) {
+        return new TutorialRepeatKey(courseId, null);
+    }
+
     private void validateTutorialDeliveryHours(TimesheetTaskType taskType, BigDecimal deliveryHours) {
         if (taskType != TimesheetTaskType.TUTORIAL) {
             return;
@@ -1,11 +1,15 @@
 package com.usyd.catams.service;
 
+import com.usyd.catams.dto.TutorialRepeatKey;
 import com.usyd.catams.entity.Timesheet;
 import com.usyd.catams.enums.ApprovalStatus;
 import java.math.BigDecimal;
 import java.time.LocalDate;
+import java.util.Collection;
 import java.util.List;
+import java.util.Map;
 import java.util.Optional;
+import java.util.Set;
 import org.springframework.data.domain.Page;
 import org.springframework.data.domain.Pageable;
 
@@ -40,5 +44,16 @@ public interface TimesheetQueryService {
 
     Page<Timesheet> getLecturerFinalApprovalQueue(Long requesterId, Pageable pageable);
 
-    boolean isTutorialRepeatEligible(Long courseId, LocalDate sessionDate);
+    /**
+     * Whether a prior tutorial of the course with the same content falls in the repeat window.
+     * A null description matches any prior tutorial of the course.
+     */
+    boolean isTutorialRepeatEligible(Long courseId, LocalDate sessionDate, String description);
+
+    /**
+     * Batch form of {@link #isTutorialRepeatEligible}: returns, per course and content, the subset
+     * of the supplied session dates that are repeat-eligible. Keys with none are omitted.
+     */
+    Map<TutorialRepeatKey, Set<LocalDate>> findTutorialRepeatEligibleDates(
+        Map<TutorialRepeatKey, ? extends Collection<LocalDate>> sessionDatesByContent);
 }
@@ -0,0 +1,396 @@
+package com.usyd.catams.service;
+
+import com.usyd.catams.dto.WeeklyRollupTotals;
+import com.usyd.catams.dto.response.RollupConsistencyReport;
+import com.usyd.catams.entity.ChangeVersionListener;
+import com.usyd.catams.entity.Timesheet;
+import com.usyd.catams.enums.ApprovalStatus;
+import com.usyd.catams.repository.TimesheetWeeklyRollupRepository;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+import org.springframework.dao.DataAccessException;
+import org.springframework.jdbc.core.ConnectionCallback;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.PlatformTransactionManager;
+import org.springframework.transaction.TransactionDefinition;
+import org.springframework.transaction.annotation.Transactional;
+import org.springframework.transaction.support.TransactionSynchronization;
+import org.springframework.transaction.support.TransactionSynchronizationManager;
+import org.springframework.transaction.support.TransactionTemplate;
+
+import java.math.BigDecimal;
+import java.time.LocalDate;
+import java.util.ArrayList;
+import java.util.Collections;
+import java.util.Comparator;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.Objects;
+import java.util.TreeMap;
+import java.util.concurrent.atomic.AtomicBoolean;
+
+/**
+ * Maintains the weekly timesheet rollup read model.
+ *
+ * Timesheet writers call into this service from inside their own transaction so the
+ * rollup commits or rolls back together with the timesheet change. Each change is
+ * expressed as removing the old contribution and adding the new one. Writers touching
+ * many timesheets collect their changes in a {@link Batch}; the net delta per
+ * (course, tutor, week, status) is then applied in one
+ * {@code INSERT ... ON CONFLICT ... DO UPDATE}, so concurrent writers to the same week
+ * neither lose increments nor collide on the first insert.
+ *
+ * A decrement that finds no row means the rollup has drifted from the timesheets table.
+ * The offending rows are discarded and a rebuild is scheduled for after the commit.
+ *
+ * The rebuild and consistency check operate on the whole table and are intended for
+ * administrative use after bulk loads or when drift is suspected.
+ *
+ * @author Development Team
+ * @since 2.0
+ */
+@Service
+@Transactional
+public class TimesheetWeeklyRollupService {
+
+    private static final Logger logger = LoggerFactory.getLogger(TimesheetWeeklyRollupService.class);
+
+    // Keys per statement; seven bind parameters each keeps well below the driver's limit
+    private static final int UPSERT_CHUNK = 1000;
+
+    private static final String COLUMNS =
+        "course_id, tutor_id, week_start_date, status, timesheet_count, total_hours, total_pay";
+
+    private static final String KEY_MATCH = "(course_id, tutor_id, week_start_date, status) IN (";
+
+    private final TimesheetWeeklyRollupRepository rollupRepository;
+    private final JdbcTemplate jdbcTemplate;
+    private final TransactionTemplate rebuildTransaction;
+    private final AtomicBoolean rebuildScheduled = new AtomicBoolean();
+    private volatile Boolean postgres;
+
+    public TimesheetWeeklyRollupService(TimesheetWeeklyRollupRepository rollupRepository,
+                                        JdbcTemplate jdbcTemplate,
+                                        PlatformTransactionManager transactionManager) {
+        this.rollupRepository = rollupRepository;
+        this.jdbcTemplate = jdbcTemplate;
+        this.rebuildTransaction = new TransactionTemplate(transactionManager);
+        this.rebuildTransaction.setPropagationBehavior(TransactionDefinition.PROPAGATION_REQUIRES_NEW);
+    }
+
+    /**
+     * Capture the rollup contribution of a timesheet before it is modified.
+     */
+    public Contribution snapshot(Timesheet timesheet) {
+        return Contribution.of(timesheet);
+    }
+
+    /**
+     * Add a newly persisted timesheet to the rollup.
+     */
+    public void recordCreated(Timesheet timesheet) {
+        apply(batch().created(timesheet));
+    }
+
+    /**
+     * Move a timesheet's contribution from its previous snapshot to its current state.
+     * No-op when nothing relevant to the rollup changed.
+     */
+    public void recordChanged(Contribution before, Timesheet after) {
+        apply(batch().changed(before, after));
+    }
+
+    /**
+     * Remove a deleted timesheet from the rollup.
+     */
+    public void recordDeleted(Timesheet timesheet) {
+        apply(batch().deleted(timesheet));
+    }
+
+    /**
+     * Start collecting rollup changes for many timesheets; hand the result to {@link #apply(Batch)}.
+     */
+    public Batch batch() {
+        return new Batch();
+    }
+
+    /**
+     * Apply the net change of a batch: one upsert per chunk of keys, plus one cleanup of
+     * emptied rows when anything was decremented.
+     */
+    public void apply(Batch batch) {
+        if (batch == null || batch.isEmpty()) {
+            return;
+        }
+        List<Map.Entry<Key, Delta>> entries = batch.deltas.entrySet().stream()
+            .filter(entry -> !entry.getValue().isZero())
+            .toList();
+        for (int from = 0; from < entries.size(); from += UPSERT_CHUNK) {
+            List<Map.Entry<Key, Delta>> chunk = entries.subList(from, Math.min(from + UPSERT_CHUNK, entries.size()));
+            upsert(chunk);
+            List<Key> decremented = chunk.stream()
+                .filter(entry -> entry.getValue().count < 0)
+                .map(Map.Entry::getKey)
+                .toList();
+            if (!decremented.isEmpty()) {
+                removeEmptied(decremented);
+            }
+        }
+    }
+
+    /**
+     * Discard the rollup and repopulate it from the timesheets table.
+     *
+     * @return number of rollup rows written
+     */
+    public int rebuild() {
+        int removed = rollupRepository.deleteAllRows();
+        int written = rollupRepository.insertFromTimesheets();
+        // Dashboard summaries read the rollup, so a rebuild can change them
+        ChangeVersionListener.timesheetsChanged();
+        logger.info("Rebuilt timesheet weekly rollup: removed={}, written={}", removed, written);
+        return written;
+    }
+
+    /**
+     * Compare every rollup row with totals recomputed from the timesheets table.
+     */
+    @Transactional(readOnly = true)
+    public RollupConsistencyReport checkConsistency() {
+        List<WeeklyRollupTotals> base = rollupRepository.computeTotalsFromTimesheets();
+        List<WeeklyRollupTotals> rollup = rollupRepository.findAllTotals();
+
+        Map<String, WeeklyRollupTotals> rollupByKey = new LinkedHashMap<>();
+        for (WeeklyRollupTotals totals : rollup) {
+            rollupByKey.put(totals.getKey(), totals);
+        }
+
+        List<String> mismatches = new ArrayList<>();
+        for (WeeklyRollupTotals expected : base) {
+            WeeklyRollupTotals actual = rollupByKey.remove(expected.getKey());
+            if (!expected.hasSameTotals(actual)) {
+                mismatches.add(expected.getKey());
+            }
+        }
+        // Anything left over has no timesheets behind it; empty rows are deleted eagerly
+        mismatches.addAll(rollupByKey.keySet());
+
+        if (!mismatches.isEmpty()) {
+            logger.warn("Timesheet weekly rollup drift detected for {} keys", mismatches.size());
+        }
+        return new RollupConsistencyReport(base.size(), rollup.size(), mismatches);
+    }
+
+    private void upsert(List<Map.Entry<Key, Delta>> chunk) {
+        String sql;
+        if (isPostgres()) {
+            sql = "INSERT INTO timesheet_weekly_rollup (" + COLUMNS + ", updated_at) VALUES "
+                + String.join(", ", Collections.nCopies(chunk.size(), "(?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)"))
+                + " ON CONFLICT (course_id, tutor_id, week_start_date, status) DO UPDATE SET "
+                + "timesheet_count = timesheet_weekly_rollup.timesheet_count + EXCLUDED.timesheet_count, "
+                + "total_hours = timesheet_weekly_rollup.total_hours + EXCLUDED.total_hours, "
+                + "total_pay = timesheet_weekly_rollup.total_pay + EXCLUDED.total_pay, "
+                + "updated_at = CURRENT_TIMESTAMP";
+        } else {
+            // H2 (test profile) has no ON CONFLICT ... DO UPDATE; its MERGE is atomic per statement
+            String source = String.join(" UNION ALL ", Collections.nCopies(chunk.size(),
+                "SELECT CAST(? AS BIGINT) AS course_id, CAST(? AS BIGINT) AS tutor_id, "
+                    + "CAST(? AS DATE) AS week_start_date, CAST(? AS VARCHAR(50)) AS status, "
+                    + "CAST(? AS BIGINT) AS timesheet_count, CAST(? AS DECIMAL(12,1)) AS total_hours, "
+                    + "CAST(? AS DECIMAL(15,3)) AS total_pay"));
+            sql = "MERGE INTO timesheet_weekly_rollup r USING (" + source + ") d "
+                + "ON r.course_id = d.course_id AND r.tutor_id = d.tutor_id "
+                + "AND r.week_start_date = d.week_start_date AND r.status = d.status "
+                + "WHEN MATCHED THEN UPDATE SET timesheet_count = r.timesheet_count + d.timesheet_count, "
+                + "total_hours = r.total_hours + d.total_hours, total_pay = r.total_pay + d.total_pay, "
+                + "updated_at = CURRENT_TIMESTAMP "
+                + "WHEN NOT MATCHED THEN INSERT (" + COLUMNS + ", updated_at) VALUES (d.course_id, d.tutor_id, "
+                + "d.week_start_date, d.status, d.timesheet_count, d.total_hours, d.total_pay, CURRENT_TIMESTAMP)";
+        }
+
+        List<Object> args = new ArrayList<>(chunk.size() * 7);
+        for (Map.Entry<Key, Delta> entry : chunk) {
+            Key key = entry.getKey();
+            Delta delta = entry.getValue();
+            args.add(key.courseId());
+            args.add(key.tutorId());
+            args.add(key.weekStartDate());
+            args.add(key.status().name());
+            args.add(delta.count);
+            args.add(delta.hours);
+            args.add(delta.pay);
+        }
+        jdbcTemplate.update(sql, args.toArray());
+    }
+
+    private void removeEmptied(List<Key> keys) {
+        String match = KEY_MATCH + String.join(", ", Collections.nCopies(keys.size(), "(?, ?, ?, ?)")) + ")";
+        List<Object> args = new ArrayList<>(keys.size() * 4);
+        for (Key key : keys) {
+            args.add(key.courseId());
+            args.add(key.tutorId());
+            args.add(key.weekStartDate());
+            args.add(key.status().name());
+        }
+        int drifted = jdbcTemplate.update(
+            "DELETE FROM timesheet_weekly_rollup WHERE timesheet_count < 0 AND " + match, args.toArray());
+        jdbcTemplate.update(
+            "DELETE FROM timesheet_weekly_rollup WHERE timesheet_count = 0 AND " + match, args.toArray());
+        if (drifted > 0) {
+            logger.error("Timesheet weekly rollup decremented below zero for {} keys; scheduling a rebuild", drifted);
+            scheduleRebuild();
+        }
+    }
+
+    private void scheduleRebuild() {
+        if (!TransactionSynchronizationManager.isSynchronizationActive()) {
+            return;
+        }
+        TransactionSynchronizationManager.registerSynchronization(new TransactionSynchronization() {
+            @Override
+            public void afterCommit() {
+                // Concurrent drift reports collapse into one rebuild
+                if (!rebuildScheduled.compareAndSet(false, true)) {
+                    return;
+                }
+                try {
+                    rebuildTransaction.executeWithoutResult(status -> rebuild());
+                } catch (RuntimeException e) {
+                    logger.error("Scheduled timesheet weekly rollup rebuild failed: {}", e.getMessage(), e);
+                } finally {
+                    rebuildScheduled.set(false);
+                }
+            }
+        });
+    }
+
+    private boolean isPostgres() {
+        Boolean known = postgres;
+        if (known == null) {
+            try {
+                known = jdbcTemplate.execute((ConnectionCallback<Boolean>) connection ->
+                    "PostgreSQL".equalsIgnoreCase(connection.getMetaData().getDatabaseProductName()));
+            } catch (DataAccessException e) {
+                return true;
+            }
+            postgres = known;
+        }
+        return Boolean.TRUE.equals(known);
+    }
+
+    /**
+     * Net rollup changes of several timesheet writes, keyed in a fixed order so concurrent
+     * batches lock rollup rows in the same sequence.
+     */
+    public static final class Batch {
+        private final Map<Key, Delta> deltas = new TreeMap<>(Key.ORDER);
+
+        private Batch() {
+        }
+
+        public Batch created(Timesheet timesheet) {
+            return add(Contribution.of(timesheet), 1);
+        }
+
+        public Batch changed(Contribution before, Timesheet after) {
+            Contribution current = Contribution.of(after);
+            if (before == null || current.equals(before)) {
+                return this;
+            }
+            return add(before, -1).add(current, 1);
+        }
+
+        public Batch deleted(Timesheet timesheet) {
+            return add(Contribution.of(timesheet), -1);
+        }
+
+        public boolean isEmpty() {
+            return deltas.values().stream().allMatch(Delta::isZero);
+        }
+
+        /**
+         * Number of distinct rollup rows this batch touches.
+         */
+        public int size() {
+            return deltas.size();
+        }
+
+        private Batch add(Contribution contribution, int sign) {
+            BigDecimal factor = BigDecimal.valueOf(sign);
+            Key key = new Key(contribution.courseId, contribution.tutorId,
+                contribution.weekStartDate, contribution.status);
+            Delta delta = deltas.computeIfAbsent(key, k -> new Delta());
+            delta.count += sign;
+            delta.hours = delta.hours.add(contribution.hours.multiply(factor));
+            delta.pay = delta.pay.add(contribution.pay.multiply(factor));
+            return this;
+        }
+    }
+
+    private record Key(Long courseId, Long tutorId, LocalDate weekStartDate, ApprovalStatus status) {
+        private static final Comparator<Key> ORDER = Comparator
+            .comparing(Key::courseId, Comparator.nullsFirst(Comparator.naturalOrder()))
+            .thenComparing(Key::tutorId, Comparator.nullsFirst(Comparator.naturalOrder()))
+            .thenComparing(Key::weekStartDate, Comparator.nullsFirst(Comparator.naturalOrder()))
+            .thenComparing(Key::status, Comparator.nullsFirst(Comparator.naturalOrder()));
+    }
+
+    private static final class Delta {
+        private long count;
+        private BigDecimal hours = BigDecimal.ZERO;
+        private BigDecimal pay = BigDecimal.ZERO;
+
+        private boolean isZero() {
+            return count == 0 && hours.signum() == 0 && pay.signum() == 0;
+        }
+    }
+
+    /**
+     * The part of a timesheet that the rollup aggregates.
+     */
+    public static final class Contribution {
+        private final Long courseId;
+        private final Long tutorId;
+        private final LocalDate weekStartDate;
+        private final ApprovalStatus status;
+        private final BigDecimal hours;
+        private final BigDecimal pay;
+
+        private Contribution(Long courseId, Long tutorId, LocalDate weekStartDate, ApprovalStatus status,
+                             BigDecimal hours, BigDecimal pay) {
+            this.courseId = courseId;
+            this.tutorId = tutorId;
+            this.weekStartDate = weekStartDate;
+            this.status = status;
+            this.hours = hours;
+            this.pay = pay;
+        }
+
+        static Contribution of(Timesheet timesheet) {
+            BigDecimal hours = timesheet.getHours() != null ? timesheet.getHours() : BigDecimal.ZERO;
+            BigDecimal rate = timesheet.getHourlyRate() != null ? timesheet.getHourlyRate() : BigDecimal.ZERO;
+            return new Contribution(timesheet.getCourseId(), timesheet.getTutorId(),
+                timesheet.getWeekStartDate(), timesheet.getStatus(), hours, hours.multiply(rate));
+        }
+
+        @Override
+        public boolean equals(Object o) {
+            if (this == o) return true;
+            if (!(o instanceof Contribution)) return false;
+            Contribution that = (Contribution) o;
+            return Objects.equals(courseId, that.courseId)
+                && Objects.equals(tutorId, that.tutorId)
+                && Objects.equals(weekStartDate, that.weekStartDate)
+                && status == that.status
+                && hours.compareTo(that.hours) == 0
+                && pay.compareTo(that.pay) == 0;
+        }
+
+        @Override
+        public int hashCode() {
+            return Objects.hash(courseId, tutorId, weekStartDate, status);
+        }
+    }
+}
@@ -1,6 +1,7 @@
 package com.usyd.catams.service.impl;
 
 import com.usyd.catams.application.ApprovalApplicationService;
+import com.usyd.catams.dto.response.ApprovalBatchResponse;
 import com.usyd.catams.entity.Approval;
 import com.usyd.catams.entity.Timesheet;
 import com.usyd.catams.enums.ApprovalAction;
@@ -8,6 +9,8 @@ import com.usyd.catams.enums.ApprovalStatus;
 import com.usyd.catams.service.ApprovalService;
 import org.springframework.beans.factory.annotation.Autowired;
 import org.springframework.context.annotation.Primary;
+import org.springframework.data.domain.Page;
+import org.springframework.data.domain.Pageable;
 import org.springframework.stereotype.Service;
 
 import java.util.List;
@@ -33,6 +36,12 @@ public class ApprovalServiceImpl implements ApprovalService {
         return approvalApplicationService.performApprovalAction(timesheetId, action, comment, requesterId);
     }
 
+    @Override
+    public ApprovalBatchResponse performBatchApprovalAction(List<Long> timesheetIds, ApprovalAction action,
+                                                            String comment, Long requesterId) {
+        return approvalApplicationService.performBatchApprovalAction(timesheetIds, action, comment, requesterId);
+    }
+
     @Override
     public List<Approval> getApprovalHistory(Long timesheetId, Long requesterId) {
         return approvalApplicationService.getApprovalHistory(timesheetId, requesterId);
@@ -43,6 +52,11 @@ public class ApprovalServiceImpl implements ApprovalService {
         return approvalApplicationService.getPendingApprovalsForUser(approverId);
     }
 
+    @Override
+    public Page<Timesheet> getPendingApprovalsForUser(Long approverId, Pageable pageable) {
+        return approvalApplicationService.getPendingApprovalsForUser(approverId, pageable);
+    }
+
     @Override
     public boolean canUserPerformAction(Timesheet timesheet, ApprovalAction action, Long requesterId) {
         return approvalApplicationService.canUserPerformAction(timesheet, action, requesterId);
@@ -1,5 +1,8 @@
 package com.usyd.catams.service.impl;
 
+import com.usyd.catams.dto.CourseBudgetTotals;
+import com.usyd.catams.dto.DashboardAggregateData;
+import com.usyd.catams.dto.DashboardWindows;
 import com.usyd.catams.dto.TimesheetSummaryData;
 import com.usyd.catams.dto.response.*;
 import com.usyd.catams.entity.Course;
@@ -10,9 +13,13 @@ import com.usyd.catams.enums.UserRole;
 import com.usyd.catams.exception.AuthenticationException;
 import com.usyd.catams.exception.BusinessException;
 import com.usyd.catams.repository.CourseRepository;
+import com.usyd.catams.repository.DashboardAggregateQueries;
 import com.usyd.catams.repository.TimesheetRepository;
+import com.usyd.catams.repository.TimesheetWeeklyRollupRepository;
+import com.usyd.catams.service.CourseScopeCache;
 import com.usyd.catams.service.DashboardService;
 import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.beans.factory.annotation.Value;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
 import org.springframework.stereotype.Service;
@@ -27,14 +34,14 @@ import java.time.temporal.ChronoUnit;
 import java.util.ArrayList;
 import java.util.List;
 import java.util.Optional;
-import java.util.stream.Collectors;
 
 /**
  * Dashboard service implementation with role-based data aggregation
  * 
  * Provides efficient dashboard summaries using direct repository aggregation queries
- * to minimize memory usage and maximize performance. Enforces strict role-based
- * access control and data filtering.
+ * to minimize memory usage and maximize performance. Each scope is aggregated in a
+ * single pass that evaluates the requested period and the current/previous week
+ * together. Enforces strict role-based access control and data filtering.
  * 
  * @author Development Team
  * @since 1.0
@@ -45,26 +52,33 @@ public class DashboardServiceImpl implements DashboardService {
 
     private final TimesheetRepository timesheetRepository;
     private final CourseRepository courseRepository;
-    private final com.usyd.catams.repository.LecturerAssignmentRepository lecturerAssignmentRepository;
+    private final CourseScopeCache courseScopeCache;
+    private final DashboardAggregateQueries aggregateQueries;
     private final Clock clock;
     private static final Logger LOGGER = LoggerFactory.getLogger(DashboardServiceImpl.class);
 
     @Autowired
     public DashboardServiceImpl(TimesheetRepository timesheetRepository,
                                CourseRepository courseRepository,
-                               com.usyd.catams.repository.LecturerAssignmentRepository lecturerAssignmentRepository,
-                               Clock clock) {
+                               CourseScopeCache courseScopeCache,
+                               Clock clock,
+                               TimesheetWeeklyRollupRepository weeklyRollupRepository,
+                               @Value("${app.dashboard.read-from-rollup:false}") Boolean readFromRollup) {
         this.timesheetRepository = timesheetRepository;
         this.courseRepository = courseRepository;
-        this.lecturerAssignmentRepository = lecturerAssignmentRepository;
+        this.courseScopeCache = courseScopeCache;
         this.clock = (clock != null ? clock : Clock.systemDefaultZone());
+        // The weekly rollup serves the same aggregates from pre-summed weeks once it is populated
+        this.aggregateQueries = (Boolean.TRUE.equals(readFromRollup) && weeklyRollupRepository != null)
+            ? weeklyRollupRepository
+            : timesheetRepository;
     }
 
     // Backward-compatible constructor used by certain tests
     public DashboardServiceImpl(TimesheetRepository timesheetRepository,
                                CourseRepository courseRepository,
                                Clock clock) {
-        this(timesheetRepository, courseRepository, null, clock);
+        this(timesheetRepository, courseRepository, null, clock, null, false);
     }
 
     @Override
@@ -102,9 +116,10 @@ public class DashboardServiceImpl implements DashboardService {
      * Aggregates personal timesheet data for the authenticated tutor.
      */
     private DashboardSummaryResponse getTutorDashboard(Long tutorId, LocalDate startDate, LocalDate endDate) {
-        // Use efficient aggregation query to get summary data
-        TimesheetSummaryData summaryData = timesheetRepository.findTimesheetSummaryByTutor(
-            tutorId, startDate, endDate);
+        // One aggregation pass covers the period summary and the workload weeks
+        DashboardAggregateData aggregate = aggregateQueries.aggregateDashboardByTutor(
+            tutorId, windowsFor(startDate, endDate));
+        TimesheetSummaryData summaryData = aggregate.getPeriodSummary();
 
         return new DashboardSummaryResponse(
             summaryData.getTotalTimesheets().intValue(),
@@ -114,7 +129,7 @@ public class DashboardServiceImpl implements DashboardService {
             null, // TUTORs don't see budget information
             getRecentActivitiesForTutor(tutorId),
             getPendingItemsForTutor(tutorId),
-            getWorkloadAnalysisForTutor(tutorId, startDate, endDate)
+            buildWorkloadAnalysis(aggregate, startDate, endDate, null, null) // TUTORs don't see tutor counts
         );
     }
 
@@ -125,7 +140,8 @@ public class DashboardServiceImpl implements DashboardService {
     private DashboardSummaryResponse getLecturerDashboard(Long lecturerId, Optional<Long> courseId, 
                                                          LocalDate startDate, LocalDate endDate) {
         List<Course> managedCourses;
-        TimesheetSummaryData summaryData;
+        DashboardAggregateData aggregate;
+        DashboardWindows windows = windowsFor(startDate, endDate);
 
         if (courseId.isPresent()) {
             // Filter to specific course
@@ -133,17 +149,15 @@ public class DashboardServiceImpl implements DashboardService {
                 .orElseThrow(() -> new BusinessException("RESOURCE_NOT_FOUND", 
                     "Course with id " + courseId.get() + " not found"));
             managedCourses = List.of(course);
-            summaryData = timesheetRepository.findTimesheetSummaryByCourse(
-                courseId.get(), startDate, endDate);
+            aggregate = aggregateQueries.aggregateDashboardByCourse(courseId.get(), windows);
         } else {
             // Get all courses assigned to this lecturer via assignments (SSOT)
             java.util.List<Long> courseIds;
-            if (lecturerAssignmentRepository != null) {
-                var assigned = lecturerAssignmentRepository.findByLecturerId(lecturerId);
-                courseIds = assigned.stream().map(a -> a.getCourseId()).toList();
+            if (courseScopeCache != null) {
+                courseIds = courseScopeCache.lecturerCourses(lecturerId).toList();
                 managedCourses = courseRepository.findAllById(courseIds).stream().filter(Course::getIsActive).toList();
             } else {
-                // Fallback for tests that don't inject the assignment repository
+                // Fallback for tests that don't inject the course scope cache
                 managedCourses = courseRepository.findByLecturerIdAndIsActive(lecturerId, true);
                 courseIds = managedCourses.stream().map(Course::getId).toList();
             }
@@ -151,23 +165,28 @@ public class DashboardServiceImpl implements DashboardService {
             
             if (courseIds.isEmpty()) {
                 // Lecturer has no active courses
-                summaryData = new TimesheetSummaryData(0L, BigDecimal.ZERO, BigDecimal.ZERO, 0L);
+                aggregate = DashboardAggregateData.empty();
             } else {
-                summaryData = timesheetRepository.findTimesheetSummaryByCourses(
-                    courseIds, startDate, endDate);
-                LOGGER.debug("Summary data for lecturer {}: {} timesheets", lecturerId, summaryData.getTotalTimesheets());
+                aggregate = aggregateQueries.aggregateDashboardByCourses(courseIds, windows);
+                LOGGER.debug("Summary data for lecturer {}: {} timesheets", lecturerId,
+                    aggregate.getPeriodSummary().getTotalTimesheets());
             }
         }
 
+        TimesheetSummaryData summaryData = aggregate.getPeriodSummary();
+        BigDecimal totalBudget = managedCourses.stream()
+            .map(Course::getBudgetAllocated)
+            .reduce(BigDecimal.ZERO, BigDecimal::add);
+
         return new DashboardSummaryResponse(
             summaryData.getTotalTimesheets().intValue(),
             summaryData.getPendingApprovals().intValue(),
             summaryData.getTotalHours(),
             summaryData.getTotalPay(),
-            calculateBudgetUsage(managedCourses, summaryData.getTotalPay()),
+            calculateBudgetUsage(totalBudget, summaryData.getTotalPay()),
             getRecentActivitiesForCourses(managedCourses),
             getPendingItemsForLecturer(lecturerId),
-            getWorkloadAnalysisForCourses(managedCourses, startDate, endDate)
+            getWorkloadAnalysisForCourses(managedCourses, aggregate, startDate, endDate)
         );
     }
 
@@ -177,25 +196,24 @@ public class DashboardServiceImpl implements DashboardService {
      */
     private DashboardSummaryResponse getAdminDashboard(Optional<Long> courseId, 
                                                       LocalDate startDate, LocalDate endDate) {
-        TimesheetSummaryData summaryData;
-
-        if (courseId.isPresent()) {
-            summaryData = timesheetRepository.findTimesheetSummaryByCourse(
-                courseId.get(), startDate, endDate);
-        } else {
-            summaryData = timesheetRepository.findTimesheetSummarySystemWide(
-                startDate, endDate);
-        }
+        DashboardWindows windows = windowsFor(startDate, endDate);
+        // Workload analysis is always system-wide, so the system-wide pass is needed either way
+        DashboardAggregateData systemWide = aggregateQueries.aggregateDashboardSystemWide(windows);
+        DashboardAggregateData scoped = courseId.isPresent()
+            ? aggregateQueries.aggregateDashboardByCourse(courseId.get(), windows)
+            : systemWide;
+        TimesheetSummaryData summaryData = scoped.getPeriodSummary();
+        CourseBudgetTotals activeCourses = courseRepository.summarizeActiveCourseBudgets();
 
         return new DashboardSummaryResponse(
             summaryData.getTotalTimesheets().intValue(),
             summaryData.getPendingApprovals().intValue(),
             summaryData.getTotalHours(),
             summaryData.getTotalPay(),
-            calculateSystemWideBudgetUsage(courseId),
+            calculateSystemWideBudgetUsage(courseId, activeCourses),
             getSystemWideRecentActivities(),
             getPendingItemsForAdmin(),
-            getSystemWideWorkloadAnalysis(startDate, endDate)
+            getSystemWideWorkloadAnalysis(systemWide, activeCourses, startDate, endDate)
         );
     }
 
@@ -204,8 +222,8 @@ public class DashboardServiceImpl implements DashboardService {
      */
     private void validateLecturerAccess(Long lecturerId, Optional<Long> courseId) {
         if (courseId.isPresent()) {
-            boolean hasAccess = lecturerAssignmentRepository != null
-                ? lecturerAssignmentRepository.existsByLecturerIdAndCourseId(lecturerId, courseId.get())
+            boolean hasAccess = courseScopeCache != null
+                ? courseScopeCache.isLecturerAssigned(lecturerId, courseId.get())
                 : courseRepository.existsByIdAndLecturerId(courseId.get(), lecturerId);
             if (!hasAccess) {
                 throw new BusinessException("ACCESS_DENIED", 
@@ -217,11 +235,7 @@ public class DashboardServiceImpl implements DashboardService {
     /**
      * Calculate budget usage for LECTURER dashboard.
      */
-    private BudgetUsage calculateBudgetUsage(List<Course> courses, BigDecimal usedBudget) {
-        BigDecimal totalBudget = courses.stream()
-            .map(Course::getBudgetAllocated)
-            .reduce(BigDecimal.ZERO, BigDecimal::add);
-
+    private BudgetUsage calculateBudgetUsage(BigDecimal totalBudget, BigDecimal usedBudget) {
         if (totalBudget.compareTo(BigDecimal.ZERO) == 0) {
             return new BudgetUsage(BigDecimal.ZERO, BigDecimal.ZERO, BigDecimal.ZERO, BigDecimal.ZERO);
         }
@@ -238,19 +252,14 @@ public class DashboardServiceImpl implements DashboardService {
     /**
      * Calculate system-wide budget usage for ADMIN dashboard.
      */
-    private BudgetUsage calculateSystemWideBudgetUsage(Optional<Long> courseId) {
+    private BudgetUsage calculateSystemWideBudgetUsage(Optional<Long> courseId, CourseBudgetTotals activeCourses) {
         if (courseId.isPresent()) {
             Course course = courseRepository.findById(courseId.get())
                 .orElseThrow(() -> new BusinessException("RESOURCE_NOT_FOUND", 
                     "Course with id " + courseId.get() + " not found"));
-            return calculateBudgetUsage(List.of(course), course.getBudgetUsed());
+            return calculateBudgetUsage(course.getBudgetAllocated(), course.getBudgetUsed());
         } else {
-            List<Course> allActiveCourses = courseRepository.findByIsActive(true);
-            BigDecimal totalUsed = allActiveCourses.stream()
-                .map(Course::getBudgetUsed)
-                .filter(v -> v != null)
-                .reduce(BigDecimal.ZERO, BigDecimal::add);
-            return calculateBudgetUsage(allActiveCourses, totalUsed);
+            return calculateBudgetUsage(activeCourses.getTotalAllocated(), activeCourses.getTotalUsed());
         }
     }
 
@@ -347,112 +356,60 @@ public class DashboardServiceImpl implements DashboardService {
         return items;
     }
 
-    /**
-     * Get workload analysis for TUTOR.
-     */
-    private WorkloadAnalysis getWorkloadAnalysisForTutor(Long tutorId, LocalDate startDate, LocalDate endDate) {
-        // Calculate current week and previous week hours
-        LocalDate currentWeekStart = LocalDate.now(clock).with(java.time.DayOfWeek.MONDAY);
-        LocalDate currentWeekEnd = currentWeekStart.plusDays(6);
-        LocalDate previousWeekStart = currentWeekStart.minusWeeks(1);
-        LocalDate previousWeekEnd = previousWeekStart.plusDays(6);
-
-        TimesheetSummaryData currentWeek = timesheetRepository.findTimesheetSummaryByTutor(
-            tutorId, currentWeekStart, currentWeekEnd);
-        TimesheetSummaryData previousWeek = timesheetRepository.findTimesheetSummaryByTutor(
-            tutorId, previousWeekStart, previousWeekEnd);
-        TimesheetSummaryData totalPeriod = timesheetRepository.findTimesheetSummaryByTutor(
-            tutorId, startDate, endDate);
-
-        long weeksBetween = ChronoUnit.WEEKS.between(startDate, endDate) + 1;
-        BigDecimal averageWeeklyHours = weeksBetween > 0 
-            ? totalPeriod.getTotalHours().divide(BigDecimal.valueOf(weeksBetween), 2, RoundingMode.HALF_UP)
-            : BigDecimal.ZERO;
-
-        return new WorkloadAnalysis(
-            currentWeek.getTotalHours(),
-            previousWeek.getTotalHours(),
-            averageWeeklyHours,
-            currentWeek.getTotalHours().max(previousWeek.getTotalHours()), // Simple peak calculation
-            null, // TUTORs don't see tutor counts
-            null  // TUTORs don't see tutor counts
-        );
-    }
-
     /**
      * Get workload analysis for LECTURER courses.
      */
-    private WorkloadAnalysis getWorkloadAnalysisForCourses(List<Course> courses, LocalDate startDate, LocalDate endDate) {
+    private WorkloadAnalysis getWorkloadAnalysisForCourses(List<Course> courses, DashboardAggregateData aggregate,
+                                                          LocalDate startDate, LocalDate endDate) {
         if (courses.isEmpty()) {
             return new WorkloadAnalysis(BigDecimal.ZERO, BigDecimal.ZERO, BigDecimal.ZERO, BigDecimal.ZERO, 0, 0);
         }
 
-        List<Long> courseIds = courses.stream().map(Course::getId).collect(Collectors.toList());
-        
-        LocalDate currentWeekStart = LocalDate.now(clock).with(java.time.DayOfWeek.MONDAY);
-        LocalDate currentWeekEnd = currentWeekStart.plusDays(6);
-        LocalDate previousWeekStart = currentWeekStart.minusWeeks(1);
-        LocalDate previousWeekEnd = previousWeekStart.plusDays(6);
-
-        TimesheetSummaryData currentWeek = timesheetRepository.findTimesheetSummaryByCourses(
-            courseIds, currentWeekStart, currentWeekEnd);
-        TimesheetSummaryData previousWeek = timesheetRepository.findTimesheetSummaryByCourses(
-            courseIds, previousWeekStart, previousWeekEnd);
-        TimesheetSummaryData totalPeriod = timesheetRepository.findTimesheetSummaryByCourses(
-            courseIds, startDate, endDate);
-
-        long weeksBetween = ChronoUnit.WEEKS.between(startDate, endDate) + 1;
-        BigDecimal averageWeeklyHours = weeksBetween > 0 
-            ? totalPeriod.getTotalHours().divide(BigDecimal.valueOf(weeksBetween), 2, RoundingMode.HALF_UP)
-            : BigDecimal.ZERO;
-
         // For MVP, use mock tutor counts - will be implemented with actual data
         int totalTutors = courses.size() * 3; // Estimate
         int activeTutors = courses.size() * 2; // Estimate
 
-        return new WorkloadAnalysis(
-            currentWeek.getTotalHours(),
-            previousWeek.getTotalHours(),
-            averageWeeklyHours,
-            currentWeek.getTotalHours().max(previousWeek.getTotalHours()),
-            totalTutors,
-            activeTutors
-        );
+        return buildWorkloadAnalysis(aggregate, startDate, endDate, totalTutors, activeTutors);
     }
 
     /**
      * Get system-wide workload analysis for ADMIN.
      */
-    private WorkloadAnalysis getSystemWideWorkloadAnalysis(LocalDate startDate, LocalDate endDate) {
-        LocalDate currentWeekStart = LocalDate.now(clock).with(java.time.DayOfWeek.MONDAY);
-        LocalDate currentWeekEnd = currentWeekStart.plusDays(6);
-        LocalDate previousWeekStart = currentWeekStart.minusWeeks(1);
-        LocalDate previousWeekEnd = previousWeekStart.plusDays(6);
-
-        TimesheetSummaryData currentWeek = timesheetRepository.findTimesheetSummarySystemWide(
-            currentWeekStart, currentWeekEnd);
-        TimesheetSummaryData previousWeek = timesheetRepository.findTimesheetSummarySystemWide(
-            previousWeekStart, previousWeekEnd);
-        TimesheetSummaryData totalPeriod = timesheetRepository.findTimesheetSummarySystemWide(
-            startDate, endDate);
+    private WorkloadAnalysis getSystemWideWorkloadAnalysis(DashboardAggregateData aggregate, CourseBudgetTotals activeCourses,
+                                                           LocalDate startDate, LocalDate endDate) {
+        // For MVP, use mock tutor counts - will be implemented with actual data
+        int courseCount = activeCourses.getCourseCount().intValue();
+        int totalTutors = courseCount * 4; // Estimate
+        int activeTutors = courseCount * 3; // Estimate
+
+        return buildWorkloadAnalysis(aggregate, startDate, endDate, totalTutors, activeTutors);
+    }
 
+    /**
+     * Build workload analysis from an aggregation pass.
+     * The period total doubles as the workload total, so no extra query is needed for the average.
+     */
+    private WorkloadAnalysis buildWorkloadAnalysis(DashboardAggregateData aggregate, LocalDate startDate, LocalDate endDate,
+                                                   Integer totalTutors, Integer activeTutors) {
         long weeksBetween = ChronoUnit.WEEKS.between(startDate, endDate) + 1;
         BigDecimal averageWeeklyHours = weeksBetween > 0 
-            ? totalPeriod.getTotalHours().divide(BigDecimal.valueOf(weeksBetween), 2, RoundingMode.HALF_UP)
+            ? aggregate.getPeriodSummary().getTotalHours().divide(BigDecimal.valueOf(weeksBetween), 2, RoundingMode.HALF_UP)
             : BigDecimal.ZERO;
 
-        // For MVP, use mock tutor counts - will be implemented with actual data
-        List<Course> allCourses = courseRepository.findByIsActive(true);
-        int totalTutors = allCourses.size() * 4; // Estimate
-        int activeTutors = allCourses.size() * 3; // Estimate
-
         return new WorkloadAnalysis(
-            currentWeek.getTotalHours(),
-            previousWeek.getTotalHours(),
+            aggregate.getCurrentWeekHours(),
+            aggregate.getPreviousWeekHours(),
             averageWeeklyHours,
-            currentWeek.getTotalHours().max(previousWeek.getTotalHours()),
+            aggregate.getCurrentWeekHours().max(aggregate.getPreviousWeekHours()), // Simple peak calculation
             totalTutors,
             activeTutors
         );
     }
+
+    /**
+     * Resolve the period and current/previous week windows against the injected clock.
+     */
+    private DashboardWindows windowsFor(LocalDate startDate, LocalDate endDate) {
+        return DashboardWindows.of(startDate, endDate, LocalDate.now(clock));
+    }
 }
@@ -13,11 +13,13 @@ import com.usyd.catams.exception.ErrorCodes;
 import com.usyd.catams.exception.ResourceNotFoundException;
 import com.usyd.catams.enums.UserRole;
 import com.usyd.catams.repository.UserRepository;
+import com.usyd.catams.security.ActiveUserCache;
 import com.usyd.catams.security.JwtTokenProvider;
 import com.usyd.catams.service.UserService;
 import java.util.Comparator;
 import java.util.List;
 
+import org.springframework.beans.factory.annotation.Autowired;
 import org.springframework.security.crypto.password.PasswordEncoder;
 import org.springframework.stereotype.Service;
 import org.springframework.transaction.annotation.Transactional;
@@ -37,13 +39,26 @@ public class UserServiceImpl implements UserService {
     private final UserRepository userRepository;
     private final PasswordEncoder passwordEncoder;
     private final JwtTokenProvider jwtTokenProvider;
+    private final ActiveUserCache activeUserCache;
 
+    @Autowired
     public UserServiceImpl(UserRepository userRepository, 
                           PasswordEncoder passwordEncoder,
-                          JwtTokenProvider jwtTokenProvider) {
+                          JwtTokenProvider jwtTokenProvider,
+                          ActiveUserCache activeUserCache) {
         this.userRepository = userRepository;
         this.passwordEncoder = passwordEncoder;
         this.jwtTokenProvider = jwtTokenProvider;
+        this.activeUserCache = activeUserCache;
+    }
+
+    /**
+     * Backward-compatible constructor used by certain tests
+     */
+    public UserServiceImpl(UserRepository userRepository,
+                          PasswordEncoder passwordEncoder,
+                          JwtTokenProvider jwtTokenProvider) {
+        this(userRepository, passwordEncoder, jwtTokenProvider, null);
     }
 
     /**
@@ -219,6 +234,11 @@ public class UserServiceImpl implements UserService {
         }
 
         User savedUser = userRepository.save(user);
+        // The JWT filter authenticates from cached snapshots; drop this user's so a
+        // deactivation (or any other change to the principal) applies on the next request
+        if (activeUserCache != null) {
+            activeUserCache.evict(userId);
+        }
         return toResponse(savedUser);
     }
 
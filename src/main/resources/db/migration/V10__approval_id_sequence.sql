@@ -0,0 +1,10 @@
+-- Same change as V9 for approvals: a pooled sequence lets Hibernate batch the approval
+-- rows written by batch approval actions. INCREMENT BY must match allocationSize on Approval.id.
+
+ALTER TABLE approvals ALTER COLUMN id DROP IDENTITY IF EXISTS;
+
+CREATE SEQUENCE IF NOT EXISTS approval_id_seq INCREMENT BY 50 OWNED BY approvals.id;
+
+SELECT setval('approval_id_seq', COALESCE((SELECT MAX(id) FROM approvals), 0) + 50);
+
+ALTER TABLE approvals ALTER COLUMN id SET DEFAULT nextval('approval_id_seq');
@@ -0,0 +1,26 @@
+-- Transactional outbox for domain events. DomainEventPublisher inserts a row in the same
+-- transaction as the aggregate change; EventOutboxDrainer claims unprocessed rows with
+-- FOR UPDATE SKIP LOCKED, dispatches them in-process and stamps processed_at.
+
+CREATE TABLE IF NOT EXISTS event_outbox (
+    id              BIGSERIAL PRIMARY KEY,
+    event_id        UUID         NOT NULL,
+    event_type      VARCHAR(100) NOT NULL,
+    aggregate_type  VARCHAR(50)  NOT NULL,
+    aggregate_id    VARCHAR(100) NOT NULL,
+    payload         BYTEA        NOT NULL,
+    occurred_at     TIMESTAMP    NOT NULL,
+    created_at      TIMESTAMP    NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    processed_at    TIMESTAMP,
+    attempts        INTEGER      NOT NULL DEFAULT 0,
+    last_error      VARCHAR(1000),
+    CONSTRAINT uq_event_outbox_event_id UNIQUE (event_id)
+);
+
+-- Drain query: processed_at IS NULL ORDER BY id LIMIT n; stays small as rows are processed
+CREATE INDEX IF NOT EXISTS idx_event_outbox_pending ON event_outbox(id)
+    WHERE processed_at IS NULL;
+
+-- Housekeeping of processed rows by age
+CREATE INDEX IF NOT EXISTS idx_event_outbox_processed_at ON event_outbox(processed_at)
+    WHERE processed_at IS NOT NULL;
@@ -0,0 +1,23 @@
+-- Dead-letter store for domain events that exhausted their delivery attempts, either through
+-- DomainEventPublisher.publishWithRetry (source RETRY) or the outbox drainer (source OUTBOX).
+-- Rows are replayed through POST /api/admin/events/dead-letters/{id}/replay.
+
+CREATE TABLE IF NOT EXISTS event_dead_letter (
+    id                BIGSERIAL PRIMARY KEY,
+    event_id          UUID          NOT NULL,
+    event_type        VARCHAR(100)  NOT NULL,
+    aggregate_type    VARCHAR(50)   NOT NULL,
+    aggregate_id      VARCHAR(100)  NOT NULL,
+    payload           BYTEA         NOT NULL,
+    source            VARCHAR(20)   NOT NULL,
+    attempts          INTEGER       NOT NULL,
+    last_error        VARCHAR(1000),
+    dead_lettered_at  TIMESTAMP     NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    replayed_at       TIMESTAMP
+);
+
+-- Admin listing of entries still awaiting replay, newest first
+CREATE INDEX IF NOT EXISTS idx_event_dead_letter_pending ON event_dead_letter(dead_lettered_at DESC, id DESC)
+    WHERE replayed_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_event_dead_letter_event_id ON event_dead_letter(event_id);
@@ -0,0 +1,14 @@
+-- Normalised-description hash for the tutorial repeat rule.
+-- Timesheet#descriptionHashOf computes the same value on every JPA write:
+-- md5 of the description lower-cased, whitespace runs collapsed to one space, then trimmed.
+
+ALTER TABLE timesheets ADD COLUMN IF NOT EXISTS description_hash VARCHAR(32);
+
+UPDATE timesheets
+SET description_hash = md5(btrim(regexp_replace(lower(description), '\s+', ' ', 'g'), ' '))
+WHERE description_hash IS NULL;
+
+-- countTutorialRepeatsOfContent: course_id = ? AND task_type = 'TUTORIAL' AND description_hash = ?
+--   AND (session_date BETWEEN ? AND ? OR week_start_date BETWEEN ? AND ?)
+CREATE INDEX IF NOT EXISTS idx_timesheet_repeat_rule
+    ON timesheets(course_id, task_type, description_hash, session_date);
@@ -0,0 +1,6 @@
+-- Lease on claimed outbox rows. EventOutboxDrainer claims a batch in a short transaction that
+-- stamps claimed_until, runs the listeners without holding locks or a connection, and closes or
+-- releases the rows in a second transaction. Rows of a node that dies mid-batch are claimable
+-- again once their lease has run out.
+
+ALTER TABLE event_outbox ADD COLUMN IF NOT EXISTS claimed_until TIMESTAMP;
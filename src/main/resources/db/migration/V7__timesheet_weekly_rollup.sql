@@ -0,0 +1,25 @@
+-- Weekly timesheet rollup read model for dashboard and budget metrics
+
+CREATE TABLE IF NOT EXISTS timesheet_weekly_rollup (
+    id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    course_id BIGINT NOT NULL,
+    tutor_id BIGINT NOT NULL,
+    week_start_date DATE NOT NULL,
+    status VARCHAR(50) NOT NULL,
+    timesheet_count BIGINT NOT NULL DEFAULT 0,
+    total_hours DECIMAL(12,1) NOT NULL DEFAULT 0,
+    total_pay DECIMAL(15,3) NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT ux_timesheet_weekly_rollup_key UNIQUE (course_id, tutor_id, week_start_date, status)
+);
+
+CREATE INDEX IF NOT EXISTS ix_timesheet_weekly_rollup_week ON timesheet_weekly_rollup(week_start_date);
+CREATE INDEX IF NOT EXISTS ix_timesheet_weekly_rollup_tutor_week ON timesheet_weekly_rollup(tutor_id, week_start_date);
+
+-- Backfill from existing timesheets so the read model starts consistent
+INSERT INTO timesheet_weekly_rollup (course_id, tutor_id, week_start_date, status,
+                                     timesheet_count, total_hours, total_pay, updated_at)
+SELECT t.course_id, t.tutor_id, t.week_start_date, t.status,
+       COUNT(*), SUM(t.hours), SUM(t.hours * t.hourly_rate), CURRENT_TIMESTAMP
+FROM timesheets t
+GROUP BY t.course_id, t.tutor_id, t.week_start_date, t.status;
@@ -0,0 +1,37 @@
+-- Composite and partial indexes aligned with the query shapes in TimesheetRepository.
+-- Guarded by TimesheetQueryPlanIntegrationTest, which fails if a hot query seq-scans timesheets.
+
+-- Tutor dashboards and tutor-scoped listings: tutor_id = ? AND week_start_date BETWEEN ? AND ?
+CREATE INDEX IF NOT EXISTS idx_timesheet_tutor_week ON timesheets(tutor_id, week_start_date);
+
+-- Course dashboards: course_id IN (...) AND week_start_date BETWEEN ? AND ?
+CREATE INDEX IF NOT EXISTS idx_timesheet_course_week ON timesheets(course_id, week_start_date);
+
+-- Course/status lookups: course_id = ? AND status = ?
+CREATE INDEX IF NOT EXISTS idx_timesheet_course_status ON timesheets(course_id, status);
+
+-- System-wide dashboards over a week window
+CREATE INDEX IF NOT EXISTS idx_timesheet_week_start ON timesheets(week_start_date);
+
+-- Status queues ordered by age: status = ? ORDER BY created_at, id
+CREATE INDEX IF NOT EXISTS idx_timesheet_status_created ON timesheets(status, created_at, id);
+
+-- Unfiltered listings and keyset pagination: ORDER BY created_at DESC, id DESC
+CREATE INDEX IF NOT EXISTS idx_timesheet_created_id ON timesheets(created_at, id);
+
+-- Approval queues only ever look at the two confirmed-but-not-final statuses
+CREATE INDEX IF NOT EXISTS idx_timesheet_confirmed_queue ON timesheets(course_id, created_at, id)
+    WHERE status IN ('TUTOR_CONFIRMED', 'LECTURER_CONFIRMED');
+
+-- countTutorialsForRepeatRule: task_type = 'TUTORIAL' AND course_id = ?
+--   AND (week_start_date BETWEEN ? AND ? OR session_date BETWEEN ? AND ?)
+-- Two partial indexes let the planner BitmapOr both date branches.
+CREATE INDEX IF NOT EXISTS idx_timesheet_tutorial_course_week ON timesheets(course_id, week_start_date)
+    WHERE task_type = 'TUTORIAL';
+CREATE INDEX IF NOT EXISTS idx_timesheet_tutorial_course_session ON timesheets(course_id, session_date)
+    WHERE task_type = 'TUTORIAL';
+
+-- Single-column indexes superseded by the composites above (same leading column)
+DROP INDEX IF EXISTS idx_timesheet_tutor;
+DROP INDEX IF EXISTS idx_timesheet_course;
+DROP INDEX IF EXISTS idx_timesheet_status;
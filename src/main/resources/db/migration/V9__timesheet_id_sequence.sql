@@ -0,0 +1,12 @@
+-- Replace the IDENTITY key on timesheets with a pooled sequence so Hibernate can
+-- allocate IDs up front and send inserts as JDBC batches (bulk import).
+-- INCREMENT BY must match allocationSize on Timesheet.id. Raw SQL inserts keep working
+-- through the column default; they take the top value of a block Hibernate never uses.
+
+ALTER TABLE timesheets ALTER COLUMN id DROP IDENTITY IF EXISTS;
+
+CREATE SEQUENCE IF NOT EXISTS timesheet_id_seq INCREMENT BY 50 OWNED BY timesheets.id;
+
+SELECT setval('timesheet_id_seq', COALESCE((SELECT MAX(id) FROM timesheets), 0) + 50);
+
+ALTER TABLE timesheets ALTER COLUMN id SET DEFAULT nextval('timesheet_id_seq');
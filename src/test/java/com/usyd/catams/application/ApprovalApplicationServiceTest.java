@@ -21,9 +21,15 @@ import org.junit.jupiter.api.DisplayName;
 import org.junit.jupiter.api.Nested;
 import org.junit.jupiter.api.Test;
 import org.junit.jupiter.api.extension.ExtendWith;
+import org.mockito.ArgumentCaptor;
 import org.mockito.InjectMocks;
 import org.mockito.Mock;
 import org.mockito.junit.jupiter.MockitoExtension;
+import org.springframework.data.domain.Page;
+import org.springframework.data.domain.PageImpl;
+import org.springframework.data.domain.PageRequest;
+import org.springframework.data.domain.Pageable;
+import org.springframework.data.domain.Sort;
 
 import java.util.List;
 import java.util.Optional;
@@ -463,19 +469,41 @@ class ApprovalApplicationServiceTest {
             when(userRepository.findById(2L)).thenReturn(Optional.of(testLecturer));
             when(approvalDomainService.getRelevantStatusesForRole(UserRole.LECTURER))
                 .thenReturn(List.of(ApprovalStatus.TUTOR_CONFIRMED));
-            when(timesheetRepository.findByStatusIn(any())).thenReturn(List.of(testTimesheet));
-            when(courseRepository.findById(100L)).thenReturn(Optional.of(testCourse));
-            when(approvalDomainService.canUserActOnTimesheet(testTimesheet, testLecturer, testCourse))
-                .thenReturn(true);
+            when(timesheetRepository.findIds(any(), any())).thenReturn(new PageImpl<>(List.of(10L)));
+            when(timesheetRepository.findAllWithApprovalsByIdIn(List.of(10L))).thenReturn(List.of(testTimesheet));
 
             // Act
             List<Timesheet> result = service.getPendingApprovalsForUser(2L);
 
             // Assert
-            assertThat(result).isNotEmpty();
-            assertThat(result).contains(testTimesheet);
+            assertThat(result).containsExactly(testTimesheet);
             verify(userRepository).findById(2L);
             verify(approvalDomainService).getRelevantStatusesForRole(UserRole.LECTURER);
+            verify(courseRepository, never()).findById(anyLong());
+            verify(timesheetRepository, never()).findByStatusIn(any());
+        }
+
+        @Test
+        @DisplayName("Should page the queue oldest first")
+        void shouldPageQueueOldestFirst() {
+            // Arrange
+            when(userRepository.findById(2L)).thenReturn(Optional.of(testLecturer));
+            when(approvalDomainService.getRelevantStatusesForRole(UserRole.LECTURER))
+                .thenReturn(List.of(ApprovalStatus.TUTOR_CONFIRMED));
+            when(timesheetRepository.findIds(any(), any()))
+                .thenReturn(new PageImpl<>(List.of(), PageRequest.of(1, 5), 5));
+
+            // Act
+            Page<Timesheet> result = service.getPendingApprovalsForUser(2L, PageRequest.of(1, 5));
+
+            // Assert
+            ArgumentCaptor<Pageable> pageable = ArgumentCaptor.forClass(Pageable.class);
+            verify(timesheetRepository).findIds(any(), pageable.capture());
+            assertThat(pageable.getValue().getPageNumber()).isEqualTo(1);
+            assertThat(pageable.getValue().getSort())
+                .containsExactly(Sort.Order.asc("createdAt"), Sort.Order.asc("id"));
+            assertThat(result.getTotalElements()).isEqualTo(5);
+            verify(timesheetRepository, never()).findAllWithApprovalsByIdIn(any());
         }
 
         @Test
@@ -485,7 +513,7 @@ class ApprovalApplicationServiceTest {
             when(userRepository.findById(2L)).thenReturn(Optional.of(testLecturer));
             when(approvalDomainService.getRelevantStatusesForRole(UserRole.LECTURER))
                 .thenReturn(List.of(ApprovalStatus.TUTOR_CONFIRMED));
-            when(timesheetRepository.findByStatusIn(any())).thenReturn(List.of());
+            when(timesheetRepository.findIds(any(), any())).thenReturn(Page.empty());
 
             // Act
             List<Timesheet> result = service.getPendingApprovalsForUser(2L);
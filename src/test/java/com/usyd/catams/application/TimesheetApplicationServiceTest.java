@@ -23,11 +23,19 @@ import com.usyd.catams.repository.UserRepository;
 import com.usyd.catams.service.Schedule1CalculationResult;
 import com.usyd.catams.service.Schedule1PolicyProvider;
 import com.usyd.catams.testdata.TestDataBuilder;
+import jakarta.persistence.criteria.CriteriaBuilder;
+import jakarta.persistence.criteria.CriteriaQuery;
+import jakarta.persistence.criteria.Expression;
+import jakarta.persistence.criteria.Path;
+import jakarta.persistence.criteria.Predicate;
+import jakarta.persistence.criteria.Root;
 import org.junit.jupiter.api.BeforeEach;
 import org.junit.jupiter.api.DisplayName;
 import org.junit.jupiter.api.Nested;
 import org.junit.jupiter.api.Test;
 import org.junit.jupiter.api.extension.ExtendWith;
+import org.mockito.ArgumentCaptor;
+import org.mockito.Captor;
 import org.mockito.InjectMocks;
 import org.mockito.Mock;
 import org.mockito.junit.jupiter.MockitoExtension;
@@ -35,20 +43,28 @@ import org.springframework.data.domain.Page;
 import org.springframework.data.domain.PageImpl;
 import org.springframework.data.domain.PageRequest;
 import org.springframework.data.domain.Pageable;
+import org.springframework.data.jpa.domain.Specification;
 
 import java.math.BigDecimal;
 import java.time.LocalDate;
+import java.util.HashMap;
+import java.util.LinkedHashMap;
 import java.util.List;
+import java.util.Map;
 import java.util.Optional;
 
 import static org.assertj.core.api.Assertions.assertThat;
 import static org.assertj.core.api.Assertions.assertThatThrownBy;
+import static org.assertj.core.api.Assertions.entry;
 import static org.mockito.ArgumentMatchers.any;
 import static org.mockito.ArgumentMatchers.anyBoolean;
 import static org.mockito.ArgumentMatchers.anyLong;
+import static org.mockito.ArgumentMatchers.anyString;
 import static org.mockito.ArgumentMatchers.eq;
 import static org.mockito.Mockito.doNothing;
 import static org.mockito.Mockito.doThrow;
+import static org.mockito.Mockito.lenient;
+import static org.mockito.Mockito.mock;
 import static org.mockito.Mockito.never;
 import static org.mockito.Mockito.verify;
 import static org.mockito.Mockito.when;
@@ -104,6 +120,9 @@ class TimesheetApplicationServiceTest {
     @InjectMocks
     private TimesheetApplicationService service;
 
+    @Captor
+    private ArgumentCaptor<Specification<Timesheet>> specCaptor;
+
     private User testTutor;
     private User testLecturer;
     private User testAdmin;
@@ -147,6 +166,32 @@ class TimesheetApplicationServiceTest {
         );
     }
 
+    /**
+     * Evaluates a listing specification against mocked criteria objects and returns the
+     * attribute/value pairs it restricts by equality.
+     */
+    @SuppressWarnings({"unchecked", "rawtypes"})
+    private static Map<String, Object> equalityFilters(Specification<Timesheet> spec) {
+        Root<Timesheet> root = mock(Root.class);
+        CriteriaQuery<?> query = mock(CriteriaQuery.class);
+        CriteriaBuilder cb = mock(CriteriaBuilder.class);
+        Map<Path<?>, String> attributes = new HashMap<>();
+        Map<String, Object> filters = new LinkedHashMap<>();
+        lenient().when(root.get(anyString())).thenAnswer(invocation -> {
+            Path<?> path = mock(Path.class);
+            attributes.put(path, invocation.getArgument(0));
+            return path;
+        });
+        lenient().when(cb.equal(any(Expression.class), any(Object.class))).thenAnswer(invocation -> {
+            filters.put(attributes.get(invocation.getArgument(0)), invocation.getArgument(1));
+            return mock(Predicate.class);
+        });
+        lenient().when(cb.and(any(Predicate.class), any(Predicate.class))).thenReturn(mock(Predicate.class));
+
+        spec.toPredicate(root, query, cb);
+        return filters;
+    }
+
     @Nested
     @DisplayName("createTimesheet() - Timesheet Creation")
     class CreateTimesheetTests {
@@ -339,17 +384,21 @@ class TimesheetApplicationServiceTest {
         void shouldGetTimesheetsForAdminWithAllFilters() {
             // Arrange
             Pageable pageable = PageRequest.of(0, 10);
-            Page<Timesheet> expectedPage = new PageImpl<>(List.of(testTimesheet));
             when(userRepository.findById(3L)).thenReturn(Optional.of(testAdmin));
             when(permissionPolicy.canViewTimesheetsByFilters(testAdmin, 1L, 100L, ApprovalStatus.DRAFT)).thenReturn(true);
-            when(timesheetRepository.findWithFilters(1L, 100L, ApprovalStatus.DRAFT, pageable)).thenReturn(expectedPage);
+            when(timesheetRepository.findIds(any(Specification.class), eq(pageable)))
+                .thenReturn(new PageImpl<>(List.of(testTimesheet.getId()), pageable, 1));
+            when(timesheetRepository.findAllWithApprovalsByIdIn(List.of(testTimesheet.getId())))
+                .thenReturn(List.of(testTimesheet));
 
             // Act
             Page<Timesheet> result = service.getTimesheets(1L, 100L, ApprovalStatus.DRAFT, 3L, pageable);
 
             // Assert
             assertThat(result).hasSize(1);
-            verify(timesheetRepository).findWithFilters(1L, 100L, ApprovalStatus.DRAFT, pageable);
+            verify(timesheetRepository).findIds(specCaptor.capture(), eq(pageable));
+            assertThat(equalityFilters(specCaptor.getValue())).containsOnly(
+                entry("tutorId", 1L), entry("courseId", 100L), entry("status", ApprovalStatus.DRAFT));
         }
 
         @Test
@@ -357,18 +406,21 @@ class TimesheetApplicationServiceTest {
         void shouldGetTimesheetsForTutorOwnOnly() {
             // Arrange
             Pageable pageable = PageRequest.of(0, 10);
-            Page<Timesheet> expectedPage = new PageImpl<>(List.of(testTimesheet));
             when(userRepository.findById(1L)).thenReturn(Optional.of(testTutor));
             when(permissionPolicy.canViewTimesheetsByFilters(testTutor, null, null, null)).thenReturn(true);
-            when(timesheetRepository.findWithFilters(1L, null, null, pageable)).thenReturn(expectedPage);
+            when(timesheetRepository.findIds(any(Specification.class), eq(pageable)))
+                .thenReturn(new PageImpl<>(List.of(testTimesheet.getId()), pageable, 1));
+            when(timesheetRepository.findAllWithApprovalsByIdIn(List.of(testTimesheet.getId())))
+                .thenReturn(List.of(testTimesheet));
 
             // Act
             Page<Timesheet> result = service.getTimesheets(null, null, null, 1L, pageable);
 
             // Assert
             assertThat(result).hasSize(1);
-            // Tutor should only see their own timesheets (ID forced to 1L)
-            verify(timesheetRepository).findWithFilters(1L, null, null, pageable);
+            // Tutor should only see their own timesheets (specification scoped to the requester)
+            verify(timesheetRepository).findIds(specCaptor.capture(), eq(pageable));
+            assertThat(equalityFilters(specCaptor.getValue())).containsOnly(entry("tutorId", testTutor.getId()));
         }
 
         @Test
@@ -0,0 +1,106 @@
+package com.usyd.catams.common.application;
+
+import com.usyd.catams.entity.Course;
+import com.usyd.catams.entity.User;
+import com.usyd.catams.enums.UserRole;
+import org.junit.jupiter.api.AfterEach;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.springframework.mock.web.MockHttpServletRequest;
+import org.springframework.web.context.request.RequestContextHolder;
+import org.springframework.web.context.request.ServletRequestAttributes;
+
+import java.math.BigDecimal;
+import java.util.Optional;
+import java.util.concurrent.atomic.AtomicInteger;
+import java.util.function.Function;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+@DisplayName("RequestEntityCache")
+class RequestEntityCacheTest {
+
+    private final RequestEntityCache cache = new RequestEntityCache();
+
+    @AfterEach
+    void tearDown() {
+        RequestContextHolder.resetRequestAttributes();
+    }
+
+    @Test
+    @DisplayName("serves the seeded principal without loading it")
+    void seededUserIsReused() {
+        startRequest();
+        User principal = user(7L);
+        AtomicInteger loads = new AtomicInteger();
+
+        cache.seedUser(principal);
+
+        assertThat(cache.findUser(7L, counting(loads, Optional.of(user(7L))))).containsSame(principal);
+        assertThat(loads).hasValue(0);
+        assertThat(cache.getHitCount()).isEqualTo(1);
+    }
+
+    @Test
+    @DisplayName("loads each course once per request")
+    void courseIsLoadedOncePerRequest() {
+        startRequest();
+        Course course = new Course("COMP1001", "Intro", "2025S1", 7L, new BigDecimal("1000.00"));
+        course.setId(3L);
+        AtomicInteger loads = new AtomicInteger();
+
+        Optional<Course> first = cache.findCourse(3L, counting(loads, Optional.of(course)));
+        Optional<Course> second = cache.findCourse(3L, counting(loads, Optional.of(course)));
+
+        assertThat(first).containsSame(course);
+        assertThat(second).containsSame(course);
+        assertThat(loads).hasValue(1);
+        assertThat(cache.getHitCount()).isEqualTo(1);
+
+        startRequest();
+        cache.findCourse(3L, counting(loads, Optional.of(course)));
+        assertThat(loads).hasValue(2);
+        assertThat(cache.getHitCount()).isZero();
+    }
+
+    @Test
+    @DisplayName("does not remember missing entities")
+    void absentEntitiesAreNotCached() {
+        startRequest();
+        AtomicInteger loads = new AtomicInteger();
+
+        assertThat(cache.findUser(9L, counting(loads, Optional.empty()))).isEmpty();
+        assertThat(cache.findUser(9L, counting(loads, Optional.of(user(9L))))).isPresent();
+        assertThat(loads).hasValue(2);
+    }
+
+    @Test
+    @DisplayName("passes every lookup through outside a request")
+    void noRequestMeansNoCaching() {
+        AtomicInteger loads = new AtomicInteger();
+
+        cache.seedUser(user(7L));
+        cache.findUser(7L, counting(loads, Optional.of(user(7L))));
+        cache.findUser(7L, counting(loads, Optional.of(user(7L))));
+
+        assertThat(loads).hasValue(2);
+        assertThat(cache.getHitCount()).isZero();
+    }
+
+    private static void startRequest() {
+        RequestContextHolder.setRequestAttributes(new ServletRequestAttributes(new MockHttpServletRequest()));
+    }
+
+    private static <T> Function<Long, Optional<T>> counting(AtomicInteger loads, Optional<T> result) {
+        return id -> {
+            loads.incrementAndGet();
+            return result;
+        };
+    }
+
+    private static User user(Long id) {
+        User user = new User("user" + id + "@test", "User " + id, "$2a$10$hashed", UserRole.LECTURER);
+        user.setId(id);
+        return user;
+    }
+}
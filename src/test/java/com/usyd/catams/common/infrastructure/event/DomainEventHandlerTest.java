@@ -0,0 +1,71 @@
+package com.usyd.catams.common.infrastructure.event;
+
+import com.usyd.catams.common.domain.event.TimesheetEvent;
+import com.usyd.catams.service.EventStreamService;
+import io.micrometer.core.instrument.Timer;
+import io.micrometer.core.instrument.simple.SimpleMeterRegistry;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.extension.ExtendWith;
+import org.mockito.Mock;
+import org.mockito.junit.jupiter.MockitoExtension;
+
+import java.math.BigDecimal;
+import java.time.LocalDate;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.assertj.core.api.Assertions.assertThatThrownBy;
+import static org.mockito.Mockito.doThrow;
+
+@ExtendWith(MockitoExtension.class)
+@DisplayName("DomainEventHandler timing")
+class DomainEventHandlerTest {
+
+    @Mock
+    private EventStreamService eventStreamService;
+
+    private SimpleMeterRegistry meterRegistry;
+    private DomainEventHandler handler;
+
+    @BeforeEach
+    void setUp() {
+        meterRegistry = new SimpleMeterRegistry();
+        handler = new DomainEventHandler(meterRegistry, eventStreamService);
+    }
+
+    @Test
+    @DisplayName("records a successful handler run")
+    void recordsSuccess() {
+        TimesheetEvent.TimesheetCreatedEvent event = event();
+
+        handler.pushTimesheetChange(event);
+
+        assertThat(handlerTimer("pushTimesheetChange", "success").count()).isEqualTo(1);
+    }
+
+    @Test
+    @DisplayName("records the error outcome and rethrows so the event is retried")
+    void recordsAndRethrowsFailure() {
+        TimesheetEvent.TimesheetCreatedEvent event = event();
+        doThrow(new IllegalStateException("stream down")).when(eventStreamService).timesheetChanged(event);
+
+        assertThatThrownBy(() -> handler.pushTimesheetChange(event))
+            .isInstanceOf(IllegalStateException.class)
+            .hasMessage("stream down");
+        assertThat(handlerTimer("pushTimesheetChange", "error").count()).isEqualTo(1);
+    }
+
+    private Timer handlerTimer(String name, String outcome) {
+        return meterRegistry.get("domain.events.handler")
+            .tag("handler", name)
+            .tag("event.type", "TIMESHEET_CREATED")
+            .tag("outcome", outcome)
+            .timer();
+    }
+
+    private static TimesheetEvent.TimesheetCreatedEvent event() {
+        return new TimesheetEvent.TimesheetCreatedEvent("88", 7L, 9L, LocalDate.of(2025, 3, 3),
+            new BigDecimal("2.0"), new BigDecimal("65.00"), "Tutorial", "7", null);
+    }
+}
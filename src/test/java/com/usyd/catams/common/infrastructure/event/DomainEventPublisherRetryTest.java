@@ -0,0 +1,169 @@
+package com.usyd.catams.common.infrastructure.event;
+
+import com.usyd.catams.common.domain.event.TimesheetEvent;
+import io.micrometer.core.instrument.simple.SimpleMeterRegistry;
+import org.junit.jupiter.api.AfterEach;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.extension.ExtendWith;
+import org.mockito.Mock;
+import org.mockito.junit.jupiter.MockitoExtension;
+import org.springframework.context.ApplicationEventPublisher;
+
+import java.math.BigDecimal;
+import java.time.Duration;
+import java.time.LocalDate;
+import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.Executor;
+import java.util.concurrent.TimeUnit;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.assertj.core.api.Assertions.assertThatThrownBy;
+import static org.mockito.ArgumentMatchers.anyString;
+import static org.mockito.ArgumentMatchers.eq;
+import static org.mockito.Mockito.*;
+
+@ExtendWith(MockitoExtension.class)
+@DisplayName("DomainEventPublisher retry")
+class DomainEventPublisherRetryTest {
+
+    @Mock
+    private ApplicationEventPublisher applicationEventPublisher;
+
+    @Mock
+    private EventOutboxStore outboxStore;
+
+    @Mock
+    private EventDeadLetterStore deadLetterStore;
+
+    private EventRetryScheduler retryScheduler;
+    private EventPublishingStats stats;
+    private DomainEventPublisher publisher;
+
+    @BeforeEach
+    void setUp() {
+        Executor direct = Runnable::run;
+        retryScheduler = new EventRetryScheduler(1, Duration.ofMillis(5), Duration.ofMillis(20));
+        EventPublishingConfiguration config = new EventPublishingConfiguration(new SimpleMeterRegistry());
+        stats = config.getStats();
+        publisher = new DomainEventPublisher(applicationEventPublisher,
+            config, outboxStore, new EventExecutors(direct, direct, direct), retryScheduler, deadLetterStore, true, 3);
+    }
+
+    @AfterEach
+    void tearDown() {
+        retryScheduler.shutdown();
+    }
+
+    @Test
+    @DisplayName("retries on the scheduler and completes once an attempt succeeds")
+    void retriesUntilSuccess() throws Exception {
+        TimesheetEvent.TimesheetCreatedEvent event = event();
+        doThrow(new IllegalStateException("listener down"))
+            .doThrow(new IllegalStateException("listener down"))
+            .doNothing()
+            .when(applicationEventPublisher).publishEvent(event);
+
+        publisher.publishWithRetry(event, 3).get(5, TimeUnit.SECONDS);
+
+        verify(applicationEventPublisher, times(3)).publishEvent(event);
+        verifyNoInteractions(deadLetterStore);
+    }
+
+    @Test
+    @DisplayName("dead-letters the event and fails the future when retries are exhausted")
+    void deadLettersWhenExhausted() {
+        TimesheetEvent.TimesheetCreatedEvent event = event();
+        doThrow(new IllegalStateException("listener down")).when(applicationEventPublisher).publishEvent(event);
+
+        CompletableFuture<Void> result = publisher.publishWithRetry(event, 2);
+
+        assertThatThrownBy(() -> result.get(5, TimeUnit.SECONDS))
+            .isInstanceOf(ExecutionException.class)
+            .hasCauseInstanceOf(EventPublishingException.class);
+        verify(applicationEventPublisher, times(3)).publishEvent(event);
+        verify(deadLetterStore).add(eq(event), eq(EventDeadLetterStore.SOURCE_RETRY), eq(3), anyString());
+    }
+
+    @Test
+    @DisplayName("does not block the caller while waiting to retry")
+    void callerIsNotBlocked() {
+        EventRetryScheduler slowScheduler = new EventRetryScheduler(1, Duration.ofSeconds(30), Duration.ofSeconds(30));
+        Executor direct = Runnable::run;
+        DomainEventPublisher slowPublisher = new DomainEventPublisher(applicationEventPublisher,
+            new EventPublishingConfiguration(new SimpleMeterRegistry()), outboxStore, new EventExecutors(direct, direct, direct),
+            slowScheduler, deadLetterStore, true, 3);
+        TimesheetEvent.TimesheetCreatedEvent event = event();
+        doThrow(new IllegalStateException("listener down")).when(applicationEventPublisher).publishEvent(event);
+
+        try {
+            long started = System.nanoTime();
+            CompletableFuture<Void> result = slowPublisher.publishWithRetry(event, 1);
+
+            assertThat(Duration.ofNanos(System.nanoTime() - started)).isLessThan(Duration.ofSeconds(5));
+            assertThat(result).isNotDone();
+        } finally {
+            slowScheduler.shutdown();
+        }
+    }
+
+    @Test
+    @DisplayName("publishing outside a transaction retries failing listeners and then dead-letters")
+    void directPublishGoesThroughRetry() {
+        TimesheetEvent.TimesheetCreatedEvent event = event();
+        doThrow(new IllegalStateException("listener down")).when(applicationEventPublisher).publishEvent(event);
+
+        publisher.publish(event);
+
+        verify(deadLetterStore, timeout(5000)).add(eq(event), eq(EventDeadLetterStore.SOURCE_RETRY), eq(4), anyString());
+        verify(applicationEventPublisher, times(4)).publishEvent(event);
+        verifyNoInteractions(outboxStore);
+    }
+
+    @Test
+    @DisplayName("a directly delivered event is counted as published once")
+    void directPublishIsCountedOnce() {
+        TimesheetEvent.TimesheetCreatedEvent event = event();
+
+        publisher.publish(event);
+
+        verify(applicationEventPublisher).publishEvent(event);
+        assertThat(stats.getTotalEventsPublished()).isEqualTo(1);
+        assertThat(stats.getTotalEventsFailed()).isZero();
+    }
+
+    @Test
+    @DisplayName("a dead-lettered event counts every failed attempt and is never published")
+    void deadLetteredEventIsCountedAsFailures() {
+        TimesheetEvent.TimesheetCreatedEvent event = event();
+        doThrow(new IllegalStateException("listener down")).when(applicationEventPublisher).publishEvent(event);
+
+        publisher.publish(event);
+
+        verify(deadLetterStore, timeout(5000)).add(eq(event), eq(EventDeadLetterStore.SOURCE_RETRY), eq(4), anyString());
+        assertThat(stats.getTotalEventsPublished()).isZero();
+        assertThat(stats.getTotalEventsFailed()).isEqualTo(4);
+    }
+
+    @Test
+    @DisplayName("backoff doubles up to the cap with jitter in the upper half")
+    void backoffIsJitteredAndCapped() {
+        EventRetryScheduler scheduler = new EventRetryScheduler(1, Duration.ofMillis(1000), Duration.ofMillis(10000));
+        try {
+            for (int i = 0; i < 50; i++) {
+                assertThat(scheduler.backoffDelay(1).toMillis()).isBetween(500L, 1000L);
+                assertThat(scheduler.backoffDelay(3).toMillis()).isBetween(2000L, 4000L);
+                assertThat(scheduler.backoffDelay(10).toMillis()).isBetween(5000L, 10000L);
+            }
+        } finally {
+            scheduler.shutdown();
+        }
+    }
+
+    private static TimesheetEvent.TimesheetCreatedEvent event() {
+        return new TimesheetEvent.TimesheetCreatedEvent("77", 7L, 9L, LocalDate.of(2025, 3, 3),
+            new BigDecimal("2.0"), new BigDecimal("65.00"), "Tutorial", "7", null);
+    }
+}
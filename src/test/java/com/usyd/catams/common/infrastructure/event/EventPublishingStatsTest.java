@@ -0,0 +1,84 @@
+package com.usyd.catams.common.infrastructure.event;
+
+import com.usyd.catams.common.domain.event.TimesheetEvent;
+import com.usyd.catams.common.domain.event.UserEvent;
+import com.usyd.catams.enums.UserRole;
+import io.micrometer.core.instrument.simple.SimpleMeterRegistry;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+
+import java.math.BigDecimal;
+import java.time.LocalDate;
+import java.util.concurrent.CountDownLatch;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.TimeUnit;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+@DisplayName("EventPublishingStats")
+class EventPublishingStatsTest {
+
+    private final SimpleMeterRegistry meterRegistry = new SimpleMeterRegistry();
+    private final EventPublishingStats stats = new EventPublishingStats(meterRegistry);
+
+    @Test
+    @DisplayName("counts concurrent publishes without losing increments")
+    void concurrentIncrementsAreNotLost() throws Exception {
+        TimesheetEvent.TimesheetCreatedEvent event = timesheetCreated();
+        int threads = 8;
+        int perThread = 5_000;
+        ExecutorService pool = Executors.newFixedThreadPool(threads);
+        CountDownLatch start = new CountDownLatch(1);
+        try {
+            for (int t = 0; t < threads; t++) {
+                pool.execute(() -> {
+                    try {
+                        start.await();
+                    } catch (InterruptedException e) {
+                        Thread.currentThread().interrupt();
+                        return;
+                    }
+                    for (int i = 0; i < perThread; i++) {
+                        stats.recordPublished(event, 1_000);
+                    }
+                });
+            }
+            start.countDown();
+        } finally {
+            pool.shutdown();
+            assertThat(pool.awaitTermination(30, TimeUnit.SECONDS)).isTrue();
+        }
+
+        assertThat(stats.getTotalEventsPublished()).isEqualTo((long) threads * perThread);
+        assertThat(meterRegistry.get("domain.events.published").tag("event.type", "TIMESHEET_CREATED")
+            .counter().count()).isEqualTo((double) threads * perThread);
+    }
+
+    @Test
+    @DisplayName("tags counters and publish timers by event and aggregate type")
+    void metersAreTaggedByType() {
+        UserEvent.UserCreatedEvent userCreated = new UserEvent.UserCreatedEvent(
+            "11", "new.user@test", "New User", UserRole.TUTOR, true, "1", null);
+
+        stats.recordPublished(timesheetCreated(), 2_000_000);
+        stats.recordFailed(userCreated, 3_000_000);
+        stats.recordFiltered(userCreated);
+
+        assertThat(meterRegistry.get("domain.events.publish")
+            .tags("event.type", "TIMESHEET_CREATED", "aggregate.type", "TIMESHEET", "outcome", "published")
+            .timer().count()).isEqualTo(1);
+        assertThat(meterRegistry.get("domain.events.failed")
+            .tags("event.type", userCreated.getEventType(), "aggregate.type", "USER")
+            .counter().count()).isEqualTo(1.0);
+        assertThat(meterRegistry.get("domain.events.filtered")
+            .tags("aggregate.type", "USER")
+            .counter().count()).isEqualTo(1.0);
+        assertThat(stats.getSuccessRate()).isEqualTo(0.5);
+    }
+
+    private static TimesheetEvent.TimesheetCreatedEvent timesheetCreated() {
+        return new TimesheetEvent.TimesheetCreatedEvent("77", 7L, 9L, LocalDate.of(2025, 3, 3),
+            new BigDecimal("2.0"), new BigDecimal("65.00"), "Tutorial", "7", null);
+    }
+}
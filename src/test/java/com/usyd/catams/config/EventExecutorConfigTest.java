@@ -0,0 +1,135 @@
+package com.usyd.catams.config;
+
+import com.usyd.catams.common.infrastructure.event.EventExecutorProperties;
+import com.usyd.catams.common.infrastructure.event.EventRetryScheduler;
+import io.micrometer.core.instrument.simple.SimpleMeterRegistry;
+import org.junit.jupiter.api.AfterEach;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.springframework.core.task.TaskRejectedException;
+import org.springframework.scheduling.concurrent.ThreadPoolTaskExecutor;
+
+import java.time.Duration;
+import java.util.concurrent.CountDownLatch;
+import java.util.concurrent.RejectedExecutionException;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.atomic.AtomicBoolean;
+import java.util.concurrent.atomic.AtomicReference;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.assertj.core.api.Assertions.assertThatThrownBy;
+
+@DisplayName("Domain event executors")
+class EventExecutorConfigTest {
+
+    private final SimpleMeterRegistry meterRegistry = new SimpleMeterRegistry();
+    private final CountDownLatch release = new CountDownLatch(1);
+    private ThreadPoolTaskExecutor executor;
+
+    @AfterEach
+    void tearDown() {
+        release.countDown();
+        if (executor != null) {
+            executor.shutdown();
+        }
+    }
+
+    @Test
+    @DisplayName("caller-runs policy runs overflow on the publisher and counts the rejection")
+    void callerRunsOverflow() throws Exception {
+        executor = singleSlotTimesheetExecutor(EventExecutorProperties.RejectionPolicy.CALLER_RUNS);
+        CountDownLatch started = new CountDownLatch(1);
+        executor.execute(() -> {
+            started.countDown();
+            await(release);
+        });
+        assertThat(started.await(5, TimeUnit.SECONDS)).isTrue();
+        executor.execute(() -> await(release));
+
+        AtomicReference<Thread> overflowThread = new AtomicReference<>();
+        executor.execute(() -> overflowThread.set(Thread.currentThread()));
+
+        assertThat(overflowThread.get()).isSameAs(Thread.currentThread());
+        assertThat(gauge("domain.events.executor.active")).isEqualTo(1.0);
+        assertThat(gauge("domain.events.executor.queued")).isEqualTo(1.0);
+        assertThat(meterRegistry.get("domain.events.executor.rejected").tag("category", "timesheet")
+            .counter().count()).isEqualTo(1.0);
+    }
+
+    @Test
+    @DisplayName("caller-runs policy rejects overflow from the retry scheduler instead of running it there")
+    void retryOverflowIsRejected() throws Exception {
+        executor = singleSlotTimesheetExecutor(EventExecutorProperties.RejectionPolicy.CALLER_RUNS);
+        executor.execute(() -> await(release));
+        executor.execute(() -> await(release));
+
+        EventRetryScheduler scheduler = new EventRetryScheduler(1, Duration.ofMillis(1), Duration.ofMillis(1));
+        AtomicReference<Throwable> failure = new AtomicReference<>();
+        AtomicBoolean ran = new AtomicBoolean();
+        CountDownLatch attempted = new CountDownLatch(1);
+        scheduler.scheduleRetry(1, () -> {
+            try {
+                executor.execute(() -> ran.set(true));
+            } catch (RuntimeException e) {
+                failure.set(e);
+            } finally {
+                attempted.countDown();
+            }
+        });
+
+        assertThat(attempted.await(5, TimeUnit.SECONDS)).isTrue();
+        assertThat(failure.get()).isInstanceOf(RejectedExecutionException.class);
+        assertThat(ran).isFalse();
+    }
+
+    @Test
+    @DisplayName("abort policy surfaces the rejection to the publisher")
+    void abortOverflow() {
+        executor = singleSlotTimesheetExecutor(EventExecutorProperties.RejectionPolicy.ABORT);
+        executor.execute(() -> await(release));
+        executor.execute(() -> await(release));
+
+        assertThatThrownBy(() -> executor.execute(() -> { }))
+            .isInstanceOf(TaskRejectedException.class);
+    }
+
+    @Test
+    @DisplayName("records queue wait and run time per category")
+    void recordsTaskTimers() throws Exception {
+        executor = singleSlotTimesheetExecutor(EventExecutorProperties.RejectionPolicy.CALLER_RUNS);
+        CountDownLatch done = new CountDownLatch(1);
+        executor.execute(done::countDown);
+        assertThat(done.await(5, TimeUnit.SECONDS)).isTrue();
+
+        executor.shutdown();
+        executor.getThreadPoolExecutor().awaitTermination(5, TimeUnit.SECONDS);
+
+        assertThat(meterRegistry.get("domain.events.executor.wait").tag("category", "timesheet").timer().count())
+            .isEqualTo(1);
+        assertThat(meterRegistry.get("domain.events.executor.duration").tag("category", "timesheet").timer().count())
+            .isEqualTo(1);
+    }
+
+    private ThreadPoolTaskExecutor singleSlotTimesheetExecutor(EventExecutorProperties.RejectionPolicy policy) {
+        EventExecutorProperties properties = new EventExecutorProperties();
+        properties.getTimesheet().setCoreSize(1);
+        properties.getTimesheet().setMaxSize(1);
+        properties.getTimesheet().setQueueCapacity(1);
+        properties.getTimesheet().setRejectionPolicy(policy);
+        ThreadPoolTaskExecutor built = new EventExecutorConfig(properties, meterRegistry).timesheetEventExecutor();
+        built.initialize();
+        return built;
+    }
+
+    private double gauge(String name) {
+        return meterRegistry.get(name).tag("category", "timesheet").gauge().value();
+    }
+
+    private static void await(CountDownLatch latch) {
+        try {
+            latch.await(5, TimeUnit.SECONDS);
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+        }
+    }
+}
@@ -0,0 +1,182 @@
+package com.usyd.catams.config;
+
+import com.usyd.catams.testing.PostgresTestContainer;
+import jakarta.persistence.EntityManager;
+import jakarta.persistence.PersistenceContext;
+import org.flywaydb.core.Flyway;
+import org.junit.jupiter.api.AfterAll;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.beans.factory.annotation.Qualifier;
+import org.springframework.boot.test.context.SpringBootTest;
+import org.springframework.boot.test.context.TestConfiguration;
+import org.springframework.context.annotation.Bean;
+import org.springframework.context.annotation.Import;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.jdbc.datasource.DriverManagerDataSource;
+import org.springframework.mock.web.MockHttpServletRequest;
+import org.springframework.mock.web.MockHttpServletResponse;
+import org.springframework.orm.jpa.JpaTransactionManager;
+import org.springframework.test.context.ActiveProfiles;
+import org.springframework.test.context.DynamicPropertyRegistry;
+import org.springframework.test.context.DynamicPropertySource;
+import org.springframework.transaction.PlatformTransactionManager;
+import org.springframework.transaction.annotation.Transactional;
+import org.springframework.web.servlet.HandlerExecutionChain;
+import org.springframework.web.servlet.HandlerInterceptor;
+import org.springframework.web.servlet.mvc.method.annotation.RequestMappingHandlerMapping;
+import org.springframework.web.util.ServletRequestPathUtils;
+import org.testcontainers.containers.PostgreSQLContainer;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+/**
+ * Boots the application with {@link ReadReplicaConfig} against the shared test container as
+ * primary and a second container as replica, so routing goes through the application's own
+ * {@link JpaTransactionManager} and Hibernate sessions rather than a hand-built stack.
+ */
+@SpringBootTest(properties = "app.datasource.read-replicas.enabled=true")
+@ActiveProfiles("integration-test")
+@Import(ReadReplicaConfigIntegrationTest.ProbeConfiguration.class)
+@DisplayName("ReadReplicaConfig")
+class ReadReplicaConfigIntegrationTest {
+
+    private static final String CLUSTER_ID_SQL = "SELECT system_identifier FROM pg_control_system()";
+
+    private static PostgreSQLContainer<?> replicaContainer;
+
+    @Autowired
+    private PlatformTransactionManager transactionManager;
+
+    @Autowired
+    private ClusterProbe clusterProbe;
+
+    @Autowired
+    @Qualifier("requestMappingHandlerMapping")
+    private RequestMappingHandlerMapping handlerMapping;
+
+    private long primaryId;
+    private long replicaId;
+
+    @DynamicPropertySource
+    static void configureProperties(DynamicPropertyRegistry registry) {
+        PostgresTestContainer primary = PostgresTestContainer.getInstance();
+        if (!primary.isRunning()) {
+            primary.start();
+        }
+        replicaContainer = new PostgreSQLContainer<>("postgres:15-alpine");
+        replicaContainer.start();
+        // A real replica carries the primary's schema; read-only work at startup expects it
+        Flyway.configure()
+            .dataSource(replicaContainer.getJdbcUrl(), replicaContainer.getUsername(), replicaContainer.getPassword())
+            .locations("classpath:db/migration")
+            .load()
+            .migrate();
+
+        registry.add("spring.datasource.url", primary::getJdbcUrl);
+        registry.add("spring.datasource.username", primary::getUsername);
+        registry.add("spring.datasource.password", primary::getPassword);
+        registry.add("spring.datasource.driver-class-name", () -> "org.postgresql.Driver");
+        registry.add("spring.jpa.properties.hibernate.dialect", () -> "org.hibernate.dialect.PostgreSQLDialect");
+        registry.add("spring.jpa.hibernate.ddl-auto", () -> "none");
+        registry.add("app.datasource.read-replicas.replicas[0].name", () -> "replica-1");
+        registry.add("app.datasource.read-replicas.replicas[0].url", replicaContainer::getJdbcUrl);
+        registry.add("app.datasource.read-replicas.replicas[0].username", replicaContainer::getUsername);
+        registry.add("app.datasource.read-replicas.replicas[0].password", replicaContainer::getPassword);
+    }
+
+    @AfterAll
+    static void stopReplica() {
+        if (replicaContainer != null) {
+            replicaContainer.stop();
+        }
+    }
+
+    @BeforeEach
+    void identifyClusters() {
+        PostgresTestContainer primary = PostgresTestContainer.getInstance();
+        primaryId = clusterOf(primary);
+        replicaId = clusterOf(replicaContainer);
+        assertThat(primaryId).isNotEqualTo(replicaId);
+    }
+
+    @Test
+    @DisplayName("sends read-only service calls through the JPA transaction manager to the replica")
+    void routesReadOnlyServiceCallsToReplica() {
+        assertThat(transactionManager).isInstanceOf(JpaTransactionManager.class);
+
+        assertThat(clusterProbe.readOnlyCluster()).isEqualTo(replicaId);
+        assertThat(clusterProbe.readWriteCluster()).isEqualTo(primaryId);
+    }
+
+    @Test
+    @DisplayName("keeps reads behind ETag and live-update endpoints on the primary")
+    void pinsPrimaryReadHandlersToPrimary() throws Exception {
+        assertThat(readOnlyClusterDuring(get("/api/timesheets"))).isEqualTo(primaryId);
+        assertThat(readOnlyClusterDuring(get("/api/dashboard/summary"))).isEqualTo(primaryId);
+        assertThat(readOnlyClusterDuring(get("/api/courses"))).isEqualTo(replicaId);
+        // The requirement ends with the request
+        assertThat(clusterProbe.readOnlyCluster()).isEqualTo(replicaId);
+    }
+
+    private long readOnlyClusterDuring(MockHttpServletRequest request) throws Exception {
+        HandlerExecutionChain chain = handlerMapping.getHandler(request);
+        assertThat(chain).isNotNull();
+        HandlerInterceptor interceptor = chain.getInterceptorList().stream()
+            .filter(PrimaryReadInterceptor.class::isInstance)
+            .findFirst()
+            .orElseThrow(() -> new AssertionError("PrimaryReadInterceptor is not registered"));
+        MockHttpServletResponse response = new MockHttpServletResponse();
+        assertThat(interceptor.preHandle(request, response, chain.getHandler())).isTrue();
+        try {
+            return clusterProbe.readOnlyCluster();
+        } finally {
+            interceptor.afterCompletion(request, response, chain.getHandler(), null);
+        }
+    }
+
+    private static long clusterOf(PostgreSQLContainer<?> container) {
+        DriverManagerDataSource dataSource = new DriverManagerDataSource(
+            container.getJdbcUrl(), container.getUsername(), container.getPassword());
+        Long id = new JdbcTemplate(dataSource).queryForObject(CLUSTER_ID_SQL, Long.class);
+        return id == null ? -1 : id;
+    }
+
+    private static MockHttpServletRequest get(String uri) {
+        MockHttpServletRequest request = new MockHttpServletRequest("GET", uri);
+        ServletRequestPathUtils.parseAndCache(request);
+        return request;
+    }
+
+    @TestConfiguration
+    static class ProbeConfiguration {
+
+        @Bean
+        ClusterProbe clusterProbe() {
+            return new ClusterProbe();
+        }
+    }
+
+    static class ClusterProbe {
+
+        @PersistenceContext
+        private EntityManager entityManager;
+
+        @Transactional(readOnly = true)
+        public long readOnlyCluster() {
+            return cluster();
+        }
+
+        @Transactional
+        public long readWriteCluster() {
+            return cluster();
+        }
+
+        private long cluster() {
+            return ((Number) entityManager.createNativeQuery(CLUSTER_ID_SQL).getSingleResult()).longValue();
+        }
+
+    }
+}
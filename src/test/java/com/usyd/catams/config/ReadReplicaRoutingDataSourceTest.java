@@ -0,0 +1,181 @@
+package com.usyd.catams.config;
+
+import com.usyd.catams.testing.PostgresTestContainer;
+import com.zaxxer.hikari.HikariDataSource;
+import io.micrometer.core.instrument.simple.SimpleMeterRegistry;
+import org.junit.jupiter.api.AfterAll;
+import org.junit.jupiter.api.AfterEach;
+import org.junit.jupiter.api.BeforeAll;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.jdbc.datasource.DataSourceTransactionManager;
+import org.springframework.jdbc.datasource.LazyConnectionDataSourceProxy;
+import org.springframework.transaction.support.TransactionTemplate;
+import org.testcontainers.containers.PostgreSQLContainer;
+
+import javax.sql.DataSource;
+import java.time.Duration;
+import java.util.LinkedHashMap;
+import java.util.Map;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+/**
+ * Routes between two real Postgres instances: the shared test container as primary and a second
+ * container standing in for a replica. Each cluster is told apart by its system identifier.
+ */
+@DisplayName("ReadReplicaRoutingDataSource")
+class ReadReplicaRoutingDataSourceTest {
+
+    private static final String CLUSTER_ID_SQL = "SELECT system_identifier FROM pg_control_system()";
+
+    private static PostgreSQLContainer<?> replicaContainer;
+
+    private final SimpleMeterRegistry meterRegistry = new SimpleMeterRegistry();
+    private HikariDataSource primaryPool;
+    private HikariDataSource replicaPool;
+    private long primaryId;
+    private long replicaId;
+
+    @BeforeAll
+    static void startContainers() {
+        PostgresTestContainer primary = PostgresTestContainer.getInstance();
+        if (!primary.isRunning()) {
+            primary.start();
+        }
+        replicaContainer = new PostgreSQLContainer<>("postgres:15-alpine");
+        replicaContainer.start();
+    }
+
+    @AfterAll
+    static void stopReplica() {
+        if (replicaContainer != null) {
+            replicaContainer.stop();
+        }
+    }
+
+    @BeforeEach
+    void setUp() {
+        PostgresTestContainer primary = PostgresTestContainer.getInstance();
+        primaryPool = pool(primary.getJdbcUrl(), primary.getUsername(), primary.getPassword());
+        replicaPool = pool(replicaContainer.getJdbcUrl(), replicaContainer.getUsername(), replicaContainer.getPassword());
+        primaryId = new JdbcTemplate(primaryPool).queryForObject(CLUSTER_ID_SQL, Long.class);
+        replicaId = new JdbcTemplate(replicaPool).queryForObject(CLUSTER_ID_SQL, Long.class);
+        assertThat(primaryId).isNotEqualTo(replicaId);
+    }
+
+    @AfterEach
+    void tearDown() {
+        primaryPool.close();
+        replicaPool.close();
+    }
+
+    @Test
+    @DisplayName("sends read-only transactions to the replica and the rest to the primary")
+    void routesByTransactionReadOnlyFlag() {
+        ReadReplicaRoutingDataSource router = router(Map.of("replica-1", replicaPool));
+        DataSource dataSource = new LazyConnectionDataSourceProxy(router);
+
+        assertThat(clusterIn(dataSource, true)).isEqualTo(replicaId);
+        assertThat(clusterIn(dataSource, false)).isEqualTo(primaryId);
+        assertThat(new JdbcTemplate(dataSource).queryForObject(CLUSTER_ID_SQL, Long.class)).isEqualTo(primaryId);
+
+        assertThat(routeCount("replica-1", ReadReplicaRoutingDataSource.REASON_READ_ONLY)).isEqualTo(1.0);
+        assertThat(routeCount(ReadReplicaRoutingDataSource.PRIMARY, ReadReplicaRoutingDataSource.REASON_READ_WRITE))
+            .isGreaterThanOrEqualTo(2.0);
+    }
+
+    @Test
+    @DisplayName("keeps read-only transactions on the primary while the thread requires it")
+    void honoursPrimaryRequirement() {
+        ReadReplicaRoutingDataSource router = router(Map.of("replica-1", replicaPool));
+        DataSource dataSource = new LazyConnectionDataSourceProxy(router);
+
+        ReadReplicaRoutingDataSource.requirePrimary();
+        try {
+            assertThat(clusterIn(dataSource, true)).isEqualTo(primaryId);
+        } finally {
+            ReadReplicaRoutingDataSource.clearPrimaryRequired();
+        }
+        assertThat(clusterIn(dataSource, true)).isEqualTo(replicaId);
+
+        assertThat(routeCount(ReadReplicaRoutingDataSource.PRIMARY, ReadReplicaRoutingDataSource.REASON_PRIMARY_REQUIRED))
+            .isEqualTo(1.0);
+        assertThat(routeCount("replica-1", ReadReplicaRoutingDataSource.REASON_READ_ONLY)).isEqualTo(1.0);
+    }
+
+    @Test
+    @DisplayName("takes a lagging replica out of rotation until it catches up")
+    void honoursLagTolerance() {
+        ReadReplicaRoutingDataSource router = router(Map.of("replica-1", replicaPool));
+        DataSource dataSource = new LazyConnectionDataSourceProxy(router);
+
+        router.applyLag("replica-1", 30.0);
+        assertThat(router.availableReplicas()).isEmpty();
+        assertThat(clusterIn(dataSource, true)).isEqualTo(primaryId);
+        assertThat(routeCount(ReadReplicaRoutingDataSource.PRIMARY, ReadReplicaRoutingDataSource.REASON_NO_REPLICA))
+            .isEqualTo(1.0);
+
+        // A standalone server is not in recovery, so the health check measures no lag
+        router.refreshReplicaHealth();
+        assertThat(router.availableReplicas()).containsExactly("replica-1");
+        assertThat(meterRegistry.get("catams.datasource.replica.lag").tag("replica", "replica-1").gauge().value())
+            .isZero();
+        assertThat(clusterIn(dataSource, true)).isEqualTo(replicaId);
+    }
+
+    @Test
+    @DisplayName("falls back to the primary when a replica cannot hand out connections")
+    void fallsBackWhenReplicaIsDown() {
+        HikariDataSource unreachable = new HikariDataSource();
+        unreachable.setJdbcUrl("jdbc:postgresql://localhost:1/catams");
+        unreachable.setUsername("nobody");
+        unreachable.setPassword("nobody");
+        unreachable.setConnectionTimeout(250);
+        try {
+            Map<String, DataSource> replicas = new LinkedHashMap<>();
+            replicas.put("down", unreachable);
+            replicas.put("replica-1", replicaPool);
+            ReadReplicaRoutingDataSource router = router(replicas);
+            DataSource dataSource = new LazyConnectionDataSourceProxy(router);
+
+            assertThat(clusterIn(dataSource, true)).isEqualTo(primaryId);
+            assertThat(routeCount(ReadReplicaRoutingDataSource.PRIMARY, ReadReplicaRoutingDataSource.REASON_REPLICA_ERROR))
+                .isEqualTo(1.0);
+            assertThat(router.availableReplicas()).containsExactly("replica-1");
+
+            router.refreshReplicaHealth();
+            assertThat(router.availableReplicas()).containsExactly("replica-1");
+            assertThat(clusterIn(dataSource, true)).isEqualTo(replicaId);
+        } finally {
+            unreachable.close();
+        }
+    }
+
+    private ReadReplicaRoutingDataSource router(Map<String, DataSource> replicas) {
+        return new ReadReplicaRoutingDataSource(primaryPool, replicas, Duration.ofSeconds(5), meterRegistry);
+    }
+
+    private long clusterIn(DataSource dataSource, boolean readOnly) {
+        TransactionTemplate template = new TransactionTemplate(new DataSourceTransactionManager(dataSource));
+        template.setReadOnly(readOnly);
+        Long id = template.execute(status -> new JdbcTemplate(dataSource).queryForObject(CLUSTER_ID_SQL, Long.class));
+        return id == null ? -1 : id;
+    }
+
+    private double routeCount(String target, String reason) {
+        var counter = meterRegistry.find("catams.datasource.route").tag("target", target).tag("reason", reason).counter();
+        return counter == null ? 0 : counter.count();
+    }
+
+    private static HikariDataSource pool(String url, String username, String password) {
+        HikariDataSource pool = new HikariDataSource();
+        pool.setJdbcUrl(url);
+        pool.setUsername(username);
+        pool.setPassword(password);
+        pool.setMaximumPoolSize(2);
+        return pool;
+    }
+}
@@ -0,0 +1,174 @@
+package com.usyd.catams.controller;
+
+import com.usyd.catams.dto.request.ApprovalBatchRequest;
+import com.usyd.catams.entity.Course;
+import com.usyd.catams.entity.LecturerAssignment;
+import com.usyd.catams.entity.Timesheet;
+import com.usyd.catams.entity.TutorAssignment;
+import com.usyd.catams.entity.User;
+import com.usyd.catams.enums.ApprovalAction;
+import com.usyd.catams.enums.ApprovalStatus;
+import com.usyd.catams.enums.UserRole;
+import com.usyd.catams.integration.IntegrationTestBase;
+import com.usyd.catams.repository.CourseRepository;
+import com.usyd.catams.repository.LecturerAssignmentRepository;
+import com.usyd.catams.repository.TimesheetRepository;
+import com.usyd.catams.repository.TutorAssignmentRepository;
+import com.usyd.catams.service.TimesheetWeeklyRollupService;
+import jakarta.persistence.EntityManagerFactory;
+import org.hibernate.SessionFactory;
+import org.hibernate.stat.Statistics;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.test.context.TestPropertySource;
+
+import java.math.BigDecimal;
+import java.time.LocalDate;
+import java.util.ArrayList;
+import java.util.List;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.jsonPath;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.status;
+
+@DisplayName("Batch approval actions")
+@TestPropertySource(properties = "spring.jpa.properties.hibernate.generate_statistics=true")
+class ApprovalBatchIntegrationTest extends IntegrationTestBase {
+
+    @Autowired
+    private CourseRepository courseRepository;
+
+    @Autowired
+    private TimesheetRepository timesheetRepository;
+
+    @Autowired
+    private TutorAssignmentRepository tutorAssignmentRepository;
+
+    @Autowired
+    private LecturerAssignmentRepository lecturerAssignmentRepository;
+
+    @Autowired
+    private TimesheetWeeklyRollupService weeklyRollupService;
+
+    @Autowired
+    private EntityManagerFactory entityManagerFactory;
+
+    @Autowired
+    private JdbcTemplate jdbcTemplate;
+
+    private User lecturer;
+    private User tutor;
+    private Course course;
+    private String lecturerBearer;
+
+    @BeforeEach
+    void setUp() {
+        lecturer = userRepository.save(new User("batch.lecturer@test", "Batch Lecturer", "$2a$10$hashed", UserRole.LECTURER));
+        tutor = userRepository.save(new User("batch.tutor@test", "Batch Tutor", "$2a$10$hashed", UserRole.TUTOR));
+        course = courseRepository.save(new Course("BATCH1001", "Batch Approvals", "2025S2",
+            lecturer.getId(), BigDecimal.valueOf(50000)));
+        tutorAssignmentRepository.save(new TutorAssignment(tutor.getId(), course.getId()));
+        lecturerAssignmentRepository.save(new LecturerAssignment(lecturer.getId(), course.getId()));
+
+        lecturerBearer = "Bearer " + jwtTokenProvider.generateToken(
+            lecturer.getId(), lecturer.getEmailValue(), lecturer.getRole().name());
+    }
+
+    @Test
+    @DisplayName("applies the action to eligible timesheets and reports the rest")
+    void appliesActionPerTimesheet() throws Exception {
+        Timesheet first = saveTimesheet(LocalDate.of(2025, 7, 7), ApprovalStatus.TUTOR_CONFIRMED);
+        Timesheet second = saveTimesheet(LocalDate.of(2025, 7, 14), ApprovalStatus.TUTOR_CONFIRMED);
+        Timesheet draft = saveTimesheet(LocalDate.of(2025, 7, 21), ApprovalStatus.DRAFT);
+        long missingId = Long.MAX_VALUE;
+
+        ApprovalBatchRequest request = new ApprovalBatchRequest(
+            List.of(first.getId(), draft.getId(), missingId, second.getId()),
+            ApprovalAction.LECTURER_CONFIRM, null);
+
+        performPost("/api/approvals/batch", request, lecturerBearer)
+            .andExpect(status().isOk())
+            .andExpect(jsonPath("$.totalCount").value(4))
+            .andExpect(jsonPath("$.succeededCount").value(2))
+            .andExpect(jsonPath("$.failedCount").value(2))
+            .andExpect(jsonPath("$.results[0].timesheetId").value(first.getId()))
+            .andExpect(jsonPath("$.results[0].success").value(true))
+            .andExpect(jsonPath("$.results[0].newStatus").value("LECTURER_CONFIRMED"))
+            .andExpect(jsonPath("$.results[1].success").value(false))
+            .andExpect(jsonPath("$.results[1].newStatus").value("DRAFT"))
+            .andExpect(jsonPath("$.results[2].success").value(false))
+            .andExpect(jsonPath("$.results[3].success").value(true));
+
+        entityManager.flush();
+        entityManager.clear();
+
+        assertThat(timesheetRepository.findWithApprovalsById(first.getId()).orElseThrow())
+            .satisfies(timesheet -> {
+                assertThat(timesheet.getStatus()).isEqualTo(ApprovalStatus.LECTURER_CONFIRMED);
+                assertThat(timesheet.getApprovals()).hasSize(1);
+            });
+        assertThat(timesheetRepository.findById(draft.getId()).orElseThrow().getStatus())
+            .isEqualTo(ApprovalStatus.DRAFT);
+    }
+
+    @Test
+    @DisplayName("issues a batch-size-independent number of statements and one rollup change per key")
+    void statementCountDoesNotGrowWithBatchSize() throws Exception {
+        long smallBatch = statementsForBatch(LocalDate.of(2025, 1, 6), 3);
+        long largeBatch = statementsForBatch(LocalDate.of(2025, 3, 3), 12);
+
+        // Allow one approval id sequence refill, which may land in either batch
+        assertThat(largeBatch)
+            .as("statements for a 12-item batch vs a 3-item batch")
+            .isBetween(smallBatch - 1, smallBatch + 1);
+        assertThat(rollupCount(ApprovalStatus.LECTURER_CONFIRMED)).isEqualTo(15L);
+        assertThat(rollupCount(ApprovalStatus.TUTOR_CONFIRMED)).isZero();
+    }
+
+    private long statementsForBatch(LocalDate firstWeek, int size) throws Exception {
+        List<Long> ids = new ArrayList<>();
+        for (int i = 0; i < size; i++) {
+            ids.add(saveTimesheet(firstWeek.plusWeeks(i), ApprovalStatus.TUTOR_CONFIRMED).getId());
+        }
+        entityManager.flush();
+        entityManager.clear();
+        Statistics statistics = entityManagerFactory.unwrap(SessionFactory.class).getStatistics();
+        statistics.clear();
+
+        performPost("/api/approvals/batch",
+                new ApprovalBatchRequest(ids, ApprovalAction.LECTURER_CONFIRM, null), lecturerBearer)
+            .andExpect(status().isOk())
+            .andExpect(jsonPath("$.succeededCount").value(size));
+
+        return statistics.getPrepareStatementCount();
+    }
+
+    private long rollupCount(ApprovalStatus status) {
+        return jdbcTemplate.queryForObject(
+            "SELECT COALESCE(SUM(timesheet_count), 0) FROM timesheet_weekly_rollup " +
+            "WHERE tutor_id = ? AND course_id = ? AND status = ?",
+            Long.class, tutor.getId(), course.getId(), status.name());
+    }
+
+    @Test
+    @DisplayName("rejects a batch rejection without a comment")
+    void requiresCommentForRejection() throws Exception {
+        Timesheet timesheet = saveTimesheet(LocalDate.of(2025, 7, 7), ApprovalStatus.TUTOR_CONFIRMED);
+
+        performPost("/api/approvals/batch",
+            new ApprovalBatchRequest(List.of(timesheet.getId()), ApprovalAction.REJECT, " "), lecturerBearer)
+            .andExpect(status().isBadRequest());
+    }
+
+    private Timesheet saveTimesheet(LocalDate weekStart, ApprovalStatus status) {
+        Timesheet timesheet = new Timesheet(tutor.getId(), course.getId(), weekStart,
+            new BigDecimal("3.0"), new BigDecimal("60.85"), "Tutorial week of " + weekStart, lecturer.getId());
+        timesheet.setStatus(status);
+        Timesheet saved = timesheetRepository.save(timesheet);
+        weeklyRollupService.recordCreated(saved);
+        return saved;
+    }
+}
@@ -0,0 +1,126 @@
+package com.usyd.catams.controller;
+
+import com.usyd.catams.entity.Course;
+import com.usyd.catams.entity.LecturerAssignment;
+import com.usyd.catams.entity.TutorAssignment;
+import com.usyd.catams.entity.User;
+import com.usyd.catams.enums.UserRole;
+import com.usyd.catams.integration.IntegrationTestBase;
+import com.usyd.catams.repository.CourseRepository;
+import com.usyd.catams.repository.LecturerAssignmentRepository;
+import com.usyd.catams.repository.TutorAssignmentRepository;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+
+import java.math.BigDecimal;
+import java.util.List;
+import java.util.Map;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.jsonPath;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.status;
+
+@DisplayName("Bulk assignment replacement")
+class AssignmentBulkIntegrationTest extends IntegrationTestBase {
+
+    @Autowired
+    private CourseRepository courseRepository;
+
+    @Autowired
+    private TutorAssignmentRepository tutorAssignmentRepository;
+
+    @Autowired
+    private LecturerAssignmentRepository lecturerAssignmentRepository;
+
+    private User lecturer;
+    private User firstTutor;
+    private User secondTutor;
+    private Course courseA;
+    private Course courseB;
+    private Course courseC;
+
+    @BeforeEach
+    void setUp() {
+        lecturer = userRepository.save(new User("assign.lecturer@test", "Assign Lecturer", "$2a$10$hashed", UserRole.LECTURER));
+        firstTutor = userRepository.save(new User("assign.tutor1@test", "First Tutor", "$2a$10$hashed", UserRole.TUTOR));
+        secondTutor = userRepository.save(new User("assign.tutor2@test", "Second Tutor", "$2a$10$hashed", UserRole.TUTOR));
+        courseA = courseRepository.save(new Course("ASGN1001", "Assign A", "2025S2", lecturer.getId(), BigDecimal.valueOf(10000)));
+        courseB = courseRepository.save(new Course("ASGN1002", "Assign B", "2025S2", lecturer.getId(), BigDecimal.valueOf(10000)));
+        courseC = courseRepository.save(new Course("ASGN1003", "Assign C", "2025S2", lecturer.getId(), BigDecimal.valueOf(10000)));
+
+        tutorAssignmentRepository.save(new TutorAssignment(firstTutor.getId(), courseA.getId()));
+        tutorAssignmentRepository.save(new TutorAssignment(firstTutor.getId(), courseB.getId()));
+        tutorAssignmentRepository.save(new TutorAssignment(secondTutor.getId(), courseA.getId()));
+        tutorAssignmentRepository.flush();
+    }
+
+    @Test
+    @DisplayName("diffs many tutors against current state and reports the changes")
+    void replacesTutorAssignments() throws Exception {
+        Map<String, Object> request = Map.of("assignments", List.of(
+            entry(firstTutor, courseB, courseC),
+            entry(secondTutor, courseA)
+        ));
+
+        performPost("/api/admin/tutors/assignments/bulk", request, adminToken)
+            .andExpect(status().isOk())
+            .andExpect(jsonPath("$.userCount").value(2))
+            .andExpect(jsonPath("$.changedUserCount").value(1))
+            .andExpect(jsonPath("$.insertedCount").value(1))
+            .andExpect(jsonPath("$.deletedCount").value(1))
+            .andExpect(jsonPath("$.changes[0].userId").value(firstTutor.getId()))
+            .andExpect(jsonPath("$.changes[0].added[0]").value(courseC.getId()))
+            .andExpect(jsonPath("$.changes[0].removed[0]").value(courseA.getId()));
+
+        entityManager.clear();
+        assertThat(tutorAssignmentRepository.findByTutorId(firstTutor.getId()))
+            .extracting(TutorAssignment::getCourseId)
+            .containsExactlyInAnyOrder(courseB.getId(), courseC.getId());
+        assertThat(tutorAssignmentRepository.findByTutorId(secondTutor.getId()))
+            .extracting(TutorAssignment::getCourseId)
+            .containsExactly(courseA.getId());
+    }
+
+    @Test
+    @DisplayName("an empty course list clears a lecturer's assignments")
+    void replacesLecturerAssignments() throws Exception {
+        lecturerAssignmentRepository.save(new LecturerAssignment(lecturer.getId(), courseA.getId()));
+        lecturerAssignmentRepository.flush();
+
+        performPost("/api/admin/lecturers/assignments/bulk",
+                Map.of("assignments", List.of(entry(lecturer))), adminToken)
+            .andExpect(status().isOk())
+            .andExpect(jsonPath("$.deletedCount").value(1))
+            .andExpect(jsonPath("$.insertedCount").value(0));
+
+        entityManager.clear();
+        assertThat(lecturerAssignmentRepository.findByLecturerId(lecturer.getId())).isEmpty();
+    }
+
+    @Test
+    @DisplayName("rejects users whose role does not match the endpoint")
+    void rejectsWrongRole() throws Exception {
+        performPost("/api/admin/tutors/assignments/bulk",
+                Map.of("assignments", List.of(entry(lecturer, courseA))), adminToken)
+            .andExpect(status().isBadRequest());
+
+        assertThat(tutorAssignmentRepository.findByTutorId(lecturer.getId())).isEmpty();
+    }
+
+    @Test
+    @DisplayName("is restricted to administrators")
+    void requiresAdmin() throws Exception {
+        performPost("/api/admin/tutors/assignments/bulk",
+                Map.of("assignments", List.of(entry(firstTutor, courseC))), lecturerToken)
+            .andExpect(status().isForbidden());
+    }
+
+    private static Map<String, Object> entry(User user, Course... courses) {
+        return Map.of(
+            "userId", user.getId(),
+            "courseIds", java.util.Arrays.stream(courses).map(Course::getId).toList()
+        );
+    }
+}
@@ -10,9 +10,11 @@ import org.mockito.ArgumentCaptor;
 import org.mockito.Mock;
 import org.mockito.junit.jupiter.MockitoExtension;
 import org.springframework.http.ResponseEntity;
+import org.springframework.mock.web.MockHttpServletRequest;
 import org.springframework.security.core.Authentication;
 import org.springframework.security.core.GrantedAuthority;
 import org.springframework.security.core.authority.SimpleGrantedAuthority;
+import org.springframework.web.context.request.ServletWebRequest;
 
 import java.math.BigDecimal;
 import java.time.Clock;
@@ -54,7 +56,8 @@ class DashboardControllerClockTest {
         DashboardSummaryResponse mockResp = new DashboardSummaryResponse(0,0, BigDecimal.ZERO, BigDecimal.ZERO, null, Collections.emptyList(), Collections.emptyList(), null);
         when(dashboardService.getDashboardSummary(anyLong(), any(), any(), any(), any())).thenReturn(mockResp);
 
-        ResponseEntity<DashboardSummaryResponse> resp = controller.getDashboardSummary(null, null, null, null, authentication);
+        ResponseEntity<DashboardSummaryResponse> resp = controller.getDashboardSummary(null, null, null, null, authentication,
+            new ServletWebRequest(new MockHttpServletRequest()));
         assertThat(resp.getStatusCode().is2xxSuccessful()).isTrue();
 
         ArgumentCaptor<LocalDate> startCap = ArgumentCaptor.forClass(LocalDate.class);
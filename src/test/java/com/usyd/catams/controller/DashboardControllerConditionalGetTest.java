@@ -0,0 +1,73 @@
+package com.usyd.catams.controller;
+
+import com.usyd.catams.dto.response.DashboardSummaryResponse;
+import com.usyd.catams.entity.User;
+import com.usyd.catams.enums.UserRole;
+import com.usyd.catams.service.ChangeVersionService;
+import com.usyd.catams.service.DashboardService;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.extension.ExtendWith;
+import org.mockito.Mock;
+import org.mockito.junit.jupiter.MockitoExtension;
+import org.springframework.http.ResponseEntity;
+import org.springframework.mock.web.MockHttpServletRequest;
+import org.springframework.mock.web.MockHttpServletResponse;
+import org.springframework.security.authentication.UsernamePasswordAuthenticationToken;
+import org.springframework.security.core.Authentication;
+import org.springframework.security.core.authority.SimpleGrantedAuthority;
+import org.springframework.web.context.request.ServletWebRequest;
+
+import java.math.BigDecimal;
+import java.time.Clock;
+import java.time.Instant;
+import java.time.ZoneOffset;
+import java.util.Collections;
+import java.util.List;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.mockito.ArgumentMatchers.any;
+import static org.mockito.ArgumentMatchers.anyLong;
+import static org.mockito.Mockito.*;
+
+@ExtendWith(MockitoExtension.class)
+class DashboardControllerConditionalGetTest {
+
+    @Mock
+    DashboardService dashboardService;
+
+    @Test
+    @DisplayName("Matching If-None-Match returns 304 without computing the summary")
+    void matchingValidatorSkipsAggregation() {
+        Clock fixed = Clock.fixed(Instant.parse("2025-08-15T00:00:00Z"), ZoneOffset.UTC);
+        DashboardController controller = new DashboardController(dashboardService, fixed, new ChangeVersionService());
+        Authentication authentication = lecturerAuthentication();
+        when(dashboardService.getDashboardSummary(anyLong(), any(), any(), any(), any()))
+            .thenReturn(new DashboardSummaryResponse(0, 0, BigDecimal.ZERO, BigDecimal.ZERO, null,
+                Collections.emptyList(), Collections.emptyList(), null));
+
+        ResponseEntity<DashboardSummaryResponse> first = controller.getDashboardSummary(null, null, null, null,
+            authentication, new ServletWebRequest(new MockHttpServletRequest(), new MockHttpServletResponse()));
+        String etag = first.getHeaders().getETag();
+        assertThat(etag).isNotBlank();
+
+        MockHttpServletRequest conditional = new MockHttpServletRequest("GET", "/api/dashboard/summary");
+        conditional.addHeader("If-None-Match", etag);
+        MockHttpServletResponse response = new MockHttpServletResponse();
+        ResponseEntity<DashboardSummaryResponse> second = controller.getDashboardSummary(null, null, null, null,
+            authentication, new ServletWebRequest(conditional, response));
+
+        assertThat(second).isNull();
+        assertThat(response.getStatus()).isEqualTo(304);
+        verify(dashboardService, times(1)).getDashboardSummary(anyLong(), any(), any(), any(), any());
+    }
+
+    private static Authentication lecturerAuthentication() {
+        User user = new User();
+        user.setId(2L);
+        user.setEmail("lecturer@university.edu.au");
+        user.setRole(UserRole.LECTURER);
+        user.setIsActive(true);
+        return new UsernamePasswordAuthenticationToken(user, null, List.of(new SimpleGrantedAuthority("ROLE_LECTURER")));
+    }
+}
@@ -0,0 +1,139 @@
+package com.usyd.catams.controller;
+
+import com.usyd.catams.entity.Course;
+import com.usyd.catams.entity.LecturerAssignment;
+import com.usyd.catams.entity.Timesheet;
+import com.usyd.catams.entity.TutorAssignment;
+import com.usyd.catams.entity.User;
+import com.usyd.catams.enums.UserRole;
+import com.usyd.catams.integration.IntegrationTestBase;
+import com.usyd.catams.repository.CourseRepository;
+import com.usyd.catams.repository.LecturerAssignmentRepository;
+import com.usyd.catams.repository.TimesheetRepository;
+import com.usyd.catams.repository.TutorAssignmentRepository;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.jdbc.core.JdbcTemplate;
+
+import java.math.BigDecimal;
+import java.time.LocalDate;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.hamcrest.Matchers.containsString;
+import static org.springframework.test.web.servlet.request.MockMvcRequestBuilders.post;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.jsonPath;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.status;
+
+@DisplayName("Bulk timesheet import")
+class TimesheetBulkImportIntegrationTest extends IntegrationTestBase {
+
+    @Autowired
+    private CourseRepository courseRepository;
+
+    @Autowired
+    private TimesheetRepository timesheetRepository;
+
+    @Autowired
+    private TutorAssignmentRepository tutorAssignmentRepository;
+
+    @Autowired
+    private LecturerAssignmentRepository lecturerAssignmentRepository;
+
+    @Autowired
+    private JdbcTemplate jdbcTemplate;
+
+    private User tutor;
+    private User unassignedTutor;
+    private Course course;
+    private String lecturerBearer;
+
+    @BeforeEach
+    void setUp() {
+        User lecturer = userRepository.save(new User("bulk.lecturer@test", "Bulk Lecturer", "$2a$10$hashed", UserRole.LECTURER));
+        tutor = userRepository.save(new User("bulk.tutor@test", "Bulk Tutor", "$2a$10$hashed", UserRole.TUTOR));
+        unassignedTutor = userRepository.save(new User("bulk.other@test", "Other Tutor", "$2a$10$hashed", UserRole.TUTOR));
+        course = courseRepository.save(new Course("BULK1001", "Bulk Loading", "2025S2",
+            lecturer.getId(), BigDecimal.valueOf(50000)));
+        tutorAssignmentRepository.save(new TutorAssignment(tutor.getId(), course.getId()));
+        lecturerAssignmentRepository.save(new LecturerAssignment(lecturer.getId(), course.getId()));
+
+        Timesheet existing = new Timesheet(tutor.getId(), course.getId(), LocalDate.of(2025, 7, 7),
+            new BigDecimal("3.0"), new BigDecimal("60.85"), "Already loaded", lecturer.getId());
+        timesheetRepository.save(existing);
+
+        lecturerBearer = "Bearer " + jwtTokenProvider.generateToken(
+            lecturer.getId(), lecturer.getEmailValue(), lecturer.getRole().name());
+    }
+
+    @Test
+    @DisplayName("creates valid rows and reports each rejected row")
+    void importsValidRowsAndReportsRejections() throws Exception {
+        List<Map<String, Object>> rows = List.of(
+            row(tutor, "2025-07-14", "Week 2 tutorial"),
+            row(tutor, "2025-07-21", "Week 3 tutorial"),
+            row(tutor, "2025-07-07", "Clashes with an existing timesheet"),
+            row(tutor, "2025-07-21", "Clashes with row 2"),
+            row(unassignedTutor, "2025-07-14", "Tutor not assigned"),
+            row(tutor, "2025-07-15", "Not a Monday")
+        );
+
+        performPost("/api/timesheets/bulk", rows, lecturerBearer)
+            .andExpect(status().isOk())
+            .andExpect(jsonPath("$.totalRows").value(6))
+            .andExpect(jsonPath("$.createdCount").value(2))
+            .andExpect(jsonPath("$.rejectedCount").value(4))
+            .andExpect(jsonPath("$.rows[0].status").value("CREATED"))
+            .andExpect(jsonPath("$.rows[0].timesheetId").isNumber())
+            .andExpect(jsonPath("$.rows[1].status").value("CREATED"))
+            .andExpect(jsonPath("$.rows[2].errors[0]").value(containsString("already exists")))
+            .andExpect(jsonPath("$.rows[3].errors[0]").value(containsString("already exists")))
+            .andExpect(jsonPath("$.rows[4].status").value("REJECTED"))
+            .andExpect(jsonPath("$.rows[5].errors[0]").value(containsString("Monday")));
+
+        assertThat(timesheetRepository.findByTutorId(tutor.getId())).hasSize(3);
+        // The weekly rollup picks up both created rows from the chunk's grouped upsert
+        assertThat(jdbcTemplate.queryForObject(
+            "SELECT COALESCE(SUM(timesheet_count), 0) FROM timesheet_weekly_rollup " +
+            "WHERE tutor_id = ? AND course_id = ? AND week_start_date IN (DATE '2025-07-14', DATE '2025-07-21')",
+            Long.class, tutor.getId(), course.getId())).isEqualTo(2L);
+    }
+
+    @Test
+    @DisplayName("accepts CSV with quoted descriptions")
+    void importsCsv() throws Exception {
+        String csv = "tutorId,courseId,weekStartDate,taskType,qualification,deliveryHours,description\n"
+            + tutor.getId() + "," + course.getId() + ",2025-07-14,TUTORIAL,STANDARD,1.0,\"Tutorial, week 2\"\n"
+            + tutor.getId() + "," + course.getId() + ",2025-07-21,TUTORIAL,STANDARD,abc,Bad hours\n";
+
+        mockMvc.perform(post("/api/timesheets/bulk")
+                .contentType("text/csv")
+                .header("Authorization", lecturerBearer)
+                .content(csv))
+            .andExpect(status().isOk())
+            .andExpect(jsonPath("$.createdCount").value(1))
+            .andExpect(jsonPath("$.rows[1].status").value("REJECTED"))
+            .andExpect(jsonPath("$.rows[1].errors[0]").value(containsString("deliveryhours")));
+
+        assertThat(timesheetRepository.findByTutorId(tutor.getId()))
+            .extracting(Timesheet::getDescription)
+            .contains("Tutorial, week 2");
+    }
+
+    private Map<String, Object> row(User rowTutor, String weekStartDate, String description) {
+        Map<String, Object> row = new HashMap<>();
+        row.put("tutorId", rowTutor.getId());
+        row.put("courseId", course.getId());
+        row.put("weekStartDate", weekStartDate);
+        row.put("taskType", "TUTORIAL");
+        row.put("qualification", "STANDARD");
+        row.put("isRepeat", false);
+        row.put("deliveryHours", 1.0);
+        row.put("description", description);
+        return row;
+    }
+}
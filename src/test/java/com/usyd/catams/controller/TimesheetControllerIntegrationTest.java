@@ -22,6 +22,7 @@ import com.usyd.catams.testdata.builder.TimesheetBuilder;
 import java.math.BigDecimal;
 import java.time.LocalDate;
 import java.util.HashMap;
+import java.util.List;
 import java.util.Map;
 import org.hamcrest.Matchers;
 import org.junit.jupiter.api.BeforeEach;
@@ -166,6 +167,45 @@ class TimesheetControllerIntegrationTest extends IntegrationTestBase {
                 .andExpect(jsonPath("$.qualification").value("PHD"));
     }
 
+    @Test
+    void shouldQuoteBatchInRequestOrderWithPerSessionRepeatEligibility() throws Exception {
+        seedTutorialSession(LocalDate.of(2025, 7, 7));
+
+        Map<String, Object> standard = baseQuotePayload("TUTORIAL", "STANDARD", 1.0, false);
+        Map<String, Object> eligibleRepeat = baseQuotePayload("TUTORIAL", "PHD", 1.0, true);
+        eligibleRepeat.put("sessionDate", "2025-07-14");
+        Map<String, Object> lateRepeat = baseQuotePayload("TUTORIAL", "PHD", 1.0, true);
+        lateRepeat.put("sessionDate", "2025-07-28");
+        Map<String, Object> oraa = baseQuotePayload("ORAA", "STANDARD", 1.5, false);
+
+        Map<String, Object> request = new HashMap<>();
+        request.put("quotes", List.of(standard, eligibleRepeat, lateRepeat, oraa));
+
+        performPost("/api/timesheets/quote/batch", request, lecturerAuthHeader)
+                .andExpect(status().isOk())
+                .andExpect(jsonPath("$.quotes.length()").value(4))
+                .andExpect(jsonPath("$.quotes[0].rateCode").value("TU2"))
+                .andExpect(jsonPath("$.quotes[0].amount").value(closeTo(182.54, 0.001)))
+                .andExpect(jsonPath("$.quotes[1].rateCode").value("TU3"))
+                .andExpect(jsonPath("$.quotes[1].isRepeat").value(true))
+                .andExpect(jsonPath("$.quotes[2].rateCode").value("TU1"))
+                .andExpect(jsonPath("$.quotes[2].isRepeat").value(false))
+                .andExpect(jsonPath("$.quotes[3].rateCode").value("AO2"));
+    }
+
+    @Test
+    void shouldRejectBatchQuoteWhenAnyEntryIsInvalid() throws Exception {
+        Map<String, Object> valid = baseQuotePayload("TUTORIAL", "STANDARD", 1.0, false);
+        Map<String, Object> notMonday = baseQuotePayload("TUTORIAL", "STANDARD", 1.0, false);
+        notMonday.put("sessionDate", "2025-07-08");
+
+        Map<String, Object> request = new HashMap<>();
+        request.put("quotes", List.of(valid, notMonday));
+
+        performPost("/api/timesheets/quote/batch", request, lecturerAuthHeader)
+                .andExpect(status().isBadRequest());
+    }
+
     @Test
     void shouldIgnoreClientFinancialFieldsWhenCreatingTimesheet() throws Exception {
         Map<String, Object> request = new HashMap<>();
@@ -294,6 +334,39 @@ class TimesheetControllerIntegrationTest extends IntegrationTestBase {
                 .andExpect(status().isCreated());
     }
 
+    @Test
+    @DisplayName("Repeat Tutorial of different content within 7 days should be rejected")
+    void repeatTutorialOfDifferentContentShouldFail() throws Exception {
+        Map<String, Object> base = new HashMap<>();
+        base.put("tutorId", tutor.getId());
+        base.put("courseId", course.getId());
+        base.put("weekStartDate", "2025-07-07");
+        base.put("taskType", "TUTORIAL");
+        base.put("qualification", "STANDARD");
+        base.put("isRepeat", false);
+        base.put("deliveryHours", 1.0);
+        base.put("sessionDate", "2025-07-07");
+        base.put("description", "Tutorial content A");
+
+        performPost("/api/timesheets", base, lecturerAuthHeader)
+                .andExpect(status().isCreated());
+
+        Map<String, Object> repeat = new HashMap<>();
+        repeat.putAll(base);
+        repeat.put("weekStartDate", "2025-07-14");
+        repeat.put("sessionDate", "2025-07-14");
+        repeat.put("isRepeat", true);
+        repeat.put("description", "Tutorial content B");
+
+        performPost("/api/timesheets", repeat, lecturerAuthHeader)
+                .andExpect(status().isBadRequest());
+
+        // Case and spacing do not make the content different
+        repeat.put("description", "  tutorial   CONTENT a ");
+        performPost("/api/timesheets", repeat, lecturerAuthHeader)
+                .andExpect(status().isCreated());
+    }
+
     @Test
     @DisplayName("Updating a timesheet preserves its original session date")
     void updatingTimesheetShouldPreserveSessionDate() throws Exception {
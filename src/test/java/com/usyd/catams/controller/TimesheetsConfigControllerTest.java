@@ -6,7 +6,9 @@ import org.springframework.boot.test.autoconfigure.web.servlet.AutoConfigureMock
 import org.springframework.boot.test.context.SpringBootTest;
 import org.springframework.http.MediaType;
 import org.springframework.test.web.servlet.MockMvc;
+import org.springframework.test.web.servlet.MvcResult;
 
+import static org.assertj.core.api.Assertions.assertThat;
 import static org.springframework.test.web.servlet.request.MockMvcRequestBuilders.get;
 import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.*;
 
@@ -28,5 +30,21 @@ class TimesheetsConfigControllerTest {
                 .andExpect(jsonPath("$.weekStart.mondayOnly").value(true))
                 .andExpect(jsonPath("$.currency").value("AUD"));
     }
-}
 
+    @Test
+    void shouldAnswerMatchingIfNoneMatchWithNotModified() throws Exception {
+        MvcResult first = mockMvc.perform(get("/api/timesheets/config").accept(MediaType.APPLICATION_JSON))
+                .andExpect(status().isOk())
+                .andExpect(header().exists("ETag"))
+                .andReturn();
+        String etag = first.getResponse().getHeader("ETag");
+
+        MvcResult second = mockMvc.perform(get("/api/timesheets/config")
+                        .accept(MediaType.APPLICATION_JSON)
+                        .header("If-None-Match", etag))
+                .andExpect(status().isNotModified())
+                .andExpect(header().string("ETag", etag))
+                .andReturn();
+        assertThat(second.getResponse().getContentAsString()).isEmpty();
+    }
+}
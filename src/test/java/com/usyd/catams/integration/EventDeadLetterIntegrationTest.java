@@ -0,0 +1,110 @@
+package com.usyd.catams.integration;
+
+import com.usyd.catams.common.domain.event.TimesheetEvent;
+import com.usyd.catams.common.infrastructure.event.EventDeadLetterStore;
+import com.usyd.catams.common.infrastructure.event.EventOutboxStore;
+import com.usyd.catams.entity.User;
+import com.usyd.catams.enums.UserRole;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.jdbc.core.JdbcTemplate;
+
+import java.math.BigDecimal;
+import java.time.LocalDate;
+import java.util.List;
+import java.util.Map;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.jsonPath;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.status;
+
+/**
+ * Dead-lettered domain events can be listed and replayed by an administrator.
+ */
+@DisplayName("Domain event dead letters")
+class EventDeadLetterIntegrationTest extends IntegrationTestBase {
+
+    @Autowired
+    private EventDeadLetterStore deadLetterStore;
+
+    @Autowired
+    private EventOutboxStore outboxStore;
+
+    @Autowired
+    private JdbcTemplate jdbcTemplate;
+
+    private String adminBearer;
+    private TimesheetEvent.TimesheetCreatedEvent event;
+    private long deadLetterId;
+
+    @BeforeEach
+    void seed() {
+        User admin = userRepository.save(new User("deadletter.admin@test", "Dead Letter Admin", "$2a$10$hashed", UserRole.ADMIN));
+        adminBearer = "Bearer " + jwtTokenProvider.generateToken(admin.getId(), admin.getEmailValue(), admin.getRole().name());
+
+        event = new TimesheetEvent.TimesheetCreatedEvent("5151", 7L, 9L, LocalDate.of(2025, 3, 3),
+            new BigDecimal("2.0"), new BigDecimal("65.00"), "Tutorial", "7", null);
+        deadLetterStore.add(event, EventDeadLetterStore.SOURCE_RETRY, 4, "IllegalStateException: listener down");
+        deadLetterId = jdbcTemplate.queryForObject(
+            "SELECT id FROM event_dead_letter WHERE event_id = ?", Long.class, event.getEventId());
+    }
+
+    @Test
+    @DisplayName("lists entries awaiting replay")
+    void listsPendingDeadLetters() throws Exception {
+        performGet("/api/admin/events/dead-letters", adminBearer)
+            .andExpect(status().isOk())
+            .andExpect(jsonPath("$[0].id").value(deadLetterId))
+            .andExpect(jsonPath("$[0].eventType").value("TIMESHEET_CREATED"))
+            .andExpect(jsonPath("$[0].attempts").value(4))
+            .andExpect(jsonPath("$[0].source").value("RETRY"));
+    }
+
+    @Test
+    @DisplayName("replay re-publishes through the outbox and cannot be repeated")
+    void replayRequeuesEventOnce() throws Exception {
+        performPost("/api/admin/events/dead-letters/" + deadLetterId + "/replay", null, adminBearer)
+            .andExpect(status().isOk())
+            .andExpect(jsonPath("$.replayedAt").isNotEmpty());
+
+        Integer queued = jdbcTemplate.queryForObject(
+            "SELECT COUNT(*) FROM event_outbox WHERE event_id = ? AND processed_at IS NULL",
+            Integer.class, event.getEventId());
+        assertThat(queued).isEqualTo(1);
+
+        performPost("/api/admin/events/dead-letters/" + deadLetterId + "/replay", null, adminBearer)
+            .andExpect(status().isConflict());
+    }
+
+    @Test
+    @DisplayName("replaying an event the drainer dead-lettered reopens its outbox row")
+    void replayReopensOutboxRow() throws Exception {
+        TimesheetEvent.TimesheetCreatedEvent drained = new TimesheetEvent.TimesheetCreatedEvent("5252", 7L, 9L,
+            LocalDate.of(2025, 3, 3), new BigDecimal("2.0"), new BigDecimal("65.00"), "Tutorial", "7", null);
+        outboxStore.append(drained);
+        long outboxId = jdbcTemplate.queryForObject(
+            "SELECT id FROM event_outbox WHERE event_id = ?", Long.class, drained.getEventId());
+        outboxStore.recordFailure(outboxId, "IllegalStateException: listener down");
+        deadLetterStore.addFromOutbox(outboxId, 10, "IllegalStateException: listener down");
+        outboxStore.markProcessed(List.of(outboxId));
+        long outboxDeadLetterId = jdbcTemplate.queryForObject(
+            "SELECT id FROM event_dead_letter WHERE event_id = ?", Long.class, drained.getEventId());
+
+        performPost("/api/admin/events/dead-letters/" + outboxDeadLetterId + "/replay", null, adminBearer)
+            .andExpect(status().isOk())
+            .andExpect(jsonPath("$.source").value("OUTBOX"))
+            .andExpect(jsonPath("$.replayedAt").isNotEmpty());
+
+        List<Map<String, Object>> rows = jdbcTemplate.queryForList(
+            "SELECT id, processed_at, attempts, last_error FROM event_outbox WHERE event_id = ?",
+            drained.getEventId());
+        assertThat(rows).singleElement().satisfies(row -> {
+            assertThat(row.get("id")).isEqualTo(outboxId);
+            assertThat(row.get("processed_at")).isNull();
+            assertThat(row.get("attempts")).isEqualTo(0);
+            assertThat(row.get("last_error")).isNull();
+        });
+    }
+}
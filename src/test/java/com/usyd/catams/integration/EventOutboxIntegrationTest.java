@@ -0,0 +1,181 @@
+package com.usyd.catams.integration;
+
+import com.usyd.catams.common.domain.event.TimesheetEvent;
+import com.usyd.catams.common.infrastructure.event.DomainEventPublisher;
+import com.usyd.catams.common.infrastructure.event.EventOutboxDrainer;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.boot.test.context.TestConfiguration;
+import org.springframework.context.annotation.Bean;
+import org.springframework.context.annotation.Import;
+import org.springframework.context.event.EventListener;
+import org.springframework.jdbc.core.JdbcTemplate;
+
+import java.math.BigDecimal;
+import java.time.LocalDate;
+import java.util.List;
+import java.util.Map;
+import java.util.Set;
+import java.util.UUID;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.CopyOnWriteArrayList;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+/**
+ * Domain events raised in a transaction go through event_outbox and are delivered by the drainer.
+ *
+ * Listeners run on the event executors, so deliveries are observed through a recording listener
+ * rather than the thread-bound {@code @RecordApplicationEvents}.
+ */
+@DisplayName("Domain event outbox")
+@Import(EventOutboxIntegrationTest.RecordingListenerConfiguration.class)
+class EventOutboxIntegrationTest extends IntegrationTestBase {
+
+    @Autowired
+    private DomainEventPublisher domainEventPublisher;
+
+    @Autowired
+    private EventOutboxDrainer eventOutboxDrainer;
+
+    @Autowired
+    private JdbcTemplate jdbcTemplate;
+
+    @Autowired
+    private RecordingListener recordingListener;
+
+    @Test
+    @DisplayName("publishing inside a transaction writes an outbox row instead of dispatching")
+    void publishInTransactionAppendsToOutbox() {
+        TimesheetEvent.TimesheetCreatedEvent event = createdEvent();
+
+        domainEventPublisher.publish(event);
+
+        assertThat(recordingListener.received(event)).isEmpty();
+        Map<String, Object> row = outboxRow(event);
+        assertThat(row.get("event_type")).isEqualTo("TIMESHEET_CREATED");
+        assertThat(row.get("aggregate_id")).isEqualTo("4242");
+        assertThat(row.get("processed_at")).isNull();
+    }
+
+    @Test
+    @DisplayName("drainer dispatches the stored event and marks the row processed")
+    void drainerDispatchesAndMarksProcessed() {
+        TimesheetEvent.TimesheetCreatedEvent event = createdEvent();
+        domainEventPublisher.publish(event);
+
+        eventOutboxDrainer.drainBatch();
+
+        assertThat(recordingListener.received(event))
+            .singleElement()
+            .satisfies(delivered -> {
+                assertThat(delivered.getEventId()).isEqualTo(event.getEventId());
+                assertThat(delivered.getHours()).isEqualByComparingTo("2.5");
+                assertThat(delivered.getWeekStartDate()).isEqualTo(LocalDate.of(2025, 3, 3));
+            });
+        Map<String, Object> row = outboxRow(event);
+        assertThat(row.get("processed_at")).isNotNull();
+        assertThat(row.get("attempts")).isEqualTo(0);
+
+        eventOutboxDrainer.drainBatch();
+
+        assertThat(recordingListener.received(event)).hasSize(1);
+    }
+
+    @Test
+    @DisplayName("a failing listener leaves the row open and the next poll delivers it again")
+    void failingListenerKeepsRowForRetry() {
+        TimesheetEvent.TimesheetCreatedEvent event = createdEvent();
+        domainEventPublisher.publish(event);
+        recordingListener.failOn(event);
+
+        eventOutboxDrainer.drainBatch();
+
+        Map<String, Object> row = outboxRow(event);
+        assertThat(row.get("processed_at")).isNull();
+        assertThat(row.get("attempts")).isEqualTo(1);
+        assertThat(jdbcTemplate.queryForObject(
+            "SELECT last_error FROM event_outbox WHERE event_id = ?", String.class, event.getEventId()))
+            .contains("listener down");
+
+        recordingListener.recover(event);
+        eventOutboxDrainer.drainBatch();
+
+        assertThat(recordingListener.received(event)).hasSize(1);
+        assertThat(outboxRow(event).get("processed_at")).isNotNull();
+    }
+
+    @Test
+    @DisplayName("a row leased by another drainer is skipped until the lease runs out")
+    void leasedRowIsSkipped() {
+        TimesheetEvent.TimesheetCreatedEvent event = createdEvent();
+        domainEventPublisher.publish(event);
+        jdbcTemplate.update("UPDATE event_outbox SET claimed_until = CURRENT_TIMESTAMP + INTERVAL '1 hour' " +
+            "WHERE event_id = ?", event.getEventId());
+
+        eventOutboxDrainer.drainBatch();
+
+        assertThat(recordingListener.received(event)).isEmpty();
+        assertThat(outboxRow(event).get("processed_at")).isNull();
+
+        jdbcTemplate.update("UPDATE event_outbox SET claimed_until = CURRENT_TIMESTAMP - INTERVAL '1 second' " +
+            "WHERE event_id = ?", event.getEventId());
+        eventOutboxDrainer.drainBatch();
+
+        assertThat(recordingListener.received(event)).hasSize(1);
+        assertThat(outboxRow(event).get("processed_at")).isNotNull();
+        assertThat(jdbcTemplate.queryForObject(
+            "SELECT claimed_until FROM event_outbox WHERE event_id = ?", Object.class, event.getEventId()))
+            .isNull();
+    }
+
+    private Map<String, Object> outboxRow(TimesheetEvent event) {
+        return jdbcTemplate.queryForMap(
+            "SELECT event_type, aggregate_id, processed_at, attempts FROM event_outbox WHERE event_id = ?",
+            event.getEventId());
+    }
+
+    private static TimesheetEvent.TimesheetCreatedEvent createdEvent() {
+        return new TimesheetEvent.TimesheetCreatedEvent("4242", 7L, 9L, LocalDate.of(2025, 3, 3),
+            new BigDecimal("2.5"), new BigDecimal("65.00"), "Tutorial", "7", null);
+    }
+
+    @TestConfiguration
+    static class RecordingListenerConfiguration {
+
+        @Bean
+        RecordingListener recordingListener() {
+            return new RecordingListener();
+        }
+    }
+
+    /**
+     * Collects delivered events from any thread and fails on demand for chosen event ids
+     */
+    static class RecordingListener {
+
+        private final List<TimesheetEvent.TimesheetCreatedEvent> received = new CopyOnWriteArrayList<>();
+        private final Set<UUID> failing = ConcurrentHashMap.newKeySet();
+
+        @EventListener
+        public void on(TimesheetEvent.TimesheetCreatedEvent event) {
+            if (failing.contains(event.getEventId())) {
+                throw new IllegalStateException("listener down");
+            }
+            received.add(event);
+        }
+
+        List<TimesheetEvent.TimesheetCreatedEvent> received(TimesheetEvent event) {
+            return received.stream().filter(e -> e.getEventId().equals(event.getEventId())).toList();
+        }
+
+        void failOn(TimesheetEvent event) {
+            failing.add(event.getEventId());
+        }
+
+        void recover(TimesheetEvent event) {
+            failing.remove(event.getEventId());
+        }
+    }
+}
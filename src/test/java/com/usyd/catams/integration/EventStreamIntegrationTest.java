@@ -0,0 +1,242 @@
+package com.usyd.catams.integration;
+
+import com.usyd.catams.common.domain.event.TimesheetEvent;
+import com.usyd.catams.common.infrastructure.event.EventOutboxDrainer;
+import com.usyd.catams.dto.request.ApprovalBatchRequest;
+import com.usyd.catams.entity.Course;
+import com.usyd.catams.entity.LecturerAssignment;
+import com.usyd.catams.entity.Timesheet;
+import com.usyd.catams.entity.TutorAssignment;
+import com.usyd.catams.entity.User;
+import com.usyd.catams.enums.ApprovalAction;
+import com.usyd.catams.enums.ApprovalStatus;
+import com.usyd.catams.enums.UserRole;
+import com.usyd.catams.repository.CourseRepository;
+import com.usyd.catams.repository.LecturerAssignmentRepository;
+import com.usyd.catams.repository.TimesheetRepository;
+import com.usyd.catams.repository.TutorAssignmentRepository;
+import com.usyd.catams.service.CourseScopeCache;
+import com.usyd.catams.service.EventStreamService;
+import com.usyd.catams.service.PeerNotificationPublisher;
+import io.micrometer.core.instrument.simple.SimpleMeterRegistry;
+import org.junit.jupiter.api.AfterEach;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.mockito.ArgumentCaptor;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.test.web.servlet.MvcResult;
+
+import java.math.BigDecimal;
+import java.time.Duration;
+import java.time.LocalDate;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.mockito.ArgumentMatchers.eq;
+import static org.mockito.Mockito.mock;
+import static org.mockito.Mockito.verify;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.jsonPath;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.request;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.status;
+
+/**
+ * The event stream delivers change notifications only to callers whose scope covers the change.
+ */
+@DisplayName("Dashboard event stream")
+class EventStreamIntegrationTest extends IntegrationTestBase {
+
+    @Autowired
+    private EventStreamService eventStreamService;
+
+    @Autowired
+    private EventOutboxDrainer eventOutboxDrainer;
+
+    @Autowired
+    private CourseScopeCache courseScopeCache;
+
+    @Autowired
+    private CourseRepository courseRepository;
+
+    @Autowired
+    private TimesheetRepository timesheetRepository;
+
+    @Autowired
+    private TutorAssignmentRepository tutorAssignmentRepository;
+
+    @Autowired
+    private LecturerAssignmentRepository lecturerAssignmentRepository;
+
+    private User tutor;
+    private User lecturer;
+    private Course course;
+    private Course otherCourse;
+    private String tutorBearer;
+    private String otherTutorBearer;
+    private String lecturerBearer;
+    private String adminBearer;
+
+    @BeforeEach
+    void seed() {
+        tutor = userRepository.save(new User("stream.tutor@test", "Stream Tutor", "$2a$10$hashed", UserRole.TUTOR));
+        User otherTutor = userRepository.save(new User("stream.other@test", "Other Tutor", "$2a$10$hashed", UserRole.TUTOR));
+        lecturer = userRepository.save(new User("stream.lecturer@test", "Stream Lecturer", "$2a$10$hashed", UserRole.LECTURER));
+        User admin = userRepository.save(new User("stream.admin@test", "Stream Admin", "$2a$10$hashed", UserRole.ADMIN));
+        course = courseRepository.save(new Course("STRM1001", "Streamed Course", "2025S2",
+            lecturer.getId(), BigDecimal.valueOf(50000)));
+        otherCourse = courseRepository.save(new Course("STRM2002", "Unassigned Course", "2025S2",
+            admin.getId(), BigDecimal.valueOf(50000)));
+        tutorAssignmentRepository.save(new TutorAssignment(tutor.getId(), course.getId()));
+        lecturerAssignmentRepository.save(new LecturerAssignment(lecturer.getId(), course.getId()));
+        tutorBearer = bearer(tutor);
+        otherTutorBearer = bearer(otherTutor);
+        lecturerBearer = bearer(lecturer);
+        adminBearer = bearer(admin);
+    }
+
+    @AfterEach
+    void closeStreams() {
+        eventStreamService.closeAll();
+        assertThat(eventStreamService.getSubscriberCount()).isZero();
+    }
+
+    @Test
+    @DisplayName("pushes timesheet changes to the owning tutor and admins only")
+    void pushesToScopedSubscribers() throws Exception {
+        MvcResult tutorStream = open(tutorBearer);
+        MvcResult otherStream = open(otherTutorBearer);
+        MvcResult adminStream = open(adminBearer);
+
+        eventStreamService.timesheetChanged(createdEvent("9001", course.getId()));
+
+        assertThat(tutorStream.getResponse().getContentAsString())
+            .contains("event:timesheet-changed")
+            .contains("\"timesheetId\":\"9001\"")
+            .contains("event:summary-invalidated");
+        assertThat(adminStream.getResponse().getContentAsString()).contains("\"timesheetId\":\"9001\"");
+        assertThat(otherStream.getResponse().getContentAsString()).doesNotContain("timesheet-changed");
+    }
+
+    @Test
+    @DisplayName("pushes to a lecturer only changes in the courses they are assigned to")
+    void scopesLecturersToTheirCourses() throws Exception {
+        MvcResult lecturerStream = open(lecturerBearer);
+
+        eventStreamService.timesheetChanged(createdEvent("9101", course.getId()));
+        eventStreamService.timesheetChanged(createdEvent("9102", otherCourse.getId()));
+
+        assertThat(lecturerStream.getResponse().getContentAsString())
+            .contains("\"timesheetId\":\"9101\"")
+            .doesNotContain("\"timesheetId\":\"9102\"");
+    }
+
+    @Test
+    @DisplayName("a timesheet write reaches the stream through the outbox and the event handler")
+    void deliversWritesThroughTheEventHandler() throws Exception {
+        Timesheet timesheet = new Timesheet(tutor.getId(), course.getId(), LocalDate.of(2025, 7, 7),
+            new BigDecimal("3.0"), new BigDecimal("60.85"), "Tutorial week 1", lecturer.getId());
+        timesheet.setStatus(ApprovalStatus.TUTOR_CONFIRMED);
+        timesheet = timesheetRepository.save(timesheet);
+        MvcResult tutorStream = open(tutorBearer);
+        MvcResult otherStream = open(otherTutorBearer);
+
+        performPost("/api/approvals/batch",
+                new ApprovalBatchRequest(List.of(timesheet.getId()), ApprovalAction.LECTURER_CONFIRM, null),
+                lecturerBearer)
+            .andExpect(status().isOk())
+            .andExpect(jsonPath("$.succeededCount").value(1));
+        assertThat(tutorStream.getResponse().getContentAsString()).doesNotContain("timesheet-changed");
+
+        eventOutboxDrainer.drainBatch();
+
+        assertThat(tutorStream.getResponse().getContentAsString())
+            .contains("event:timesheet-changed")
+            .contains("\"timesheetId\":\"" + timesheet.getId() + "\"")
+            .contains("\"eventType\":\"TIMESHEET_APPROVAL_PROCESSED\"");
+        assertThat(otherStream.getResponse().getContentAsString()).doesNotContain("timesheet-changed");
+    }
+
+    @Test
+    @DisplayName("a bulk import reaches the stream as one change per affected course")
+    void deliversBulkImportsPerCourse() throws Exception {
+        MvcResult tutorStream = open(tutorBearer);
+        MvcResult otherStream = open(otherTutorBearer);
+        MvcResult lecturerStream = open(lecturerBearer);
+
+        performPost("/api/timesheets/bulk",
+                List.of(importRow("2025-07-14", "Week 2 tutorial"), importRow("2025-07-21", "Week 3 tutorial")),
+                lecturerBearer)
+            .andExpect(status().isOk())
+            .andExpect(jsonPath("$.createdCount").value(2));
+        assertThat(tutorStream.getResponse().getContentAsString()).doesNotContain("timesheet-changed");
+
+        eventOutboxDrainer.drainBatch();
+
+        String tutorFrames = tutorStream.getResponse().getContentAsString();
+        assertThat(tutorFrames)
+            .contains("\"courseId\":" + course.getId())
+            .contains("\"eventType\":\"COURSE_TIMESHEETS_IMPORTED\"")
+            .contains("event:summary-invalidated");
+        assertThat(tutorFrames.split("event:timesheet-changed", -1)).hasSize(2);
+        assertThat(lecturerStream.getResponse().getContentAsString())
+            .contains("\"eventType\":\"COURSE_TIMESHEETS_IMPORTED\"");
+        assertThat(otherStream.getResponse().getContentAsString()).doesNotContain("timesheet-changed");
+    }
+
+    @Test
+    @DisplayName("forwards changes to other instances and pushes theirs to local subscribers")
+    void fansOutAcrossInstances() throws Exception {
+        PeerNotificationPublisher peerPublisher = mock(PeerNotificationPublisher.class);
+        EventStreamService peer = new EventStreamService(courseScopeCache, peerPublisher,
+            new SimpleMeterRegistry(), Duration.ofMinutes(1), 5);
+        MvcResult tutorStream = open(tutorBearer);
+
+        peer.timesheetChanged(createdEvent("9201", course.getId()));
+
+        ArgumentCaptor<String> payload = ArgumentCaptor.forClass(String.class);
+        verify(peerPublisher).notifyPeers(eq(EventStreamService.CHANNEL), payload.capture());
+        assertThat(tutorStream.getResponse().getContentAsString()).doesNotContain("9201");
+
+        eventStreamService.onNotification(payload.getValue());
+
+        assertThat(tutorStream.getResponse().getContentAsString())
+            .contains("\"timesheetId\":\"9201\"")
+            .contains("\"tutorId\":" + tutor.getId());
+    }
+
+    @Test
+    @DisplayName("rejects unauthenticated subscribers")
+    void requiresAuthentication() throws Exception {
+        performGet("/api/events/stream", null).andExpect(status().isUnauthorized());
+    }
+
+    private TimesheetEvent.TimesheetCreatedEvent createdEvent(String timesheetId, Long courseId) {
+        return new TimesheetEvent.TimesheetCreatedEvent(timesheetId, tutor.getId(), courseId,
+            LocalDate.of(2025, 3, 3), new BigDecimal("2.0"), new BigDecimal("65.00"), "Tutorial", "1", null);
+    }
+
+    private Map<String, Object> importRow(String weekStartDate, String description) {
+        Map<String, Object> row = new HashMap<>();
+        row.put("tutorId", tutor.getId());
+        row.put("courseId", course.getId());
+        row.put("weekStartDate", weekStartDate);
+        row.put("taskType", "TUTORIAL");
+        row.put("qualification", "STANDARD");
+        row.put("isRepeat", false);
+        row.put("deliveryHours", 1.0);
+        row.put("description", description);
+        return row;
+    }
+
+    private MvcResult open(String bearer) throws Exception {
+        return performGet("/api/events/stream", bearer)
+            .andExpect(request().asyncStarted())
+            .andReturn();
+    }
+
+    private String bearer(User user) {
+        return "Bearer " + jwtTokenProvider.generateToken(user.getId(), user.getEmailValue(), user.getRole().name());
+    }
+}
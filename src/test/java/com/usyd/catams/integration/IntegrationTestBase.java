@@ -54,6 +54,8 @@ public abstract class IntegrationTestBase {
             registry.add("spring.datasource.password", () -> "");
             registry.add("spring.datasource.driver-class-name", () -> "org.h2.Driver");
             registry.add("spring.jpa.properties.hibernate.dialect", () -> "org.hibernate.dialect.H2Dialect");
+            // The outbox drain query relies on PostgreSQL (SKIP LOCKED, interval arithmetic)
+            registry.add("app.events.outbox.enabled", () -> "false");
         } else {
             try {
                 PostgresTestContainer postgres = PostgresTestContainer.getInstance();
@@ -0,0 +1,133 @@
+package com.usyd.catams.integration;
+
+import com.fasterxml.jackson.databind.JsonNode;
+import com.usyd.catams.entity.Course;
+import com.usyd.catams.entity.Timesheet;
+import com.usyd.catams.entity.User;
+import com.usyd.catams.enums.ApprovalStatus;
+import com.usyd.catams.enums.UserRole;
+import com.usyd.catams.repository.CourseRepository;
+import com.usyd.catams.repository.TimesheetRepository;
+import com.usyd.catams.service.PayrollExportService;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+
+import java.io.ByteArrayOutputStream;
+import java.math.BigDecimal;
+import java.nio.charset.StandardCharsets;
+import java.time.LocalDate;
+import java.util.ArrayList;
+import java.util.List;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.status;
+
+/**
+ * Payroll export content: detail rows per final-confirmed timesheet, grouped by rate code,
+ * with subtotals and a grand total.
+ */
+@DisplayName("Payroll export")
+class PayrollExportIntegrationTest extends IntegrationTestBase {
+
+    private static final LocalDate FROM = LocalDate.of(2025, 3, 3);
+    private static final LocalDate TO = LocalDate.of(2025, 3, 31);
+
+    @Autowired
+    private PayrollExportService payrollExportService;
+
+    @Autowired
+    private TimesheetRepository timesheetRepository;
+
+    @Autowired
+    private CourseRepository courseRepository;
+
+    private User tutor;
+    private User lecturer;
+    private Course course;
+
+    @BeforeEach
+    void seed() {
+        lecturer = userRepository.save(new User("payroll.lecturer@test", "Payroll Lecturer", "$2a$10$hashed", UserRole.LECTURER));
+        tutor = userRepository.save(new User("payroll.tutor@test", "Tutor, Payroll", "$2a$10$hashed", UserRole.TUTOR));
+        course = courseRepository.save(new Course("PAY1001", "Payroll Course", "2025S1",
+            lecturer.getId(), BigDecimal.valueOf(50000)));
+
+        timesheet(LocalDate.of(2025, 3, 3), "TU2", "2.0", "130.00", ApprovalStatus.FINAL_CONFIRMED);
+        timesheet(LocalDate.of(2025, 3, 10), "TU1", "3.0", "195.00", ApprovalStatus.FINAL_CONFIRMED);
+        timesheet(LocalDate.of(2025, 3, 17), "TU2", "2.0", "130.00", ApprovalStatus.FINAL_CONFIRMED);
+        timesheet(LocalDate.of(2025, 3, 24), "TU1", "1.0", "65.00", ApprovalStatus.LECTURER_CONFIRMED);
+        timesheet(LocalDate.of(2025, 4, 7), "TU1", "1.0", "65.00", ApprovalStatus.FINAL_CONFIRMED);
+        entityManager.flush();
+    }
+
+    @Test
+    @DisplayName("CSV groups detail rows by rate code with subtotals and a total")
+    void csvExportGroupsByRateCode() {
+        List<String> lines = export(PayrollExportService.Format.CSV);
+
+        assertThat(lines).hasSize(7);
+        assertThat(lines.get(0)).startsWith("record_type,rate_code,timesheet_id");
+        assertThat(lines.subList(1, 7)).extracting(line -> line.substring(0, line.indexOf(',', line.indexOf(',') + 1)))
+            .containsExactly("DETAIL,TU1", "SUBTOTAL,TU1", "DETAIL,TU2", "DETAIL,TU2", "SUBTOTAL,TU2", "TOTAL,");
+        assertThat(lines.get(1)).contains("\"Tutor, Payroll\"");
+        assertThat(lines.get(5)).endsWith(",2,4.0,0.0,4.0,,260.00");
+        assertThat(lines.get(6)).endsWith(",3,7.0,0.0,7.0,,455.00");
+    }
+
+    @Test
+    @DisplayName("CSV neutralises cells a spreadsheet would evaluate as formulas")
+    void csvExportNeutralisesFormulas() {
+        tutor.setName("=HYPERLINK(\"http://evil.example\",\"Payslip\")");
+        userRepository.save(tutor);
+        entityManager.flush();
+
+        List<String> lines = export(PayrollExportService.Format.CSV);
+
+        assertThat(lines.get(1)).contains(",\"'=HYPERLINK(\"\"http://evil.example\"\",\"\"Payslip\"\")\",");
+        assertThat(lines.get(6)).endsWith(",3,7.0,0.0,7.0,,455.00");
+    }
+
+    @Test
+    @DisplayName("NDJSON emits one typed object per line")
+    void ndjsonExportEmitsTypedLines() throws Exception {
+        List<String> lines = export(PayrollExportService.Format.NDJSON);
+
+        List<JsonNode> records = new ArrayList<>();
+        for (String line : lines) {
+            records.add(objectMapper.readTree(line));
+        }
+        assertThat(records).extracting(node -> node.get("type").asText())
+            .containsExactly("detail", "subtotal", "detail", "detail", "subtotal", "total");
+        assertThat(records.get(1).get("rateCode").asText()).isEqualTo("TU1");
+        assertThat(records.get(1).get("amount").decimalValue()).isEqualByComparingTo("195.00");
+        assertThat(records.get(5).get("timesheetCount").asLong()).isEqualTo(3);
+    }
+
+    @Test
+    @DisplayName("rejects a reversed date range")
+    void rejectsReversedRange() throws Exception {
+        User admin = userRepository.save(new User("payroll.admin@test", "Payroll Admin", "$2a$10$hashed", UserRole.ADMIN));
+        String bearer = "Bearer " + jwtTokenProvider.generateToken(admin.getId(), admin.getEmailValue(), admin.getRole().name());
+
+        performGet("/api/admin/payroll/export?from=2025-03-31&to=2025-03-01", bearer)
+            .andExpect(status().isBadRequest());
+    }
+
+    private List<String> export(PayrollExportService.Format format) {
+        ByteArrayOutputStream output = new ByteArrayOutputStream();
+        payrollExportService.export(FROM, TO, format, output);
+        return output.toString(StandardCharsets.UTF_8).lines().toList();
+    }
+
+    private void timesheet(LocalDate week, String rateCode, String hours, String amount, ApprovalStatus status) {
+        Timesheet timesheet = new Timesheet(tutor.getId(), course.getId(), week,
+            new BigDecimal(hours), new BigDecimal("65.00"), "Tutorial " + week, lecturer.getId());
+        timesheet.setDeliveryHours(new BigDecimal(hours));
+        timesheet.setRateCode(rateCode);
+        timesheet.setCalculatedAmount(new BigDecimal(amount));
+        timesheet.setStatus(status);
+        timesheetRepository.save(timesheet);
+    }
+}
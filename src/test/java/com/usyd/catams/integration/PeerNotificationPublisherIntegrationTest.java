@@ -0,0 +1,37 @@
+package com.usyd.catams.integration;
+
+import com.usyd.catams.entity.User;
+import com.usyd.catams.enums.UserRole;
+import com.usyd.catams.service.PeerNotificationPublisher;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.jdbc.core.JdbcTemplate;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+/**
+ * A failed peer notification must not abort the transaction that sent it.
+ */
+@DisplayName("Peer notification publisher")
+class PeerNotificationPublisherIntegrationTest extends IntegrationTestBase {
+
+    @Autowired
+    private PeerNotificationPublisher peerNotificationPublisher;
+
+    @Autowired
+    private JdbcTemplate jdbcTemplate;
+
+    @Test
+    @DisplayName("keeps the caller's transaction usable when NOTIFY fails")
+    void failedNotifyLeavesTransactionUsable() {
+        User user = userRepository.saveAndFlush(
+            new User("notify.user@test", "Notify User", "$2a$10$hashed", UserRole.TUTOR));
+
+        // Postgres rejects NOTIFY payloads of 8000 bytes or more
+        peerNotificationPublisher.notifyPeers("peer_notification_test", "x".repeat(8000));
+
+        assertThat(jdbcTemplate.queryForObject(
+            "SELECT COUNT(*) FROM users WHERE id = ?", Long.class, user.getId())).isEqualTo(1L);
+    }
+}
@@ -0,0 +1,123 @@
+package com.usyd.catams.integration;
+
+import com.fasterxml.jackson.databind.JsonNode;
+import com.usyd.catams.entity.Course;
+import com.usyd.catams.entity.Timesheet;
+import com.usyd.catams.entity.User;
+import com.usyd.catams.repository.CourseRepository;
+import com.usyd.catams.repository.TimesheetRepository;
+import com.usyd.catams.testdata.TestDataBuilder;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+
+import java.math.BigDecimal;
+import java.time.LocalDate;
+import java.util.ArrayList;
+import java.util.List;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.jsonPath;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.status;
+
+/**
+ * Walks the keyset (cursor) mode of the timesheet listing end to end.
+ */
+@DisplayName("Timesheet cursor pagination")
+class TimesheetCursorPaginationIntegrationTest extends IntegrationTestBase {
+
+    private static final int ROWS = 7;
+
+    @Autowired
+    private TimesheetRepository timesheetRepository;
+
+    @Autowired
+    private CourseRepository courseRepository;
+
+    private String adminBearer;
+    private List<Long> expectedNewestFirst;
+
+    @BeforeEach
+    void seedTimesheets() {
+        User admin = userRepository.save(TestDataBuilder.anAdmin()
+            .withEmail("cursor-admin@integration.test")
+            .withName("Cursor Admin")
+            .build());
+        User lecturer = userRepository.save(TestDataBuilder.aLecturer()
+            .withEmail("cursor-lecturer@integration.test")
+            .withName("Cursor Lecturer")
+            .build());
+        User tutor = userRepository.save(TestDataBuilder.aTutor()
+            .withEmail("cursor-tutor@integration.test")
+            .withName("Cursor Tutor")
+            .build());
+        Course course = courseRepository.save(TestDataBuilder.aCourse()
+            .withId(null)
+            .withCode("CURS1001")
+            .withName("Cursor Course")
+            .withLecturerId(lecturer.getId())
+            .build());
+
+        List<Timesheet> saved = new ArrayList<>();
+        LocalDate monday = LocalDate.of(2025, 3, 3);
+        for (int i = 0; i < ROWS; i++) {
+            saved.add(timesheetRepository.save(new Timesheet(tutor.getId(), course.getId(), monday.plusWeeks(i),
+                new BigDecimal("2.0"), new BigDecimal("45.00"), "Cursor row " + i, lecturer.getId())));
+        }
+        entityManager.flush();
+        entityManager.clear();
+
+        expectedNewestFirst = timesheetRepository.findAllById(saved.stream().map(Timesheet::getId).toList())
+            .stream()
+            .sorted((a, b) -> {
+                int byCreated = b.getCreatedAt().compareTo(a.getCreatedAt());
+                return byCreated != 0 ? byCreated : b.getId().compareTo(a.getId());
+            })
+            .map(Timesheet::getId)
+            .toList();
+        entityManager.clear();
+
+        adminBearer = "Bearer " + jwtTokenProvider.generateToken(admin.getId(), admin.getEmail(), admin.getRole().name());
+    }
+
+    @Test
+    @DisplayName("following nextCursor visits every row once, newest first")
+    void walkingCursorsVisitsEveryRowOnce() throws Exception {
+        List<Long> visited = new ArrayList<>();
+        String url = "/api/timesheets?cursor=true&size=3";
+        int pages = 0;
+
+        while (url != null) {
+            String body = performGet(url, adminBearer)
+                .andExpect(status().isOk())
+                .andExpect(jsonPath("$.pageInfo.totalElements").value(-1))
+                .andReturn().getResponse().getContentAsString();
+            JsonNode page = objectMapper.readTree(body);
+            page.get("timesheets").forEach(node -> visited.add(node.get("id").asLong()));
+            pages++;
+
+            JsonNode next = page.get("nextCursor");
+            url = next == null || next.isNull() ? null : "/api/timesheets?size=3&after=" + next.asText();
+        }
+
+        assertThat(pages).isEqualTo(3);
+        assertThat(visited).containsExactlyElementsOf(expectedNewestFirst);
+    }
+
+    @Test
+    @DisplayName("offset pages keep their shape without nextCursor")
+    void offsetModeUnchanged() throws Exception {
+        performGet("/api/timesheets?page=0&size=3", adminBearer)
+            .andExpect(status().isOk())
+            .andExpect(jsonPath("$.pageInfo.totalElements").value(ROWS))
+            .andExpect(jsonPath("$.nextCursor").doesNotExist());
+    }
+
+    @Test
+    @DisplayName("a malformed cursor is rejected as a bad request")
+    void malformedCursorRejected() throws Exception {
+        performGet("/api/timesheets?after=not-a-cursor", adminBearer)
+            .andExpect(status().isBadRequest());
+    }
+}
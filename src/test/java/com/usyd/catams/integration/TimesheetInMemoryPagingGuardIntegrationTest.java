@@ -0,0 +1,143 @@
+package com.usyd.catams.integration;
+
+import ch.qos.logback.classic.Logger;
+import ch.qos.logback.classic.spi.ILoggingEvent;
+import ch.qos.logback.core.read.ListAppender;
+import com.usyd.catams.entity.Course;
+import com.usyd.catams.entity.LecturerAssignment;
+import com.usyd.catams.entity.Timesheet;
+import com.usyd.catams.entity.TutorAssignment;
+import com.usyd.catams.entity.User;
+import com.usyd.catams.enums.ApprovalStatus;
+import com.usyd.catams.repository.CourseRepository;
+import com.usyd.catams.repository.LecturerAssignmentRepository;
+import com.usyd.catams.repository.TimesheetRepository;
+import com.usyd.catams.repository.TutorAssignmentRepository;
+import com.usyd.catams.testdata.TestDataBuilder;
+import org.junit.jupiter.api.AfterEach;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.slf4j.LoggerFactory;
+import org.springframework.beans.factory.annotation.Autowired;
+
+import java.math.BigDecimal;
+import java.time.LocalDate;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.jsonPath;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.status;
+
+/**
+ * Fails if any paged timesheet listing makes Hibernate paginate a collection fetch in memory
+ * (HHH90003004); those endpoints must page over IDs first.
+ */
+@DisplayName("Timesheet paging without in-memory pagination")
+class TimesheetInMemoryPagingGuardIntegrationTest extends IntegrationTestBase {
+
+    private static final String IN_MEMORY_PAGINATION = "HHH90003004";
+
+    @Autowired
+    private TimesheetRepository timesheetRepository;
+
+    @Autowired
+    private CourseRepository courseRepository;
+
+    @Autowired
+    private LecturerAssignmentRepository lecturerAssignmentRepository;
+
+    @Autowired
+    private TutorAssignmentRepository tutorAssignmentRepository;
+
+    private final ListAppender<ILoggingEvent> hibernateWarnings = new ListAppender<>();
+    private Logger rootLogger;
+
+    private String adminBearer;
+    private String lecturerBearer;
+    private String tutorBearer;
+
+    @BeforeEach
+    void seedAndCaptureLogs() {
+        User admin = userRepository.save(TestDataBuilder.anAdmin()
+            .withEmail("paging-admin@integration.test").withName("Paging Admin").build());
+        User lecturer = userRepository.save(TestDataBuilder.aLecturer()
+            .withEmail("paging-lecturer@integration.test").withName("Paging Lecturer").build());
+        User tutor = userRepository.save(TestDataBuilder.aTutor()
+            .withEmail("paging-tutor@integration.test").withName("Paging Tutor").build());
+        Course course = courseRepository.save(TestDataBuilder.aCourse()
+            .withId(null)
+            .withCode("PAGE1001")
+            .withName("Paging Course")
+            .withLecturerId(lecturer.getId())
+            .build());
+        lecturerAssignmentRepository.save(new LecturerAssignment(lecturer.getId(), course.getId()));
+        tutorAssignmentRepository.save(new TutorAssignment(tutor.getId(), course.getId()));
+
+        LocalDate monday = LocalDate.of(2025, 3, 3);
+        ApprovalStatus[] statuses = {
+            ApprovalStatus.DRAFT,
+            ApprovalStatus.PENDING_TUTOR_CONFIRMATION,
+            ApprovalStatus.TUTOR_CONFIRMED,
+            ApprovalStatus.LECTURER_CONFIRMED
+        };
+        for (int i = 0; i < statuses.length; i++) {
+            Timesheet timesheet = new Timesheet(tutor.getId(), course.getId(), monday.plusWeeks(i),
+                new BigDecimal("2.0"), new BigDecimal("45.00"), "Paging row " + i, lecturer.getId());
+            timesheet.setStatus(statuses[i]);
+            timesheetRepository.save(timesheet);
+        }
+        entityManager.flush();
+        entityManager.clear();
+
+        adminBearer = bearer(admin);
+        lecturerBearer = bearer(lecturer);
+        tutorBearer = bearer(tutor);
+
+        rootLogger = (Logger) LoggerFactory.getLogger(org.slf4j.Logger.ROOT_LOGGER_NAME);
+        hibernateWarnings.start();
+        rootLogger.addAppender(hibernateWarnings);
+    }
+
+    @AfterEach
+    void stopCapturingLogs() {
+        rootLogger.detachAppender(hibernateWarnings);
+        hibernateWarnings.stop();
+    }
+
+    @Test
+    @DisplayName("paged listings never trigger Hibernate's in-memory pagination warning")
+    void pagedListingsPageInSql() throws Exception {
+        String[][] requests = {
+            {"/api/timesheets?page=0&size=2", adminBearer},
+            {"/api/timesheets?page=0&size=2", lecturerBearer},
+            {"/api/timesheets?page=0&size=2", tutorBearer},
+            {"/api/timesheets/me?page=0&size=2", tutorBearer},
+            {"/api/timesheets/pending-approval?page=0&size=2", adminBearer},
+            {"/api/timesheets/pending-approval?page=0&size=2", tutorBearer},
+            {"/api/timesheets/pending-final-approval?page=0&size=2", lecturerBearer},
+            {"/api/timesheets/pending-final-approval?page=0&size=2", adminBearer}
+        };
+        for (String[] request : requests) {
+            performGet(request[0], request[1])
+                .andExpect(status().isOk())
+                .andExpect(jsonPath("$.timesheets").isArray());
+        }
+
+        assertThat(hibernateWarnings.list)
+            .extracting(ILoggingEvent::getFormattedMessage)
+            .noneMatch(message -> message.contains(IN_MEMORY_PAGINATION));
+    }
+
+    @Test
+    @DisplayName("ID-first pages keep totals and order")
+    void idFirstPagesKeepTotals() throws Exception {
+        performGet("/api/timesheets?page=1&size=3", adminBearer)
+            .andExpect(status().isOk())
+            .andExpect(jsonPath("$.pageInfo.totalElements").value(4))
+            .andExpect(jsonPath("$.timesheets.length()").value(1));
+    }
+
+    private String bearer(User user) {
+        return "Bearer " + jwtTokenProvider.generateToken(user.getId(), user.getEmail(), user.getRole().name());
+    }
+}
@@ -0,0 +1,103 @@
+package com.usyd.catams.integration;
+
+import com.usyd.catams.entity.Course;
+import com.usyd.catams.entity.Timesheet;
+import com.usyd.catams.entity.User;
+import com.usyd.catams.repository.CourseRepository;
+import com.usyd.catams.repository.TimesheetRepository;
+import com.usyd.catams.testdata.TestDataBuilder;
+import jakarta.persistence.EntityManagerFactory;
+import org.hibernate.SessionFactory;
+import org.hibernate.stat.Statistics;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.test.context.TestPropertySource;
+
+import java.math.BigDecimal;
+import java.time.LocalDate;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.jsonPath;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.status;
+
+/**
+ * Guards the timesheet listing against N+1 lookups: resolving tutor and course names for a page
+ * must cost the same number of statements regardless of how many rows the page holds.
+ */
+@DisplayName("Timesheet listing statement count")
+@TestPropertySource(properties = "spring.jpa.properties.hibernate.generate_statistics=true")
+class TimesheetListingStatementCountIntegrationTest extends IntegrationTestBase {
+
+    private static final int ROWS = 30;
+    private static final LocalDate MONDAY = LocalDate.of(2025, 3, 3);
+
+    @Autowired
+    private TimesheetRepository timesheetRepository;
+
+    @Autowired
+    private CourseRepository courseRepository;
+
+    @Autowired
+    private EntityManagerFactory entityManagerFactory;
+
+    private String adminBearer;
+
+    @BeforeEach
+    void seedDistinctTutorsAndCourses() {
+        User admin = userRepository.save(TestDataBuilder.anAdmin()
+            .withEmail("statements-admin@integration.test")
+            .withName("Statements Admin")
+            .build());
+        User lecturer = userRepository.save(TestDataBuilder.aLecturer()
+            .withEmail("statements-lecturer@integration.test")
+            .withName("Statements Lecturer")
+            .build());
+
+        // One distinct tutor and course per row so a per-row lookup cannot hide behind the session cache
+        for (int i = 0; i < ROWS; i++) {
+            User tutor = userRepository.save(TestDataBuilder.aTutor()
+                .withEmail("statements-tutor" + i + "@integration.test")
+                .withName("Statements Tutor " + i)
+                .build());
+            Course course = courseRepository.save(TestDataBuilder.aCourse()
+                .withId(null)
+                .withCode(String.format("STMT%04d", i))
+                .withName("Statements Course " + i)
+                .withLecturerId(lecturer.getId())
+                .build());
+            timesheetRepository.save(new Timesheet(tutor.getId(), course.getId(), MONDAY,
+                new BigDecimal("2.0"), new BigDecimal("45.00"), "Statement count row " + i, lecturer.getId()));
+        }
+        entityManager.flush();
+        entityManager.clear();
+
+        adminBearer = "Bearer " + jwtTokenProvider.generateToken(admin.getId(), admin.getEmail(), admin.getRole().name());
+    }
+
+    @Test
+    @DisplayName("GET /api/timesheets issues a page-size-independent number of statements")
+    void listingStatementCountDoesNotGrowWithPageSize() throws Exception {
+        long smallPage = statementsForPage(5);
+        long largePage = statementsForPage(ROWS);
+
+        assertThat(largePage)
+            .as("statements for a %d-row page vs a 5-row page", ROWS)
+            .isEqualTo(smallPage);
+    }
+
+    private long statementsForPage(int size) throws Exception {
+        Statistics statistics = entityManagerFactory.unwrap(SessionFactory.class).getStatistics();
+        entityManager.clear();
+        statistics.clear();
+
+        performGet("/api/timesheets?page=0&size=" + size, adminBearer)
+            .andExpect(status().isOk())
+            .andExpect(jsonPath("$.timesheets.length()").value(size))
+            .andExpect(jsonPath("$.timesheets[0].tutorName").value(org.hamcrest.Matchers.startsWith("Statements Tutor")))
+            .andExpect(jsonPath("$.timesheets[0].courseName").value(org.hamcrest.Matchers.startsWith("Statements Course")));
+
+        return statistics.getPrepareStatementCount();
+    }
+}
@@ -0,0 +1,236 @@
+package com.usyd.catams.integration;
+
+import com.usyd.catams.dto.DashboardAggregateData;
+import com.usyd.catams.dto.DashboardWindows;
+import com.usyd.catams.dto.response.RollupConsistencyReport;
+import com.usyd.catams.entity.Course;
+import com.usyd.catams.entity.Timesheet;
+import com.usyd.catams.entity.User;
+import com.usyd.catams.enums.ApprovalStatus;
+import com.usyd.catams.repository.CourseRepository;
+import com.usyd.catams.repository.TimesheetRepository;
+import com.usyd.catams.repository.TimesheetWeeklyRollupRepository;
+import com.usyd.catams.service.TimesheetWeeklyRollupService;
+import com.usyd.catams.testdata.TestDataBuilder;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.transaction.PlatformTransactionManager;
+import org.springframework.transaction.TransactionDefinition;
+import org.springframework.transaction.support.TransactionTemplate;
+
+import java.math.BigDecimal;
+import java.time.LocalDate;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.concurrent.CyclicBarrier;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
+import java.util.concurrent.TimeUnit;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+/**
+ * Verifies the weekly rollup stays consistent with the timesheets table across
+ * create, change and delete, and that a rebuild repairs drift.
+ */
+@DisplayName("Timesheet weekly rollup")
+class TimesheetWeeklyRollupIntegrationTest extends IntegrationTestBase {
+
+    private static final LocalDate WEEK_ONE = LocalDate.of(2025, 3, 3);
+    private static final LocalDate WEEK_TWO = LocalDate.of(2025, 3, 10);
+
+    @Autowired
+    private TimesheetRepository timesheetRepository;
+
+    @Autowired
+    private CourseRepository courseRepository;
+
+    @Autowired
+    private TimesheetWeeklyRollupRepository rollupRepository;
+
+    @Autowired
+    private TimesheetWeeklyRollupService rollupService;
+
+    @Autowired
+    private JdbcTemplate jdbcTemplate;
+
+    @Autowired
+    private PlatformTransactionManager transactionManager;
+
+    private User tutor;
+    private User lecturer;
+    private Course course;
+
+    @BeforeEach
+    void seedCourse() {
+        lecturer = userRepository.save(TestDataBuilder.aLecturer()
+            .withEmail("rollup-lecturer@integration.test")
+            .withName("Rollup Lecturer")
+            .build());
+        tutor = userRepository.save(TestDataBuilder.aTutor()
+            .withEmail("rollup-tutor@integration.test")
+            .withName("Rollup Tutor")
+            .build());
+        course = courseRepository.save(TestDataBuilder.aCourse()
+            .withId(null)
+            .withCode("ROLL1001")
+            .withName("Rollup Course")
+            .withLecturerId(lecturer.getId())
+            .build());
+        rollupService.rebuild();
+    }
+
+    @Test
+    @DisplayName("create, status change and delete keep the rollup consistent")
+    void incrementalMaintenanceStaysConsistent() {
+        Timesheet first = createTimesheet(WEEK_ONE, "2.0");
+        Timesheet second = createTimesheet(WEEK_TWO, "3.5");
+        assertConsistent(2);
+
+        TimesheetWeeklyRollupService.Contribution before = rollupService.snapshot(first);
+        first.setStatus(ApprovalStatus.PENDING_TUTOR_CONFIRMATION);
+        timesheetRepository.save(first);
+        rollupService.recordChanged(before, first);
+        assertConsistent(2);
+
+        timesheetRepository.delete(second);
+        rollupService.recordDeleted(second);
+        assertConsistent(1);
+    }
+
+    @Test
+    @DisplayName("rebuild repairs timesheets written without the rollup hook")
+    void rebuildRepairsDrift() {
+        timesheetRepository.save(new Timesheet(tutor.getId(), course.getId(), WEEK_ONE,
+            new BigDecimal("1.5"), new BigDecimal("45.00"), "Written behind the rollup", lecturer.getId()));
+        entityManager.flush();
+
+        assertThat(rollupService.checkConsistency().isConsistent()).isFalse();
+
+        assertThat(rollupService.rebuild()).isEqualTo(1);
+        assertConsistent(1);
+    }
+
+    @Test
+    @DisplayName("a batch applies the net change of many timesheets")
+    void batchAppliesNetChange() {
+        Timesheet first = createTimesheet(WEEK_ONE, "2.0");
+        Timesheet second = timesheetRepository.save(new Timesheet(tutor.getId(), course.getId(), WEEK_ONE,
+            new BigDecimal("1.0"), new BigDecimal("45.00"), "Batched row", lecturer.getId()));
+
+        TimesheetWeeklyRollupService.Contribution before = rollupService.snapshot(first);
+        first.setStatus(ApprovalStatus.PENDING_TUTOR_CONFIRMATION);
+        timesheetRepository.save(first);
+        TimesheetWeeklyRollupService.Batch batch = rollupService.batch()
+            .created(second)
+            .changed(before, first);
+        assertThat(batch.size()).isEqualTo(2);
+        rollupService.apply(batch);
+
+        assertConsistent(2);
+    }
+
+    @Test
+    @DisplayName("a decrement with no rollup row behind it leaves no negative row")
+    void decrementWithoutRowDoesNotGoNegative() {
+        Timesheet unrolled = timesheetRepository.save(new Timesheet(tutor.getId(), course.getId(), WEEK_ONE,
+            new BigDecimal("1.5"), new BigDecimal("45.00"), "Written behind the rollup", lecturer.getId()));
+        entityManager.flush();
+
+        timesheetRepository.delete(unrolled);
+        rollupService.recordDeleted(unrolled);
+
+        assertConsistent(0);
+    }
+
+    @Test
+    @DisplayName("concurrent first writes to the same week both land")
+    void concurrentFirstWritesDoNotCollide() throws Exception {
+        // Rollup rows carry no foreign keys, so the writers need no committed users or courses
+        long courseId = 987_654_001L;
+        long tutorId = 987_654_002L;
+        TransactionTemplate writer = new TransactionTemplate(transactionManager);
+        writer.setPropagationBehavior(TransactionDefinition.PROPAGATION_REQUIRES_NEW);
+        CyclicBarrier bothStarted = new CyclicBarrier(2);
+        ExecutorService pool = Executors.newFixedThreadPool(2);
+        try {
+            List<Future<?>> writes = new ArrayList<>();
+            for (int i = 0; i < 2; i++) {
+                writes.add(pool.submit(() -> writer.executeWithoutResult(status -> {
+                    awaitQuietly(bothStarted);
+                    rollupService.recordCreated(new Timesheet(tutorId, courseId, WEEK_ONE,
+                        new BigDecimal("2.0"), new BigDecimal("45.00"), "Concurrent row", lecturer.getId()));
+                    // Hold the row until both writers have reached the upsert
+                    sleepQuietly(200);
+                })));
+            }
+            for (Future<?> write : writes) {
+                write.get(30, TimeUnit.SECONDS);
+            }
+
+            Long count = jdbcTemplate.queryForObject(
+                "SELECT timesheet_count FROM timesheet_weekly_rollup WHERE course_id = ? AND tutor_id = ?",
+                Long.class, courseId, tutorId);
+            assertThat(count).isEqualTo(2L);
+        } finally {
+            pool.submit(() -> writer.executeWithoutResult(status -> jdbcTemplate.update(
+                "DELETE FROM timesheet_weekly_rollup WHERE course_id = ?", courseId))).get(30, TimeUnit.SECONDS);
+            pool.shutdownNow();
+        }
+    }
+
+    @Test
+    @DisplayName("dashboard aggregates read from the rollup match the timesheets table")
+    void dashboardAggregatesMatchBaseTable() {
+        createTimesheet(WEEK_ONE, "2.0");
+        createTimesheet(WEEK_TWO, "4.0");
+        DashboardWindows windows = DashboardWindows.of(WEEK_ONE, WEEK_TWO.plusDays(6), WEEK_TWO.plusDays(2));
+
+        DashboardAggregateData fromTimesheets = timesheetRepository.aggregateDashboardSystemWide(windows);
+        DashboardAggregateData fromRollup = rollupRepository.aggregateDashboardSystemWide(windows);
+
+        assertThat(fromRollup.getPeriodSummary().getTotalTimesheets())
+            .isEqualTo(fromTimesheets.getPeriodSummary().getTotalTimesheets());
+        assertThat(fromRollup.getPeriodSummary().getTotalHours())
+            .isEqualByComparingTo(fromTimesheets.getPeriodSummary().getTotalHours());
+        assertThat(fromRollup.getPeriodSummary().getTotalPay())
+            .isEqualByComparingTo(fromTimesheets.getPeriodSummary().getTotalPay());
+        assertThat(fromRollup.getCurrentWeekHours()).isEqualByComparingTo(fromTimesheets.getCurrentWeekHours());
+        assertThat(fromRollup.getPreviousWeekHours()).isEqualByComparingTo(fromTimesheets.getPreviousWeekHours());
+    }
+
+    private Timesheet createTimesheet(LocalDate weekStart, String hours) {
+        Timesheet saved = timesheetRepository.save(new Timesheet(tutor.getId(), course.getId(), weekStart,
+            new BigDecimal(hours), new BigDecimal("45.00"), "Rollup row " + weekStart, lecturer.getId()));
+        rollupService.recordCreated(saved);
+        return saved;
+    }
+
+    private static void awaitQuietly(CyclicBarrier barrier) {
+        try {
+            barrier.await(10, TimeUnit.SECONDS);
+        } catch (Exception e) {
+            throw new IllegalStateException(e);
+        }
+    }
+
+    private static void sleepQuietly(long millis) {
+        try {
+            Thread.sleep(millis);
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+        }
+    }
+
+    private void assertConsistent(int expectedRows) {
+        entityManager.flush();
+        entityManager.clear();
+        RollupConsistencyReport report = rollupService.checkConsistency();
+        assertThat(report.getMismatchedKeys()).isEmpty();
+        assertThat(report.getRollupRows()).isEqualTo(expectedRows);
+    }
+}
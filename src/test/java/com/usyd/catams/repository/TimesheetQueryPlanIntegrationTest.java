@@ -0,0 +1,399 @@
+package com.usyd.catams.repository;
+
+import com.fasterxml.jackson.databind.JsonNode;
+import com.usyd.catams.integration.IntegrationTestBase;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+import com.usyd.catams.dto.DashboardWindows;
+import com.usyd.catams.enums.ApprovalStatus;
+import com.usyd.catams.enums.UserRole;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.beans.factory.config.BeanPostProcessor;
+import org.springframework.boot.test.context.TestConfiguration;
+import org.springframework.context.annotation.Bean;
+import org.springframework.context.annotation.Import;
+import org.springframework.data.domain.PageRequest;
+import org.springframework.data.domain.Pageable;
+import org.springframework.data.domain.Sort;
+import org.springframework.jdbc.core.ConnectionCallback;
+import org.springframework.jdbc.core.JdbcTemplate;
+
+import javax.sql.DataSource;
+import java.lang.reflect.InvocationTargetException;
+import java.lang.reflect.Method;
+import java.lang.reflect.Proxy;
+import java.sql.Connection;
+import java.sql.PreparedStatement;
+import java.sql.ResultSet;
+import java.sql.SQLException;
+import java.time.LocalDate;
+import java.time.LocalDateTime;
+import java.util.ArrayList;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Locale;
+import java.util.Map;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+/**
+ * EXPLAIN regression suite for the hot {@link TimesheetRepository} queries.
+ *
+ * <p>Seeds a semester-history-sized dataset on the Postgres Testcontainer, refreshes planner
+ * statistics and fails if any query plan falls back to a sequential scan of {@code timesheets}.
+ * Each repository method is called for real; the SQL and parameters Hibernate sends to the
+ * driver are captured and replayed under {@code EXPLAIN}, so the plans follow query changes.</p>
+ */
+@DisplayName("Timesheet query plans")
+@Import(TimesheetQueryPlanIntegrationTest.StatementCaptureConfiguration.class)
+class TimesheetQueryPlanIntegrationTest extends IntegrationTestBase {
+
+    private static final Logger logger = LoggerFactory.getLogger(TimesheetQueryPlanIntegrationTest.class);
+
+    private static final int TUTORS = 200;
+    private static final int COURSES = 40;
+    private static final int TIMESHEETS = 20_000;
+
+    @Autowired
+    private JdbcTemplate jdbcTemplate;
+
+    @Autowired
+    private TimesheetRepository timesheetRepository;
+
+    private long tutorId;
+    private long courseId;
+    private long lecturerId;
+
+    @BeforeEach
+    void seedLargeDataset() {
+        jdbcTemplate.update("INSERT INTO users (email_value, name, hashed_password, role) " +
+            "VALUES ('plan-lecturer@integration.test', 'Plan Lecturer', 'x', 'LECTURER')");
+        jdbcTemplate.update("INSERT INTO users (email_value, name, hashed_password, role) " +
+            "SELECT 'plan-tutor-' || g || '@integration.test', 'Plan Tutor ' || g, 'x', 'TUTOR' " +
+            "FROM generate_series(0, ?) g", TUTORS - 1);
+        lecturerId = jdbcTemplate.queryForObject(
+            "SELECT id FROM users WHERE email_value = 'plan-lecturer@integration.test'", Long.class);
+        jdbcTemplate.update("INSERT INTO courses (code_value, name, semester, lecturer_id, budget_allocated) " +
+            "SELECT 'PLAN' || lpad(g::text, 4, '0'), 'Plan Course ' || g, '2023S1', ?, 100000 " +
+            "FROM generate_series(0, ?) g", lecturerId, COURSES - 1);
+
+        // tutor = g % 200 and week = g / 200 keep (tutor, course, week) unique; ~5% of rows per queue status
+        jdbcTemplate.update(
+            "WITH tutors AS (SELECT id, row_number() OVER (ORDER BY id) - 1 AS n FROM users " +
+            "                WHERE email_value LIKE 'plan-tutor-%'), " +
+            "     plan_courses AS (SELECT id, row_number() OVER (ORDER BY id) - 1 AS n FROM courses " +
+            "                      WHERE code_value LIKE 'PLAN%') " +
+            "INSERT INTO timesheets (tutor_id, course_id, week_start_date, session_date, hours, hourly_rate, " +
+            "                        description, description_hash, task_type, status, created_at, created_by) " +
+            "SELECT t.id, c.id, DATE '2023-01-02' + (g / ?) * 7, DATE '2023-01-02' + (g / ?) * 7, 2.0, 45.00, " +
+            "       'Plan row ' || g, md5('plan row ' || (g % 50)), " +
+            "       CASE WHEN g % 10 = 0 THEN 'TUTORIAL' ELSE 'MARKING' END, " +
+            "       CASE g % 20 WHEN 0 THEN 'TUTOR_CONFIRMED' WHEN 1 THEN 'LECTURER_CONFIRMED' " +
+            "                   WHEN 2 THEN 'PENDING_TUTOR_CONFIRMATION' ELSE 'FINAL_CONFIRMED' END, " +
+            "       TIMESTAMP '2023-01-02 09:00' + g * INTERVAL '1 minute', ? " +
+            "FROM generate_series(0, ?) g " +
+            "JOIN tutors t ON t.n = g % ? " +
+            "JOIN plan_courses c ON c.n = (g * 7) % ?",
+            TUTORS, TUTORS, lecturerId, TIMESHEETS - 1, TUTORS, COURSES);
+
+        jdbcTemplate.update("INSERT INTO tutor_assignments (tutor_id, course_id) " +
+            "SELECT DISTINCT tutor_id, course_id FROM timesheets WHERE description LIKE 'Plan row %'");
+        // The lecturer owns two of the forty courses so lecturer scopes stay selective
+        jdbcTemplate.update("INSERT INTO lecturer_assignments (lecturer_id, course_id) " +
+            "SELECT ?, id FROM courses WHERE code_value IN ('PLAN0000', 'PLAN0001')", lecturerId);
+
+        tutorId = jdbcTemplate.queryForObject(
+            "SELECT id FROM users WHERE email_value = 'plan-tutor-0@integration.test'", Long.class);
+        courseId = jdbcTemplate.queryForObject(
+            "SELECT id FROM courses WHERE code_value = 'PLAN0000'", Long.class);
+
+        for (String table : List.of("users", "courses", "timesheets", "tutor_assignments", "lecturer_assignments")) {
+            jdbcTemplate.execute("ANALYZE " + table);
+        }
+    }
+
+    @Test
+    @DisplayName("no hot repository query sequentially scans timesheets")
+    void hotQueriesUseIndexes() throws Exception {
+        List<String> violations = new ArrayList<>();
+        for (Map.Entry<String, Runnable> query : hotQueries().entrySet()) {
+            List<CapturedStatement> statements = StatementCapture.during(query.getValue());
+            assertThat(statements).as("SQL issued by " + query.getKey()).isNotEmpty();
+            for (CapturedStatement statement : statements) {
+                if (!statement.reads("timesheets") || isUnfilteredCount(query.getKey(), statement)) {
+                    continue;
+                }
+                JsonNode plan = explain(statement, false).get("Plan");
+                if (seqScansTimesheets(plan)) {
+                    violations.add(query.getKey() + ": " + statement.sql() + " -> " + plan.toPrettyString());
+                }
+            }
+        }
+
+        assertThat(violations)
+            .as("queries falling back to a sequential scan of timesheets")
+            .isEmpty();
+    }
+
+    /**
+     * Every production call into {@link TimesheetRepository}, with selective arguments where the
+     * real caller passes them. The SQL EXPLAINed is what Hibernate renders for each call.
+     */
+    private Map<String, Runnable> hotQueries() {
+        LocalDate from = LocalDate.of(2023, 3, 6);
+        LocalDate to = LocalDate.of(2023, 3, 13);
+        LocalDateTime newest = LocalDateTime.of(2100, 1, 1, 0, 0);
+        LocalDateTime oldest = LocalDateTime.of(2000, 1, 1, 0, 0);
+        Pageable newestFirst = PageRequest.of(0, 20, Sort.by(Sort.Direction.DESC, "createdAt"));
+        Pageable oldestFirst = PageRequest.of(0, 20, Sort.by(Sort.Order.asc("createdAt"), Sort.Order.asc("id")));
+        Pageable limit = PageRequest.of(0, 21);
+        DashboardWindows windows = DashboardWindows.of(from, LocalDate.of(2023, 4, 30), LocalDate.of(2023, 4, 24));
+        List<Long> lecturerCourseIds = jdbcTemplate.queryForList(
+            "SELECT course_id FROM lecturer_assignments WHERE lecturer_id = ? ORDER BY course_id", Long.class, lecturerId);
+        List<Long> someIds = jdbcTemplate.queryForList(
+            "SELECT id FROM timesheets WHERE tutor_id = ? ORDER BY id LIMIT 20", Long.class, tutorId);
+
+        Map<String, Runnable> queries = new LinkedHashMap<>();
+        queries.put("findIds(withFilters(tutorId))", () -> timesheetRepository.findIds(
+            TimesheetSpecifications.withFilters(tutorId, null, null), newestFirst));
+        queries.put("findIds(withFilters(status))", () -> timesheetRepository.findIds(
+            TimesheetSpecifications.withFilters(null, null, ApprovalStatus.PENDING_TUTOR_CONFIRMATION), oldestFirst));
+        queries.put("findIds(withFilters())", () -> timesheetRepository.findIds(
+            TimesheetSpecifications.withFilters(null, null, null), newestFirst));
+        queries.put("findIds(withLecturerScope)", () -> timesheetRepository.findIds(
+            TimesheetSpecifications.withLecturerScope(lecturerId, null, null), newestFirst));
+        queries.put("findIds(pendingApprovalFor(TUTOR))", () -> timesheetRepository.findIds(
+            TimesheetSpecifications.pendingApprovalFor(UserRole.TUTOR, tutorId,
+                List.of(ApprovalStatus.PENDING_TUTOR_CONFIRMATION)), oldestFirst));
+        queries.put("findIds(pendingApprovalFor(LECTURER))", () -> timesheetRepository.findIds(
+            TimesheetSpecifications.pendingApprovalFor(UserRole.LECTURER, lecturerId,
+                List.of(ApprovalStatus.TUTOR_CONFIRMED)), oldestFirst));
+        queries.put("findIds(pendingApprovalFor(ADMIN))", () -> timesheetRepository.findIds(
+            TimesheetSpecifications.pendingApprovalFor(UserRole.ADMIN, null,
+                List.of(ApprovalStatus.LECTURER_CONFIRMED)), oldestFirst));
+        queries.put("findAllWithApprovalsByIdIn", () -> timesheetRepository.findAllWithApprovalsByIdIn(someIds));
+        queries.put("findByIdWithApprovals", () -> timesheetRepository.findByIdWithApprovals(someIds.get(0)));
+        queries.put("findIdsWithFiltersBefore", () -> timesheetRepository.findIdsWithFiltersBefore(
+            null, null, null, newest, Long.MAX_VALUE, limit));
+        queries.put("findIdsWithFiltersBefore(tutorId)", () -> timesheetRepository.findIdsWithFiltersBefore(
+            tutorId, null, null, newest, Long.MAX_VALUE, limit));
+        queries.put("findIdsWithFiltersAfter(status)", () -> timesheetRepository.findIdsWithFiltersAfter(
+            null, null, ApprovalStatus.LECTURER_CONFIRMED, oldest, 0L, limit));
+        queries.put("findIdsWithLecturerScopeBefore", () -> timesheetRepository.findIdsWithLecturerScopeBefore(
+            lecturerId, null, null, newest, Long.MAX_VALUE, limit));
+        queries.put("findIdsApprovedByTutorByCoursesWithAssignmentAfter", () ->
+            timesheetRepository.findIdsApprovedByTutorByCoursesWithAssignmentAfter(lecturerId, oldest, 0L, limit));
+        queries.put("findPendingTimesheetsForApprover(tutor)", () ->
+            timesheetRepository.findPendingTimesheetsForApprover(tutorId, false));
+        queries.put("findPendingTimesheetsForApprover(HR)", () ->
+            timesheetRepository.findPendingTimesheetsForApprover(tutorId, true));
+        queries.put("findByStatus", () -> timesheetRepository.findByStatus(ApprovalStatus.LECTURER_CONFIRMED));
+        queries.put("findByTutorId", () -> timesheetRepository.findByTutorId(tutorId));
+        queries.put("findByCourseId", () -> timesheetRepository.findByCourseId(courseId));
+        queries.put("findByTutorIdAndCourseId", () -> timesheetRepository.findByTutorIdAndCourseId(tutorId, courseId));
+        queries.put("findByTutorIdAndWeekPeriod_WeekStartDateBetween", () ->
+            timesheetRepository.findByTutorIdAndWeekPeriod_WeekStartDateBetween(tutorId, from, to));
+        queries.put("findByTutorIdAndCourseIdAndWeekPeriod_WeekStartDate", () ->
+            timesheetRepository.findByTutorIdAndCourseIdAndWeekPeriod_WeekStartDate(tutorId, courseId, from));
+        queries.put("existsByTutorIdAndCourseIdAndWeekPeriod_WeekStartDate", () ->
+            timesheetRepository.existsByTutorIdAndCourseIdAndWeekPeriod_WeekStartDate(tutorId, courseId, from));
+        queries.put("findWeekKeys", () -> timesheetRepository.findWeekKeys(List.of(tutorId), List.of(courseId), from, to));
+        queries.put("getTotalHoursByTutorAndCourse", () ->
+            timesheetRepository.getTotalHoursByTutorAndCourse(tutorId, courseId));
+        queries.put("getTotalApprovedBudgetUsedByCourse", () ->
+            timesheetRepository.getTotalApprovedBudgetUsedByCourse(courseId));
+        queries.put("aggregateDashboardByTutor", () -> timesheetRepository.aggregateDashboardByTutor(tutorId, windows));
+        queries.put("aggregateDashboardByCourse", () -> timesheetRepository.aggregateDashboardByCourse(courseId, windows));
+        queries.put("aggregateDashboardByCourses", () ->
+            timesheetRepository.aggregateDashboardByCourses(lecturerCourseIds, windows));
+        queries.put("aggregateDashboardSystemWide", () -> timesheetRepository.aggregateDashboardSystemWide(windows));
+        queries.put("countTutorialsForRepeatRule", () ->
+            timesheetRepository.countTutorialsForRepeatRule(courseId, from, to, null));
+        queries.put("countTutorialsForRepeatRule(description)", () ->
+            timesheetRepository.countTutorialsForRepeatRule(courseId, from, to, "Plan row 10"));
+        queries.put("findTutorialSessionDatesForRepeatRule", () ->
+            timesheetRepository.findTutorialSessionDatesForRepeatRule(lecturerCourseIds, from, to));
+        return queries;
+    }
+
+    /**
+     * The unfiltered admin listing counts every row for its page total; only its page query has
+     * to stay on an index.
+     */
+    private static boolean isUnfilteredCount(String query, CapturedStatement statement) {
+        return query.equals("findIds(withFilters())")
+            && statement.sql().toLowerCase(Locale.ROOT).startsWith("select count(");
+    }
+
+    @Test
+    @DisplayName("repeat-rule content match: description hash index versus text comparison")
+    void repeatRuleContentMatchUsesHashIndex() throws Exception {
+        String legacy = "SELECT COUNT(*) FROM timesheets t " +
+            "WHERE t.task_type = 'TUTORIAL' " +
+            "AND t.course_id = " + courseId + " " +
+            "AND (t.week_start_date BETWEEN DATE '2023-03-06' AND DATE '2023-03-13' " +
+            "OR t.session_date BETWEEN DATE '2023-03-06' AND DATE '2023-03-13') " +
+            "AND LOWER(CAST(t.description AS TEXT)) = LOWER(CAST('Plan row 10' AS TEXT))";
+        JsonNode before = explainAnalyze(legacy);
+        List<CapturedStatement> statements = StatementCapture.during(() -> timesheetRepository.countTutorialsForRepeatRule(
+            courseId, LocalDate.of(2023, 3, 6), LocalDate.of(2023, 3, 13), "Plan row 10"));
+        assertThat(statements).hasSize(1);
+        JsonNode after = explain(statements.get(0), true);
+
+        // Recorded for comparison in the test log; only the plan shape is asserted
+        logger.info("countTutorialsForRepeatRule with description: text match {} ms, hash index {} ms",
+            before.path("Execution Time").asDouble(), after.path("Execution Time").asDouble());
+        assertThat(after.path("Plan").toString()).contains("idx_timesheet_repeat_rule");
+        assertThat(seqScansTimesheets(after.path("Plan"))).isFalse();
+    }
+
+    /**
+     * EXPLAIN a captured statement on the test transaction's connection, which holds the seeded
+     * rows and their statistics, binding the same parameters Hibernate bound.
+     */
+    private JsonNode explain(CapturedStatement statement, boolean analyze) throws Exception {
+        String prefix = analyze ? "EXPLAIN (ANALYZE, FORMAT JSON) " : "EXPLAIN (FORMAT JSON) ";
+        String planJson = jdbcTemplate.execute((ConnectionCallback<String>) connection -> {
+            try (PreparedStatement explain = connection.prepareStatement(prefix + statement.sql())) {
+                statement.bindTo(explain);
+                try (ResultSet rs = explain.executeQuery()) {
+                    rs.next();
+                    return rs.getString(1);
+                }
+            }
+        });
+        return objectMapper.readTree(planJson).get(0);
+    }
+
+    private JsonNode explainAnalyze(String sql) throws Exception {
+        String planJson = jdbcTemplate.queryForObject("EXPLAIN (ANALYZE, FORMAT JSON) " + sql, String.class);
+        return objectMapper.readTree(planJson).get(0);
+    }
+
+    private boolean seqScansTimesheets(JsonNode node) {
+        if ("Seq Scan".equals(node.path("Node Type").asText())
+            && "timesheets".equals(node.path("Relation Name").asText())) {
+            return true;
+        }
+        for (JsonNode child : node.path("Plans")) {
+            if (seqScansTimesheets(child)) {
+                return true;
+            }
+        }
+        return false;
+    }
+
+    /**
+     * One prepared statement as Hibernate executed it: the SQL and every parameter setter call.
+     */
+    record CapturedStatement(String sql, List<Bind> binds) {
+
+        boolean reads(String table) {
+            return sql.toLowerCase(Locale.ROOT).matches("(?s)\\s*select\\b.*\\b" + table + "\\b.*");
+        }
+
+        void bindTo(PreparedStatement statement) throws SQLException {
+            for (Bind bind : binds) {
+                try {
+                    bind.setter().invoke(statement, bind.args());
+                } catch (InvocationTargetException e) {
+                    throw e.getCause() instanceof SQLException sql ? sql : new SQLException(e.getCause());
+                } catch (IllegalAccessException e) {
+                    throw new SQLException(e);
+                }
+            }
+        }
+    }
+
+    record Bind(Method setter, Object[] args) {
+    }
+
+    /**
+     * Records the statements executed on the current thread while a capture is active. The
+     * DataSource is wrapped at the JDBC level so the SQL is exactly what reaches the driver.
+     */
+    static final class StatementCapture {
+
+        private static final ThreadLocal<List<CapturedStatement>> ACTIVE = new ThreadLocal<>();
+
+        static List<CapturedStatement> during(Runnable action) {
+            List<CapturedStatement> captured = new ArrayList<>();
+            ACTIVE.set(captured);
+            try {
+                action.run();
+            } finally {
+                ACTIVE.remove();
+            }
+            return captured;
+        }
+
+        static DataSource wrap(DataSource dataSource) {
+            return proxy(DataSource.class, (method, args) -> {
+                Object result = invoke(dataSource, method, args);
+                return result instanceof Connection connection ? wrap(connection) : result;
+            });
+        }
+
+        private static Connection wrap(Connection connection) {
+            return proxy(Connection.class, (method, args) -> {
+                Object result = invoke(connection, method, args);
+                if (result instanceof PreparedStatement statement && method.getName().equals("prepareStatement")) {
+                    return wrap(statement, (String) args[0]);
+                }
+                return result;
+            });
+        }
+
+        private static PreparedStatement wrap(PreparedStatement statement, String sql) {
+            List<Bind> binds = new ArrayList<>();
+            return proxy(PreparedStatement.class, (method, args) -> {
+                String name = method.getName();
+                if (name.startsWith("set") && args != null && args.length >= 2 && args[0] instanceof Integer) {
+                    binds.add(new Bind(method, args.clone()));
+                } else if (name.equals("clearParameters")) {
+                    binds.clear();
+                } else if (name.startsWith("execute") && args == null) {
+                    List<CapturedStatement> captured = ACTIVE.get();
+                    if (captured != null) {
+                        captured.add(new CapturedStatement(sql, List.copyOf(binds)));
+                    }
+                }
+                return invoke(statement, method, args);
+            });
+        }
+
+        private interface Handler {
+            Object handle(Method method, Object[] args) throws Throwable;
+        }
+
+        private static <T> T proxy(Class<T> type, Handler handler) {
+            return type.cast(Proxy.newProxyInstance(StatementCapture.class.getClassLoader(), new Class<?>[]{type},
+                (proxy, method, args) -> handler.handle(method, args)));
+        }
+
+        private static Object invoke(Object target, Method method, Object[] args) throws Throwable {
+            try {
+                return method.invoke(target, args);
+            } catch (InvocationTargetException e) {
+                throw e.getCause();
+            }
+        }
+    }
+
+    @TestConfiguration(proxyBeanMethods = false)
+    static class StatementCaptureConfiguration {
+
+        @Bean
+        static BeanPostProcessor statementCapturingDataSource() {
+            return new BeanPostProcessor() {
+                @Override
+                public Object postProcessAfterInitialization(Object bean, String beanName) {
+                    return bean instanceof DataSource dataSource ? StatementCapture.wrap(dataSource) : bean;
+                }
+            };
+        }
+    }
+}
@@ -206,4 +206,29 @@ public class TimesheetRepositoryIntegrationTest extends IntegrationTestBase {
         // Assert
         assertThat(count).isGreaterThanOrEqualTo(1L);
     }
+
+    @Test
+    @DisplayName("countTutorialsForRepeatRule should match content through the normalised description hash")
+    void countTutorialsForRepeatRule_withDescription_matchesNormalisedContent() {
+        Timesheet tutorial = new Timesheet(
+            tutor2Id,
+            course1Id,
+            new WeekPeriod(com.usyd.catams.testutils.TestDates.mondayOf(LocalDate.of(2024, 6, 17))),
+            new BigDecimal("1.0"),
+            new Money(new BigDecimal("42.00")),
+            "EA  Tutorial ",
+            lecturerId
+        );
+        tutorial.setTaskType(com.usyd.catams.enums.TimesheetTaskType.TUTORIAL);
+        tutorial.setStatus(ApprovalStatus.DRAFT);
+        tutorial.setSessionDate(LocalDate.of(2024, 6, 17));
+        entityManager.persist(tutorial);
+        entityManager.flush();
+
+        LocalDate from = LocalDate.of(2024, 6, 17);
+        LocalDate to = LocalDate.of(2024, 6, 24);
+        assertThat(tutorial.getDescriptionHash()).isEqualTo(Timesheet.descriptionHashOf("ea tutorial"));
+        assertThat(timesheetRepository.countTutorialsForRepeatRule(course1Id, from, to, "ea tutorial")).isEqualTo(1L);
+        assertThat(timesheetRepository.countTutorialsForRepeatRule(course1Id, from, to, "Marking review")).isZero();
+    }
 }
@@ -3,6 +3,7 @@ package com.usyd.catams.repository;
 import com.usyd.catams.dto.TimesheetSummaryData;
 import com.usyd.catams.entity.Course;
 import com.usyd.catams.entity.Timesheet;
+import com.usyd.catams.entity.TutorAssignment;
 import com.usyd.catams.entity.User;
 import com.usyd.catams.enums.ApprovalStatus;
 import com.usyd.catams.enums.UserRole;
@@ -18,7 +19,7 @@ import org.springframework.boot.test.autoconfigure.orm.jpa.TestEntityManager;
 import org.springframework.data.domain.Page;
 import org.springframework.data.domain.PageRequest;
 import org.springframework.data.domain.Pageable;
-// import org.springframework.data.domain.Sort;
+import org.springframework.data.domain.Sort;
 import org.springframework.test.context.ActiveProfiles;
 
 import java.math.BigDecimal;
@@ -301,6 +302,52 @@ class TimesheetRepositoryTest {
         assertThat(combinedFilter.getContent().get(0).getDescription()).isEqualTo("Work 1");
     }
 
+    @Test
+    void testSpecificationsApplyOnlySetFilters() {
+        // Given
+        User anotherTutor = entityManager.persistAndFlush(new User(new Email("spec-tutor@usyd.edu.au"),
+                "Spec Tutor", "hashedPassword", UserRole.TUTOR));
+        Course unassignedCourse = entityManager.persistAndFlush(new Course(new CourseCode("PHYS2001"),
+                "Unassigned Course", "2024S1", lecturer.getId(), new Money(new BigDecimal("3000.00"))));
+
+        Timesheet draft = new Timesheet(tutor.getId(), course.getId(), weekStartDate,
+                new BigDecimal("5.0"), new BigDecimal("25.00"), "Work 1", lecturer.getId());
+        Timesheet pending = new Timesheet(anotherTutor.getId(), course.getId(), weekStartDate,
+                new BigDecimal("3.0"), new BigDecimal("25.00"), "Work 2", lecturer.getId());
+        pending.setStatus(ApprovalStatus.PENDING_TUTOR_CONFIRMATION);
+        Timesheet outOfScope = new Timesheet(tutor.getId(), unassignedCourse.getId(), weekStartDate,
+                new BigDecimal("4.0"), new BigDecimal("25.00"), "Work 3", lecturer.getId());
+        entityManager.persistAndFlush(draft);
+        entityManager.persistAndFlush(pending);
+        entityManager.persistAndFlush(outOfScope);
+
+        entityManager.persistAndFlush(new com.usyd.catams.entity.LecturerAssignment(lecturer.getId(), course.getId()));
+        entityManager.persistAndFlush(new com.usyd.catams.entity.TutorAssignment(tutor.getId(), course.getId()));
+        entityManager.persistAndFlush(new com.usyd.catams.entity.TutorAssignment(tutor.getId(), unassignedCourse.getId()));
+
+        Pageable pageable = PageRequest.of(0, 10);
+
+        // When & Then
+        assertThat(timesheetRepository.findAll(TimesheetSpecifications.withFilters(null, null, null), pageable)
+                .getTotalElements()).isEqualTo(3);
+        assertThat(timesheetRepository.findAll(
+                TimesheetSpecifications.withFilters(tutor.getId(), null, null), pageable).getContent())
+                .extracting(Timesheet::getDescription).containsExactlyInAnyOrder("Work 1", "Work 3");
+        assertThat(timesheetRepository.findAll(
+                TimesheetSpecifications.withFilters(null, course.getId(), ApprovalStatus.PENDING_TUTOR_CONFIRMATION),
+                pageable).getContent())
+                .extracting(Timesheet::getDescription).containsExactly("Work 2");
+
+        // Lecturer scope: assigned courses only, and only tutors assigned to that course
+        assertThat(timesheetRepository.findAll(
+                TimesheetSpecifications.withLecturerScope(lecturer.getId(), null, null), pageable).getContent())
+                .extracting(Timesheet::getDescription).containsExactly("Work 1");
+        assertThat(timesheetRepository.findAll(
+                TimesheetSpecifications.withLecturerScope(lecturer.getId(), course.getId(), ApprovalStatus.DRAFT),
+                pageable).getContent())
+                .extracting(Timesheet::getDescription).containsExactly("Work 1");
+    }
+
     @Test
     void testGetTotalHoursByTutorAndCourse() {
         // Given
@@ -399,6 +446,46 @@ class TimesheetRepositoryTest {
         assertThat(tutorPending.get(0).getTutorId()).isEqualTo(tutor.getId());
     }
 
+    @Test
+    void testPendingApprovalQueueForLecturerRequiresOwnedCourseAndAssignedTutor() {
+        // Given
+        User otherTutor = entityManager.persistAndFlush(new User(new Email("other.tutor@usyd.edu.au"), "Other Tutor",
+                "hashedPassword", UserRole.TUTOR));
+        entityManager.persistAndFlush(new TutorAssignment(tutor.getId(), course.getId()));
+
+        Timesheet older = new Timesheet(tutor.getId(), course.getId(), weekStartDate,
+                new BigDecimal("2.0"), new BigDecimal("25.00"), "Older", lecturer.getId());
+        older.setStatus(ApprovalStatus.TUTOR_CONFIRMED);
+        Timesheet newer = new Timesheet(tutor.getId(), course.getId(), weekStartDate.plusWeeks(1),
+                new BigDecimal("2.0"), new BigDecimal("25.00"), "Newer", lecturer.getId());
+        newer.setStatus(ApprovalStatus.TUTOR_CONFIRMED);
+        Timesheet unassignedTutor = new Timesheet(otherTutor.getId(), course.getId(), weekStartDate,
+                new BigDecimal("2.0"), new BigDecimal("25.00"), "Unassigned", lecturer.getId());
+        unassignedTutor.setStatus(ApprovalStatus.TUTOR_CONFIRMED);
+        Timesheet wrongStatus = new Timesheet(tutor.getId(), course.getId(), weekStartDate.plusWeeks(2),
+                new BigDecimal("2.0"), new BigDecimal("25.00"), "Awaiting HR", lecturer.getId());
+        wrongStatus.setStatus(ApprovalStatus.LECTURER_CONFIRMED);
+
+        entityManager.persistAndFlush(older);
+        entityManager.persistAndFlush(newer);
+        entityManager.persistAndFlush(unassignedTutor);
+        entityManager.persistAndFlush(wrongStatus);
+
+        // When
+        Page<Long> lecturerQueue = timesheetRepository.findIds(
+                TimesheetSpecifications.pendingApprovalFor(UserRole.LECTURER, lecturer.getId(),
+                        List.of(ApprovalStatus.TUTOR_CONFIRMED)),
+                PageRequest.of(0, 10, Sort.by("createdAt", "id")));
+        Page<Long> otherLecturerQueue = timesheetRepository.findIds(
+                TimesheetSpecifications.pendingApprovalFor(UserRole.LECTURER, tutor.getId(),
+                        List.of(ApprovalStatus.TUTOR_CONFIRMED)),
+                PageRequest.of(0, 10));
+
+        // Then
+        assertThat(lecturerQueue.getContent()).containsExactly(older.getId(), newer.getId());
+        assertThat(otherLecturerQueue.getContent()).isEmpty();
+    }
+
     @Test
     void testFindByCreatedBy() {
         // Given
@@ -0,0 +1,120 @@
+package com.usyd.catams.security;
+
+import com.usyd.catams.entity.User;
+import com.usyd.catams.testdata.TestDataBuilder;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+
+import java.time.Clock;
+import java.time.Duration;
+import java.time.Instant;
+import java.time.ZoneId;
+import java.time.ZoneOffset;
+import java.util.Optional;
+import java.util.concurrent.atomic.AtomicInteger;
+import java.util.function.Function;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+@DisplayName("ActiveUserCache")
+class ActiveUserCacheTest {
+
+    private MutableClock clock;
+    private ActiveUserCache cache;
+    private AtomicInteger loads;
+
+    @BeforeEach
+    void setUp() {
+        clock = new MutableClock(Instant.parse("2025-03-03T09:00:00Z"));
+        cache = new ActiveUserCache(Duration.ofSeconds(60), 2, clock);
+        loads = new AtomicInteger();
+    }
+
+    @Test
+    @DisplayName("serves repeat lookups from the cache until the TTL expires")
+    void cachesUntilTtl() {
+        Function<Long, Optional<User>> loader = countingLoader(activeUser(1L, true));
+
+        cache.get(1L, loader);
+        cache.get(1L, loader);
+        assertThat(loads).hasValue(1);
+
+        clock.advance(Duration.ofSeconds(61));
+        cache.get(1L, loader);
+        assertThat(loads).hasValue(2);
+    }
+
+    @Test
+    @DisplayName("eviction forces the next lookup to reload")
+    void evictReloads() {
+        cache.get(1L, countingLoader(activeUser(1L, true)));
+
+        cache.evict(1L);
+        Optional<User> reloaded = cache.get(1L, countingLoader(activeUser(1L, false)));
+
+        assertThat(reloaded).isEmpty();
+        assertThat(loads).hasValue(2);
+        assertThat(cache.size()).isZero();
+    }
+
+    @Test
+    @DisplayName("inactive and missing users are not cached")
+    void doesNotCacheInactive() {
+        assertThat(cache.get(1L, countingLoader(activeUser(1L, false)))).isEmpty();
+        assertThat(cache.get(2L, id -> Optional.empty())).isEmpty();
+        assertThat(cache.size()).isZero();
+    }
+
+    @Test
+    @DisplayName("stays within its size bound")
+    void boundedSize() {
+        for (long id = 1; id <= 5; id++) {
+            cache.get(id, countingLoader(activeUser(id, true)));
+        }
+        assertThat(cache.size()).isEqualTo(2);
+    }
+
+    private Function<Long, Optional<User>> countingLoader(User user) {
+        return id -> {
+            loads.incrementAndGet();
+            return Optional.of(user);
+        };
+    }
+
+    private static User activeUser(Long id, boolean active) {
+        User user = TestDataBuilder.aTutor()
+            .withId(id)
+            .withEmail("cache-" + id + "@catams.edu.au")
+            .build();
+        user.setIsActive(active);
+        return user;
+    }
+
+    private static final class MutableClock extends Clock {
+        private Instant now;
+
+        private MutableClock(Instant now) {
+            this.now = now;
+        }
+
+        void advance(Duration duration) {
+            now = now.plus(duration);
+        }
+
+        @Override
+        public ZoneId getZone() {
+            return ZoneOffset.UTC;
+        }
+
+        @Override
+        public Clock withZone(ZoneId zone) {
+            return this;
+        }
+
+        @Override
+        public Instant instant() {
+            return now;
+        }
+    }
+}
@@ -8,7 +8,10 @@ import org.junit.jupiter.api.BeforeEach;
 import org.junit.jupiter.api.DisplayName;
 import org.junit.jupiter.api.Test;
 
+import org.springframework.http.MediaType;
+
 import static org.springframework.test.web.servlet.request.MockMvcRequestBuilders.get;
+import static org.springframework.test.web.servlet.request.MockMvcRequestBuilders.patch;
 import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.*;
 
 /**
@@ -78,6 +81,33 @@ public class JwtAuthenticationIntegrationTest extends IntegrationTestBase {
                 .andExpect(status().isUnauthorized());
     }
 
+    @Test
+    @DisplayName("Should reject a cached user's token once the user is deactivated")
+    void shouldRejectTokenAfterDeactivation() throws Exception {
+        User admin = userRepository.save(TestDataBuilder.anAdmin()
+                .withId(null)
+                .withEmail("jwt.admin@catams.edu.au")
+                .withName("JWT Admin")
+                .build());
+        String adminBearer = "Bearer " + jwtTokenProvider.generateToken(
+                admin.getId(), admin.getEmail(), admin.getRole().name());
+
+        // First request caches the lecturer's snapshot
+        mockMvc.perform(get("/api/dashboard")
+                .header("Authorization", "Bearer " + validToken))
+                .andExpect(status().is2xxSuccessful());
+
+        mockMvc.perform(patch("/api/users/" + testUser.getId())
+                .header("Authorization", adminBearer)
+                .contentType(MediaType.APPLICATION_JSON)
+                .content("{\"isActive\": false}"))
+                .andExpect(status().isOk());
+
+        mockMvc.perform(get("/api/dashboard")
+                .header("Authorization", "Bearer " + validToken))
+                .andExpect(status().isUnauthorized());
+    }
+
     @Test
     @DisplayName("Should extract correct user information from valid token")
     void shouldExtractUserInfoFromToken() {
@@ -0,0 +1,110 @@
+package com.usyd.catams.service;
+
+import com.usyd.catams.entity.ChangeVersionListener;
+import com.usyd.catams.entity.Course;
+import com.usyd.catams.entity.Timesheet;
+import com.usyd.catams.enums.ApprovalStatus;
+import com.usyd.catams.enums.UserRole;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.springframework.transaction.support.TransactionSynchronization;
+import org.springframework.transaction.support.TransactionSynchronizationManager;
+import org.springframework.transaction.support.TransactionSynchronizationUtils;
+
+import java.time.LocalDate;
+import java.util.ArrayList;
+import java.util.List;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+@DisplayName("ChangeVersionService")
+class ChangeVersionServiceTest {
+
+    private static final LocalDate START = LocalDate.of(2025, 7, 1);
+    private static final LocalDate END = LocalDate.of(2025, 11, 30);
+    private static final LocalDate TODAY = LocalDate.of(2025, 8, 15);
+
+    private final ChangeVersionService service = new ChangeVersionService();
+    private final ChangeVersionListener listener = new ChangeVersionListener();
+
+    @Test
+    @DisplayName("tags are strong, stable and vary with the request shape")
+    void tagsAreStableForTheSameRequest() {
+        String tag = service.timesheetListTag(5L, UserRole.LECTURER, null, 3L, ApprovalStatus.PENDING_TUTOR_CONFIRMATION, 20);
+
+        assertThat(tag).startsWith("\"").endsWith("\"").doesNotStartWith("W/");
+        assertThat(service.timesheetListTag(5L, UserRole.LECTURER, null, 3L, ApprovalStatus.PENDING_TUTOR_CONFIRMATION, 20))
+            .isEqualTo(tag);
+        assertThat(service.timesheetListTag(5L, UserRole.LECTURER, null, 3L, ApprovalStatus.PENDING_TUTOR_CONFIRMATION, 50))
+            .isNotEqualTo(tag);
+        assertThat(new ChangeVersionService().configTag()).isNotEqualTo(service.configTag());
+    }
+
+    @Test
+    @DisplayName("a timesheet write moves its tutor's scope and the global scope only")
+    void timesheetWritesAreScopedToTheirTutor() {
+        String tutorA = service.dashboardSummaryTag(101L, UserRole.TUTOR, null, START, END, TODAY);
+        String tutorB = service.dashboardSummaryTag(102L, UserRole.TUTOR, null, START, END, TODAY);
+        String lecturer = service.dashboardSummaryTag(7L, UserRole.LECTURER, null, START, END, TODAY);
+
+        Timesheet timesheet = new Timesheet();
+        timesheet.setTutorId(101L);
+        listener.onChanged(timesheet);
+
+        assertThat(service.dashboardSummaryTag(101L, UserRole.TUTOR, null, START, END, TODAY)).isNotEqualTo(tutorA);
+        assertThat(service.dashboardSummaryTag(102L, UserRole.TUTOR, null, START, END, TODAY)).isEqualTo(tutorB);
+        assertThat(service.dashboardSummaryTag(7L, UserRole.LECTURER, null, START, END, TODAY)).isNotEqualTo(lecturer);
+    }
+
+    @Test
+    @DisplayName("reference data writes move every scope")
+    void referenceWritesMoveEveryScope() {
+        String tutor = service.dashboardSummaryTag(103L, UserRole.TUTOR, null, START, END, TODAY);
+        String admin = service.dashboardSummaryTag(1L, UserRole.ADMIN, null, START, END, TODAY);
+
+        listener.onChanged(new Course());
+
+        assertThat(service.dashboardSummaryTag(103L, UserRole.TUTOR, null, START, END, TODAY)).isNotEqualTo(tutor);
+        assertThat(service.dashboardSummaryTag(1L, UserRole.ADMIN, null, START, END, TODAY)).isNotEqualTo(admin);
+    }
+
+    @Test
+    @DisplayName("a change broadcast by another instance moves the same scopes as a local write")
+    void peerChangesMoveScopes() {
+        String tutorA = service.dashboardSummaryTag(104L, UserRole.TUTOR, null, START, END, TODAY);
+        String tutorB = service.dashboardSummaryTag(105L, UserRole.TUTOR, null, START, END, TODAY);
+        String lecturer = service.dashboardSummaryTag(7L, UserRole.LECTURER, null, START, END, TODAY);
+
+        ChangeVersionListener.peerChanged("tutor:104");
+
+        assertThat(service.dashboardSummaryTag(104L, UserRole.TUTOR, null, START, END, TODAY)).isNotEqualTo(tutorA);
+        assertThat(service.dashboardSummaryTag(105L, UserRole.TUTOR, null, START, END, TODAY)).isEqualTo(tutorB);
+        assertThat(service.dashboardSummaryTag(7L, UserRole.LECTURER, null, START, END, TODAY)).isNotEqualTo(lecturer);
+
+        ChangeVersionListener.peerChanged(null);
+
+        assertThat(service.dashboardSummaryTag(105L, UserRole.TUTOR, null, START, END, TODAY)).isNotEqualTo(tutorB);
+    }
+
+    @Test
+    @DisplayName("writes are shared with peers once per transaction")
+    void writesAreSharedOncePerTransaction() {
+        List<String> shared = new ArrayList<>();
+        ChangeVersionListener.broadcastTo(shared::add);
+        TransactionSynchronizationManager.initSynchronization();
+        try {
+            Timesheet timesheet = new Timesheet();
+            timesheet.setTutorId(106L);
+            listener.onChanged(timesheet);
+            listener.onChanged(timesheet);
+            listener.onChanged(new Course());
+
+            assertThat(shared).containsExactly("tutor:106", "reference");
+        } finally {
+            TransactionSynchronizationUtils.invokeAfterCompletion(
+                TransactionSynchronizationManager.getSynchronizations(), TransactionSynchronization.STATUS_ROLLED_BACK);
+            TransactionSynchronizationManager.clearSynchronization();
+            ChangeVersionListener.broadcastTo(null);
+        }
+    }
+}
@@ -0,0 +1,89 @@
+package com.usyd.catams.service;
+
+import com.usyd.catams.entity.ChangeVersionListener;
+import com.usyd.catams.entity.LecturerAssignment;
+import com.usyd.catams.entity.TutorAssignment;
+import com.usyd.catams.repository.LecturerAssignmentRepository;
+import com.usyd.catams.repository.TutorAssignmentRepository;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.extension.ExtendWith;
+import org.mockito.Mock;
+import org.mockito.junit.jupiter.MockitoExtension;
+
+import java.time.Clock;
+import java.time.Duration;
+import java.time.Instant;
+import java.time.ZoneOffset;
+import java.util.List;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.mockito.Mockito.times;
+import static org.mockito.Mockito.verify;
+import static org.mockito.Mockito.when;
+
+@ExtendWith(MockitoExtension.class)
+@DisplayName("CourseScopeCache")
+class CourseScopeCacheTest {
+
+    @Mock
+    private LecturerAssignmentRepository lecturerAssignmentRepository;
+
+    @Mock
+    private TutorAssignmentRepository tutorAssignmentRepository;
+
+    private CourseScopeCache cache;
+
+    @BeforeEach
+    void setUp() {
+        Clock clock = Clock.fixed(Instant.parse("2025-03-03T09:00:00Z"), ZoneOffset.UTC);
+        cache = new CourseScopeCache(lecturerAssignmentRepository, tutorAssignmentRepository, null, clock,
+            Duration.ofMinutes(10));
+    }
+
+    @Test
+    @DisplayName("answers repeat checks for a lecturer from one query")
+    void cachesLecturerScope() {
+        when(lecturerAssignmentRepository.findByLecturerId(501L))
+            .thenReturn(List.of(new LecturerAssignment(501L, 30L), new LecturerAssignment(501L, 10L)));
+
+        assertThat(cache.isLecturerAssigned(501L, 10L)).isTrue();
+        assertThat(cache.isLecturerAssigned(501L, 30L)).isTrue();
+        assertThat(cache.isLecturerAssigned(501L, 20L)).isFalse();
+        assertThat(cache.lecturerCourses(501L).toList()).containsExactly(10L, 30L);
+
+        verify(lecturerAssignmentRepository, times(1)).findByLecturerId(501L);
+    }
+
+    @Test
+    @DisplayName("explicit eviction and remote invalidation reload only the affected user")
+    void evictionIsPerUser() {
+        when(tutorAssignmentRepository.findByTutorId(601L)).thenReturn(List.of(new TutorAssignment(601L, 10L)));
+        when(tutorAssignmentRepository.findByTutorId(602L)).thenReturn(List.of(new TutorAssignment(602L, 20L)));
+        cache.tutorCourses(601L);
+        cache.tutorCourses(602L);
+
+        cache.evictTutor(601L);
+        cache.tutorCourses(601L);
+        cache.tutorCourses(602L);
+        cache.applyRemoteInvalidation("tutor:602");
+        cache.tutorCourses(602L);
+
+        verify(tutorAssignmentRepository, times(2)).findByTutorId(601L);
+        verify(tutorAssignmentRepository, times(2)).findByTutorId(602L);
+    }
+
+    @Test
+    @DisplayName("a JPA write to the user's assignments invalidates their cached scope")
+    void assignmentWritesInvalidate() {
+        when(tutorAssignmentRepository.findByTutorId(603L))
+            .thenReturn(List.of())
+            .thenReturn(List.of(new TutorAssignment(603L, 40L)));
+        assertThat(cache.isTutorAssigned(603L, 40L)).isFalse();
+
+        new ChangeVersionListener().onChanged(new TutorAssignment(603L, 40L));
+
+        assertThat(cache.isTutorAssigned(603L, 40L)).isTrue();
+    }
+}
@@ -1,6 +1,8 @@
 package com.usyd.catams.service;
 
-import com.usyd.catams.dto.TimesheetSummaryData;
+import com.usyd.catams.dto.CourseBudgetTotals;
+import com.usyd.catams.dto.DashboardAggregateData;
+import com.usyd.catams.dto.DashboardWindows;
 import com.usyd.catams.dto.response.DashboardSummaryResponse;
 import com.usyd.catams.entity.Course;
 import com.usyd.catams.enums.UserRole;
@@ -60,27 +62,11 @@ class DashboardServiceImplTest {
     void shouldReturnTutorDashboard() {
         // Given
         Long tutorId = 123L;
-        TimesheetSummaryData mockSummary = new TimesheetSummaryData(5L, new BigDecimal("42.5"), new BigDecimal("1912.50"), 2L);
-        TimesheetSummaryData mockCurrentWeek = new TimesheetSummaryData(2L, new BigDecimal("16.0"), new BigDecimal("720.00"), 1L);
-        TimesheetSummaryData mockPreviousWeek = new TimesheetSummaryData(2L, new BigDecimal("18.0"), new BigDecimal("810.00"), 0L);
+        DashboardAggregateData mockAggregate = new DashboardAggregateData(
+            5L, new BigDecimal("42.5"), new BigDecimal("1912.50"), 2L, new BigDecimal("16.0"), new BigDecimal("18.0"));
         
-        // Mock all calls with any LocalDate to return appropriate responses
-        when(timesheetRepository.findTimesheetSummaryByTutor(eq(tutorId), any(LocalDate.class), any(LocalDate.class)))
-            .thenAnswer(invocation -> {
-                LocalDate start = invocation.getArgument(1);
-                LocalDate end = invocation.getArgument(2);
-                // If it's the original call with test dates, return main summary
-                if (start.equals(startDate) && end.equals(endDate)) {
-                    return mockSummary;
-                }
-                // For workload analysis calls with different date ranges
-                long daysBetween = java.time.temporal.ChronoUnit.DAYS.between(start, end);
-                if (daysBetween <= 7) {
-                    // Weekly calls - alternate between current and previous week data
-                    return start.isAfter(LocalDate.now().minusWeeks(1)) ? mockCurrentWeek : mockPreviousWeek;
-                }
-                return mockSummary; // Default to summary for longer periods
-            });
+        when(timesheetRepository.aggregateDashboardByTutor(eq(tutorId), any(DashboardWindows.class)))
+            .thenReturn(mockAggregate);
 
         // When
         DashboardSummaryResponse result = dashboardService.getDashboardSummary(
@@ -98,7 +84,7 @@ class DashboardServiceImplTest {
         assertThat(result.getWorkloadAnalysis().getCurrentWeekHours()).isEqualTo(new BigDecimal("16.0"));
         assertThat(result.getWorkloadAnalysis().getPreviousWeekHours()).isEqualTo(new BigDecimal("18.0"));
         
-        verify(timesheetRepository, times(4)).findTimesheetSummaryByTutor(eq(tutorId), any(LocalDate.class), any(LocalDate.class));
+        verify(timesheetRepository, times(1)).aggregateDashboardByTutor(eq(tutorId), any(DashboardWindows.class));
     }
 
     @Test
@@ -129,26 +115,13 @@ class DashboardServiceImplTest {
         List<Course> managedCourses = List.of(course1, course2);
         List<Long> courseIds = List.of(1L, 2L);
         
-        TimesheetSummaryData mockSummary = new TimesheetSummaryData(15L, new BigDecimal("120.0"), new BigDecimal("5400.00"), 5L);
-        TimesheetSummaryData mockCurrentWeek = new TimesheetSummaryData(8L, new BigDecimal("60.0"), new BigDecimal("2700.00"), 2L);
-        TimesheetSummaryData mockPreviousWeek = new TimesheetSummaryData(7L, new BigDecimal("50.0"), new BigDecimal("2250.00"), 1L);
+        DashboardAggregateData mockAggregate = new DashboardAggregateData(
+            15L, new BigDecimal("120.0"), new BigDecimal("5400.00"), 5L, new BigDecimal("60.0"), new BigDecimal("50.0"));
         
         when(courseRepository.findByLecturerIdAndIsActive(lecturerId, true))
             .thenReturn(managedCourses);
-        // Mock all calls to return appropriate responses based on date range
-        when(timesheetRepository.findTimesheetSummaryByCourses(eq(courseIds), any(LocalDate.class), any(LocalDate.class)))
-            .thenAnswer(invocation -> {
-                LocalDate start = invocation.getArgument(1);
-                LocalDate end = invocation.getArgument(2);
-                if (start.equals(startDate) && end.equals(endDate)) {
-                    return mockSummary;
-                }
-                long daysBetween = java.time.temporal.ChronoUnit.DAYS.between(start, end);
-                if (daysBetween <= 7) {
-                    return start.isAfter(LocalDate.now().minusWeeks(1)) ? mockCurrentWeek : mockPreviousWeek;
-                }
-                return mockSummary;
-            });
+        when(timesheetRepository.aggregateDashboardByCourses(eq(courseIds), any(DashboardWindows.class)))
+            .thenReturn(mockAggregate);
 
         // When
         DashboardSummaryResponse result = dashboardService.getDashboardSummary(
@@ -166,7 +139,7 @@ class DashboardServiceImplTest {
         assertThat(result.getWorkloadAnalysis().getPreviousWeekHours()).isEqualTo(new BigDecimal("50.0"));
         
         verify(courseRepository).findByLecturerIdAndIsActive(lecturerId, true);
-        verify(timesheetRepository, times(4)).findTimesheetSummaryByCourses(eq(courseIds), any(LocalDate.class), any(LocalDate.class));
+        verify(timesheetRepository, times(1)).aggregateDashboardByCourses(eq(courseIds), any(DashboardWindows.class));
     }
 
     @Test
@@ -176,33 +149,15 @@ class DashboardServiceImplTest {
         Long lecturerId = 999L;
         Long courseId = 456L;
         Course course = createMockCourse(courseId, "COMP1001", new BigDecimal("5000.00"));
-        List<Long> singleCourseIds = List.of(courseId);
-        
-        TimesheetSummaryData mockSummary = new TimesheetSummaryData(8L, new BigDecimal("64.0"), new BigDecimal("2880.00"), 3L);
-        TimesheetSummaryData mockCurrentWeek = new TimesheetSummaryData(4L, new BigDecimal("30.0"), new BigDecimal("1350.00"), 1L);
-        TimesheetSummaryData mockPreviousWeek = new TimesheetSummaryData(3L, new BigDecimal("25.0"), new BigDecimal("1125.00"), 0L);
+        DashboardAggregateData mockAggregate = new DashboardAggregateData(
+            8L, new BigDecimal("64.0"), new BigDecimal("2880.00"), 3L, new BigDecimal("30.0"), new BigDecimal("25.0"));
         
         when(courseRepository.existsByIdAndLecturerId(courseId, lecturerId))
             .thenReturn(true);
         when(courseRepository.findById(courseId))
             .thenReturn(Optional.of(course));
-        // Mock the main summary call
-        when(timesheetRepository.findTimesheetSummaryByCourse(courseId, startDate, endDate))
-            .thenReturn(mockSummary);
-        // Mock the workload analysis calls (uses courses method with single course)
-        when(timesheetRepository.findTimesheetSummaryByCourses(eq(singleCourseIds), any(LocalDate.class), any(LocalDate.class)))
-            .thenAnswer(invocation -> {
-                LocalDate start = invocation.getArgument(1);
-                LocalDate end = invocation.getArgument(2);
-                if (start.equals(startDate) && end.equals(endDate)) {
-                    return mockSummary;
-                }
-                long daysBetween = java.time.temporal.ChronoUnit.DAYS.between(start, end);
-                if (daysBetween <= 7) {
-                    return start.isAfter(LocalDate.now().minusWeeks(1)) ? mockCurrentWeek : mockPreviousWeek;
-                }
-                return mockSummary;
-            });
+        when(timesheetRepository.aggregateDashboardByCourse(eq(courseId), any(DashboardWindows.class)))
+            .thenReturn(mockAggregate);
 
         // When
         DashboardSummaryResponse result = dashboardService.getDashboardSummary(
@@ -215,11 +170,13 @@ class DashboardServiceImplTest {
         assertThat(result.getPendingApprovals()).isEqualTo(3);
         assertThat(result.getBudgetUsage()).isNotNull();
         assertThat(result.getWorkloadAnalysis()).isNotNull();
+        assertThat(result.getWorkloadAnalysis().getCurrentWeekHours()).isEqualTo(new BigDecimal("30.0"));
+        assertThat(result.getWorkloadAnalysis().getPreviousWeekHours()).isEqualTo(new BigDecimal("25.0"));
         
         verify(courseRepository).existsByIdAndLecturerId(courseId, lecturerId);
         verify(courseRepository).findById(courseId);
-        verify(timesheetRepository).findTimesheetSummaryByCourse(courseId, startDate, endDate);
-        verify(timesheetRepository, times(3)).findTimesheetSummaryByCourses(eq(singleCourseIds), any(LocalDate.class), any(LocalDate.class));
+        verify(timesheetRepository, times(1)).aggregateDashboardByCourse(eq(courseId), any(DashboardWindows.class));
+        verify(timesheetRepository, never()).aggregateDashboardByCourses(any(), any());
     }
 
     @Test
@@ -274,28 +231,13 @@ class DashboardServiceImplTest {
     void shouldReturnAdminDashboardSystemWide() {
         // Given
         Long adminId = 777L;
-        TimesheetSummaryData mockSummary = new TimesheetSummaryData(50L, new BigDecimal("400.0"), new BigDecimal("18000.00"), 12L);
-        TimesheetSummaryData mockCurrentWeek = new TimesheetSummaryData(20L, new BigDecimal("150.0"), new BigDecimal("6750.00"), 5L);
-        TimesheetSummaryData mockPreviousWeek = new TimesheetSummaryData(18L, new BigDecimal("140.0"), new BigDecimal("6300.00"), 3L);
-        Course course1 = createMockCourse(1L, "COMP1001", new BigDecimal("5000.00"));
-        Course course2 = createMockCourse(2L, "COMP2001", new BigDecimal("7000.00"));
+        DashboardAggregateData mockAggregate = new DashboardAggregateData(
+            50L, new BigDecimal("400.0"), new BigDecimal("18000.00"), 12L, new BigDecimal("150.0"), new BigDecimal("140.0"));
         
-        // Mock all system-wide calls
-        when(timesheetRepository.findTimesheetSummarySystemWide(any(LocalDate.class), any(LocalDate.class)))
-            .thenAnswer(invocation -> {
-                LocalDate start = invocation.getArgument(0);
-                LocalDate end = invocation.getArgument(1);
-                if (start.equals(startDate) && end.equals(endDate)) {
-                    return mockSummary;
-                }
-                long daysBetween = java.time.temporal.ChronoUnit.DAYS.between(start, end);
-                if (daysBetween <= 7) {
-                    return start.isAfter(LocalDate.now().minusWeeks(1)) ? mockCurrentWeek : mockPreviousWeek;
-                }
-                return mockSummary;
-            });
-        when(courseRepository.findByIsActive(true))
-            .thenReturn(List.of(course1, course2));
+        when(timesheetRepository.aggregateDashboardSystemWide(any(DashboardWindows.class)))
+            .thenReturn(mockAggregate);
+        when(courseRepository.summarizeActiveCourseBudgets())
+            .thenReturn(new CourseBudgetTotals(2L, new BigDecimal("12000.00"), new BigDecimal("7200.00")));
 
         // When
         DashboardSummaryResponse result = dashboardService.getDashboardSummary(
@@ -311,8 +253,12 @@ class DashboardServiceImplTest {
         assertThat(result.getWorkloadAnalysis().getCurrentWeekHours()).isEqualTo(new BigDecimal("150.0"));
         assertThat(result.getWorkloadAnalysis().getPreviousWeekHours()).isEqualTo(new BigDecimal("140.0"));
         
-        verify(timesheetRepository, times(4)).findTimesheetSummarySystemWide(any(LocalDate.class), any(LocalDate.class));
-        verify(courseRepository, times(2)).findByIsActive(true); // Called for budget and workload analysis
+        assertThat(result.getBudgetUsage().getTotalBudget()).isEqualTo(new BigDecimal("12000.00"));
+        assertThat(result.getWorkloadAnalysis().getTotalTutors()).isEqualTo(8);
+        
+        verify(timesheetRepository, times(1)).aggregateDashboardSystemWide(any(DashboardWindows.class));
+        verify(courseRepository, times(1)).summarizeActiveCourseBudgets(); // Shared by budget and workload analysis
+        verify(courseRepository, never()).findByIsActive(true);
     }
 
     @Test
@@ -322,32 +268,20 @@ class DashboardServiceImplTest {
         Long adminId = 777L;
         Long courseId = 456L;
         Course course = createMockCourse(courseId, "COMP1001", new BigDecimal("5000.00"));
-        List<Long> singleCourseIds = List.of(courseId);
-        TimesheetSummaryData mockSummary = new TimesheetSummaryData(12L, new BigDecimal("96.0"), new BigDecimal("4320.00"), 4L);
-        TimesheetSummaryData mockCurrentWeek = new TimesheetSummaryData(5L, BigDecimal.valueOf(40), new BigDecimal("1800.00"), 2L);
-        TimesheetSummaryData mockPreviousWeek = new TimesheetSummaryData(4L, new BigDecimal("32.0"), new BigDecimal("1440.00"), 1L);
+        DashboardAggregateData mockCourseAggregate = new DashboardAggregateData(
+            12L, new BigDecimal("96.0"), new BigDecimal("4320.00"), 4L, BigDecimal.valueOf(10), new BigDecimal("8.0"));
+        DashboardAggregateData mockSystemAggregate = new DashboardAggregateData(
+            30L, new BigDecimal("240.0"), new BigDecimal("10800.00"), 9L, BigDecimal.valueOf(40), new BigDecimal("32.0"));
         
-        // Mock the main summary call
-        when(timesheetRepository.findTimesheetSummaryByCourse(courseId, startDate, endDate))
-            .thenReturn(mockSummary);
+        when(timesheetRepository.aggregateDashboardByCourse(eq(courseId), any(DashboardWindows.class)))
+            .thenReturn(mockCourseAggregate);
         when(courseRepository.findById(courseId))
             .thenReturn(Optional.of(course));
-        // Mock the system-wide workload analysis calls (Admin always uses system-wide for workload analysis)
-        when(timesheetRepository.findTimesheetSummarySystemWide(any(LocalDate.class), any(LocalDate.class)))
-            .thenAnswer(invocation -> {
-                LocalDate start = invocation.getArgument(0);
-                LocalDate end = invocation.getArgument(1);
-                if (start.equals(startDate) && end.equals(endDate)) {
-                    return mockSummary;
-                }
-                long daysBetween = java.time.temporal.ChronoUnit.DAYS.between(start, end);
-                if (daysBetween <= 7) {
-                    return start.isAfter(LocalDate.now().minusWeeks(1)) ? mockCurrentWeek : mockPreviousWeek;
-                }
-                return mockSummary;
-            });
-        when(courseRepository.findByIsActive(true))
-            .thenReturn(List.of(course)); // For workload analysis tutor counts
+        // Admin always uses system-wide data for workload analysis
+        when(timesheetRepository.aggregateDashboardSystemWide(any(DashboardWindows.class)))
+            .thenReturn(mockSystemAggregate);
+        when(courseRepository.summarizeActiveCourseBudgets())
+            .thenReturn(new CourseBudgetTotals(1L, new BigDecimal("5000.00"), new BigDecimal("3000.00"))); // For workload analysis tutor counts
 
         // When
         DashboardSummaryResponse result = dashboardService.getDashboardSummary(
@@ -361,10 +295,12 @@ class DashboardServiceImplTest {
         assertThat(result.getBudgetUsage()).isNotNull();
         assertThat(result.getWorkloadAnalysis()).isNotNull();
         
-        verify(timesheetRepository).findTimesheetSummaryByCourse(courseId, startDate, endDate);
+        assertThat(result.getWorkloadAnalysis().getCurrentWeekHours()).isEqualTo(BigDecimal.valueOf(40));
+        
+        verify(timesheetRepository).aggregateDashboardByCourse(eq(courseId), any(DashboardWindows.class));
         verify(courseRepository).findById(courseId); // Called for budget calculation
-        verify(timesheetRepository, atLeastOnce()).findTimesheetSummarySystemWide(any(LocalDate.class), any(LocalDate.class));
-        verify(courseRepository).findByIsActive(true); // Called for workload analysis tutor counts
+        verify(timesheetRepository).aggregateDashboardSystemWide(any(DashboardWindows.class));
+        verify(courseRepository).summarizeActiveCourseBudgets(); // Called for workload analysis tutor counts
     }
 
     // ==================== ERROR HANDLING TESTS ====================
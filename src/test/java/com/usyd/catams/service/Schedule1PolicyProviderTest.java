@@ -1,14 +1,28 @@
 package com.usyd.catams.service;
 
+import com.usyd.catams.entity.RateAmount;
+import com.usyd.catams.entity.RateCode;
+import com.usyd.catams.entity.Schedule1CatalogueListener;
 import com.usyd.catams.enums.TimesheetTaskType;
+import com.usyd.catams.enums.TutorQualification;
 import com.usyd.catams.repository.PolicyVersionRepository;
 import com.usyd.catams.repository.RateAmountRepository;
 import com.usyd.catams.repository.RateCodeRepository;
+import io.micrometer.core.instrument.simple.SimpleMeterRegistry;
 import org.junit.jupiter.api.Test;
 import org.springframework.core.env.Environment;
 
+import java.math.BigDecimal;
+import java.time.Clock;
+import java.time.LocalDate;
+import java.time.ZoneOffset;
+import java.util.List;
+
+import static org.assertj.core.api.Assertions.assertThat;
 import static org.assertj.core.api.Assertions.assertThatThrownBy;
 import static org.mockito.Mockito.mock;
+import static org.mockito.Mockito.times;
+import static org.mockito.Mockito.verify;
 import static org.mockito.Mockito.when;
 
 /**
@@ -32,4 +46,83 @@ class Schedule1PolicyProviderTest {
             .isInstanceOf(IllegalStateException.class)
             .hasMessageContaining("No tutorial rate codes configured");
     }
+
+    @Test
+    void shouldResolveRateEffectiveOnSessionDateFromCatalogue() {
+        RateCodeRepository rateCodeRepository = mock(RateCodeRepository.class);
+        RateAmountRepository rateAmountRepository = mock(RateAmountRepository.class);
+        RateCode tu2 = tutorialCode("TU2");
+        when(rateCodeRepository.findByTaskType(TimesheetTaskType.TUTORIAL)).thenReturn(List.of(tu2));
+        when(rateCodeRepository.findAll()).thenReturn(List.of(tu2));
+        when(rateAmountRepository.findAllWithRateCode()).thenReturn(List.of(
+            amount(tu2, "2025-07-01", null, "182.54"),
+            amount(tu2, "2024-07-01", "2025-07-01", "175.94")
+        ));
+        SimpleMeterRegistry meterRegistry = new SimpleMeterRegistry();
+        Schedule1PolicyProvider provider = new Schedule1PolicyProvider(rateCodeRepository, rateAmountRepository,
+            mock(PolicyVersionRepository.class), mock(Environment.class), fixedClock("2025-09-01"), meterRegistry);
+
+        assertThat(provider.resolvePolicyByRateCode("TU2", TutorQualification.STANDARD, LocalDate.parse("2024-09-02"))
+            .getSessionAmountAud()).isEqualByComparingTo("175.94");
+        assertThat(provider.resolvePolicyByRateCode("TU2", TutorQualification.STANDARD, LocalDate.parse("2025-07-01"))
+            .getSessionAmountAud()).isEqualByComparingTo("182.54");
+        // Before any configured rate: falls back to the rate in force today
+        assertThat(provider.resolveTutorialPolicy(TutorQualification.STANDARD, false, LocalDate.parse("2020-01-06"))
+            .getSessionAmountAud()).isEqualByComparingTo("182.54");
+
+        verify(rateAmountRepository, times(1)).findAllWithRateCode();
+        assertThat(meterRegistry.get("schedule1.policy.lookups").tag("result", "hit").counter().count()).isEqualTo(2.0);
+        assertThat(meterRegistry.get("schedule1.policy.lookups").tag("result", "miss").counter().count()).isEqualTo(1.0);
+    }
+
+    @Test
+    void shouldReloadCatalogueAfterPolicyDataChanges() {
+        RateCodeRepository rateCodeRepository = mock(RateCodeRepository.class);
+        RateAmountRepository rateAmountRepository = mock(RateAmountRepository.class);
+        RateCode tu2 = tutorialCode("TU2");
+        when(rateCodeRepository.findByTaskType(TimesheetTaskType.TUTORIAL)).thenReturn(List.of(tu2));
+        when(rateCodeRepository.findAll()).thenReturn(List.of(tu2));
+        when(rateAmountRepository.findAllWithRateCode())
+            .thenReturn(List.of(amount(tu2, "2025-07-01", null, "182.54")))
+            .thenReturn(List.of(amount(tu2, "2025-07-01", "2026-07-01", "182.54"),
+                amount(tu2, "2026-07-01", null, "190.00")));
+        Schedule1PolicyProvider provider = new Schedule1PolicyProvider(rateCodeRepository, rateAmountRepository,
+            mock(PolicyVersionRepository.class), mock(Environment.class), fixedClock("2025-09-01"),
+            new SimpleMeterRegistry());
+        LocalDate nextYear = LocalDate.parse("2026-08-03");
+        assertThat(provider.resolvePolicyByRateCode("TU2", TutorQualification.STANDARD, nextYear)
+            .getSessionAmountAud()).isEqualByComparingTo("182.54");
+
+        new Schedule1CatalogueListener().onPolicyDataChanged(new RateAmount());
+
+        assertThat(provider.resolvePolicyByRateCode("TU2", TutorQualification.STANDARD, nextYear)
+            .getSessionAmountAud()).isEqualByComparingTo("190.00");
+        verify(rateAmountRepository, times(2)).findAllWithRateCode();
+    }
+
+    private static RateCode tutorialCode(String code) {
+        RateCode rateCode = new RateCode();
+        rateCode.setCode(code);
+        rateCode.setTaskType(TimesheetTaskType.TUTORIAL);
+        rateCode.setDefaultDeliveryHours(new BigDecimal("1.0"));
+        rateCode.setDefaultAssociatedHours(new BigDecimal("2.0"));
+        rateCode.setRepeatable(false);
+        return rateCode;
+    }
+
+    private static RateAmount amount(RateCode code, String from, String to, String sessionAmount) {
+        RateAmount amount = new RateAmount();
+        amount.setRateCode(code);
+        amount.setQualification(TutorQualification.STANDARD);
+        amount.setEffectiveFrom(LocalDate.parse(from));
+        amount.setEffectiveTo(to == null ? null : LocalDate.parse(to));
+        amount.setHourlyAmountAud(new BigDecimal(sessionAmount));
+        amount.setMaxAssociatedHours(new BigDecimal("2.0"));
+        amount.setMaxPayableHours(new BigDecimal("3.0"));
+        return amount;
+    }
+
+    private static Clock fixedClock(String date) {
+        return Clock.fixed(LocalDate.parse(date).atStartOfDay().toInstant(ZoneOffset.UTC), ZoneOffset.UTC);
+    }
 }
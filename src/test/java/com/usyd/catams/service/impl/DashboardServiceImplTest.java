@@ -1,6 +1,7 @@
 package com.usyd.catams.service.impl;
 
-import com.usyd.catams.dto.TimesheetSummaryData;
+import com.usyd.catams.dto.DashboardAggregateData;
+import com.usyd.catams.dto.DashboardWindows;
 import com.usyd.catams.enums.UserRole;
 import com.usyd.catams.repository.CourseRepository;
 import com.usyd.catams.repository.TimesheetRepository;
@@ -17,6 +18,7 @@ import java.util.Optional;
 
 import static org.assertj.core.api.Assertions.assertThat;
 import static org.mockito.ArgumentMatchers.any;
+import static org.mockito.ArgumentMatchers.eq;
 import static org.mockito.Mockito.*;
 
 @ExtendWith(MockitoExtension.class)
@@ -34,9 +36,9 @@ class DashboardServiceImplTest {
         // Clock fixed to Wednesday 2025-08-13; Monday is 2025-08-11
         Clock fixed = Clock.fixed(Instant.parse("2025-08-13T00:00:00Z"), ZoneOffset.UTC);
 
-        // Stub repository summary calls to avoid NPEs
-        when(timesheetRepository.findTimesheetSummaryByTutor(any(), any(), any()))
-                .thenReturn(new TimesheetSummaryData(0L, java.math.BigDecimal.ZERO, java.math.BigDecimal.ZERO, 0L));
+        // Stub repository aggregation call to avoid NPEs
+        when(timesheetRepository.aggregateDashboardByTutor(any(), any()))
+                .thenReturn(DashboardAggregateData.empty());
 
         DashboardServiceImpl svc = new DashboardServiceImpl(timesheetRepository, courseRepository, fixed);
 
@@ -45,25 +47,16 @@ class DashboardServiceImplTest {
 
         svc.getDashboardSummary(2L, UserRole.TUTOR, Optional.empty(), start, end);
 
-        // Capture one of the current-week summary calls
-        ArgumentCaptor<Long> tutorIdCap = ArgumentCaptor.forClass(Long.class);
-        ArgumentCaptor<LocalDate> startCap = ArgumentCaptor.forClass(LocalDate.class);
-        ArgumentCaptor<LocalDate> endCap = ArgumentCaptor.forClass(LocalDate.class);
-
-        verify(timesheetRepository, atLeastOnce())
-                .findTimesheetSummaryByTutor(tutorIdCap.capture(), startCap.capture(), endCap.capture());
-
-        // Verify at least one call used the Clock-derived Monday 2025-08-11 and Sunday 2025-08-17
-        LocalDate expectedStart = LocalDate.of(2025, 8, 11);
-        LocalDate expectedEnd = LocalDate.of(2025, 8, 17);
-        boolean found = false;
-        for (int i = 0; i < startCap.getAllValues().size(); i++) {
-            if (expectedStart.equals(startCap.getAllValues().get(i)) && expectedEnd.equals(endCap.getAllValues().get(i))) {
-                found = true;
-                break;
-            }
-        }
-        assertThat(found).isTrue();
+        ArgumentCaptor<DashboardWindows> windowsCap = ArgumentCaptor.forClass(DashboardWindows.class);
+        verify(timesheetRepository).aggregateDashboardByTutor(eq(2L), windowsCap.capture());
+
+        // The single aggregation pass must use the Clock-derived Monday 2025-08-11 and Sunday 2025-08-17
+        DashboardWindows windows = windowsCap.getValue();
+        assertThat(windows.getCurrentWeekStart()).isEqualTo(LocalDate.of(2025, 8, 11));
+        assertThat(windows.getCurrentWeekEnd()).isEqualTo(LocalDate.of(2025, 8, 17));
+        assertThat(windows.getPreviousWeekStart()).isEqualTo(LocalDate.of(2025, 8, 4));
+        assertThat(windows.getPreviousWeekEnd()).isEqualTo(LocalDate.of(2025, 8, 10));
+        assertThat(windows.getStartDate()).isEqualTo(start);
+        assertThat(windows.getEndDate()).isEqualTo(end);
     }
 }
-